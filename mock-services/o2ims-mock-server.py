@@ -9,17 +9,32 @@ Author: Generated by Claude Code
 License: MIT
 """
 
+import argparse
+import asyncio
+import base64
+import hashlib
+import heapq
 import logging
+import math
+import os
+import random
 import sys
+import time
 import uuid
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Union
+from array import array
+from bisect import bisect_right, insort
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from fnmatch import fnmatch
+from typing import AsyncIterator, Callable, Dict, List, Optional, Any, Sequence, Tuple, Union
 from enum import Enum
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Query, Request, Response, Path
+import yaml
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response, Path
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 from pydantic.types import UUID4
 
@@ -87,6 +102,14 @@ class DeploymentManagerType(str, Enum):
     HELM = "HELM"
 
 
+class ProvisioningRequestStatus(str, Enum):
+    """Provisioning request lifecycle states"""
+    PENDING = "PENDING"
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
 # Data Models
 class BaseO2IMSModel(BaseModel):
     """Base model for all O2IMS entities"""
@@ -149,6 +172,28 @@ class InfrastructureProvisioningRequest(BaseO2IMSModel):
     extensions: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Vendor-specific extensions")
 
 
+class ProvisioningRequestCreate(BaseO2IMSModel):
+    """Body of a provisioning request creation"""
+    name: str = Field(..., description="Human-readable name of the request")
+    description: Optional[str] = Field(None, description="Description of the request")
+    request_type: str = Field("NETWORK_FUNCTION_DEPLOYMENT", description="Type of provisioning request")
+    requested_capacity: Dict[str, float] = Field(default_factory=dict, description="Requested resource capacity")
+    extensions: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Vendor-specific extensions")
+
+
+# Upper bound on the requests of one bulk creation
+MAX_BULK_REQUESTS = 10000
+
+
+class ProvisioningRequestBulkCreate(BaseO2IMSModel):
+    """Body of a bulk creation: explicit requests, or count copies of a template"""
+    requests: List[ProvisioningRequestCreate] = Field(
+        default_factory=list, max_length=MAX_BULK_REQUESTS, description="Requests to create"
+    )
+    template: Optional[ProvisioningRequestCreate] = Field(None, description="Template for count requests")
+    count: int = Field(0, ge=0, le=MAX_BULK_REQUESTS, description="Number of requests created from the template")
+
+
 class AlarmEventRecord(BaseO2IMSModel):
     """Alarm event record"""
     alarm_event_record_id: UUID4 = Field(..., description="Unique identifier for the alarm")
@@ -179,6 +224,9 @@ class MockDataGenerator:
         self.resource_pool_ids = {
             f"edge{i}": [uuid.uuid4() for _ in range(3)] for i in range(1, 5)
         }
+        self.provisioning_request_ids = {
+            f"edge{i}": [uuid.uuid4() for _ in range(3)] for i in range(1, 5)
+        }
 
     def generate_status(self) -> O2IMSStatus:
         """Generate O2IMS status response"""
@@ -383,7 +431,7 @@ class MockDataGenerator:
 
         for i, template in enumerate(request_templates):
             request = InfrastructureProvisioningRequest(
-                infrastructure_request_id=uuid.uuid4(),
+                infrastructure_request_id=self.provisioning_request_ids[site][i],
                 name=template["name"],
                 description=template["description"],
                 request_type=template["request_type"],
@@ -428,8 +476,1312 @@ class MockDataGenerator:
         return filtered_items[offset:offset + limit]
 
 
-# Initialize mock data generator
+# Precomputed inventory
+def notify(listeners: List[Callable], event_type: str, collection: str, object_id: str, obj: BaseO2IMSModel, scope: Optional[str]) -> None:
+    """Call change listeners"""
+    for listener in listeners:
+        listener(event_type, collection, object_id, obj, scope)
+
+
+def _index_key(value: Any) -> str:
+    """Normalize a field or query value for case-insensitive index lookups"""
+    if isinstance(value, Enum):
+        value = value.value
+    return str(value).lower()
+
+
+class InventoryStore:
+    """Precomputed, indexed O2IMS inventory.
+
+    Objects are built once and kept in id-keyed dicts, each with its JSON
+    serialization and secondary indexes on the filterable fields. List
+    responses are assembled from the serialized objects, cached per query and
+    invalidated whenever the collection changes. Listeners are called with
+    (event type, collection, id, object, scope) after every change.
+    """
+
+    DEPLOYMENT_MANAGERS = "deploymentManagers"
+    RESOURCE_POOLS = "resourcePools"
+    PROVISIONING_REQUESTS = "provisioningRequests"
+
+    INDEXED_FIELDS = {
+        DEPLOYMENT_MANAGERS: ("deployment_manager_type",),
+        RESOURCE_POOLS: ("resource_pool_type", "location"),
+        PROVISIONING_REQUESTS: ("request_status",),
+    }
+
+    # Cached list responses per collection before the cache is reset
+    MAX_CACHED_QUERIES = 1024
+
+    def __init__(self):
+        self.objects: Dict[str, Dict[str, BaseO2IMSModel]] = {c: {} for c in self.INDEXED_FIELDS}
+        self.versions: Dict[str, int] = {c: 0 for c in self.INDEXED_FIELDS}
+        self._serialized: Dict[str, Dict[str, bytes]] = {c: {} for c in self.INDEXED_FIELDS}
+        self._sequence: Dict[str, Dict[str, int]] = {c: {} for c in self.INDEXED_FIELDS}
+        self._scopes: Dict[str, Dict[str, Optional[str]]] = {c: {} for c in self.INDEXED_FIELDS}
+        # collection -> field -> normalized value -> ids (dicts as ordered sets)
+        self._indexes: Dict[str, Dict[str, Dict[str, Dict[str, None]]]] = {
+            c: {f: {} for f in fields + ("__scope__",)} for c, fields in self.INDEXED_FIELDS.items()
+        }
+        self._list_cache: Dict[str, Dict[tuple, Tuple[bytes, Optional[str]]]] = {c: {} for c in self.INDEXED_FIELDS}
+        self._next_sequence = 0
+        self.listeners: List[Callable[[str, str, str, BaseO2IMSModel, Optional[str]], None]] = []
+
+    @classmethod
+    def from_generator(cls, generator: MockDataGenerator) -> "InventoryStore":
+        """Build the inventory once from the mock data generator"""
+        store = cls()
+        for manager in generator.generate_deployment_managers():
+            store.put(cls.DEPLOYMENT_MANAGERS, str(manager.deployment_manager_id), manager)
+        for pool in generator.generate_resource_pools():
+            store.put(cls.RESOURCE_POOLS, str(pool.resource_pool_id), pool)
+        for manager_id in generator.deployment_manager_ids.values():
+            for request in generator.generate_provisioning_requests(str(manager_id)):
+                store.put(
+                    cls.PROVISIONING_REQUESTS,
+                    str(request.infrastructure_request_id),
+                    request,
+                    scope=str(manager_id),
+                )
+        return store
+
+    def _index_values(self, collection: str, obj: BaseO2IMSModel, scope: Optional[str]):
+        for field in self.INDEXED_FIELDS[collection]:
+            yield field, _index_key(getattr(obj, field, ""))
+        if scope is not None:
+            yield "__scope__", scope
+
+    def put(self, collection: str, object_id: str, obj: BaseO2IMSModel, scope: Optional[str] = None) -> None:
+        """Insert or replace an object, updating indexes and invalidating cached lists"""
+        added = object_id not in self.objects[collection]
+        if not added:
+            self._unindex(collection, object_id)
+        else:
+            self._sequence[collection][object_id] = self._next_sequence
+            self._next_sequence += 1
+        self.objects[collection][object_id] = obj
+        self._scopes[collection][object_id] = scope
+        self._serialized[collection][object_id] = obj.model_dump_json(by_alias=True).encode()
+        for field, key in self._index_values(collection, obj, scope):
+            self._indexes[collection][field].setdefault(key, {})[object_id] = None
+        self._invalidate(collection)
+        notify(self.listeners, "ADDED" if added else "MODIFIED", collection, object_id, obj, scope)
+
+    def delete(self, collection: str, object_id: str) -> bool:
+        """Remove an object; returns whether it existed"""
+        if object_id not in self.objects[collection]:
+            return False
+        self._unindex(collection, object_id)
+        obj = self.objects[collection].pop(object_id)
+        del self._serialized[collection][object_id]
+        del self._sequence[collection][object_id]
+        scope = self._scopes[collection].pop(object_id)
+        self._invalidate(collection)
+        notify(self.listeners, "DELETED", collection, object_id, obj, scope)
+        return True
+
+    def _unindex(self, collection: str, object_id: str) -> None:
+        obj = self.objects[collection][object_id]
+        for field, key in self._index_values(collection, obj, self._scopes[collection][object_id]):
+            postings = self._indexes[collection][field].get(key)
+            if postings is not None:
+                postings.pop(object_id, None)
+                if not postings:
+                    del self._indexes[collection][field][key]
+
+    def _invalidate(self, collection: str) -> None:
+        self.versions[collection] += 1
+        self._list_cache[collection].clear()
+
+    def next_id(self, collection: str) -> str:
+        """Id for a new object"""
+        return str(uuid.uuid4())
+
+    def get(self, collection: str, object_id: str) -> Optional[BaseO2IMSModel]:
+        """Object by id"""
+        return self.objects[collection].get(object_id)
+
+    def get_json(self, collection: str, object_id: str) -> Optional[bytes]:
+        """Serialized object by id"""
+        return self._serialized[collection].get(object_id)
+
+    def select(self, collection: str, filters: Optional[Dict[str, Any]] = None, scope: Optional[str] = None) -> List[str]:
+        """Ids matching all filters (case-insensitive equality), in insertion order"""
+        filters = {field: value for field, value in (filters or {}).items() if value is not None}
+        indexes = self._indexes[collection]
+        postings = []
+        unindexed = {}
+        for field, value in filters.items():
+            if field in indexes:
+                postings.append(indexes[field].get(_index_key(value), {}))
+            else:
+                unindexed[field] = _index_key(value)
+        if scope is not None:
+            postings.append(indexes["__scope__"].get(scope, {}))
+
+        if not postings:
+            ids = list(self.objects[collection])
+        else:
+            postings.sort(key=len)
+            ids = [i for i in postings[0] if all(i in other for other in postings[1:])]
+            sequence = self._sequence[collection]
+            ids.sort(key=sequence.__getitem__)
+
+        if unindexed:
+            objects = self.objects[collection]
+            ids = [
+                i for i in ids
+                if all(
+                    hasattr(objects[i], field) and _index_key(getattr(objects[i], field)) == key
+                    for field, key in unindexed.items()
+                )
+            ]
+        return ids
+
+    def page(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        scope: Optional[str] = None,
+    ) -> Tuple[bytes, Optional[str]]:
+        """
+        Serialized JSON array of one page of matching objects (cached per query)
+
+        Returns the body and the cursor of the next page (None on the last page).
+        A cursor continues after the last object of the previous page; offset only
+        applies without one. Raises ValueError for a cursor of another query.
+        """
+        query = query_key(collection, filters, scope)
+        key = (query, limit, offset, cursor)
+        cache = self._list_cache[collection]
+        cached = cache.get(key)
+        if cached is None:
+            ids = self.select(collection, filters, scope)
+            sequence = self._sequence[collection]
+            if cursor is not None:
+                after = decode_cursor(cursor, query)
+                offset = bisect_right([sequence[i] for i in ids], after)
+            page = ids[offset:offset + limit]
+            next_cursor = None
+            if page and offset + limit < len(ids):
+                next_cursor = encode_cursor(query, sequence[page[-1]])
+            serialized = self._serialized[collection]
+            cached = (b"[" + b",".join(serialized[i] for i in page) + b"]", next_cursor)
+            if len(cache) >= self.MAX_CACHED_QUERIES:
+                cache.clear()
+            cache[key] = cached
+        return cached
+
+    def ids(self, collection: str, filters: Optional[Dict[str, Any]] = None, scope: Optional[str] = None) -> List[str]:
+        """Ids of all matching objects"""
+        return self.select(collection, filters, scope)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of objects per collection"""
+        return {collection: len(objects) for collection, objects in self.objects.items()}
+
+
+# Cursor pagination
+def query_key(collection: str, filters: Optional[Dict[str, Any]], scope: Optional[str]) -> tuple:
+    """Normalized identity of a list query, independent of the page"""
+    return (
+        collection,
+        scope,
+        tuple(sorted((f, _index_key(v)) for f, v in (filters or {}).items() if v is not None)),
+    )
+
+
+def _query_fingerprint(query: tuple) -> str:
+    return hashlib.blake2b(repr(query).encode(), digest_size=6).hexdigest()
+
+
+def encode_cursor(query: tuple, position: int) -> str:
+    """Opaque cursor continuing a query after the given position"""
+    token = f"{_query_fingerprint(query)}:{position}".encode()
+    return base64.urlsafe_b64encode(token).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, query: tuple) -> int:
+    """Position encoded in a cursor; ValueError if malformed or from another query"""
+    try:
+        token = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        fingerprint, position = token.split(":")
+        position = int(position)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+    if fingerprint != _query_fingerprint(query):
+        raise ValueError("Cursor does not belong to this query")
+    return position
+
+
+# Synthetic large-scale inventory
+MAX_SYNTHETIC_SITES = 10000
+MAX_OBJECTS_PER_SITE = 64
+
+
+class SyntheticSite:
+    """One synthesized edge site; its pools and requests live in the inventory's arrays"""
+    __slots__ = ("name", "location", "manager_type", "nodes")
+
+    def __init__(self, name: str, location: int, manager_type: int, nodes: int):
+        self.name = name
+        self.location = location
+        self.manager_type = manager_type
+        self.nodes = nodes
+
+
+class SyntheticInventory:
+    """Deterministic large-scale O-Cloud inventory synthesized from a seed.
+
+    Sites are ``__slots__`` records; resource pools and provisioning requests are
+    positions in compact ``array`` columns (pool ``i`` belongs to site
+    ``i // pools_per_site``). Object ids encode the position in their low 32
+    bits, so lookups by id need no dict, and objects are rendered on demand.
+    Secondary indexes map each filter value to a sorted position array; list
+    queries walk the smallest matching array from the cursor position and
+    check the remaining filters against the columns.
+
+    Provisioning requests are mutable: updated requests are kept as overrides
+    of their row, created ones are appended as new rows and deleted ones are
+    flagged. Listeners are called as for InventoryStore.
+    """
+
+    DEPLOYMENT_MANAGERS = InventoryStore.DEPLOYMENT_MANAGERS
+    RESOURCE_POOLS = InventoryStore.RESOURCE_POOLS
+    PROVISIONING_REQUESTS = InventoryStore.PROVISIONING_REQUESTS
+
+    REGIONS = ("us-east", "us-west", "eu-central", "eu-west", "ap-northeast", "ap-southeast")
+    ZONES = ("a", "b", "c")
+    MANAGER_TYPES = tuple(DeploymentManagerType)
+    MANAGER_WEIGHTS = (70, 10, 5, 15)
+    POOL_TYPES = tuple(ResourcePoolType)
+    POOL_RESOURCES = {
+        ResourcePoolType.COMPUTE: [ResourceType.VIRTUAL_MACHINE, ResourceType.CONTAINER],
+        ResourcePoolType.STORAGE: [ResourceType.STORAGE_VOLUME],
+        ResourcePoolType.NETWORK: [ResourceType.NETWORK_FUNCTION],
+        ResourcePoolType.MIXED: [ResourceType.PHYSICAL_SERVER, ResourceType.CONTAINER],
+    }
+    REQUEST_TEMPLATES = (
+        ("5G-Core", "NETWORK_FUNCTION_DEPLOYMENT", "5G Core Network Functions deployment", 16, 64, 200),
+        ("Edge-Apps", "APPLICATION_DEPLOYMENT", "Edge applications deployment", 8, 32, 100),
+        ("Monitoring", "MONITORING_DEPLOYMENT", "Monitoring stack deployment", 4, 16, 500),
+    )
+    REQUEST_STATUSES = ("COMPLETED", "IN_PROGRESS", "PENDING", "FAILED")
+    STATUS_WEIGHTS = (70, 20, 8, 2)
+
+    # Cached list responses before the cache is reset
+    MAX_CACHED_QUERIES = 1024
+
+    def __init__(self, sites: int, pools_per_site: int = 3, requests_per_site: int = 3, seed: int = 0):
+        """
+        Synthesize the inventory
+
+        Raises ValueError if sites exceeds MAX_SYNTHETIC_SITES or a per-site count
+        exceeds MAX_OBJECTS_PER_SITE.
+        """
+        if not 1 <= sites <= MAX_SYNTHETIC_SITES:
+            raise ValueError(f"Synthetic sites must be between 1 and {MAX_SYNTHETIC_SITES}")
+        for count in (pools_per_site, requests_per_site):
+            if not 0 <= count <= MAX_OBJECTS_PER_SITE:
+                raise ValueError(f"Per-site pool and request counts must be between 0 and {MAX_OBJECTS_PER_SITE}")
+
+        rng = random.Random(seed)
+        self.seed = seed
+        self.pools_per_site = pools_per_site
+        self.requests_per_site = requests_per_site
+        self.base_timestamp = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        self.locations = tuple(f"{region}-{zone}" for region in self.REGIONS for zone in self.ZONES)
+
+        manager_codes = range(len(self.MANAGER_TYPES))
+        self.sites = [
+            SyntheticSite(
+                name=f"edge-{i + 1:05d}",
+                location=rng.randrange(len(self.locations)),
+                manager_type=rng.choices(manager_codes, self.MANAGER_WEIGHTS)[0],
+                nodes=rng.randint(3, 24),
+            )
+            for i in range(sites)
+        ]
+        # The first three pools of a site are compute, storage and network
+        self.pool_types = array("B", (
+            j if j < 3 else rng.randrange(len(self.POOL_TYPES))
+            for _ in range(sites) for j in range(pools_per_site)
+        ))
+        total_requests = sites * requests_per_site
+        status_codes = range(len(self.REQUEST_STATUSES))
+        self.request_status = array("B", rng.choices(status_codes, self.STATUS_WEIGHTS, k=total_requests))
+        self.request_template = array("B", (rng.randrange(len(self.REQUEST_TEMPLATES)) for _ in range(total_requests)))
+        # Minutes between the base timestamp and creation
+        self.request_created = array("I", (rng.randrange(60 * 24 * 90) for _ in range(total_requests)))
+
+        self._deleted = bytearray(total_requests)
+        self._deleted_count = 0
+        self._overrides: Dict[int, InfrastructureProvisioningRequest] = {}
+        # Rows of created requests per site, outside the site's synthesized range
+        self._created_by_site: Dict[int, array] = {}
+        self.listeners: List[Callable[[str, str, str, BaseO2IMSModel, Optional[str]], None]] = []
+
+        self._id_prefix = {collection: self._prefix(collection) for collection in InventoryStore.INDEXED_FIELDS}
+        self._indexes = {
+            collection: {field: self._build_index(collection, field) for field in fields}
+            for collection, fields in InventoryStore.INDEXED_FIELDS.items()
+        }
+        self._list_cache: Dict[tuple, Tuple[bytes, Optional[str]]] = {}
+
+    def _prefix(self, collection: str) -> int:
+        """Upper 96 bits of the collection's ids, with UUID version 4 and variant bits"""
+        digest = hashlib.blake2b(f"{self.seed}:{collection}".encode(), digest_size=16).digest()
+        value = int.from_bytes(digest, "big")
+        value = (value & ~(0xF << 76)) | (0x4 << 76)
+        value = (value & ~(0x3 << 62)) | (0x2 << 62)
+        return value & ~0xFFFFFFFF
+
+    def object_id(self, collection: str, position: int) -> uuid.UUID:
+        """Id of the object at a position"""
+        return uuid.UUID(int=self._id_prefix[collection] | position)
+
+    def position(self, collection: str, object_id: str) -> Optional[int]:
+        """Position of the object with an id, None if it does not exist"""
+        try:
+            value = uuid.UUID(object_id).int
+        except ValueError:
+            return None
+        position = value & 0xFFFFFFFF
+        if value - position != self._id_prefix[collection] or position >= self.count(collection):
+            return None
+        if collection == self.PROVISIONING_REQUESTS and self._deleted[position]:
+            return None
+        return position
+
+    def count(self, collection: str) -> int:
+        """Number of objects in a collection"""
+        if collection == self.RESOURCE_POOLS:
+            return len(self.pool_types)
+        if collection == self.PROVISIONING_REQUESTS:
+            return len(self.request_status)
+        return len(self.sites)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of objects per collection"""
+        counts = {collection: self.count(collection) for collection in InventoryStore.INDEXED_FIELDS}
+        counts[self.PROVISIONING_REQUESTS] -= self._deleted_count
+        return counts
+
+    def _value(self, collection: str, field: str, position: int) -> str:
+        """Normalized value of an indexed field"""
+        if collection == self.DEPLOYMENT_MANAGERS:
+            return self.MANAGER_TYPES[self.sites[position].manager_type].value.lower()
+        if collection == self.RESOURCE_POOLS:
+            if field == "location":
+                return self.locations[self.sites[position // self.pools_per_site].location]
+            return self.POOL_TYPES[self.pool_types[position]].value.lower()
+        return self.REQUEST_STATUSES[self.request_status[position]].lower()
+
+    def _build_index(self, collection: str, field: str) -> Dict[str, array]:
+        index: Dict[str, array] = {}
+        for position in range(self.count(collection)):
+            index.setdefault(self._value(collection, field, position), array("I")).append(position)
+        return index
+
+    def select(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        scope: Optional[str] = None,
+        after: int = -1,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Positions matching all filters, ascending, starting after a position
+
+        Unknown filter fields match nothing, like a missing attribute.
+        """
+        candidates: List[Sequence[int]] = [range(self.count(collection))]
+        if scope is not None:
+            site = self.position(self.DEPLOYMENT_MANAGERS, scope)
+            if site is None:
+                return []
+            per_site = self.pools_per_site if collection == self.RESOURCE_POOLS else self.requests_per_site
+            candidates[0] = range(site * per_site, (site + 1) * per_site)
+            created = self._created_by_site.get(site) if collection == self.PROVISIONING_REQUESTS else None
+            if created:
+                candidates[0] = list(candidates[0]) + list(created)
+        in_scope = candidates[0]
+        deleted = self._deleted if collection == self.PROVISIONING_REQUESTS else None
+        checks = []
+        for field, value in (filters or {}).items():
+            if value is None:
+                continue
+            index = self._indexes[collection].get(field)
+            if index is None:
+                return []
+            key = _index_key(value)
+            candidates.append(index.get(key, ()))
+            checks.append((field, key))
+
+        driving = min(candidates, key=len)
+        matches = []
+        for i in range(bisect_right(driving, after), len(driving)):
+            position = driving[i]
+            if position not in in_scope or (deleted is not None and deleted[position]):
+                continue
+            if all(self._value(collection, field, position) == key for field, key in checks):
+                if skip:
+                    skip -= 1
+                    continue
+                matches.append(position)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+
+    def page(
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        scope: Optional[str] = None,
+    ) -> Tuple[bytes, Optional[str]]:
+        """Serialized JSON page and next cursor, as InventoryStore.page"""
+        query = query_key(collection, filters, scope)
+        key = (query, limit, offset, cursor)
+        cached = self._list_cache.get(key)
+        if cached is None:
+            if cursor is not None:
+                after, skip = decode_cursor(cursor, query), 0
+            else:
+                after, skip = -1, offset
+            # One extra match tells whether there is a next page
+            positions = self.select(collection, filters, scope, after, skip, limit + 1)
+            next_cursor = encode_cursor(query, positions[limit - 1]) if len(positions) > limit else None
+            body = b"[" + b",".join(self._render(collection, p) for p in positions[:limit]) + b"]"
+            cached = (body, next_cursor)
+            if len(self._list_cache) >= self.MAX_CACHED_QUERIES:
+                self._list_cache.clear()
+            self._list_cache[key] = cached
+        return cached
+
+    def ids(self, collection: str, filters: Optional[Dict[str, Any]] = None, scope: Optional[str] = None) -> List[str]:
+        """Ids of all matching objects"""
+        return [str(self.object_id(collection, position)) for position in self.select(collection, filters, scope)]
+
+    def next_id(self, collection: str) -> str:
+        """Id for a new object (the next row)"""
+        if collection != self.PROVISIONING_REQUESTS:
+            raise ValueError("Synthetic inventory only creates provisioning requests")
+        return str(self.object_id(collection, len(self.request_status)))
+
+    def put(self, collection: str, object_id: str, obj: BaseO2IMSModel, scope: Optional[str] = None) -> None:
+        """Update a provisioning request, or append a new one with an id from next_id"""
+        if collection != self.PROVISIONING_REQUESTS:
+            raise ValueError("Synthetic inventory only updates provisioning requests")
+        status = self.REQUEST_STATUSES.index(obj.request_status)
+        index = self._indexes[collection]["request_status"]
+        position = self.position(collection, object_id)
+        added = position is None
+        if added:
+            if object_id != self.next_id(collection):
+                raise ValueError(f"Unknown provisioning request {object_id}")
+            site = self.position(self.DEPLOYMENT_MANAGERS, scope) if scope is not None else None
+            if site is None:
+                raise ValueError("New provisioning requests need their deployment manager as scope")
+            position = len(self.request_status)
+            self.request_status.append(status)
+            self.request_template.append(0)
+            self.request_created.append(0)
+            self._deleted.append(0)
+            self._created_by_site.setdefault(site, array("I")).append(position)
+            index.setdefault(self.REQUEST_STATUSES[status].lower(), array("I")).append(position)
+        elif status != self.request_status[position]:
+            index[self.REQUEST_STATUSES[self.request_status[position]].lower()].remove(position)
+            insort(index.setdefault(self.REQUEST_STATUSES[status].lower(), array("I")), position)
+            self.request_status[position] = status
+        self._overrides[position] = obj
+        self._list_cache.clear()
+        notify(self.listeners, "ADDED" if added else "MODIFIED", collection, object_id, obj, scope)
+
+    def delete(self, collection: str, object_id: str) -> bool:
+        """Remove a provisioning request; returns whether it existed"""
+        position = self.position(collection, object_id) if collection == self.PROVISIONING_REQUESTS else None
+        if position is None:
+            return False
+        obj = self._build(collection, position)
+        self._indexes[collection]["request_status"][self.REQUEST_STATUSES[self.request_status[position]].lower()].remove(position)
+        self._deleted[position] = 1
+        self._deleted_count += 1
+        self._overrides.pop(position, None)
+        self._list_cache.clear()
+        scope = (obj.extensions or {}).get("deployment_manager_id")
+        notify(self.listeners, "DELETED", collection, object_id, obj, scope)
+        return True
+
+    def get(self, collection: str, object_id: str) -> Optional[BaseO2IMSModel]:
+        """Object by id"""
+        position = self.position(collection, object_id)
+        return None if position is None else self._build(collection, position)
+
+    def get_json(self, collection: str, object_id: str) -> Optional[bytes]:
+        """Serialized object by id"""
+        position = self.position(collection, object_id)
+        return None if position is None else self._render(collection, position)
+
+    def _render(self, collection: str, position: int) -> bytes:
+        return self._build(collection, position).model_dump_json(by_alias=True).encode()
+
+    def _build(self, collection: str, position: int) -> BaseO2IMSModel:
+        if collection == self.RESOURCE_POOLS:
+            return self._pool(position)
+        if collection == self.PROVISIONING_REQUESTS:
+            override = self._overrides.get(position)
+            return override if override is not None else self._request(position)
+        return self._manager(position)
+
+    def _manager(self, position: int) -> DeploymentManagerInfo:
+        site = self.sites[position]
+        manager_type = self.MANAGER_TYPES[site.manager_type]
+        location = self.locations[site.location]
+        return DeploymentManagerInfo(
+            deployment_manager_id=self.object_id(self.DEPLOYMENT_MANAGERS, position),
+            name=f"{manager_type.value.title()}-{site.name.upper()}",
+            description=f"{manager_type.value.title()} deployment manager for {site.name.upper()} edge site",
+            deployment_manager_type=manager_type,
+            service_uri=f"https://{site.name}.{location}.o-cloud.local:6443",
+            capacity={
+                "total_nodes": site.nodes,
+                "total_cpu_cores": 32 * site.nodes,
+                "total_memory_gb": 128 * site.nodes,
+                "total_storage_gb": 1000 * site.nodes,
+            },
+            extensions={"edge_site": site.name, "location": location},
+        )
+
+    def _pool(self, position: int) -> ResourcePoolInfo:
+        site_index = position // self.pools_per_site
+        site = self.sites[site_index]
+        pool_type = self.POOL_TYPES[self.pool_types[position]]
+        return ResourcePoolInfo(
+            resource_pool_id=self.object_id(self.RESOURCE_POOLS, position),
+            name=f"{site.name.upper()}-{pool_type.value}-{position % self.pools_per_site}",
+            description=f"{pool_type.value.title()} resource pool for {site.name.upper()} edge site",
+            location=self.locations[site.location],
+            resource_type_list=self.POOL_RESOURCES[pool_type],
+            resource_pool_type=pool_type,
+            global_location_id=f"global-location-{site.name}",
+            extensions={
+                "edge_site": site.name,
+                "deployment_manager_id": str(self.object_id(self.DEPLOYMENT_MANAGERS, site_index)),
+                "total_nodes": site.nodes,
+            },
+        )
+
+    def _request(self, position: int) -> InfrastructureProvisioningRequest:
+        site_index = position // self.requests_per_site
+        site = self.sites[site_index]
+        prefix, request_type, description, cpu, memory, storage = self.REQUEST_TEMPLATES[self.request_template[position]]
+        status = self.REQUEST_STATUSES[self.request_status[position]]
+        requested = {"cpu_cores": cpu, "memory_gb": memory, "storage_gb": storage}
+        if status == "COMPLETED":
+            allocated = dict(requested)
+        elif status == "IN_PROGRESS":
+            allocated = {name: value // 2 for name, value in requested.items()}
+        else:
+            allocated = None
+        created_at = self.base_timestamp + timedelta(minutes=self.request_created[position])
+        return InfrastructureProvisioningRequest(
+            infrastructure_request_id=self.object_id(self.PROVISIONING_REQUESTS, position),
+            name=f"{prefix}-{site.name.upper()}-{position % self.requests_per_site}",
+            description=f"{description} for {site.name.upper()}",
+            request_type=request_type,
+            request_status=status,
+            created_at=created_at,
+            updated_at=created_at + timedelta(minutes=30),
+            requested_capacity=requested,
+            allocated_capacity=allocated,
+            extensions={
+                "deployment_manager_id": str(self.object_id(self.DEPLOYMENT_MANAGERS, site_index)),
+                "edge_site": site.name,
+                "priority": "high" if request_type == "NETWORK_FUNCTION_DEPLOYMENT" else "medium",
+            },
+        )
+
+
+def create_inventory(generator: MockDataGenerator):
+    """
+    Inventory selected by the environment
+
+    O2IMS_SYNTHETIC_SITES > 0 selects a SyntheticInventory with
+    O2IMS_SYNTHETIC_POOLS_PER_SITE, O2IMS_SYNTHETIC_REQUESTS_PER_SITE and
+    O2IMS_SYNTHETIC_SEED; otherwise the four edge sites of the generator are used.
+    """
+    sites = int(os.environ.get("O2IMS_SYNTHETIC_SITES", "0"))
+    if sites <= 0:
+        return InventoryStore.from_generator(generator)
+    inventory = SyntheticInventory(
+        sites,
+        pools_per_site=int(os.environ.get("O2IMS_SYNTHETIC_POOLS_PER_SITE", "3")),
+        requests_per_site=int(os.environ.get("O2IMS_SYNTHETIC_REQUESTS_PER_SITE", "3")),
+        seed=int(os.environ.get("O2IMS_SYNTHETIC_SEED", "0")),
+    )
+    logger.info(f"Synthesized inventory: {inventory.counts()}")
+    return inventory
+
+
+# Change events and alarms
+class EventLog:
+    """Change events numbered with resourceVersion-style sequence numbers.
+
+    Every change gets the next version and is kept, rendered once as an SSE
+    frame, in a bounded history shared by all watchers. A watch resumes after
+    any version still in the history; older versions are expired (410 Gone,
+    as in a Kubernetes watch). Changes happen on the event loop, so watchers
+    are woken by setting an asyncio.Event.
+    """
+
+    ALARMS = "alarms"
+
+    def __init__(self, capacity: int = 10000):
+        self.version = 0
+        # (version, collection, scope, frame); versions are contiguous
+        self._events: deque = deque(maxlen=capacity)
+        self._changed = asyncio.Event()
+
+    def record(self, event_type: str, collection: str, object_id: str, obj: BaseO2IMSModel, scope: Optional[str] = None) -> int:
+        """Append a change event; returns its version"""
+        self.version += 1
+        data = b'{"type":"%s","resourceVersion":%d,"collection":"%s","object":%s}' % (
+            event_type.encode(), self.version, collection.encode(), obj.model_dump_json(by_alias=True).encode()
+        )
+        frame = b"id: %d\nevent: %s\ndata: %s\n\n" % (self.version, event_type.encode(), data)
+        self._events.append((self.version, collection, scope, frame))
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+        return self.version
+
+    def expired(self, version: int) -> bool:
+        """Whether events after version are no longer all in the history"""
+        oldest = self._events[0][0] if self._events else self.version + 1
+        return version < oldest - 1
+
+    def since(self, version: int) -> List[tuple]:
+        """Events after version, oldest first (version must not be expired)"""
+        count = min(self.version - version, len(self._events))
+        first = len(self._events) - count
+        return [self._events[i] for i in range(first, len(self._events))]
+
+    async def watch(
+        self,
+        version: Optional[int],
+        collections: Optional[Sequence[str]] = None,
+        scope: Optional[str] = None,
+        heartbeat: float = 15.0,
+    ) -> AsyncIterator[bytes]:
+        """SSE frames of matching events after version (None: from now), with keepalive comments"""
+        version = self.version if version is None else version
+        while True:
+            changed = self._changed
+            if self.expired(version):
+                yield (
+                    b'event: ERROR\ndata: {"type":"ERROR","object":{"code":410,"reason":"Expired",'
+                    b'"message":"resourceVersion %d is too old, list again"}}\n\n' % version
+                )
+                return
+            events = self.since(version)
+            for event_version, collection, event_scope, frame in events:
+                if (collections is None or collection in collections) and (scope is None or event_scope == scope):
+                    yield frame
+            if events:
+                version = events[-1][0]
+                continue
+            try:
+                await asyncio.wait_for(changed.wait(), heartbeat)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+
+
+class AlarmStore:
+    """Recent alarm event records, reported to listeners as they are raised"""
+
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self.alarms: Dict[str, AlarmEventRecord] = {}
+        self.listeners: List[Callable[[str, str, str, BaseO2IMSModel, Optional[str]], None]] = []
+
+    def raise_alarm(
+        self,
+        resource_id: str,
+        resource_type_id: str,
+        alarm_type: AlarmType,
+        probable_cause_id: str,
+        severity: AlarmSeverity,
+        scope: Optional[str] = None,
+        extensions: Optional[Dict[str, Any]] = None,
+    ) -> AlarmEventRecord:
+        """Record a new alarm, dropping the oldest one beyond capacity"""
+        alarm = AlarmEventRecord(
+            alarm_event_record_id=uuid.uuid4(),
+            resource_id=resource_id,
+            resource_type_id=resource_type_id,
+            alarm_type=alarm_type,
+            probable_cause_id=probable_cause_id,
+            alarm_raised_time=datetime.now(timezone.utc),
+            perceived_severity=severity,
+            extensions=extensions or {},
+        )
+        alarm_id = str(alarm.alarm_event_record_id)
+        self.alarms[alarm_id] = alarm
+        if len(self.alarms) > self.capacity:
+            del self.alarms[next(iter(self.alarms))]
+        notify(self.listeners, "ADDED", EventLog.ALARMS, alarm_id, alarm, scope)
+        return alarm
+
+    def list_json(self, limit: int = 100, offset: int = 0) -> bytes:
+        """Serialized JSON array of a page of alarms, oldest first"""
+        page = list(self.alarms.values())[offset:offset + limit]
+        return b"[" + b",".join(alarm.model_dump_json(by_alias=True).encode() for alarm in page) + b"]"
+
+
+# Provisioning request lifecycle
+class LatencyDistribution:
+    """Duration in seconds: fixed:S, uniform:A,B, normal:MEAN,STDDEV, exponential:MEAN,
+    lognormal:MEDIAN,SIGMA or pareto:SCALE,ALPHA (long tail, SCALE is the minimum)"""
+
+    PARAMETERS = {"fixed": 1, "uniform": 2, "normal": 2, "exponential": 1, "lognormal": 2, "pareto": 2}
+
+    def __init__(self, spec: str):
+        kind, _, params = spec.partition(":")
+        try:
+            values = [float(value) for value in params.split(",")] if params else []
+        except ValueError:
+            values = []
+        if (
+            self.PARAMETERS.get(kind) != len(values)
+            or any(value < 0 for value in values)
+            or (kind == "pareto" and values[1] == 0)
+        ):
+            raise ValueError(
+                f"Invalid latency distribution '{spec}' (expected fixed:S, uniform:A,B, normal:MEAN,STDDEV, "
+                "exponential:MEAN, lognormal:MEDIAN,SIGMA or pareto:SCALE,ALPHA)"
+            )
+        self.spec = spec
+        self.kind = kind
+        self.params = values
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one duration"""
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "normal":
+            return max(0.0, rng.gauss(*self.params))
+        if self.kind == "exponential":
+            return rng.expovariate(1 / self.params[0]) if self.params[0] else 0.0
+        if self.kind == "pareto":
+            scale, alpha = self.params
+            return scale * rng.paretovariate(alpha)
+        median, sigma = self.params
+        return rng.lognormvariate(math.log(median), sigma) if median else 0.0
+
+
+class ProvisioningSimulator:
+    """Moves provisioning requests through PENDING -> IN_PROGRESS -> COMPLETED/FAILED.
+
+    Transitions are kept on a heap, each due after a latency drawn from the
+    queue (PENDING) or provisioning (IN_PROGRESS) distribution. Starting to
+    provision reserves the requested capacity from the deployment manager's
+    site pools; requests that do not fit fail with InsufficientCapacity, and
+    failed or deleted requests release what they hold. Failures raise an
+    alarm. advance() applies all due transitions and is driven by a
+    background task of the app.
+    """
+
+    PROVISIONING_REQUESTS = InventoryStore.PROVISIONING_REQUESTS
+
+    # Accounted request capacity keys and the deployment manager totals they draw on
+    CAPACITY_KEYS = {
+        "cpu_cores": "total_cpu_cores",
+        "memory_gb": "total_memory_gb",
+        "storage_gb": "total_storage_gb",
+    }
+
+    def __init__(
+        self,
+        inventory,
+        queue_latency: LatencyDistribution,
+        provision_latency: LatencyDistribution,
+        failure_rate: float = 0.05,
+        seed: int = 0,
+        clock=time.monotonic,
+        alarms: Optional[AlarmStore] = None,
+    ):
+        if not 0 <= failure_rate <= 1:
+            raise ValueError("Failure rate must be between 0 and 1")
+        self.inventory = inventory
+        self.queue_latency = queue_latency
+        self.provision_latency = provision_latency
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.clock = clock
+        self.alarms = alarms
+        self.transitions = 0
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._sequence = 0
+        # Deployment manager id -> {"total": {...}, "allocated": {...}}, built on first use
+        self._capacity: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    def adopt(self) -> int:
+        """Schedule the inventory's PENDING and IN_PROGRESS requests; returns how many"""
+        now = self.clock()
+        adopted = 0
+        for status, latency in (
+            (ProvisioningRequestStatus.PENDING, self.queue_latency),
+            (ProvisioningRequestStatus.IN_PROGRESS, self.provision_latency),
+        ):
+            for request_id in self.inventory.ids(self.PROVISIONING_REQUESTS, {"request_status": status}):
+                self._schedule_at(now + latency.sample(self.rng), request_id)
+                adopted += 1
+        return adopted
+
+    def _schedule_at(self, due: float, request_id: str) -> None:
+        self._sequence += 1
+        heapq.heappush(self._schedule, (due, self._sequence, request_id))
+
+    def create(self, dm_id: str, spec: ProvisioningRequestCreate) -> InfrastructureProvisioningRequest:
+        """Add a PENDING request for a deployment manager"""
+        request_id = self.inventory.next_id(self.PROVISIONING_REQUESTS)
+        now = datetime.now(timezone.utc)
+        request = InfrastructureProvisioningRequest(
+            infrastructure_request_id=request_id,
+            name=spec.name,
+            description=spec.description,
+            request_type=spec.request_type,
+            request_status=ProvisioningRequestStatus.PENDING.value,
+            created_at=now,
+            updated_at=now,
+            requested_capacity=spec.requested_capacity,
+            allocated_capacity=None,
+            extensions={**(spec.extensions or {}), "deployment_manager_id": dm_id},
+        )
+        self.inventory.put(self.PROVISIONING_REQUESTS, request_id, request, scope=dm_id)
+        self._schedule_at(self.clock() + self.queue_latency.sample(self.rng), request_id)
+        return request
+
+    def delete(self, request_id: str) -> bool:
+        """Remove a request, releasing its capacity; returns whether it existed"""
+        request = self.inventory.get(self.PROVISIONING_REQUESTS, request_id)
+        if request is None:
+            return False
+        self._allocate(request, None)
+        # Its heap entry is skipped once due
+        return self.inventory.delete(self.PROVISIONING_REQUESTS, request_id)
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """Apply all transitions due by now; returns how many were applied"""
+        now = self.clock() if now is None else now
+        applied = 0
+        while self._schedule and self._schedule[0][0] <= now:
+            _, _, request_id = heapq.heappop(self._schedule)
+            if self._transition(request_id, now):
+                applied += 1
+        self.transitions += applied
+        return applied
+
+    async def run(self, interval: float) -> None:
+        """Advance the lifecycle every interval seconds"""
+        while True:
+            self.advance()
+            await asyncio.sleep(interval)
+
+    def _transition(self, request_id: str, now: float) -> bool:
+        request = self.inventory.get(self.PROVISIONING_REQUESTS, request_id)
+        if request is None:
+            return False
+        if request.request_status == ProvisioningRequestStatus.PENDING:
+            if not self._fits(request):
+                self._update(request, ProvisioningRequestStatus.FAILED, None, "InsufficientCapacity")
+                return True
+            self._update(request, ProvisioningRequestStatus.IN_PROGRESS, dict(request.requested_capacity))
+            self._schedule_at(now + self.provision_latency.sample(self.rng), request_id)
+            return True
+        if request.request_status == ProvisioningRequestStatus.IN_PROGRESS:
+            # Adopted requests may hold only part of their capacity so far
+            if not self._fits(request):
+                self._update(request, ProvisioningRequestStatus.FAILED, None, "InsufficientCapacity")
+            elif self.rng.random() < self.failure_rate:
+                self._update(request, ProvisioningRequestStatus.FAILED, None, "ProvisioningFailed")
+            else:
+                self._update(request, ProvisioningRequestStatus.COMPLETED, dict(request.requested_capacity))
+            return True
+        return False
+
+    def _update(
+        self,
+        request: InfrastructureProvisioningRequest,
+        status: ProvisioningRequestStatus,
+        allocated: Optional[Dict[str, Any]],
+        failure_reason: Optional[str] = None,
+    ) -> None:
+        self._allocate(request, allocated)
+        extensions = dict(request.extensions or {})
+        if failure_reason:
+            extensions["failure_reason"] = failure_reason
+        updated = request.model_copy(update={
+            "request_status": status.value,
+            "allocated_capacity": allocated,
+            "updated_at": datetime.now(timezone.utc),
+            "extensions": extensions,
+        })
+        self.inventory.put(
+            self.PROVISIONING_REQUESTS,
+            str(request.infrastructure_request_id),
+            updated,
+            scope=self._manager_of(request),
+        )
+        if failure_reason and self.alarms is not None:
+            self.alarms.raise_alarm(
+                str(request.infrastructure_request_id),
+                "provisioningRequest",
+                AlarmType.PROCESSING_ERROR_ALARM,
+                failure_reason,
+                AlarmSeverity.MAJOR,
+                scope=self._manager_of(request),
+                extensions={"deployment_manager_id": self._manager_of(request), "request_name": request.name},
+            )
+
+    @staticmethod
+    def _manager_of(request: InfrastructureProvisioningRequest) -> str:
+        return (request.extensions or {}).get("deployment_manager_id", "")
+
+    def _site_capacity(self, dm_id: str) -> Dict[str, Dict[str, float]]:
+        """Capacity totals of a deployment manager and what its requests hold"""
+        state = self._capacity.get(dm_id)
+        if state is None:
+            manager = self.inventory.get(InventoryStore.DEPLOYMENT_MANAGERS, dm_id)
+            totals = manager.capacity if manager is not None else {}
+            allocated = dict.fromkeys(self.CAPACITY_KEYS, 0.0)
+            for request_id in self.inventory.ids(self.PROVISIONING_REQUESTS, scope=dm_id):
+                held = self.inventory.get(self.PROVISIONING_REQUESTS, request_id).allocated_capacity or {}
+                for key in self.CAPACITY_KEYS:
+                    allocated[key] += float(held.get(key, 0))
+            state = self._capacity[dm_id] = {
+                "total": {key: float(totals.get(total, 0)) for key, total in self.CAPACITY_KEYS.items()},
+                "allocated": allocated,
+            }
+        return state
+
+    def _fits(self, request: InfrastructureProvisioningRequest) -> bool:
+        state = self._site_capacity(self._manager_of(request))
+        held = request.allocated_capacity or {}
+        return all(
+            state["allocated"][key] + float(request.requested_capacity.get(key, 0)) - float(held.get(key, 0))
+            <= state["total"][key]
+            for key in self.CAPACITY_KEYS
+        )
+
+    def _allocate(self, request: InfrastructureProvisioningRequest, allocated: Optional[Dict[str, Any]]) -> None:
+        """Account a change of the request's allocation (call before storing it)"""
+        state = self._site_capacity(self._manager_of(request))
+        held = request.allocated_capacity or {}
+        for key in self.CAPACITY_KEYS:
+            state["allocated"][key] += float((allocated or {}).get(key, 0)) - float(held.get(key, 0))
+
+    def capacity(self, dm_id: str) -> Dict[str, Dict[str, float]]:
+        """Total, allocated and available capacity of a deployment manager"""
+        state = self._site_capacity(dm_id)
+        available = {key: state["total"][key] - state["allocated"][key] for key in self.CAPACITY_KEYS}
+        return {"total": dict(state["total"]), "allocated": dict(state["allocated"]), "available": available}
+
+    def stats(self) -> Dict[str, int]:
+        """Scheduled and applied transitions"""
+        return {"scheduled": len(self._schedule), "transitions": self.transitions}
+
+
+def create_simulator(inventory, alarms: Optional[AlarmStore] = None) -> ProvisioningSimulator:
+    """
+    Lifecycle simulator configured by the environment
+
+    O2IMS_QUEUE_LATENCY and O2IMS_PROVISION_LATENCY are latency distributions of
+    the PENDING and IN_PROGRESS phases, O2IMS_FAILURE_RATE the share of failed
+    provisioning and O2IMS_LIFECYCLE_SEED the seed of all draws.
+    """
+    simulator = ProvisioningSimulator(
+        inventory,
+        LatencyDistribution(os.environ.get("O2IMS_QUEUE_LATENCY", "exponential:2")),
+        LatencyDistribution(os.environ.get("O2IMS_PROVISION_LATENCY", "lognormal:10,0.5")),
+        failure_rate=float(os.environ.get("O2IMS_FAILURE_RATE", "0.05")),
+        seed=int(os.environ.get("O2IMS_LIFECYCLE_SEED", "0")),
+        alarms=alarms,
+    )
+    simulator.adopt()
+    return simulator
+
+
+# Latency and fault injection
+class FaultRule:
+    """Latency and faults injected into requests matching a path glob and methods"""
+
+    FIELDS = ("path", "methods", "latency", "latency_cap", "error_rate", "error_status", "reset_rate", "bandwidth_kbps")
+
+    def __init__(
+        self,
+        path: str = "*",
+        methods: Optional[List[str]] = None,
+        latency: Optional[str] = None,
+        latency_cap: float = 30.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        reset_rate: float = 0.0,
+        bandwidth_kbps: Optional[float] = None,
+    ):
+        if not isinstance(path, str):
+            raise ValueError("path must be a string")
+        if methods is not None and not (
+            isinstance(methods, list) and all(isinstance(method, str) for method in methods)
+        ):
+            raise ValueError("methods must be a list of HTTP methods")
+        if latency is not None and not isinstance(latency, str):
+            raise ValueError("latency must be a distribution such as exponential:0.1")
+        numbers = {"latency_cap": latency_cap, "error_rate": error_rate, "reset_rate": reset_rate}
+        if bandwidth_kbps is not None:
+            numbers["bandwidth_kbps"] = bandwidth_kbps
+        for name, value in numbers.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"{name} must be a number")
+        if isinstance(error_status, bool) or not isinstance(error_status, int):
+            raise ValueError("error_status must be an integer")
+        if not latency_cap >= 0:
+            raise ValueError("latency_cap must not be negative")
+        for name, rate in (("error_rate", error_rate), ("reset_rate", reset_rate)):
+            if not 0 <= rate <= 1:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if not 400 <= error_status <= 599:
+            raise ValueError("error_status must be a 4xx or 5xx status")
+        if bandwidth_kbps is not None and bandwidth_kbps <= 0:
+            raise ValueError("bandwidth_kbps must be positive")
+        self.path = path
+        self.methods = [method.upper() for method in methods] if methods else None
+        self.latency = LatencyDistribution(latency) if latency else None
+        self.latency_cap = latency_cap
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.reset_rate = reset_rate
+        self.bandwidth_kbps = bandwidth_kbps
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FaultRule":
+        """Rule from a profile entry; raises ValueError for unknown or invalid fields"""
+        if not isinstance(data, dict):
+            raise ValueError("Fault rules must be mappings")
+        unknown = set(data) - set(cls.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown fault rule fields: {', '.join(sorted(unknown))}")
+        try:
+            return cls(**data)
+        except TypeError as exc:
+            raise ValueError(str(exc))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "methods": self.methods,
+            "latency": self.latency.spec if self.latency else None,
+            "latency_cap": self.latency_cap,
+            "error_rate": self.error_rate,
+            "error_status": self.error_status,
+            "reset_rate": self.reset_rate,
+            "bandwidth_kbps": self.bandwidth_kbps,
+        }
+
+    def matches(self, method: str, path: str) -> bool:
+        return (self.methods is None or method in self.methods) and fnmatch(path, self.path)
+
+
+class FaultDecision:
+    """What to inject into one request"""
+    __slots__ = ("delay", "error_status", "reset", "bandwidth_kbps")
+
+    def __init__(self, delay: float, error_status: Optional[int], reset: bool, bandwidth_kbps: Optional[float]):
+        self.delay = delay
+        self.error_status = error_status
+        self.reset = reset
+        self.bandwidth_kbps = bandwidth_kbps
+
+
+class FaultProfile:
+    """Per-endpoint latency and fault injection, loaded from a YAML profile.
+
+    The first rule matching a request's method and path applies, else the
+    default rule. All draws come from one generator seeded by the profile,
+    so a sequential test run sees the same latencies and faults every time.
+
+    Example profile::
+
+        seed: 42
+        default:
+          latency: normal:0.02,0.005
+        rules:
+          - path: /o2ims_infrastructureInventory/v1/resourcePools*
+            methods: [GET]
+            latency: pareto:0.05,1.5
+            latency_cap: 5
+            error_rate: 0.05
+            error_status: 503
+          - path: "*/o2ims_infrastructureProvisioningRequest*"
+            reset_rate: 0.01
+            bandwidth_kbps: 64
+    """
+
+    # Never slowed down or failed, so the mock stays observable and controllable
+    EXEMPT_PREFIXES = ("/health", "/admin/", "/docs", "/redoc", "/openapi.json")
+
+    def __init__(self, rules: Optional[List[FaultRule]] = None, default: Optional[FaultRule] = None, seed: int = 0):
+        self.rules = rules or []
+        self.default = default or FaultRule()
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.injected = {"delayed": 0, "errors": 0, "resets": 0, "throttled": 0}
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "FaultProfile":
+        """Profile from parsed YAML/JSON; raises ValueError if invalid"""
+        data = data or {}
+        if not isinstance(data, dict):
+            raise ValueError("A fault profile must be a mapping")
+        unknown = set(data) - {"seed", "default", "rules"}
+        if unknown:
+            raise ValueError(f"Unknown fault profile fields: {', '.join(sorted(unknown))}")
+        rules = data.get("rules") or []
+        if not isinstance(rules, list):
+            raise ValueError("rules must be a list")
+        seed = data.get("seed", 0)
+        if not isinstance(seed, int):
+            raise ValueError("seed must be an integer")
+        return cls(
+            [FaultRule.from_dict(rule) for rule in rules],
+            FaultRule.from_dict(data["default"]) if data.get("default") else None,
+            seed,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "FaultProfile":
+        """Profile from a YAML file"""
+        with open(path) as profile_file:
+            return cls.from_dict(yaml.safe_load(profile_file))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seed": self.seed,
+            "default": self.default.to_dict(),
+            "rules": [rule.to_dict() for rule in self.rules],
+            "injected": dict(self.injected),
+        }
+
+    def decide(self, method: str, path: str) -> Optional[FaultDecision]:
+        """Faults for a request, None if nothing is injected"""
+        if path.startswith(self.EXEMPT_PREFIXES):
+            return None
+        rule = next((rule for rule in self.rules if rule.matches(method, path)), self.default)
+        delay = min(rule.latency.sample(self.rng), rule.latency_cap) if rule.latency else 0.0
+        error_status = rule.error_status if rule.error_rate and self.rng.random() < rule.error_rate else None
+        reset = bool(rule.reset_rate) and error_status is None and self.rng.random() < rule.reset_rate
+        if not (delay or error_status or reset or rule.bandwidth_kbps):
+            return None
+        self.injected["delayed"] += delay > 0
+        self.injected["errors"] += error_status is not None
+        self.injected["resets"] += reset
+        # Errors and resets replace the body, so only the rest is throttled
+        self.injected["throttled"] += rule.bandwidth_kbps is not None and error_status is None and not reset
+        return FaultDecision(delay, error_status, reset, rule.bandwidth_kbps)
+
+
+def create_fault_profile() -> FaultProfile:
+    """Profile from the YAML file in O2IMS_FAULT_PROFILE (none: no injection)"""
+    path = os.environ.get("O2IMS_FAULT_PROFILE")
+    if not path:
+        return FaultProfile()
+    profile = FaultProfile.load(path)
+    logger.info(f"Loaded fault profile {path} with {len(profile.rules)} rules (seed {profile.seed})")
+    return profile
+
+
+class InjectedReset(Exception):
+    """Raised mid-response so the server drops the connection"""
+
+
+async def throttle(body: AsyncIterator[bytes], bandwidth_kbps: float, interval: float = 0.05) -> AsyncIterator[bytes]:
+    """Re-chunk a response body to at most bandwidth_kbps"""
+    chunk_size = max(1, int(bandwidth_kbps * 1000 / 8 * interval))
+    async for data in body:
+        for start in range(0, len(data), chunk_size):
+            chunk = data[start:start + chunk_size]
+            await asyncio.sleep(len(chunk) * 8 / (bandwidth_kbps * 1000))
+            yield chunk
+
+
+async def reset_midway(body: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Send half of the first body chunk, then fail the response"""
+    async for data in body:
+        yield data[:len(data) // 2]
+        break
+    raise InjectedReset("Injected connection reset")
+
+
+def json_response(body: bytes, status_code: int = 200) -> Response:
+    """Response for pre-serialized JSON"""
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def page_response(
+    request: Request,
+    collection: str,
+    filters: Dict[str, Any],
+    limit: int,
+    offset: int,
+    cursor: Optional[str],
+    scope: Optional[str] = None,
+) -> Response:
+    """List response with the next page in the X-Next-Cursor and Link headers"""
+    try:
+        body, next_cursor = inventory.page(collection, filters, limit, offset, cursor, scope)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    response = json_response(body)
+    response.headers["X-Resource-Version"] = str(events.version)
+    if next_cursor:
+        next_url = request.url.remove_query_params("offset").include_query_params(cursor=next_cursor)
+        response.headers["X-Next-Cursor"] = next_cursor
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return response
+
+
+# Initialize mock data generator and the inventory built from it
 mock_data = MockDataGenerator()
+inventory = create_inventory(mock_data)
+events = EventLog(int(os.environ.get("O2IMS_WATCH_HISTORY", "10000")))
+alarms = AlarmStore()
+inventory.listeners.append(events.record)
+alarms.listeners.append(events.record)
+simulator = create_simulator(inventory, alarms)
+faults = create_fault_profile()
+status_json = mock_data.generate_status().model_dump_json(by_alias=True).encode()
+
+# Seconds between lifecycle scheduler runs
+LIFECYCLE_INTERVAL = float(os.environ.get("O2IMS_LIFECYCLE_INTERVAL", "0.1"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the provisioning lifecycle scheduler while the app serves"""
+    task = asyncio.create_task(simulator.run(LIFECYCLE_INTERVAL))
+    yield
+    task.cancel()
+
 
 # FastAPI app initialization
 app = FastAPI(
@@ -437,7 +1789,8 @@ app = FastAPI(
     description="Mock implementation of O-RAN O2IMS Interface Specification 3.0",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -453,22 +1806,43 @@ app.add_middleware(
 # Middleware for request logging
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Log all incoming requests"""
-    start_time = datetime.now()
-
-    # Log request details
-    logger.info(f"Request: {request.method} {request.url}")
-    logger.info(f"Headers: {dict(request.headers)}")
-
-    if request.query_params:
-        logger.info(f"Query Parameters: {dict(request.query_params)}")
-
-    # Process request
-    response = await call_next(request)
-
-    # Log response details
-    duration = (datetime.now() - start_time).total_seconds()
-    logger.info(f"Response: {response.status_code} - Duration: {duration:.3f}s")
+    """Log all incoming requests, injecting latency and faults of the fault profile"""
+    start_time = time.perf_counter()
+
+    # Headers only at debug level; formatting them per request is costly under load
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Request: {request.method} {request.url} Headers: {dict(request.headers)}")
+
+    fault = faults.decide(request.method, request.url.path)
+    if fault is not None and fault.delay:
+        await asyncio.sleep(fault.delay)
+
+    if fault is not None and fault.error_status is not None:
+        response = JSONResponse(
+            status_code=fault.error_status,
+            content={
+                "error": {
+                    "status": fault.error_status,
+                    "title": "Injected fault",
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "path": str(request.url)
+                }
+            }
+        )
+    else:
+        # Process request
+        response = await call_next(request)
+        if fault is not None and fault.reset:
+            response.body_iterator = reset_midway(response.body_iterator)
+        elif fault is not None and fault.bandwidth_kbps:
+            response.body_iterator = throttle(response.body_iterator, fault.bandwidth_kbps)
+
+    # One line per request
+    duration = time.perf_counter() - start_time
+    injected = ""
+    if fault is not None:
+        injected = f" - Injected: delay={fault.delay:.3f}s status={fault.error_status} reset={fault.reset}"
+    logger.info(f"{request.method} {request.url.path} - {response.status_code} - Duration: {duration:.3f}s{injected}")
 
     return response
 
@@ -481,10 +1855,64 @@ async def health_check():
         "status": "healthy",
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "service": "O2IMS Mock Server",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "inventory": inventory.counts(),
+        "lifecycle": simulator.stats()
     }
 
 
+# Endpoint helpers
+PROVISIONING_REQUESTS_PATH = "/o2ims_infrastructureInventory/v1/deploymentManagers/{dmId}/o2ims_infrastructureProvisioningRequest"
+
+
+def require_deployment_manager(dmId: str) -> None:
+    """Raise 404 unless the deployment manager exists"""
+    if inventory.get(InventoryStore.DEPLOYMENT_MANAGERS, dmId) is None:
+        logger.error(f"Deployment manager {dmId} not found")
+        raise HTTPException(status_code=404, detail=f"Deployment manager {dmId} not found")
+
+
+def require_provisioning_request(dmId: str, requestId: str) -> InfrastructureProvisioningRequest:
+    """Provisioning request of a deployment manager, or 404"""
+    request = inventory.get(InventoryStore.PROVISIONING_REQUESTS, requestId)
+    if request is None or ProvisioningSimulator._manager_of(request) != dmId:
+        logger.error(f"Provisioning request {requestId} not found")
+        raise HTTPException(status_code=404, detail=f"Provisioning request {requestId} not found")
+    return request
+
+
+# Fault profile administration
+@app.get("/admin/faults", tags=["Admin"])
+async def get_fault_profile():
+    """Current fault profile and counts of injected faults"""
+    return faults.to_dict()
+
+
+@app.put("/admin/faults", tags=["Admin"])
+async def put_fault_profile(request: Request):
+    """
+    Replace the fault profile at runtime
+
+    Accepts the YAML profile format as YAML or JSON. The generator is reseeded
+    from the new profile, so each replacement starts a reproducible sequence.
+    """
+    global faults
+    try:
+        faults = FaultProfile.from_dict(yaml.safe_load(await request.body()))
+    except (ValueError, yaml.YAMLError) as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid fault profile: {exc}")
+    logger.info(f"Fault profile replaced: {len(faults.rules)} rules (seed {faults.seed})")
+    return faults.to_dict()
+
+
+@app.delete("/admin/faults", tags=["Admin"])
+async def delete_fault_profile():
+    """Stop injecting latency and faults"""
+    global faults
+    faults = FaultProfile()
+    return faults.to_dict()
+
+
 # O2IMS API Endpoints
 @app.get("/o2ims_infrastructureInventory/v1/status", response_model=O2IMSStatus, tags=["O2IMS"])
 async def get_o2ims_status():
@@ -494,16 +1922,17 @@ async def get_o2ims_status():
     Returns the current status of the O2IMS service including supported features,
     locales, and time zones.
     """
-    logger.info("Fetching O2IMS status")
-    return mock_data.generate_status()
+    return json_response(status_json)
 
 
 @app.get("/o2ims_infrastructureInventory/v1/deploymentManagers", response_model=List[DeploymentManagerInfo], tags=["O2IMS"])
 async def get_deployment_managers(
+    request: Request,
     filter: Optional[str] = Query(None, description="Filter expression"),
     limit: Optional[int] = Query(100, ge=1, le=1000, description="Maximum number of items to return"),
     offset: Optional[int] = Query(0, ge=0, description="Number of items to skip"),
-    deployment_manager_type: Optional[DeploymentManagerType] = Query(None, description="Filter by deployment manager type")
+    deployment_manager_type: Optional[DeploymentManagerType] = Query(None, description="Filter by deployment manager type"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor of the next page (X-Next-Cursor header)")
 ):
     """
     Get list of deployment managers
@@ -511,25 +1940,25 @@ async def get_deployment_managers(
     Returns information about all deployment managers managing infrastructure
     resources in the O2IMS domain.
     """
-    logger.info(f"Fetching deployment managers with filters: limit={limit}, offset={offset}, type={deployment_manager_type}")
-
-    filters = {"limit": limit, "offset": offset}
-    if deployment_manager_type:
-        filters["deployment_manager_type"] = deployment_manager_type
-
-    managers = mock_data.generate_deployment_managers(filters)
-    logger.info(f"Returning {len(managers)} deployment managers")
-
-    return managers
+    return page_response(
+        request,
+        InventoryStore.DEPLOYMENT_MANAGERS,
+        {"deployment_manager_type": deployment_manager_type},
+        limit,
+        offset,
+        cursor,
+    )
 
 
 @app.get("/o2ims_infrastructureInventory/v1/resourcePools", response_model=List[ResourcePoolInfo], tags=["O2IMS"])
 async def get_resource_pools(
+    request: Request,
     filter: Optional[str] = Query(None, description="Filter expression"),
     limit: Optional[int] = Query(100, ge=1, le=1000, description="Maximum number of items to return"),
     offset: Optional[int] = Query(0, ge=0, description="Number of items to skip"),
     resource_pool_type: Optional[ResourcePoolType] = Query(None, description="Filter by resource pool type"),
-    location: Optional[str] = Query(None, description="Filter by location")
+    location: Optional[str] = Query(None, description="Filter by location"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor of the next page (X-Next-Cursor header)")
 ):
     """
     Get list of resource pools
@@ -537,28 +1966,26 @@ async def get_resource_pools(
     Returns information about all resource pools available in the O2IMS domain,
     including compute, storage, and network resource pools.
     """
-    logger.info(f"Fetching resource pools with filters: limit={limit}, offset={offset}, type={resource_pool_type}, location={location}")
-
-    filters = {"limit": limit, "offset": offset}
-    if resource_pool_type:
-        filters["resource_pool_type"] = resource_pool_type
-    if location:
-        filters["location"] = location
-
-    pools = mock_data.generate_resource_pools(filters)
-    logger.info(f"Returning {len(pools)} resource pools")
-
-    return pools
+    return page_response(
+        request,
+        InventoryStore.RESOURCE_POOLS,
+        {"resource_pool_type": resource_pool_type, "location": location},
+        limit,
+        offset,
+        cursor,
+    )
 
 
 @app.get("/o2ims_infrastructureInventory/v1/deploymentManagers/{dmId}/o2ims_infrastructureProvisioningRequest",
          response_model=List[InfrastructureProvisioningRequest], tags=["O2IMS"])
 async def get_infrastructure_provisioning_requests(
+    request: Request,
     dmId: str = Path(..., description="Deployment Manager ID"),
     filter: Optional[str] = Query(None, description="Filter expression"),
     limit: Optional[int] = Query(100, ge=1, le=1000, description="Maximum number of items to return"),
     offset: Optional[int] = Query(0, ge=0, description="Number of items to skip"),
-    request_status: Optional[str] = Query(None, description="Filter by request status")
+    request_status: Optional[str] = Query(None, description="Filter by request status"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor of the next page (X-Next-Cursor header)")
 ):
     """
     Get infrastructure provisioning requests for a specific deployment manager
@@ -566,55 +1993,184 @@ async def get_infrastructure_provisioning_requests(
     Returns all infrastructure provisioning requests associated with the specified
     deployment manager, including pending, in-progress, and completed requests.
     """
-    logger.info(f"Fetching provisioning requests for deployment manager {dmId}")
+    require_deployment_manager(dmId)
+
+    return page_response(
+        request,
+        InventoryStore.PROVISIONING_REQUESTS,
+        {"request_status": request_status},
+        limit,
+        offset,
+        cursor,
+        scope=dmId,
+    )
 
-    # Validate deployment manager exists
-    all_managers = mock_data.generate_deployment_managers()
-    dm_exists = any(str(dm.deployment_manager_id) == dmId for dm in all_managers)
 
-    if not dm_exists:
-        logger.error(f"Deployment manager {dmId} not found")
-        raise HTTPException(status_code=404, detail=f"Deployment manager {dmId} not found")
+@app.post(PROVISIONING_REQUESTS_PATH, response_model=InfrastructureProvisioningRequest, status_code=201, tags=["O2IMS"])
+async def create_infrastructure_provisioning_request(
+    body: ProvisioningRequestCreate,
+    dmId: str = Path(..., description="Deployment Manager ID")
+):
+    """
+    Create an infrastructure provisioning request
+
+    The request starts PENDING and is moved through IN_PROGRESS to COMPLETED or
+    FAILED by the lifecycle simulator.
+    """
+    require_deployment_manager(dmId)
+    request = simulator.create(dmId, body)
+    return json_response(request.model_dump_json(by_alias=True).encode(), status_code=201)
+
+
+@app.post(PROVISIONING_REQUESTS_PATH + "/bulk", status_code=201, tags=["O2IMS"])
+async def bulk_create_infrastructure_provisioning_requests(
+    body: ProvisioningRequestBulkCreate,
+    dmId: str = Path(..., description="Deployment Manager ID")
+):
+    """
+    Create many provisioning requests at once
+
+    Creates the listed requests plus `count` copies of the template (numbered
+    by name), for load tests of reconcilers and verifiers.
+    """
+    require_deployment_manager(dmId)
+    if body.count and body.template is None:
+        raise HTTPException(status_code=400, detail="count requires a template")
+    if len(body.requests) + body.count > MAX_BULK_REQUESTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_REQUESTS} requests per bulk creation")
+    specs = list(body.requests)
+    if body.template is not None:
+        specs.extend(
+            body.template.model_copy(update={"name": f"{body.template.name}-{i}"})
+            for i in range(body.count)
+        )
+    ids = [str(simulator.create(dmId, spec).infrastructure_request_id) for spec in specs]
+    return JSONResponse(status_code=201, content={"created": len(ids), "ids": ids})
 
-    filters = {"limit": limit, "offset": offset}
-    if request_status:
-        filters["request_status"] = request_status
 
-    requests = mock_data.generate_provisioning_requests(dmId, filters)
-    logger.info(f"Returning {len(requests)} provisioning requests for deployment manager {dmId}")
+@app.get(PROVISIONING_REQUESTS_PATH + "/{requestId}", response_model=InfrastructureProvisioningRequest, tags=["O2IMS"])
+async def get_infrastructure_provisioning_request(dmId: str, requestId: str):
+    """Get specific provisioning request by ID"""
+    require_provisioning_request(dmId, requestId)
+    return json_response(inventory.get_json(InventoryStore.PROVISIONING_REQUESTS, requestId))
 
-    return requests
+
+@app.delete(PROVISIONING_REQUESTS_PATH + "/{requestId}", status_code=204, tags=["O2IMS"])
+async def delete_infrastructure_provisioning_request(dmId: str, requestId: str):
+    """Delete a provisioning request, releasing its allocated capacity"""
+    require_provisioning_request(dmId, requestId)
+    simulator.delete(requestId)
+    return Response(status_code=204)
+
+
+@app.get("/o2ims_infrastructureInventory/v1/deploymentManagers/{dmId}/capacity", tags=["O2IMS"])
+async def get_deployment_manager_capacity(dmId: str):
+    """Total, allocated and available capacity of a deployment manager's site pools"""
+    require_deployment_manager(dmId)
+    return simulator.capacity(dmId)
+
+
+INVENTORY_COLLECTIONS = (
+    InventoryStore.DEPLOYMENT_MANAGERS,
+    InventoryStore.RESOURCE_POOLS,
+    InventoryStore.PROVISIONING_REQUESTS,
+)
+
+# Seconds between keepalive comments on idle watch streams
+WATCH_HEARTBEAT = float(os.environ.get("O2IMS_WATCH_HEARTBEAT", "15"))
+
+
+def watch_response(
+    resource_version: Optional[int],
+    last_event_id: Optional[str],
+    collections: Sequence[str],
+    scope: Optional[str] = None,
+) -> StreamingResponse:
+    """SSE stream of change events, resuming after resourceVersion or Last-Event-ID"""
+    if resource_version is None and last_event_id:
+        try:
+            resource_version = int(last_event_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Last-Event-ID must be a resourceVersion")
+    if resource_version is not None and resource_version > events.version:
+        raise HTTPException(status_code=400, detail=f"resourceVersion {resource_version} is newer than {events.version}")
+    return StreamingResponse(
+        events.watch(resource_version, collections, scope, WATCH_HEARTBEAT),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "X-Resource-Version": str(events.version)},
+    )
+
+
+@app.get("/o2ims_infrastructureInventory/v1/watch", tags=["O2IMS"])
+async def watch_inventory(
+    resourceVersion: Optional[int] = Query(None, ge=0, description="Resume after this version (default: now)"),
+    collection: Optional[str] = Query(None, description="Comma-separated collections (default: all inventory)"),
+    deploymentManagerId: Optional[str] = Query(None, description="Only provisioning requests of this deployment manager"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Watch inventory changes
+
+    Server-sent events (ADDED, MODIFIED, DELETED) for deployment managers,
+    resource pools and provisioning requests, each with the resourceVersion
+    of the change. List responses carry the current version in the
+    X-Resource-Version header, so a client lists once and then watches from
+    that version. An expired version ends the stream with an ERROR event
+    (code 410); the client then lists again.
+    """
+    collections = tuple(collection.split(",")) if collection else INVENTORY_COLLECTIONS
+    unknown = set(collections) - set(INVENTORY_COLLECTIONS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown collections: {', '.join(sorted(unknown))}")
+    if deploymentManagerId is not None:
+        collections = tuple(c for c in collections if c == InventoryStore.PROVISIONING_REQUESTS)
+    return watch_response(resourceVersion, last_event_id, collections, deploymentManagerId)
+
+
+@app.get("/o2ims_infrastructureMonitoring/v1/alarms", response_model=List[AlarmEventRecord], tags=["O2IMS"])
+async def get_alarms(
+    limit: Optional[int] = Query(100, ge=1, le=1000, description="Maximum number of items to return"),
+    offset: Optional[int] = Query(0, ge=0, description="Number of items to skip")
+):
+    """Get recent alarm event records, oldest first"""
+    response = json_response(alarms.list_json(limit, offset))
+    response.headers["X-Resource-Version"] = str(events.version)
+    return response
+
+
+@app.get("/o2ims_infrastructureMonitoring/v1/alarms/watch", tags=["O2IMS"])
+async def watch_alarms(
+    resourceVersion: Optional[int] = Query(None, ge=0, description="Resume after this version (default: now)"),
+    deploymentManagerId: Optional[str] = Query(None, description="Only alarms of this deployment manager"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """Watch raised alarms as server-sent events, resumable like the inventory watch"""
+    return watch_response(resourceVersion, last_event_id, (EventLog.ALARMS,), deploymentManagerId)
 
 
 # Additional utility endpoints
 @app.get("/o2ims_infrastructureInventory/v1/deploymentManagers/{dmId}", response_model=DeploymentManagerInfo, tags=["O2IMS"])
 async def get_deployment_manager_by_id(dmId: str):
     """Get specific deployment manager by ID"""
-    logger.info(f"Fetching deployment manager {dmId}")
+    manager = inventory.get_json(InventoryStore.DEPLOYMENT_MANAGERS, dmId)
 
-    all_managers = mock_data.generate_deployment_managers()
-    manager = next((dm for dm in all_managers if str(dm.deployment_manager_id) == dmId), None)
-
-    if not manager:
+    if manager is None:
         logger.error(f"Deployment manager {dmId} not found")
         raise HTTPException(status_code=404, detail=f"Deployment manager {dmId} not found")
 
-    return manager
+    return json_response(manager)
 
 
 @app.get("/o2ims_infrastructureInventory/v1/resourcePools/{poolId}", response_model=ResourcePoolInfo, tags=["O2IMS"])
 async def get_resource_pool_by_id(poolId: str):
     """Get specific resource pool by ID"""
-    logger.info(f"Fetching resource pool {poolId}")
-
-    all_pools = mock_data.generate_resource_pools()
-    pool = next((rp for rp in all_pools if str(rp.resource_pool_id) == poolId), None)
+    pool = inventory.get_json(InventoryStore.RESOURCE_POOLS, poolId)
 
-    if not pool:
+    if pool is None:
         logger.error(f"Resource pool {poolId} not found")
         raise HTTPException(status_code=404, detail=f"Resource pool {poolId} not found")
 
-    return pool
+    return json_response(pool)
 
 
 # Error handlers
@@ -653,6 +2209,31 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="O2IMS Mock Server")
+    parser.add_argument("--synthetic-sites", type=int, help="Synthesize this many sites (up to 10000) instead of edge1-4")
+    parser.add_argument("--pools-per-site", type=int, help="Resource pools per synthetic site (default 3)")
+    parser.add_argument("--requests-per-site", type=int, help="Provisioning requests per synthetic site (default 3)")
+    parser.add_argument("--seed", type=int, help="Seed of the synthetic inventory (default 0)")
+    parser.add_argument("--queue-latency", help="Latency distribution of PENDING requests (default exponential:2)")
+    parser.add_argument("--provision-latency", help="Latency distribution of IN_PROGRESS requests (default lognormal:10,0.5)")
+    parser.add_argument("--failure-rate", type=float, help="Share of failed provisioning (default 0.05)")
+    parser.add_argument("--fault-profile", help="YAML profile of injected latency and faults")
+    args = parser.parse_args()
+
+    # The server re-imports this module, so options are passed through the environment
+    for option, variable in (
+        (args.synthetic_sites, "O2IMS_SYNTHETIC_SITES"),
+        (args.pools_per_site, "O2IMS_SYNTHETIC_POOLS_PER_SITE"),
+        (args.requests_per_site, "O2IMS_SYNTHETIC_REQUESTS_PER_SITE"),
+        (args.seed, "O2IMS_SYNTHETIC_SEED"),
+        (args.queue_latency, "O2IMS_QUEUE_LATENCY"),
+        (args.provision_latency, "O2IMS_PROVISION_LATENCY"),
+        (args.failure_rate, "O2IMS_FAILURE_RATE"),
+        (args.fault_profile, "O2IMS_FAULT_PROFILE"),
+    ):
+        if option is not None:
+            os.environ[variable] = str(option)
+
     logger.info("Starting O2IMS Mock Server on port 30205")
     uvicorn.run(
         "o2ims-mock-server:app",
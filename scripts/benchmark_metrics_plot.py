@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark for Nightly Regression Report Generation
+Times loading, aggregation and chart rendering of metrics_plot.py on a
+synthetic metrics file, and reports the memory held by the loaded records
+"""
+
+import argparse
+import json
+import logging
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from metrics_plot import MetricsPlotter
+
+SITES = ['edge1', 'edge2', 'edge3', 'edge4']
+SERVICE_TYPES = ['enhanced-mobile-broadband', 'ultra-reliable-low-latency', 'massive-machine-type']
+
+
+def synthetic_records(count, seed=0):
+    """Deterministic pipeline runs, one minute apart, across sites and service types"""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        success = rng.random() > 0.05
+        yield {
+            'timestamp': (start + timedelta(minutes=i)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'site': SITES[i % len(SITES)],
+            'service_type': SERVICE_TYPES[i % len(SERVICE_TYPES)],
+            'metrics': {
+                'pipeline_success': success,
+                'total_duration_ms': round(rng.gauss(1200, 150), 1),
+                'intent_generation_ms': round(rng.gauss(45, 5), 1),
+                'krm_translation_ms': round(rng.gauss(120, 15), 1),
+                'sync_latency_ms': round(rng.expovariate(1 / 30), 1),
+                'pr_ready_time_ms': round(rng.gauss(800, 90), 1),
+                'stages_total': 7,
+                'stages_completed': 7 if success else rng.randint(1, 6),
+                'stages_failed': 0 if success else 1,
+                'success_rate': 1.0 if success else round(rng.random(), 2),
+                'postcheck_pass': success,
+            },
+        }
+
+
+def write_metrics(path, count, seed=0):
+    """Stream synthetic records into a {"metrics": [...]} file without holding them"""
+    with open(path, 'w') as f:
+        f.write('{"metrics": [')
+        for i, record in enumerate(synthetic_records(count, seed)):
+            if i:
+                f.write(',')
+            json.dump(record, f)
+        f.write(']}')
+
+
+def timed(results, stage, func):
+    start = time.perf_counter()
+    value = func()
+    results[stage] = round(time.perf_counter() - start, 3)
+    return value
+
+
+def run(records, workdir, jobs=None):
+    """Stage timings in seconds, plus the loaded frame's size in MiB"""
+    workdir = Path(workdir)
+    input_file = workdir / 'metrics.json'
+    results = {'records': records}
+
+    timed(results, 'generate_s', lambda: write_metrics(input_file, records))
+    results['input_mib'] = round(input_file.stat().st_size / 2**20, 1)
+
+    plotter = MetricsPlotter(input_file, workdir / 'report', jobs=jobs, force=True)
+    if not timed(results, 'load_s', plotter.load_data):
+        raise RuntimeError(f"Failed to load {input_file}")
+    results['frame_mib'] = round(plotter.df.memory_usage(deep=True).sum() / 2**20, 1)
+
+    timed(results, 'aggregate_s', lambda: (plotter.dashboard_data(), plotter.trend_data()))
+    timed(results, 'render_s', plotter.render_charts)
+    timed(results, 'compose_s', lambda: (plotter.create_performance_dashboard(), plotter.create_kpi_trends()))
+    results['report_s'] = round(sum(results[s] for s in ('load_s', 'aggregate_s', 'render_s', 'compose_s')), 3)
+    return results
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Benchmark nightly regression report generation')
+    parser.add_argument('--records', '-n', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help='Synthetic record counts to benchmark')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Chart rendering processes (default: CPU count)')
+    parser.add_argument('--output', '-o', help='Write the results as JSON to this file')
+    args = parser.parse_args()
+
+    if any(n < 1 for n in args.records):
+        parser.error('--records must be positive')
+
+    # metrics_plot configures INFO logging on import
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = []
+    for count in args.records:
+        with tempfile.TemporaryDirectory() as workdir:
+            result = run(count, workdir, args.jobs)
+        results.append(result)
+        print(f"{count:>10} records: load {result['load_s']:.2f}s, aggregate {result['aggregate_s']:.2f}s, "
+              f"render {result['render_s']:.2f}s, compose {result['compose_s']:.2f}s "
+              f"(report {result['report_s']:.2f}s, frame {result['frame_mib']} MiB, "
+              f"input {result['input_mib']} MiB)")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + '\n')
+
+
+if __name__ == '__main__':
+    main()
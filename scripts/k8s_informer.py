@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+
+"""
+k8s_informer.py - List+watch informer cache for GitOps and O2IMS resources
+
+Keeps a local, indexed copy of RootSync, ResourceGroup and ProvisioningRequest
+objects up to date from one list call followed by a long-running watch, instead
+of polling kubectl. Readers query the cache, register event callbacks, or block
+until a predicate holds on the cache.
+
+Usage:
+    python3 k8s_informer.py list rootsync -n config-management-system
+    python3 k8s_informer.py wait resourcegroup intent-to-o2-rootsync \\
+        -n config-management-system --timeout 600 --output status.json
+"""
+
+import atexit
+import base64
+import json
+import logging
+import os
+import random
+import ssl
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Exit codes of the wait command
+EXIT_READY = 0
+EXIT_TIMEOUT = 2
+EXIT_UNAVAILABLE = 3
+
+SERVICE_ACCOUNT_DIR = '/var/run/secrets/kubernetes.io/serviceaccount'
+
+
+@dataclass(frozen=True)
+class Resource:
+    """API location of a namespaced resource type"""
+    group: str
+    version: str
+    plural: str
+    kind: str
+
+    def path(self, namespace: Optional[str] = None) -> str:
+        prefix = f"/apis/{self.group}/{self.version}" if self.group else f"/api/{self.version}"
+        if namespace:
+            return f"{prefix}/namespaces/{namespace}/{self.plural}"
+        return f"{prefix}/{self.plural}"
+
+
+ROOTSYNC = Resource('configsync.gke.io', 'v1beta1', 'rootsyncs', 'RootSync')
+RESOURCEGROUP = Resource('kpt.dev', 'v1alpha1', 'resourcegroups', 'ResourceGroup')
+PROVISIONINGREQUEST = Resource('o2ims.provisioning.oran.org', 'v1alpha1', 'provisioningrequests',
+                               'ProvisioningRequest')
+
+RESOURCES = {
+    'rootsync': ROOTSYNC,
+    'resourcegroup': RESOURCEGROUP,
+    'provisioningrequest': PROVISIONINGREQUEST,
+}
+
+
+class ApiError(Exception):
+    """Error response from the API server"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+
+
+class ResourceVersionExpired(ApiError):
+    """Watch resource version is older than the server's history (410 Gone)"""
+
+
+def _write_temp(data: bytes) -> str:
+    """Write decoded kubeconfig credential data to a file removed at exit"""
+    handle = tempfile.NamedTemporaryFile(prefix='kube-', delete=False)
+    with handle:
+        handle.write(data)
+    atexit.register(os.unlink, handle.name)
+    return handle.name
+
+
+def _credential_file(entry: Dict, key: str, base_dir: str) -> Optional[str]:
+    """Path of a '<key>' file or decoded '<key>-data' entry"""
+    if entry.get(f"{key}-data"):
+        return _write_temp(base64.b64decode(entry[f"{key}-data"]))
+    if entry.get(key):
+        return os.path.join(base_dir, os.path.expanduser(entry[key]))
+    return None
+
+
+class KubeApi:
+    """Minimal Kubernetes API client for list and watch calls"""
+
+    def __init__(self, server: str, token: Optional[str] = None,
+                 verify: Any = True, timeout: float = 10):
+        """
+        Args:
+            server: API server URL
+            token: Bearer token
+            verify: SSL context, CA bundle path, or False to skip verification
+            timeout: Connect and request timeout in seconds (watches wait longer for events)
+        """
+        headers = {'Accept': 'application/json'}
+        if token:
+            headers['Authorization'] = f"Bearer {token}"
+        self.server = server.rstrip('/')
+        self.timeout = timeout
+        self.client = httpx.Client(base_url=self.server, headers=headers, verify=verify, timeout=timeout)
+
+    @classmethod
+    def from_kubeconfig(cls, path: Optional[str] = None, context: Optional[str] = None) -> 'KubeApi':
+        """Build a client from a kubeconfig file (KUBECONFIG or ~/.kube/config by default)"""
+        path = path or os.environ.get('KUBECONFIG', '').split(os.pathsep)[0] or '~/.kube/config'
+        path = os.path.expanduser(path)
+        with open(path) as f:
+            config = yaml.safe_load(f) or {}
+        base_dir = os.path.dirname(os.path.abspath(path))
+
+        def named(section: str, name: str) -> Dict:
+            for entry in config.get(section) or []:
+                if entry.get('name') == name:
+                    return entry.get(section[:-1]) or {}
+            raise ValueError(f"{section[:-1]} '{name}' not found in {path}")
+
+        context = named('contexts', context or config.get('current-context', ''))
+        cluster = named('clusters', context['cluster'])
+        user = named('users', context['user']) if context.get('user') else {}
+
+        if cluster.get('insecure-skip-tls-verify'):
+            verify: Any = False
+        else:
+            verify = ssl.create_default_context(cafile=_credential_file(cluster, 'certificate-authority', base_dir))
+            certfile = _credential_file(user, 'client-certificate', base_dir)
+            if certfile:
+                verify.load_cert_chain(certfile, _credential_file(user, 'client-key', base_dir))
+        token = user.get('token')
+        if not token and user.get('tokenFile'):
+            with open(os.path.join(base_dir, user['tokenFile'])) as f:
+                token = f.read().strip()
+        return cls(cluster['server'], token=token, verify=verify)
+
+    @classmethod
+    def in_cluster(cls) -> 'KubeApi':
+        """Build a client from the pod's service account"""
+        with open(os.path.join(SERVICE_ACCOUNT_DIR, 'token')) as f:
+            token = f.read().strip()
+        server = f"https://{os.environ['KUBERNETES_SERVICE_HOST']}:{os.environ['KUBERNETES_SERVICE_PORT']}"
+        return cls(server, token=token, verify=ssl.create_default_context(
+            cafile=os.path.join(SERVICE_ACCOUNT_DIR, 'ca.crt')))
+
+    @classmethod
+    def from_environment(cls, context: Optional[str] = None) -> 'KubeApi':
+        """KUBE_API_SERVER (e.g. a kubectl proxy), the in-cluster service account, or kubeconfig"""
+        if os.environ.get('KUBE_API_SERVER'):
+            return cls(os.environ['KUBE_API_SERVER'], token=os.environ.get('KUBE_API_TOKEN'))
+        if os.environ.get('KUBERNETES_SERVICE_HOST') and not context:
+            return cls.in_cluster()
+        return cls.from_kubeconfig(context=context)
+
+    def _check(self, response: httpx.Response):
+        if response.status_code == 410:
+            raise ResourceVersionExpired(410, response.text)
+        if response.status_code >= 400:
+            raise ApiError(response.status_code, response.text)
+
+    def list(self, resource: Resource, namespace: Optional[str] = None,
+             label_selector: Optional[str] = None, field_selector: Optional[str] = None) -> Dict:
+        """List objects; the result carries metadata.resourceVersion to watch from"""
+        params = {}
+        if label_selector:
+            params['labelSelector'] = label_selector
+        if field_selector:
+            params['fieldSelector'] = field_selector
+        response = self.client.get(resource.path(namespace), params=params)
+        self._check(response)
+        return response.json()
+
+    def watch(self, resource: Resource, resource_version: str, namespace: Optional[str] = None,
+              label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+              timeout_seconds: int = 300, stop: Optional[threading.Event] = None) -> Iterator[Dict]:
+        """
+        Stream watch events after resource_version until the server ends the watch.
+
+        Raises:
+            ResourceVersionExpired: If the server no longer has resource_version
+            ApiError: For other error responses or ERROR events
+        """
+        params = {
+            'watch': 'true',
+            'resourceVersion': resource_version,
+            'allowWatchBookmarks': 'true',
+            'timeoutSeconds': str(timeout_seconds),
+        }
+        if label_selector:
+            params['labelSelector'] = label_selector
+        if field_selector:
+            params['fieldSelector'] = field_selector
+        # Reads may idle until the next event, the server-side timeout ends the watch
+        timeout = httpx.Timeout(self.timeout, read=timeout_seconds + self.timeout)
+        with self.client.stream('GET', resource.path(namespace), params=params, timeout=timeout) as response:
+            if response.status_code >= 400:
+                response.read()
+                self._check(response)
+            for line in response.iter_lines():
+                if stop is not None and stop.is_set():
+                    return
+                if not line:
+                    continue
+                event = json.loads(line)
+                if event.get('type') == 'ERROR':
+                    status = event.get('object') or {}
+                    code = status.get('code', 500)
+                    error = ResourceVersionExpired if code == 410 else ApiError
+                    raise error(code, status.get('message', 'watch error'))
+                yield event
+
+    def close(self):
+        self.client.close()
+
+
+def object_key(obj: Dict) -> str:
+    """Cache key 'namespace/name' (or 'name' for cluster-scoped objects)"""
+    metadata = obj.get('metadata', {})
+    namespace = metadata.get('namespace')
+    return f"{namespace}/{metadata['name']}" if namespace else metadata['name']
+
+
+def index_by_namespace(obj: Dict) -> List[str]:
+    return [obj.get('metadata', {}).get('namespace', '')]
+
+
+# Event handler signature: (event_type, obj, old_obj); old_obj is None for ADDED
+EventHandler = Callable[[str, Dict, Optional[Dict]], None]
+
+
+class Store:
+    """Thread-safe object cache with secondary indexes"""
+
+    def __init__(self):
+        self._items: Dict[str, Dict] = {}
+        self._indexers: Dict[str, Callable[[Dict], List[str]]] = {}
+        self._indices: Dict[str, Dict[str, set]] = {}
+        self._changed = threading.Condition()
+        self.version = 0
+        self.add_index('namespace', index_by_namespace)
+
+    def add_index(self, name: str, func: Callable[[Dict], List[str]]):
+        """Index objects by the values func returns for them"""
+        with self._changed:
+            self._indexers[name] = func
+            self._indices[name] = {}
+            for key, obj in self._items.items():
+                for value in func(obj):
+                    self._indices[name].setdefault(value, set()).add(key)
+
+    def _unindex(self, key: str, obj: Dict):
+        for name, func in self._indexers.items():
+            for value in func(obj):
+                keys = self._indices[name].get(value)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._indices[name][value]
+
+    def _index(self, key: str, obj: Dict):
+        for name, func in self._indexers.items():
+            for value in func(obj):
+                self._indices[name].setdefault(value, set()).add(key)
+
+    def _notify(self):
+        self.version += 1
+        self._changed.notify_all()
+
+    def apply(self, event_type: str, obj: Dict) -> Optional[Dict]:
+        """Apply an ADDED, MODIFIED or DELETED event; returns the previous object"""
+        key = object_key(obj)
+        with self._changed:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._unindex(key, old)
+            if event_type != 'DELETED':
+                self._items[key] = obj
+                self._index(key, obj)
+            self._notify()
+        return old
+
+    def replace(self, objects: List[Dict]) -> List[Tuple[str, Dict, Optional[Dict]]]:
+        """
+        Replace the contents with a fresh list result.
+
+        Returns:
+            The (event_type, obj, old) changes relative to the previous contents,
+            so a relist after a broken watch still reports what was missed
+        """
+        fresh = {object_key(obj): obj for obj in objects}
+        events = []
+        with self._changed:
+            for key, old in self._items.items():
+                if key not in fresh:
+                    events.append(('DELETED', old, old))
+            for key, obj in fresh.items():
+                old = self._items.get(key)
+                if old is None:
+                    events.append(('ADDED', obj, None))
+                elif old.get('metadata', {}).get('resourceVersion') != obj.get('metadata', {}).get('resourceVersion'):
+                    events.append(('MODIFIED', obj, old))
+            self._items = fresh
+            self._indices = {name: {} for name in self._indexers}
+            for key, obj in fresh.items():
+                self._index(key, obj)
+            self._notify()
+        return events
+
+    def get(self, name: str, namespace: Optional[str] = None) -> Optional[Dict]:
+        with self._changed:
+            return self._items.get(f"{namespace}/{name}" if namespace else name)
+
+    def list(self, namespace: Optional[str] = None) -> List[Dict]:
+        if namespace is not None:
+            return self.by_index('namespace', namespace)
+        with self._changed:
+            return [self._items[key] for key in sorted(self._items)]
+
+    def by_index(self, name: str, value: str) -> List[Dict]:
+        with self._changed:
+            return [self._items[key] for key in sorted(self._indices[name].get(value, ()))]
+
+    def wait_for(self, predicate: Callable[['Store'], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Block until predicate(store) is truthy, re-evaluating it after each change.
+
+        Returns:
+            The truthy predicate result, or None on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while True:
+                version = self.version
+                result = predicate(self)
+                if result:
+                    return result
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._changed.wait_for(lambda: self.version != version, remaining)
+
+    def wait_for_change(self, version: int, timeout: Optional[float] = None) -> int:
+        """Block until the store version differs from version; returns the current version"""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+
+class Informer:
+    """Keeps a Store in sync with one resource type through list+watch"""
+
+    def __init__(self, api: KubeApi, resource: Resource, namespace: Optional[str] = None,
+                 label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                 watch_timeout: int = 300, max_backoff: float = 30):
+        self.api = api
+        self.resource = resource
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.field_selector = field_selector
+        self.watch_timeout = watch_timeout
+        self.max_backoff = max_backoff
+        self.store = Store()
+        self.resource_version: Optional[str] = None
+        self.synced = threading.Event()
+        self.last_error: Optional[Exception] = None
+        self._handlers: List[EventHandler] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_event_handler(self, handler: EventHandler):
+        """Call handler(event_type, obj, old) after each cache change"""
+        self._handlers.append(handler)
+
+    def _dispatch(self, event_type: str, obj: Dict, old: Optional[Dict]):
+        for handler in self._handlers:
+            try:
+                handler(event_type, obj, old)
+            except Exception as e:
+                logger.error(f"{self.resource.kind} event handler failed: {e}")
+
+    def relist(self):
+        """Replace the cache from a list call and remember where to watch from"""
+        result = self.api.list(self.resource, self.namespace, self.label_selector, self.field_selector)
+        events = self.store.replace(result.get('items') or [])
+        self.resource_version = result.get('metadata', {}).get('resourceVersion', '0')
+        self.synced.set()
+        for event in events:
+            self._dispatch(*event)
+
+    def watch_once(self):
+        """Apply watch events until the server ends the watch"""
+        for event in self.api.watch(self.resource, self.resource_version, self.namespace,
+                                    self.label_selector, self.field_selector,
+                                    self.watch_timeout, self._stop):
+            event_type, obj = event['type'], event['object']
+            self.resource_version = obj.get('metadata', {}).get('resourceVersion', self.resource_version)
+            if event_type == 'BOOKMARK':
+                continue
+            old = self.store.apply(event_type, obj)
+            self._dispatch(event_type, obj, old)
+
+    def run(self):
+        """List, then watch until stopped; relist when the watch position expired"""
+        failures = 0
+        while not self._stop.is_set():
+            try:
+                if self.resource_version is None:
+                    self.relist()
+                self.watch_once()
+                failures = 0
+            except ResourceVersionExpired:
+                logger.info(f"{self.resource.kind} watch expired, relisting")
+                self.resource_version = None
+            except (ApiError, httpx.HTTPError, ValueError, OSError) as e:
+                if self._stop.is_set():
+                    break
+                self.last_error = e
+                failures += 1
+                delay = min(self.max_backoff, 0.5 * 2 ** failures) * random.uniform(0.5, 1)
+                logger.warning(f"{self.resource.kind} list/watch failed ({e}), retrying in {delay:.1f}s")
+                self._stop.wait(delay)
+
+    def start(self) -> 'Informer':
+        """Run the informer in a daemon thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, name=f"informer-{self.resource.plural}",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5):
+        """Stop after the current watch event (or at the latest when the watch times out)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the initial list to fill the cache"""
+        return self.synced.wait(timeout)
+
+
+def condition_status(obj: Dict, condition_type: str) -> Optional[str]:
+    for condition in obj.get('status', {}).get('conditions') or []:
+        if condition.get('type') == condition_type:
+            return condition.get('status')
+    return None
+
+
+def rootsync_synced(obj: Dict) -> bool:
+    """RootSync has completed at least one sync"""
+    return bool(obj.get('status', {}).get('sync', {}).get('lastUpdate'))
+
+
+def resourcegroup_reconciled(obj: Dict) -> bool:
+    """ResourceGroup is not stalled and has observed its current generation"""
+    observed = obj.get('status', {}).get('observedGeneration')
+    return (condition_status(obj, 'Stalled') == 'False'
+            and observed is not None
+            and observed == obj.get('metadata', {}).get('generation'))
+
+
+def provisioning_request_status(obj: Dict) -> str:
+    """Phase of a ProvisioningRequest, falling back to its Ready condition"""
+    phase = obj.get('status', {}).get('phase')
+    if phase:
+        return phase
+    ready = condition_status(obj, 'Ready')
+    if ready is not None:
+        return 'Ready' if ready == 'True' else 'NotReady'
+    return 'Unknown'
+
+
+def provisioning_request_ready(obj: Dict) -> bool:
+    return provisioning_request_status(obj) in ('Ready', 'Published')
+
+
+def describe(obj: Dict) -> str:
+    """One-line status summary for logs"""
+    status = obj.get('status', {})
+    metadata = obj.get('metadata', {})
+    parts = [f"{obj.get('kind', 'object')} {object_key(obj)}"]
+    stalled = condition_status(obj, 'Stalled')
+    if stalled is not None:
+        parts.append(f"stalled={stalled}")
+    if 'observedGeneration' in status:
+        parts.append(f"observed_gen={status['observedGeneration']}, current_gen={metadata.get('generation')}")
+    commit = status.get('sourceCommit') or status.get('sync', {}).get('commit')
+    if commit:
+        parts.append(f"commit={commit[:8]}")
+    if obj.get('kind') == PROVISIONINGREQUEST.kind:
+        parts.append(f"status={provisioning_request_status(obj)}")
+    return ', '.join(parts)
+
+
+READY_PREDICATES = {
+    'rootsync': rootsync_synced,
+    'resourcegroup': resourcegroup_reconciled,
+    'provisioningrequest': provisioning_request_ready,
+}
+
+
+def wait_command(api: KubeApi, kind: str, name: str, namespace: Optional[str],
+                 timeout: float, output: Optional[str] = None) -> int:
+    """Watch one object until it is ready; returns a process exit code"""
+    informer = Informer(api, RESOURCES[kind], namespace, field_selector=f"metadata.name={name}")
+    ready = READY_PREDICATES[kind]
+
+    def on_event(event_type: str, obj: Dict, old: Optional[Dict]):
+        logger.info(f"{event_type}: {describe(obj)}")
+
+    informer.add_event_handler(on_event)
+    informer.start()
+    try:
+        if not informer.wait_for_sync(min(timeout, api.timeout * 3)):
+            logger.error(f"Cannot list {kind}: {informer.last_error}")
+            return EXIT_UNAVAILABLE
+        if informer.store.get(name, namespace) is None:
+            logger.warning(f"{RESOURCES[kind].kind} '{name}' not found in namespace '{namespace}', waiting")
+        found = informer.store.wait_for(
+            lambda store: (obj := store.get(name, namespace)) is not None and ready(obj), timeout)
+
+        # Written here rather than from the event handler: the store is
+        # updated before handlers run, so the handler may not have fired yet
+        last_seen = informer.store.get(name, namespace)
+        if output and last_seen is not None:
+            with open(f"{output}.tmp", 'w') as f:
+                json.dump(last_seen, f, indent=2)
+            os.replace(f"{output}.tmp", output)
+
+        if found:
+            logger.info(f"{RESOURCES[kind].kind} '{name}' is ready")
+            return EXIT_READY
+        logger.error(f"Timeout after {timeout}s waiting for {RESOURCES[kind].kind} '{name}'")
+        return EXIT_TIMEOUT
+    finally:
+        informer.stop(timeout=0)
+
+
+def list_command(api: KubeApi, kind: str, namespace: Optional[str]) -> int:
+    informer = Informer(api, RESOURCES[kind], namespace)
+    try:
+        informer.relist()
+    except (ApiError, httpx.HTTPError) as e:
+        logger.error(f"Cannot list {kind}: {e}")
+        return EXIT_UNAVAILABLE
+    for obj in informer.store.list():
+        print(describe(obj))
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description='List+watch cache for GitOps and O2IMS resources')
+    parser.add_argument('--context', help='kubeconfig context (default: current context)')
+    parser.add_argument('--server', help='API server URL, e.g. a kubectl proxy (overrides kubeconfig)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    wait = subparsers.add_parser('wait', help='Wait until an object is synced/reconciled/ready')
+    wait.add_argument('kind', choices=sorted(RESOURCES))
+    wait.add_argument('name')
+    wait.add_argument('-n', '--namespace', default='config-management-system')
+    wait.add_argument('--timeout', type=float, default=600, help='Seconds to wait')
+    wait.add_argument('--output', help='Write the latest object JSON to this file')
+
+    list_parser = subparsers.add_parser('list', help='List cached objects with their status')
+    list_parser.add_argument('kind', choices=sorted(RESOURCES))
+    list_parser.add_argument('-n', '--namespace')
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+
+    try:
+        api = KubeApi(args.server) if args.server else KubeApi.from_environment(args.context)
+    except (OSError, KeyError, ValueError, ssl.SSLError) as e:
+        logger.error(f"Cannot load Kubernetes configuration: {e}")
+        return EXIT_UNAVAILABLE
+
+    with api.client:
+        if args.command == 'wait':
+            return wait_command(api, args.kind, args.name, args.namespace, args.timeout, args.output)
+        return list_command(api, args.kind, args.namespace)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
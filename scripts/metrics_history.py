@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Metrics History Store for Nightly Regression Reports
+Appends nightly results to a date-partitioned Parquet dataset, so reports
+read only the columns and dates they need instead of one ever-growing JSON file
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError as e:
+    print(f"Error: Required packages not installed. Run: pip install pandas numpy")
+    print(f"Missing: {e}")
+    sys.exit(1)
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # only the Parquet store needs it; JSON inputs work without
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+# Columns kept from each record, with compact dtypes (metrics.* fields are flattened)
+ID_COLUMNS = ['pipeline_id', 'ci_run']
+CATEGORY_COLUMNS = ['site', 'service_type']
+BOOL_COLUMNS = ['pipeline_success', 'postcheck_pass']
+FLOAT_COLUMNS = [
+    'total_duration_ms', 'intent_generation_ms', 'krm_translation_ms', 'sync_latency_ms',
+    'pr_ready_time_ms', 'stages_total', 'stages_completed', 'stages_failed', 'success_rate',
+]
+
+# Records flattened per json_normalize call, bounding the intermediate dicts
+NORMALIZE_CHUNK = 100_000
+
+# Rows per Parquet row group; timestamp statistics are kept per group
+ROW_GROUP_SIZE = 64 * 1024
+
+
+def normalize_metrics(records, chunk_size=NORMALIZE_CHUNK, ids=False):
+    """Flatten metric records into one typed column per field.
+
+    Sites and service types become categoricals (in order of first
+    appearance), timestamps UTC datetimes, success flags booleans and
+    measurements float32. Fields missing from a record are NaN (False for
+    flags). With ids, pipeline_id and ci_run are kept as strings.
+    """
+    frames = []
+    for start in range(0, len(records), chunk_size):
+        flat = pd.json_normalize(records[start:start + chunk_size], sep='.')
+        flat.columns = [c[len('metrics.'):] if c.startswith('metrics.') else c for c in flat.columns]
+        frame = pd.DataFrame(index=flat.index)
+        frame['timestamp'] = pd.to_datetime(flat.get('timestamp'), utc=True, format='ISO8601')
+        if ids:
+            for column in ID_COLUMNS:
+                frame[column] = (flat[column] if column in flat else pd.Series(pd.NA, index=flat.index)).astype('string')
+        for column in CATEGORY_COLUMNS:
+            if column in flat:
+                # Categories in order of first appearance, matching unique()
+                frame[column] = pd.Categorical(flat[column], categories=flat[column].dropna().unique())
+            else:
+                frame[column] = pd.Categorical([None] * len(flat))
+        for column in BOOL_COLUMNS:
+            frame[column] = flat[column].fillna(False).astype(bool) if column in flat else False
+        for column in FLOAT_COLUMNS:
+            frame[column] = pd.to_numeric(flat[column], errors='coerce').astype('float32') if column in flat else np.float32('nan')
+        frames.append(frame)
+
+    if not frames:
+        return pd.DataFrame({
+            'timestamp': pd.Series(dtype='datetime64[ns, UTC]'),
+            **({c: pd.Series(dtype='string') for c in ID_COLUMNS} if ids else {}),
+            **{c: pd.Series(dtype='category') for c in CATEGORY_COLUMNS},
+            **{c: pd.Series(dtype=bool) for c in BOOL_COLUMNS},
+            **{c: pd.Series(dtype='float32') for c in FLOAT_COLUMNS},
+        })
+
+    df = pd.concat(frames, ignore_index=True)
+    for column in CATEGORY_COLUMNS:
+        # Chunks have different category sets; merge them instead of falling back to object
+        df[column] = pd.api.types.union_categoricals([f[column] for f in frames], ignore_order=True)
+    return df
+
+
+def history_schema():
+    """Arrow schema of stored records, matching normalize_metrics(ids=True)"""
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema(
+        [('timestamp', pa.timestamp('us', tz='UTC'))]
+        + [(c, pa.string()) for c in ID_COLUMNS]
+        + [(c, category) for c in CATEGORY_COLUMNS]
+        + [(c, pa.bool_()) for c in BOOL_COLUMNS]
+        + [(c, pa.float32()) for c in FLOAT_COLUMNS]
+    )
+
+
+class HistoryStore:
+    """Append-only Parquet dataset of metric records, partitioned by UTC run date.
+
+    Layout is <root>/date=YYYY-MM-DD/<source>.parquet: every ingested results
+    file adds one Parquet file per date it covers, named after a hash of its
+    contents, so ingesting the same results twice is a no-op.
+    """
+
+    def __init__(self, root):
+        if pa is None:
+            raise RuntimeError("The metrics history store requires pyarrow. Run: pip install pyarrow")
+        self.root = Path(root)
+        self.partitioning = ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive')
+
+    def append(self, df, source):
+        """Write records to their date partitions; returns the number of rows written"""
+        dated = df[df['timestamp'].notna()]
+        if len(dated) < len(df):
+            logger.warning(f"Skipping {len(df) - len(dated)} records without a timestamp from {source}")
+
+        written = 0
+        dates = dated['timestamp'].dt.strftime('%Y-%m-%d')
+        for day, part in dated.groupby(dates, sort=True):
+            path = self.root / f'date={day}' / f'{source}.parquet'
+            if path.exists():
+                logger.info(f"{path} already ingested, skipping")
+                continue
+
+            # Sorted rows give each row group a narrow timestamp range to filter on
+            part = part.sort_values('timestamp', kind='stable')
+            table = pa.Table.from_pandas(part, schema=history_schema(), preserve_index=False)
+
+            # Dot-prefixed files are ignored by dataset discovery until renamed
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(f'.{path.name}.partial')
+            pq.write_table(table, partial, row_group_size=ROW_GROUP_SIZE, compression='zstd')
+            os.replace(partial, path)
+            written += len(part)
+
+        return written
+
+    def ingest(self, json_file):
+        """Append the records of one results JSON file; returns the number of rows written"""
+        raw = Path(json_file).read_bytes()
+        data = json.loads(raw)
+        if not isinstance(data, dict) or 'metrics' not in data:
+            raise ValueError(f"No 'metrics' key found in {json_file}")
+
+        source = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        return self.append(normalize_metrics(data['metrics'], ids=True), source)
+
+    def dates(self):
+        """Dates with stored records, oldest first"""
+        return sorted(p.name[len('date='):] for p in self.root.glob('date=*') if p.is_dir())
+
+    def read(self, columns=None, since=None, until=None):
+        """Records from since to until (inclusive YYYY-MM-DD dates) as a typed DataFrame.
+
+        Only the requested columns are decoded, and date partitions outside
+        the range are never opened.
+        """
+        columns = list(columns or history_schema().names)
+        if not self.root.is_dir():
+            return normalize_metrics([], ids=True)[columns]
+
+        dataset = ds.dataset(self.root, schema=history_schema().append(pa.field('date', pa.string())),
+                             format='parquet', partitioning=self.partitioning)
+        selection = None
+        if since:
+            selection = ds.field('date') >= str(since)
+        if until:
+            upper = ds.field('date') <= str(until)
+            selection = upper if selection is None else selection & upper
+
+        table = dataset.to_table(columns=columns, filter=selection)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def json_sources(paths):
+    """Results JSON files among paths, searching directories recursively"""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(path.rglob('*.json'))
+        else:
+            yield path
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description='Store nightly regression metrics in a Parquet history')
+    parser.add_argument('--store', '-s', required=True, help='History store directory')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Verbose logging')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest = subparsers.add_parser('ingest', help="Append a night's results JSON files")
+    ingest.add_argument('files', nargs='+', help='Results JSON files')
+
+    convert = subparsers.add_parser('convert', help='Migrate existing results JSON files or directories')
+    convert.add_argument('paths', nargs='+', help='Results JSON files or directories to search')
+
+    subparsers.add_parser('info', help='Show stored dates and record counts')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+
+    try:
+        store = HistoryStore(args.store)
+    except RuntimeError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    if args.command == 'ingest':
+        try:
+            for path in args.files:
+                logger.info(f"Ingested {store.ingest(path)} records from {path}")
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to ingest: {e}")
+            sys.exit(1)
+
+    elif args.command == 'convert':
+        converted = skipped = 0
+        for path in json_sources(args.paths):
+            try:
+                rows = store.ingest(path)
+            except (OSError, ValueError) as e:
+                # Directories hold other JSON documents too; report and carry on
+                logger.warning(f"Skipping {path}: {e}")
+                skipped += 1
+                continue
+            logger.info(f"Converted {rows} records from {path}")
+            converted += 1
+        logger.info(f"Converted {converted} files into {store.root} ({skipped} skipped)")
+
+    else:
+        dates = store.dates()
+        df = store.read(['timestamp'])
+        print(f"{store.root}: {len(df)} records over {len(dates)} dates"
+              + (f" ({dates[0]} to {dates[-1]})" if dates else ""))
+
+
+if __name__ == '__main__':
+    main()
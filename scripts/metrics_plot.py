@@ -6,8 +6,12 @@ Generates comprehensive KPI visualizations and HTML reports
 
 import json
 import argparse
+import hashlib
+import inspect
+import shutil
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 import logging
@@ -27,41 +31,438 @@ except ImportError as e:
     print(f"Missing: {e}")
     sys.exit(1)
 
+from metrics_history import CATEGORY_COLUMNS, HistoryStore, normalize_metrics
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Fields the report reads; a history store decodes only these columns
+PLOT_COLUMNS = ['timestamp'] + CATEGORY_COLUMNS + ['pipeline_success'] + [
+    'total_duration_ms', 'intent_generation_ms', 'krm_translation_ms', 'sync_latency_ms',
+    'pr_ready_time_ms', 'stages_completed', 'stages_failed', 'success_rate',
+]
+
+# Per-run series longer than this are averaged into this many points before plotting
+MAX_PLOT_POINTS = 1000
+
+
+def column_means(df, columns):
+    """NaN-skipping means of float32 columns, accumulated in float64"""
+    return pd.Series({c: np.nanmean(df[c].to_numpy(), dtype=np.float64) for c in columns})
+
+
+def downsample(frame, columns, max_points=MAX_PLOT_POINTS):
+    """Average consecutive rows into at most max_points rows (datetimes average too)"""
+    if len(frame) <= max_points:
+        return frame[columns].reset_index(drop=True)
+    bucket = np.arange(len(frame)) * max_points // len(frame)
+    return frame[columns].groupby(bucket).mean()
+
+
+def box_stats(df, by, column):
+    """Box plot statistics per group for Axes.bxp, computed with grouped quantiles.
+
+    Whiskers extend to the furthest value within 1.5 IQR of the box, as in
+    Axes.boxplot; outliers are not drawn.
+    """
+    grouped = df.groupby(by, observed=True)[column]
+    quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    iqr = quartiles[0.75] - quartiles[0.25]
+    keys = df[by]
+    low_fence = (quartiles[0.25] - 1.5 * iqr).reindex(keys).to_numpy()
+    high_fence = (quartiles[0.75] + 1.5 * iqr).reindex(keys).to_numpy()
+    values = df[column].to_numpy()
+    whislo = df[column].where(values >= low_fence).groupby(keys, observed=True).min()
+    whishi = df[column].where(values <= high_fence).groupby(keys, observed=True).max()
+    return [
+        {'label': str(group), 'q1': q[0.25], 'med': q[0.5], 'q3': q[0.75],
+         'whislo': whislo[group], 'whishi': whishi[group], 'fliers': []}
+        for group, q in quartiles.iterrows()
+    ]
+
+
+def format_time_axis(ax, timestamps, hour_interval):
+    """Hourly ticks for a single night of runs, automatic date ticks for longer spans"""
+    span = timestamps.max() - timestamps.min() if len(timestamps) else pd.Timedelta(0)
+    if span <= pd.Timedelta(days=1):
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
+        ax.xaxis.set_major_locator(mdates.HourLocator(interval=hour_interval))
+    else:
+        locator = mdates.AutoDateLocator()
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+
+
+# Each chart is its own figure, so it can be drawn in a worker process and cached on disk
+CHART_STYLE = {'style': 'seaborn', 'palette': 'husl', 'dpi': 150}
+DASHBOARD_PANEL_SIZE = (6, 14 / 3)
+TREND_PANEL_SIZE = (7.5, 5)
+TITLE_BAND = 0.6  # inches above the tiled charts for the figure title
+
+
+def apply_style():
+    """Plot style shared by the main process and chart workers"""
+    try:
+        plt.style.use(CHART_STYLE['style'])
+    except:
+        plt.style.use('default')
+
+    sns.set_palette(CHART_STYLE['palette'])
+
+
+def digest(obj, h=None):
+    """Stable content hash of a chart's data slice (frames, arrays, containers, scalars)"""
+    if h is None:
+        h = hashlib.blake2b(digest_size=16)
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        layout = (obj.columns.tolist(), obj.dtypes.astype(str).tolist()) if isinstance(obj, pd.DataFrame) \
+            else (obj.name, str(obj.dtype))
+        h.update(repr(layout).encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        h.update(repr((obj.dtype.str, obj.shape)).encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        for key in sorted(obj):
+            h.update(repr(key).encode())
+            digest(obj[key], h)
+    elif isinstance(obj, (list, tuple)):
+        h.update(f'{type(obj).__name__}[{len(obj)}]'.encode())
+        for item in obj:
+            digest(item, h)
+    else:
+        h.update(repr(obj).encode())
+    return h
+
+
+def chart_key(draw, data, figsize):
+    """Cache key of a chart: its data slice, drawing code and style parameters"""
+    try:
+        source = inspect.getsource(draw)
+    except (OSError, TypeError):
+        source = draw.__qualname__
+    h = digest((source, figsize, CHART_STYLE, matplotlib.__version__))
+    return digest(data, h).hexdigest()
+
+
+def render_chart(draw, data, path, figsize):
+    """Draw one chart and save it as PNG (runs in a worker process)"""
+    fig, ax = plt.subplots(figsize=figsize)
+    draw(ax, data)
+    fig.tight_layout()
+
+    # Write then rename, so an interrupted run never leaves a truncated cache entry
+    partial = path.with_name(path.name + '.partial')
+    fig.savefig(partial, format='png', dpi=CHART_STYLE['dpi'], facecolor='white')
+    plt.close(fig)
+    os.replace(partial, path)
+    return path
+
+
+def compose_charts(paths, cols, title, path):
+    """Tile rendered chart images in a grid under a title, without redrawing them"""
+    images = [plt.imread(p) for p in paths]
+    height, width = images[0].shape[:2]
+    rows = -(-len(images) // cols)
+    dpi = CHART_STYLE['dpi']
+    band = int(TITLE_BAND * dpi)
+
+    fig = plt.figure(figsize=(cols * width / dpi, (rows * height + band) / dpi), dpi=dpi)
+    for i, image in enumerate(images):
+        row, col = divmod(i, cols)
+        fig.figimage(image, xo=col * width, yo=(rows - 1 - row) * height)
+    fig.suptitle(title, fontsize=16, fontweight='bold', y=1 - band / 2 / (rows * height + band))
+
+    partial = path.with_name(path.name + '.partial')
+    fig.savefig(partial, format='png', dpi=dpi, facecolor='white')
+    plt.close(fig)
+    os.replace(partial, path)
+    return path
+
+
+def plot_success_by_site(ax, success_by_site):
+    """Chart 1: Pipeline Success Rate by Site"""
+    if success_by_site is not None:
+        bars = ax.bar(success_by_site.index, success_by_site.values,
+                     color=['green' if x >= 95 else 'orange' if x >= 90 else 'red' for x in success_by_site.values],
+                     alpha=0.7, edgecolor='black')
+        ax.set_title('Pipeline Success Rate by Site')
+        ax.set_ylabel('Success Rate (%)')
+        ax.set_ylim(0, 105)
+        ax.axhline(y=95, color='green', linestyle='--', alpha=0.5, label='Target: 95%')
+
+        # Add value labels
+        for bar, value in zip(bars, success_by_site.values):
+            ax.text(bar.get_x() + bar.get_width()/2., bar.get_height() + 1,
+                   f'{value:.1f}%', ha='center', va='bottom', fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+
+def plot_duration_by_service(ax, services):
+    """Chart 2: Duration Trends by Service Type"""
+    for service_type, runs, durations, markers in services or []:
+        ax.plot(runs, durations, marker='o' if markers else None,
+               label=service_type.replace('-', '\n'), alpha=0.7, linewidth=2)
+
+    ax.set_title('Pipeline Duration by Service Type')
+    ax.set_xlabel('Test Run')
+    ax.set_ylabel('Duration (ms)')
+    ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+    ax.grid(True, alpha=0.3)
+
+
+def plot_sync_latency_histogram(ax, histogram):
+    """Chart 3: Sync Latency Distribution, from precomputed bin counts"""
+    if histogram is not None:
+        edges = histogram['edges']
+        ax.hist(edges[:-1], bins=edges, weights=histogram['counts'], alpha=0.7, color='skyblue', edgecolor='black')
+        ax.axvline(histogram['mean'], color='red', linestyle='--',
+                  label=f"Mean: {histogram['mean']:.1f}ms", linewidth=2)
+
+    ax.set_title('GitOps Sync Latency Distribution')
+    ax.set_xlabel('Latency (ms)')
+    ax.set_ylabel('Frequency')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+
+def plot_pr_ready_by_site(ax, stats):
+    """Chart 4: PR Ready Time Comparison"""
+    if stats is not None:
+        boxes = ax.bxp(stats, showfliers=False, patch_artist=True)
+        for box in boxes['boxes']:
+            box.set(facecolor='lightgreen', alpha=0.7)
+
+    ax.set_title('PR Ready Time by Site')
+    ax.set_ylabel('Time (ms)')
+    ax.grid(True, alpha=0.3)
+
+
+def plot_intent_components(ax, data):
+    """Chart 5: Intent Processing Performance"""
+    if data is not None:
+        x, components = data['runs'], data['components']
+        width = 0.35 * (x[1] - x[0] if len(x) > 1 else 1)
+
+        ax.bar(x - width/2, components['intent_generation_ms'], width, label='Intent Gen', alpha=0.7)
+        ax.bar(x + width/2, components['krm_translation_ms'], width, label='KRM Translation', alpha=0.7)
+
+    ax.set_title('Intent Processing Components')
+    ax.set_xlabel('Test Run')
+    ax.set_ylabel('Time (ms)')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+
+def plot_success_heatmap(ax, success_matrix):
+    """Chart 6: Success Rate Heatmap"""
+    if success_matrix is not None:
+        sites = list(success_matrix.index)
+        services = list(success_matrix.columns)
+        matrix = success_matrix.to_numpy(dtype=float)
+
+        im = ax.imshow(matrix, cmap='RdYlGn', vmin=0, vmax=1, aspect='auto')
+        ax.set_xticks(range(len(services)))
+        ax.set_xticklabels([s.replace('-', '\n') for s in services], rotation=45, ha='right')
+        ax.set_yticks(range(len(sites)))
+        ax.set_yticklabels(sites)
+
+        # Add text annotations
+        for i in range(len(sites)):
+            for j in range(len(services)):
+                ax.text(j, i, f'{matrix[i, j]:.1%}',
+                       ha="center", va="center", color="black", fontweight='bold')
+
+        ax.figure.colorbar(im, ax=ax, label='Success Rate')
+
+    ax.set_title('Success Rate Heatmap\n(Site vs Service Type)')
+
+
+def plot_stage_analysis(ax, data):
+    """Chart 7: Stage Completion Analysis"""
+    if data is not None:
+        x, stages = data['runs'], data['stages']
+        ax.scatter(x, stages['stages_completed'], alpha=0.7, label='Completed', color='green', s=50)
+        ax.scatter(x, stages['stages_failed'], alpha=0.7, label='Failed', color='red', s=50)
+
+    ax.set_title('Pipeline Stage Analysis')
+    ax.set_xlabel('Test Run')
+    ax.set_ylabel('Number of Stages')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+
+def plot_duration_trend(ax, data):
+    """Chart 8: Performance Trends Over Time, with a linear fit over all runs"""
+    if data is not None:
+        trend, slope = data['trend'], data['slope']
+        ax.plot(trend['timestamp'].values, trend['total_duration_ms'].values, marker='o',
+               color='purple', linewidth=2, alpha=0.7)
+        ax.plot(trend['timestamp'].values, data['fit'], "--",
+               color='red', alpha=0.8,
+               label=f'Trend: {"↗" if slope > 0 else "↘"} {abs(slope):.1f}ms/run')
+        format_time_axis(ax, trend['timestamp'], 1)
+
+    ax.set_title('Performance Trend Analysis')
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Duration (ms)')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+
+def plot_summary(ax, summary_text):
+    """Chart 9: Overall Summary Stats"""
+    ax.axis('off')
+    if summary_text is not None:
+        ax.text(0.05, 0.5, summary_text, fontsize=10, family='monospace',
+               verticalalignment='center', transform=ax.transAxes,
+               bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', alpha=0.8))
+
+
+def plot_sync_latency_trend(ax, data):
+    """Trend 1: Sync Latency Over Time"""
+    trend = data['trend']
+    timestamps = trend['timestamp'].values
+    sync_latencies = trend['sync_latency_ms'].values
+
+    ax.plot(timestamps, sync_latencies, marker='o', color='blue', linewidth=2, markersize=data['marker_size'])
+    ax.axhline(y=50, color='red', linestyle='--', alpha=0.7, label='SLA Limit: 50ms')
+    ax.fill_between(timestamps, sync_latencies, alpha=0.3, color='blue')
+
+    ax.set_title('GitOps Sync Latency Trend')
+    ax.set_ylabel('Latency (ms)')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    format_time_axis(ax, trend['timestamp'], 2)
+
+
+def plot_success_rate_trend(ax, data):
+    """Trend 2: Success Rate Trend"""
+    trend = data['trend']
+    timestamps = trend['timestamp'].values
+    success_rates = trend['success_rate'].values * 100
+
+    ax.plot(timestamps, success_rates, marker='s', color='green', linewidth=2, markersize=data['marker_size'])
+    ax.axhline(y=95, color='orange', linestyle='--', alpha=0.7, label='Target: 95%')
+    ax.fill_between(timestamps, success_rates, alpha=0.3, color='green')
+
+    ax.set_title('Pipeline Success Rate Trend')
+    ax.set_ylabel('Success Rate (%)')
+    ax.set_ylim(0, 105)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    format_time_axis(ax, trend['timestamp'], 2)
+
+
+def plot_service_duration_trend(ax, data):
+    """Trend 3: Duration by Service Type"""
+    for service_type, service_trend in data['services']:
+        ax.plot(service_trend['timestamp'].values, service_trend['total_duration_ms'].values, marker='o',
+               markersize=data['marker_size'], label=service_type.replace('-', ' ').title(), linewidth=2, alpha=0.8)
+
+    ax.set_title('Duration Trends by Service Type')
+    ax.set_ylabel('Duration (ms)')
+    ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+    ax.grid(True, alpha=0.3)
+    format_time_axis(ax, pd.concat([trend['timestamp'] for _, trend in data['services']]), 2)
+
+
+def plot_pr_ready_trend(ax, data):
+    """Trend 4: PR Ready Time with its moving average"""
+    trend, marker_size = data['trend'], data['marker_size']
+    timestamps = trend['timestamp'].values
+    pr_times = trend['pr_ready_time_ms'].values
+
+    if data['moving_avg'] is not None:
+        ax.plot(timestamps, pr_times, 'o-', markersize=marker_size, alpha=0.6,
+                label='Actual', color='purple')
+        ax.plot(timestamps, data['moving_avg'], '-', linewidth=3,
+                label=f"{data['window_size']}-run MA", color='red')
+    else:
+        ax.plot(timestamps, pr_times, 'o-', alpha=0.8, label='PR Ready Time', color='purple')
+
+    ax.set_title('PR Ready Time Trend')
+    ax.set_ylabel('Time (ms)')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    format_time_axis(ax, trend['timestamp'], 2)
+
+
+# Chart name -> drawing function, in grid order
+DASHBOARD_CHARTS = {
+    'success_by_site': plot_success_by_site,
+    'duration_by_service': plot_duration_by_service,
+    'sync_latency_histogram': plot_sync_latency_histogram,
+    'pr_ready_by_site': plot_pr_ready_by_site,
+    'intent_components': plot_intent_components,
+    'success_heatmap': plot_success_heatmap,
+    'stage_analysis': plot_stage_analysis,
+    'duration_trend': plot_duration_trend,
+    'summary': plot_summary,
+}
+TREND_CHARTS = {
+    'sync_latency_trend': plot_sync_latency_trend,
+    'success_rate_trend': plot_success_rate_trend,
+    'service_duration_trend': plot_service_duration_trend,
+    'pr_ready_trend': plot_pr_ready_trend,
+}
+
+
 class MetricsPlotter:
     """Main class for generating KPI plots and reports"""
 
-    def __init__(self, input_file, output_dir, title="Nightly Regression Report"):
+    def __init__(self, input_file, output_dir, title="Nightly Regression Report", jobs=None, force=False,
+                 since=None, until=None):
         self.input_file = Path(input_file)
         self.output_dir = Path(output_dir)
         self.title = title
+        self.since = since
+        self.until = until
+        self.jobs = jobs or os.cpu_count() or 1
+        self.force = force
 
-        # Create output directory
+        # Create output directory; rendered charts are kept in charts/ across runs
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.chart_dir = self.output_dir / 'charts'
+        self.chart_dir.mkdir(exist_ok=True)
 
-        # Set style
-        try:
-            plt.style.use('seaborn')
-        except:
-            plt.style.use('default')
+        # Chart name -> image path, and the charts drawn (not cached) this run
+        self.charts = {}
+        self.redrawn = None
 
-        sns.set_palette("husl")
+        apply_style()
 
     def load_data(self):
-        """Load and validate metrics data"""
-        try:
-            with open(self.input_file, 'r') as f:
-                data = json.load(f)
+        """Load and validate metrics data from a JSON file or a history store directory.
 
-            if 'metrics' not in data:
-                raise ValueError("No 'metrics' key found in data")
-
-            self.data = data
-            self.metrics = data['metrics']
-            logger.info(f"Loaded {len(self.metrics)} metric records")
+        Only runs dated since..until (inclusive, UTC) are kept.
+        """
+        try:
+            if self.input_file.is_dir():
+                self.data = {}
+                self.df = HistoryStore(self.input_file).read(PLOT_COLUMNS, self.since, self.until)
+            else:
+                with open(self.input_file, 'r') as f:
+                    data = json.load(f)
+
+                if 'metrics' not in data:
+                    raise ValueError("No 'metrics' key found in data")
+
+                records = data.pop('metrics')
+                self.data = data
+                df = normalize_metrics(records)
+                del records
+                if self.since or self.until:
+                    dates = df['timestamp'].dt.strftime('%Y-%m-%d')
+                    df = df[(dates >= (self.since or '')) & (dates <= (self.until or '9999-12-31'))]
+                    df = df.reset_index(drop=True)
+                self.df = df
+
+            logger.info(f"Loaded {len(self.df)} metric records "
+                        f"({self.df.memory_usage(deep=True).sum() / 2**20:.1f} MiB)")
 
             return True
 
@@ -69,189 +470,47 @@ class MetricsPlotter:
             logger.error(f"Failed to load data: {e}")
             return False
 
-    def create_performance_dashboard(self):
-        """Create main performance dashboard with multiple charts"""
-        logger.info("Generating performance dashboard...")
+    def dashboard_data(self):
+        """Data slice drawn by each dashboard chart; empty when there are no records"""
+        df = self.df
 
-        # Create figure with subplots
-        fig, axes = plt.subplots(3, 3, figsize=(18, 14))
-        fig.suptitle(f'{self.title} - Performance Dashboard', fontsize=16, fontweight='bold')
-
-        # Convert metrics to DataFrame for easier analysis
-        df = pd.DataFrame(self.metrics)
-
-        # Chart 1: Pipeline Success Rate by Site
-        ax = axes[0, 0]
-        if not df.empty:
-            success_by_site = df.groupby('site')['metrics'].apply(
-                lambda x: sum(m['pipeline_success'] for m in x) / len(x) * 100
-            )
-            bars = ax.bar(success_by_site.index, success_by_site.values,
-                         color=['green' if x >= 95 else 'orange' if x >= 90 else 'red' for x in success_by_site.values],
-                         alpha=0.7, edgecolor='black')
-            ax.set_title('Pipeline Success Rate by Site')
-            ax.set_ylabel('Success Rate (%)')
-            ax.set_ylim(0, 105)
-            ax.axhline(y=95, color='green', linestyle='--', alpha=0.5, label='Target: 95%')
-
-            # Add value labels
-            for bar, value in zip(bars, success_by_site.values):
-                ax.text(bar.get_x() + bar.get_width()/2., bar.get_height() + 1,
-                       f'{value:.1f}%', ha='center', va='bottom', fontweight='bold')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-
-        # Chart 2: Duration Trends by Service Type
-        ax = axes[0, 1]
-        if not df.empty:
-            for service_type in df['service_type'].unique():
-                service_data = df[df['service_type'] == service_type]
-                durations = [m['total_duration_ms'] for m in service_data['metrics']]
-                ax.plot(range(len(durations)), durations, marker='o',
-                       label=service_type.replace('-', '\n'), alpha=0.7, linewidth=2)
-
-        ax.set_title('Pipeline Duration by Service Type')
-        ax.set_xlabel('Test Run')
-        ax.set_ylabel('Duration (ms)')
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        ax.grid(True, alpha=0.3)
-
-        # Chart 3: Sync Latency Distribution
-        ax = axes[0, 2]
-        if not df.empty:
-            all_sync_latencies = [m['sync_latency_ms'] for m in df['metrics']]
-            ax.hist(all_sync_latencies, bins=15, alpha=0.7, color='skyblue', edgecolor='black')
-            ax.axvline(np.mean(all_sync_latencies), color='red', linestyle='--',
-                      label=f'Mean: {np.mean(all_sync_latencies):.1f}ms', linewidth=2)
-
-        ax.set_title('GitOps Sync Latency Distribution')
-        ax.set_xlabel('Latency (ms)')
-        ax.set_ylabel('Frequency')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-
-        # Chart 4: PR Ready Time Comparison
-        ax = axes[1, 0]
-        if not df.empty:
-            pr_times_by_site = {}
-            for site in df['site'].unique():
-                site_data = df[df['site'] == site]
-                pr_times_by_site[site] = [m['pr_ready_time_ms'] for m in site_data['metrics']]
-
-            ax.boxplot(pr_times_by_site.values(), labels=pr_times_by_site.keys(),
-                      patch_artist=True,
-                      boxprops=dict(facecolor='lightgreen', alpha=0.7))
-
-        ax.set_title('PR Ready Time by Site')
-        ax.set_ylabel('Time (ms)')
-        ax.grid(True, alpha=0.3)
-
-        # Chart 5: Intent Processing Performance
-        ax = axes[1, 1]
-        if not df.empty:
-            intent_times = [m['intent_generation_ms'] for m in df['metrics']]
-            krm_times = [m['krm_translation_ms'] for m in df['metrics']]
-
-            x = range(len(intent_times))
-            width = 0.35
-
-            ax.bar([i - width/2 for i in x], intent_times, width, label='Intent Gen', alpha=0.7)
-            ax.bar([i + width/2 for i in x], krm_times, width, label='KRM Translation', alpha=0.7)
-
-        ax.set_title('Intent Processing Components')
-        ax.set_xlabel('Test Run')
-        ax.set_ylabel('Time (ms)')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-
-        # Chart 6: Success Rate Heatmap
-        ax = axes[1, 2]
-        if not df.empty:
-            # Create success rate matrix
-            sites = df['site'].unique()
-            services = df['service_type'].unique()
-
-            success_matrix = np.zeros((len(sites), len(services)))
-
-            for i, site in enumerate(sites):
-                for j, service in enumerate(services):
-                    subset = df[(df['site'] == site) & (df['service_type'] == service)]
-                    if not subset.empty:
-                        success_rate = sum(m['pipeline_success'] for m in subset['metrics']) / len(subset)
-                        success_matrix[i, j] = success_rate
-
-            im = ax.imshow(success_matrix, cmap='RdYlGn', vmin=0, vmax=1, aspect='auto')
-            ax.set_xticks(range(len(services)))
-            ax.set_xticklabels([s.replace('-', '\n') for s in services], rotation=45, ha='right')
-            ax.set_yticks(range(len(sites)))
-            ax.set_yticklabels(sites)
-
-            # Add text annotations
-            for i in range(len(sites)):
-                for j in range(len(services)):
-                    text = ax.text(j, i, f'{success_matrix[i, j]:.1%}',
-                                 ha="center", va="center", color="black", fontweight='bold')
-
-            plt.colorbar(im, ax=ax, label='Success Rate')
-
-        ax.set_title('Success Rate Heatmap\n(Site vs Service Type)')
-
-        # Chart 7: Stage Completion Analysis
-        ax = axes[2, 0]
-        if not df.empty:
-            stages_completed = [m['stages_completed'] for m in df['metrics']]
-            stages_failed = [m['stages_failed'] for m in df['metrics']]
-
-            x = range(len(stages_completed))
-            ax.scatter(x, stages_completed, alpha=0.7, label='Completed', color='green', s=50)
-            ax.scatter(x, stages_failed, alpha=0.7, label='Failed', color='red', s=50)
-
-        ax.set_title('Pipeline Stage Analysis')
-        ax.set_xlabel('Test Run')
-        ax.set_ylabel('Number of Stages')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-
-        # Chart 8: Performance Trends Over Time
-        ax = axes[2, 1]
-        if not df.empty:
-            # Sort by timestamp for trend analysis
-            df_sorted = df.sort_values('timestamp')
-            timestamps = pd.to_datetime(df_sorted['timestamp'])
-            avg_durations = [m['total_duration_ms'] for m in df_sorted['metrics']]
-
-            ax.plot(timestamps.values, avg_durations, marker='o', color='purple', linewidth=2, alpha=0.7)
-
-            # Add trend line
-            z = np.polyfit(range(len(avg_durations)), avg_durations, 1)
-            p = np.poly1d(z)
-            ax.plot(timestamps.values, p(range(len(avg_durations))), "--", color='red', alpha=0.8,
-                   label=f'Trend: {"↗" if z[0] > 0 else "↘"} {abs(z[0]):.1f}ms/run')
-
-        ax.set_title('Performance Trend Analysis')
-        ax.set_xlabel('Time')
-        ax.set_ylabel('Duration (ms)')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-
-        # Format x-axis for better time display
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-        ax.xaxis.set_major_locator(mdates.HourLocator(interval=1))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+        if df.empty:
+            return {}
 
-        # Chart 9: Overall Summary Stats
-        ax = axes[2, 2]
-        ax.axis('off')
+        success_by_site = df.groupby('site', observed=True)['pipeline_success'].mean() * 100
+        success_by_site.index = success_by_site.index.astype(str)
 
-        if not df.empty:
-            # Calculate summary statistics
-            total_runs = len(df)
-            successful_runs = sum(m['pipeline_success'] for m in df['metrics'])
-            avg_duration = np.mean([m['total_duration_ms'] for m in df['metrics']])
-            avg_sync_latency = np.mean([m['sync_latency_ms'] for m in df['metrics']])
-            avg_success_rate = np.mean([m['success_rate'] for m in df['metrics']])
+        services = []
+        for service_type, service_data in df.groupby('service_type', observed=True, sort=False):
+            durations = downsample(service_data, ['total_duration_ms'])['total_duration_ms'].to_numpy()
+            runs = np.linspace(0, len(service_data) - 1, len(durations))
+            services.append((service_type, runs, durations, len(service_data) <= MAX_PLOT_POINTS))
+
+        sync_latencies = df['sync_latency_ms'].dropna().to_numpy()
+        counts, edges = np.histogram(sync_latencies, bins=15)
+
+        components = downsample(df, ['intent_generation_ms', 'krm_translation_ms'])
+        stages = downsample(df, ['stages_completed', 'stages_failed'])
 
-            summary_text = f"""
+        # Site x service success rate matrix, untested combinations shown as 0
+        success_matrix = df.pivot_table(index='site', columns='service_type', values='pipeline_success',
+                                        aggfunc='mean', observed=True).fillna(0.0)
+        success_matrix.index = success_matrix.index.astype(str)
+        success_matrix.columns = success_matrix.columns.astype(str)
+
+        # Sort by timestamp for trend analysis; the trend line is fitted over all runs
+        df_sorted = df[['timestamp', 'total_duration_ms']].sort_values('timestamp', kind='stable')
+        trend = downsample(df_sorted, ['timestamp', 'total_duration_ms'])
+        z = np.polyfit(np.arange(len(df_sorted)), df_sorted['total_duration_ms'].to_numpy(dtype=np.float64), 1)
+        fit = np.poly1d(z)(np.linspace(0, len(df_sorted) - 1, len(trend)))
+
+        # Calculate summary statistics
+        total_runs = len(df)
+        successful_runs = int(df['pipeline_success'].sum())
+        means = column_means(df, ['total_duration_ms', 'sync_latency_ms', 'success_rate'])
+        latest_run = df['timestamp'].max()
+
+        summary_text = f"""
 NIGHTLY REGRESSION SUMMARY
 {'='*30}
 
@@ -260,132 +519,151 @@ Successful Runs: {successful_runs}
 Overall Success Rate: {successful_runs/total_runs*100:.1f}%
 
 Performance Metrics:
-  Avg Duration: {avg_duration:.1f}ms
-  Avg Sync Latency: {avg_sync_latency:.1f}ms
-  Avg Stage Success: {avg_success_rate:.1%}
+  Avg Duration: {means['total_duration_ms']:.1f}ms
+  Avg Sync Latency: {means['sync_latency_ms']:.1f}ms
+  Avg Stage Success: {means['success_rate']:.1%}
 
-Sites Tested: {', '.join(df['site'].unique())}
-Services Tested: {len(df['service_type'].unique())}
+Sites Tested: {', '.join(df['site'].unique().astype(str))}
+Services Tested: {df['service_type'].nunique()}
 
 Status: {'✅ PASS' if successful_runs/total_runs >= 0.95 else '⚠️ DEGRADED' if successful_runs/total_runs >= 0.90 else '❌ FAIL'}
 
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
+Latest Run: {latest_run.strftime('%Y-%m-%d %H:%M UTC') if pd.notna(latest_run) else 'n/a'}
             """
 
-            ax.text(0.05, 0.5, summary_text, fontsize=10, family='monospace',
-                   verticalalignment='center', transform=ax.transAxes,
-                   bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', alpha=0.8))
+        return {
+            'success_by_site': success_by_site.sort_index(),
+            'duration_by_service': services,
+            'sync_latency_histogram': {'counts': counts, 'edges': edges,
+                                       'mean': sync_latencies.mean(dtype=np.float64)},
+            'pr_ready_by_site': box_stats(df, 'site', 'pr_ready_time_ms'),
+            'intent_components': {'runs': np.linspace(0, len(df) - 1, len(components)), 'components': components},
+            'success_heatmap': success_matrix,
+            'stage_analysis': {'runs': np.linspace(0, len(df) - 1, len(stages)), 'stages': stages},
+            'duration_trend': {'trend': trend, 'slope': z[0], 'fit': fit},
+            'summary': summary_text,
+        }
+
+    def trend_data(self):
+        """Data slice drawn by each KPI trend chart; empty when there are no records"""
+        df = self.df
 
-        plt.tight_layout()
+        if df.empty:
+            return {}
 
-        # Save the dashboard
-        dashboard_path = self.output_dir / 'performance_dashboard.png'
-        plt.savefig(dashboard_path, dpi=150, bbox_inches='tight', facecolor='white')
-        logger.info(f"Dashboard saved to {dashboard_path}")
+        # Sort by timestamp; series longer than MAX_PLOT_POINTS are plotted as bucket averages
+        df_sorted = df.sort_values('timestamp', kind='stable')
+        marker_size = 6 if len(df_sorted) <= MAX_PLOT_POINTS else 0
+        trend = downsample(df_sorted, ['timestamp', 'sync_latency_ms', 'success_rate', 'pr_ready_time_ms'])
 
-        plt.close()
+        services = [
+            (service_type, downsample(service_data, ['timestamp', 'total_duration_ms']))
+            for service_type, service_data in df_sorted.groupby('service_type', observed=True, sort=False)
+        ]
+
+        # Create moving average over all runs, then reduce it like the plotted series
+        window_size = min(5, len(df_sorted))
+        moving_avg = None
+        if window_size > 1:
+            moving_avg = df_sorted['pr_ready_time_ms'].rolling(window=window_size).mean()
+            moving_avg = downsample(moving_avg.to_frame(), ['pr_ready_time_ms'])['pr_ready_time_ms'].to_numpy()
+
+        return {
+            'sync_latency_trend': {'trend': trend[['timestamp', 'sync_latency_ms']], 'marker_size': marker_size},
+            'success_rate_trend': {'trend': trend[['timestamp', 'success_rate']], 'marker_size': marker_size},
+            'service_duration_trend': {'services': services, 'marker_size': marker_size},
+            'pr_ready_trend': {'trend': trend[['timestamp', 'pr_ready_time_ms']], 'marker_size': marker_size,
+                               'moving_avg': moving_avg, 'window_size': window_size},
+        }
+
+    def render_charts(self):
+        """Render every chart whose data slice changed since the last run.
+
+        Each chart is saved as charts/<name>-<key>.png, where the key hashes
+        its data slice, drawing code and style. Existing files are reused and
+        the rest are drawn in parallel, one process per chart.
+        """
+        logger.info("Rendering charts...")
+
+        dashboard_data = self.dashboard_data()
+        pending = {}
+        for charts, data, figsize in ((DASHBOARD_CHARTS, dashboard_data, DASHBOARD_PANEL_SIZE),
+                                      (TREND_CHARTS, self.trend_data(), TREND_PANEL_SIZE)):
+            for name, draw in charts.items():
+                if charts is TREND_CHARTS and not data:
+                    continue
+                chart_data = data.get(name)
+                path = self.chart_dir / f'{name}-{chart_key(draw, chart_data, figsize)}.png'
+                self.charts[name] = path
+                if self.force or not path.exists():
+                    pending[name] = (draw, chart_data, path, figsize)
+
+        if len(pending) > 1 and self.jobs > 1:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(pending)), initializer=apply_style) as pool:
+                for future in [pool.submit(render_chart, *job) for job in pending.values()]:
+                    future.result()
+        else:
+            for job in pending.values():
+                render_chart(*job)
+
+        for name in self.charts:
+            self.remove_stale(name)
+
+        self.redrawn = list(pending)
+        logger.info(f"Rendered {len(pending)} of {len(self.charts)} charts "
+                    f"({len(self.charts) - len(pending)} unchanged)")
+        return self.charts
+
+    def remove_stale(self, name):
+        """Delete cached images of a chart other than its current one"""
+        for path in self.chart_dir.glob(f'{name}-{"[0-9a-f]" * 32}.png'):
+            if path != self.charts[name]:
+                path.unlink()
+
+    def compose(self, name, chart_names, cols, title):
+        """Tile cached charts into output_dir/<name>.png, itself cached by its inputs"""
+        if self.redrawn is None:
+            self.render_charts()
+
+        paths = [self.charts[c] for c in chart_names]
+        cached = self.chart_dir / f'{name}-{chart_key(compose_charts, [title, cols, [p.name for p in paths]], None)}.png'
+        if self.force or not cached.exists():
+            compose_charts(paths, cols, title, cached)
+        self.charts[name] = cached
+        self.remove_stale(name)
+
+        output_path = self.output_dir / f'{name}.png'
+        shutil.copyfile(cached, output_path)
+        return output_path
+
+    def create_performance_dashboard(self):
+        """Create main performance dashboard from the rendered dashboard charts"""
+        logger.info("Generating performance dashboard...")
+
+        dashboard_path = self.compose('performance_dashboard', DASHBOARD_CHARTS, 3,
+                                      f'{self.title} - Performance Dashboard')
+        logger.info(f"Dashboard saved to {dashboard_path}")
 
         return dashboard_path
 
     def create_kpi_trends(self):
-        """Create KPI trend charts"""
+        """Create KPI trend charts from the rendered trend charts"""
         logger.info("Generating KPI trend charts...")
 
-        df = pd.DataFrame(self.metrics)
-
-        if df.empty:
+        if self.df.empty:
             logger.warning("No data available for KPI trends")
             return None
 
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-        fig.suptitle(f'{self.title} - KPI Trends', fontsize=16, fontweight='bold')
-
-        # Sort by timestamp
-        df_sorted = df.sort_values('timestamp')
-
-        # Trend 1: Sync Latency Over Time
-        ax = axes[0, 0]
-        timestamps = pd.to_datetime(df_sorted['timestamp'])
-        sync_latencies = [m['sync_latency_ms'] for m in df_sorted['metrics']]
-
-        ax.plot(timestamps.values, sync_latencies, marker='o', color='blue', linewidth=2, markersize=6)
-        ax.axhline(y=50, color='red', linestyle='--', alpha=0.7, label='SLA Limit: 50ms')
-        ax.fill_between(timestamps.values, sync_latencies, alpha=0.3, color='blue')
-
-        ax.set_title('GitOps Sync Latency Trend')
-        ax.set_ylabel('Latency (ms)')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-
-        # Trend 2: Success Rate Trend
-        ax = axes[0, 1]
-        success_rates = [m['success_rate'] * 100 for m in df_sorted['metrics']]
-
-        ax.plot(timestamps.values, success_rates, marker='s', color='green', linewidth=2, markersize=6)
-        ax.axhline(y=95, color='orange', linestyle='--', alpha=0.7, label='Target: 95%')
-        ax.fill_between(timestamps.values, success_rates, alpha=0.3, color='green')
-
-        ax.set_title('Pipeline Success Rate Trend')
-        ax.set_ylabel('Success Rate (%)')
-        ax.set_ylim(0, 105)
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-
-        # Trend 3: Duration by Service Type
-        ax = axes[1, 0]
-        for service_type in df['service_type'].unique():
-            service_data = df_sorted[df_sorted['service_type'] == service_type]
-            service_timestamps = pd.to_datetime(service_data['timestamp'])
-            service_durations = [m['total_duration_ms'] for m in service_data['metrics']]
-
-            ax.plot(service_timestamps.values, service_durations, marker='o',
-                   label=service_type.replace('-', ' ').title(), linewidth=2, alpha=0.8)
-
-        ax.set_title('Duration Trends by Service Type')
-        ax.set_ylabel('Duration (ms)')
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        ax.grid(True, alpha=0.3)
-
-        # Trend 4: PR Ready Time Distribution
-        ax = axes[1, 1]
-        pr_times = [m['pr_ready_time_ms'] for m in df_sorted['metrics']]
-
-        # Create moving average
-        window_size = min(5, len(pr_times))
-        if window_size > 1:
-            moving_avg = pd.Series(pr_times).rolling(window=window_size).mean()
-            ax.plot(timestamps.values, pr_times, 'o-', alpha=0.6, label='Actual', color='purple')
-            ax.plot(timestamps.values, moving_avg.values, '-', linewidth=3, label=f'{window_size}-run MA', color='red')
-        else:
-            ax.plot(timestamps.values, pr_times, 'o-', alpha=0.8, label='PR Ready Time', color='purple')
-
-        ax.set_title('PR Ready Time Trend')
-        ax.set_ylabel('Time (ms)')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-
-        # Format all time axes
-        for ax in axes.flat:
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-            ax.xaxis.set_major_locator(mdates.HourLocator(interval=2))
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-
-        plt.tight_layout()
-
-        # Save KPI trends
-        trends_path = self.output_dir / 'kpi_trends.png'
-        plt.savefig(trends_path, dpi=150, bbox_inches='tight', facecolor='white')
+        trends_path = self.compose('kpi_trends', TREND_CHARTS, 2, f'{self.title} - KPI Trends')
         logger.info(f"KPI trends saved to {trends_path}")
 
-        plt.close()
-
         return trends_path
 
     def generate_html_report(self, dashboard_path, trends_path):
         """Generate comprehensive HTML report"""
         logger.info("Generating HTML report...")
 
-        df = pd.DataFrame(self.metrics)
+        df = self.df
 
         if df.empty:
             logger.warning("No data available for HTML report")
@@ -393,11 +671,12 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
 
         # Calculate summary statistics
         total_runs = len(df)
-        successful_runs = sum(m['pipeline_success'] for m in df['metrics'])
+        successful_runs = int(df['pipeline_success'].sum())
         overall_success_rate = successful_runs / total_runs * 100
-        avg_duration = np.mean([m['total_duration_ms'] for m in df['metrics']])
-        avg_sync_latency = np.mean([m['sync_latency_ms'] for m in df['metrics']])
-        avg_pr_time = np.mean([m['pr_ready_time_ms'] for m in df['metrics']])
+        means = column_means(df, ['total_duration_ms', 'sync_latency_ms', 'pr_ready_time_ms', 'stages_completed'])
+        avg_duration = means['total_duration_ms']
+        avg_sync_latency = means['sync_latency_ms']
+        avg_pr_time = means['pr_ready_time_ms']
 
         # Determine overall status
         if overall_success_rate >= 95:
@@ -411,8 +690,10 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
             status_text = "❌ SYSTEM FAILURE"
 
         # Get site and service breakdowns
-        sites_tested = list(df['site'].unique())
-        services_tested = list(df['service_type'].unique())
+        sites_tested = list(df['site'].unique().astype(str))
+        services_tested = list(df['service_type'].unique().astype(str))
+        best_site = df.groupby('site', observed=True)['pipeline_success'].sum().idxmax()
+        fastest_service = df.groupby('service_type', observed=True)['total_duration_ms'].mean().idxmin()
 
         html_content = f"""
 <!DOCTYPE html>
@@ -748,9 +1029,9 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
                 <div class="summary-card">
                     <h3>📈 Performance Insights</h3>
                     <ul class="summary-list">
-                        <li><span>Best Performing Site:</span> <strong>{max(set(df['site']), key=lambda x: sum(m['pipeline_success'] for m in df[df['site']==x]['metrics']))}</strong></li>
-                        <li><span>Fastest Service Type:</span> <strong>{min(services_tested, key=lambda x: np.mean([m['total_duration_ms'] for m in df[df['service_type']==x]['metrics']])).replace('-', ' ').title()}</strong></li>
-                        <li><span>Avg Stages Completed:</span> <strong>{np.mean([m['stages_completed'] for m in df['metrics']]):.1f}</strong></li>
+                        <li><span>Best Performing Site:</span> <strong>{best_site}</strong></li>
+                        <li><span>Fastest Service Type:</span> <strong>{fastest_service.replace('-', ' ').title()}</strong></li>
+                        <li><span>Avg Stages Completed:</span> <strong>{means['stages_completed']:.1f}</strong></li>
                         <li><span>SLA Compliance:</span> <strong>{"✅ Met" if avg_sync_latency < 50 else "⚠️ At Risk"}</strong></li>
                     </ul>
                 </div>
@@ -781,7 +1062,7 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
         """Generate JSON summary for API consumption"""
         logger.info("Generating JSON summary...")
 
-        df = pd.DataFrame(self.metrics)
+        df = self.df
 
         if df.empty:
             summary = {
@@ -791,7 +1072,9 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
         else:
             # Calculate comprehensive summary
             total_runs = len(df)
-            successful_runs = sum(m['pipeline_success'] for m in df['metrics'])
+            successful_runs = int(df['pipeline_success'].sum())
+            means = column_means(df, ['total_duration_ms', 'sync_latency_ms', 'pr_ready_time_ms',
+                                      'intent_generation_ms', 'krm_translation_ms'])
 
             summary = {
                 "timestamp": datetime.now().isoformat(),
@@ -800,21 +1083,22 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
                     "total_runs": total_runs,
                     "successful_runs": successful_runs,
                     "success_rate": successful_runs / total_runs if total_runs > 0 else 0,
-                    "sites_tested": list(df['site'].unique()),
-                    "services_tested": list(df['service_type'].unique())
+                    "sites_tested": list(df['site'].unique().astype(str)),
+                    "services_tested": list(df['service_type'].unique().astype(str))
                 },
                 "performance": {
-                    "avg_duration_ms": float(np.mean([m['total_duration_ms'] for m in df['metrics']])),
-                    "avg_sync_latency_ms": float(np.mean([m['sync_latency_ms'] for m in df['metrics']])),
-                    "avg_pr_ready_time_ms": float(np.mean([m['pr_ready_time_ms'] for m in df['metrics']])),
-                    "avg_intent_generation_ms": float(np.mean([m['intent_generation_ms'] for m in df['metrics']])),
-                    "avg_krm_translation_ms": float(np.mean([m['krm_translation_ms'] for m in df['metrics']]))
+                    "avg_duration_ms": float(means['total_duration_ms']),
+                    "avg_sync_latency_ms": float(means['sync_latency_ms']),
+                    "avg_pr_ready_time_ms": float(means['pr_ready_time_ms']),
+                    "avg_intent_generation_ms": float(means['intent_generation_ms']),
+                    "avg_krm_translation_ms": float(means['krm_translation_ms'])
                 },
                 "status": {
                     "overall": "PASS" if successful_runs / total_runs >= 0.95 else "WARN" if successful_runs / total_runs >= 0.90 else "FAIL",
-                    "sla_compliance": bool(np.mean([m['sync_latency_ms'] for m in df['metrics']]) < 50)
+                    "sla_compliance": bool(means['sync_latency_ms'] < 50)
                 },
-                "raw_data_count": total_runs
+                "raw_data_count": total_runs,
+                "charts": {name: str(path.relative_to(self.output_dir)) for name, path in self.charts.items()}
             }
 
         # Save JSON summary
@@ -826,12 +1110,26 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
 
         return json_path
 
+def run_date(value):
+    """argparse type for YYYY-MM-DD dates, compared as strings against partitions"""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').strftime('%Y-%m-%d')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', expected YYYY-MM-DD")
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description='Generate KPI plots and reports for nightly regression')
-    parser.add_argument('--input', '-i', required=True, help='Input JSON file with aggregated metrics')
+    parser.add_argument('--input', '-i', required=True,
+                        help='Input JSON file with aggregated metrics, or a metrics_history.py store directory')
     parser.add_argument('--output', '-o', required=True, help='Output directory for reports')
     parser.add_argument('--title', '-t', default='Nightly Regression Report', help='Report title')
+    parser.add_argument('--since', type=run_date, help='First run date to report (YYYY-MM-DD, UTC)')
+    parser.add_argument('--until', type=run_date, help='Last run date to report (YYYY-MM-DD, UTC)')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Chart rendering processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Redraw all charts, ignoring cached images')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose logging')
 
     args = parser.parse_args()
@@ -840,7 +1138,8 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
 
     # Initialize plotter
-    plotter = MetricsPlotter(args.input, args.output, args.title)
+    plotter = MetricsPlotter(args.input, args.output, args.title, jobs=args.jobs, force=args.force,
+                             since=args.since, until=args.until)
 
     # Load data
     if not plotter.load_data():
@@ -848,7 +1147,8 @@ def main():
         sys.exit(1)
 
     try:
-        # Generate visualizations
+        # Generate visualizations; unchanged charts are reused from the output directory
+        plotter.render_charts()
         dashboard_path = plotter.create_performance_dashboard()
         trends_path = plotter.create_kpi_trends()
 
@@ -5,22 +5,33 @@ monitoring_metrics_collector.py - Collect metrics from edge sites and GitOps sys
 This script collects metrics from multiple sources and provides them to Prometheus
 """
 
+import asyncio
+import bisect
+import hashlib
+import ipaddress
+import os
+import random
+import socket
 import time
-import requests
 import json
 import subprocess
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
+import httpx
 from prometheus_client import start_http_server, Gauge, Counter, Histogram
 import yaml
 
+from k8s_informer import ROOTSYNC, Informer, KubeApi, rootsync_synced
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+# Probes and watches would otherwise log every HTTP request
+logging.getLogger('httpx').setLevel(logging.WARNING)
 
 # Prometheus metrics
 edge_site_up = Gauge('edge_site_up', 'Edge site availability', ['site'])
@@ -29,12 +40,94 @@ o2ims_service_up = Gauge('o2ims_service_up', 'O2IMS service availability', ['sit
 gitops_sync_status = Gauge('gitops_sync_status', 'GitOps sync status', ['repository'])
 gitops_sync_failures = Counter('gitops_sync_failures_total', 'GitOps sync failures', ['repository'])
 response_time = Histogram('service_response_time_seconds', 'Service response time', ['service', 'site'])
+probe_latency = Histogram('edge_probe_duration_seconds', 'Edge probe latency', ['probe', 'site', 'result'],
+                          buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10))
+collection_cycle_seconds = Histogram('metrics_collection_cycle_seconds', 'Duration of a collection cycle',
+                                     buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60))
+collection_last_cycle_seconds = Gauge('metrics_collection_last_cycle_seconds',
+                                      'Duration of the most recent collection cycle')
+collector_owned_sites = Gauge('metrics_collector_owned_sites', 'Edge sites probed by this collector instance')
+collector_peers = Gauge('metrics_collector_peers', 'Live collector instances sharing the edge sites')
+collector_rebalances = Counter('metrics_collector_rebalances_total', 'Collector membership changes')
+config_reloads = Counter('metrics_collector_config_reloads_total', 'Configuration reloads', ['result'])
+
+# Ring key of the GitOps check, so exactly one instance runs it
+GITOPS_SHARD_KEY = '__gitops__'
+
+
+def is_loopback(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return host == 'localhost'
+
+
+def outbound_address() -> Optional[str]:
+    """Local address of the interface routing outside traffic (no packet is sent)"""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.connect(('192.0.2.1', 9))
+            address = sock.getsockname()[0]
+    except OSError:
+        return None
+    return None if is_loopback(address) else address
+
+
+def local_addresses() -> Set[str]:
+    """Addresses this host answers on, as far as they can be found without extra packages"""
+    addresses = {'localhost'}
+    try:
+        addresses.update(info[4][0] for info in socket.getaddrinfo(socket.gethostname(), None))
+    except OSError:
+        pass
+    outbound = outbound_address()
+    if outbound:
+        addresses.add(outbound)
+    return addresses
+
+
+def ring_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'big')
+
+
+class HashRing:
+    """Consistent hash ring with virtual nodes
+
+    Each member owns the keys hashing between its virtual nodes and the previous
+    point on the ring, so adding or removing a member only moves the keys of the
+    arcs it gains or loses (about 1/N of them).
+    """
+
+    def __init__(self, members: Iterable[str], virtual_nodes: int = 128):
+        self.members = sorted(set(members))
+        self.virtual_nodes = virtual_nodes
+        points = sorted((ring_hash(f"{member}#{i}"), member)
+                        for member in self.members for i in range(virtual_nodes))
+        self._hashes = [h for h, _ in points]
+        self._owners = [member for _, member in points]
+
+    def owner(self, key: str) -> Optional[str]:
+        """Member owning key (None for an empty ring)"""
+        if not self._hashes:
+            return None
+        return self._owners[bisect.bisect(self._hashes, ring_hash(key)) % len(self._hashes)]
+
 
 class MetricsCollector:
-    def __init__(self, config_file: str = '/home/ubuntu/nephio-intent-to-o2-demo/configs/monitoring-config.yaml'):
+    def __init__(self, config_file: str = '/home/ubuntu/nephio-intent-to-o2-demo/configs/monitoring-config.yaml',
+                 metrics_port: int = 8000):
+        self.config_file = config_file
+        self.config_mtime = self.file_mtime()
         self.config = self.load_config(config_file)
         self.edge_sites = self.config.get('edge_sites', {})
         self.gitops_config = self.config.get('gitops', {})
+        self.rootsync_informer: Optional[Informer] = None
+        self.use_informer = self.gitops_config.get('use_informer', True)
+        self.metrics_port = metrics_port
+        self.instance_id = self.resolve_instance_id()
+        self.ring = HashRing([self.instance_id])
+        self.owned_sites: Set[str] = set()
+        self.owns_gitops = False
 
     def load_config(self, config_file: str) -> Dict:
         """Load monitoring configuration"""
@@ -45,6 +138,139 @@ class MetricsCollector:
             logger.warning(f"Config file {config_file} not found, using defaults")
             return self.default_config()
 
+    def file_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.config_file).st_mtime
+        except OSError:
+            return None
+
+    def reload_config(self) -> bool:
+        """Re-read the config file if it changed; a broken file keeps the current config"""
+        mtime = self.file_mtime()
+        if mtime is None or mtime == self.config_mtime:
+            return False
+        self.config_mtime = mtime
+        try:
+            with open(self.config_file, 'r') as f:
+                config = yaml.safe_load(f)
+            if not isinstance(config, dict):
+                raise ValueError("top level is not a mapping")
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            logger.error(f"Ignoring invalid config {self.config_file}: {e}")
+            config_reloads.labels(result='error').inc()
+            return False
+
+        added = sorted(set(config.get('edge_sites', {})) - set(self.edge_sites))
+        removed = sorted(set(self.edge_sites) - set(config.get('edge_sites', {})))
+        self.config = config
+        self.edge_sites = config.get('edge_sites', {})
+        self.gitops_config = config.get('gitops', {})
+        self.instance_id = self.resolve_instance_id()
+        config_reloads.labels(result='success').inc()
+        logger.info(f"Reloaded {self.config_file}: {len(self.edge_sites)} sites "
+                    f"(added {added or 'none'}, removed {removed or 'none'})")
+        return True
+
+    @property
+    def sharding(self) -> Dict:
+        return self.config.get('sharding') or {}
+
+    def resolve_instance_id(self) -> str:
+        """This collector's ring member name, the host:port its peers list it under"""
+        configured = self.sharding.get('instance_id') or os.environ.get('COLLECTOR_INSTANCE_ID')
+        if configured:
+            return configured
+        host = os.environ.get('POD_IP')
+        if not host:
+            try:
+                host = socket.gethostbyname(socket.gethostname())
+            except OSError:
+                host = None
+            # Debian/Ubuntu map the hostname to 127.0.1.1, which would give
+            # every replica the same id and none its real peer address
+            if host is None or is_loopback(host):
+                host = outbound_address() or socket.gethostname()
+        return f"{host}:{self.metrics_port}"
+
+    def is_self(self, peer: str, addresses: Set[str]) -> bool:
+        """Whether a peer address points at this instance, given the local addresses"""
+        if peer == self.instance_id:
+            return True
+        host, _, port = peer.rpartition(':')
+        own_port = self.instance_id.rpartition(':')[2]
+        if port != own_port:
+            return False
+        return is_loopback(host) or host in addresses
+
+    def peer_address(self, peer: str) -> str:
+        return peer if ':' in peer else f"{peer}:{self.metrics_port}"
+
+    async def discover_peers(self, deadline: float) -> List[str]:
+        """
+        Live collector instances, including this one.
+
+        Candidates are the static sharding.peers plus every address of
+        sharding.peer_dns (e.g. a headless Service). A candidate is live when its
+        metrics port accepts a TCP connection within the deadline.
+        """
+        candidates = {self.peer_address(peer) for peer in self.sharding.get('peers') or []}
+        peer_dns = self.sharding.get('peer_dns')
+        if peer_dns:
+            try:
+                infos = await asyncio.get_running_loop().getaddrinfo(
+                    peer_dns, self.metrics_port, type=socket.SOCK_STREAM)
+                candidates.update(f"{info[4][0]}:{self.metrics_port}" for info in infos)
+            except OSError as e:
+                logger.warning(f"Cannot resolve collector peers {peer_dns}: {e}")
+        # Any local address (not only the one in instance_id) is this instance
+        addresses = local_addresses()
+        candidates = {peer for peer in candidates if not self.is_self(peer, addresses)}
+
+        async def live(peer: str) -> bool:
+            host, port = peer.rsplit(':', 1)
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(host, int(port)), timeout=deadline)
+                writer.close()
+                await writer.wait_closed()
+                return True
+            except (OSError, asyncio.TimeoutError):
+                return False
+
+        peers = sorted(candidates)
+        alive = await asyncio.gather(*(live(peer) for peer in peers))
+        return sorted([self.instance_id] + [peer for peer, up in zip(peers, alive) if up])
+
+    async def update_shard(self, deadline: float) -> Set[str]:
+        """Refresh membership and the set of sites this instance probes"""
+        members = await self.discover_peers(deadline)
+        virtual_nodes = int(self.sharding.get('virtual_nodes', 128))
+        if members != self.ring.members or virtual_nodes != self.ring.virtual_nodes:
+            logger.info(f"Collector membership changed: {self.ring.members} -> {members}")
+            self.ring = HashRing(members, virtual_nodes)
+            collector_rebalances.inc()
+
+        owned = {site for site in self.edge_sites if self.ring.owner(site) == self.instance_id}
+        # Sites moved to another instance (or removed) stop being exported here,
+        # so each site's availability and the GitOps sync status have exactly
+        # one source across the fleet
+        for site in self.owned_sites - owned:
+            for gauge in (edge_site_up, slo_service_up, o2ims_service_up):
+                try:
+                    gauge.remove(site)
+                except KeyError:
+                    pass
+        owns_gitops = self.ring.owner(GITOPS_SHARD_KEY) == self.instance_id
+        if self.owns_gitops and not owns_gitops:
+            gitops_sync_status.clear()
+        self.owns_gitops = owns_gitops
+        if owned != self.owned_sites:
+            logger.info(f"Probing {len(owned)} of {len(self.edge_sites)} sites "
+                        f"(+{len(owned - self.owned_sites)} -{len(self.owned_sites - owned)})")
+        self.owned_sites = owned
+        collector_owned_sites.set(len(owned))
+        collector_peers.set(len(members))
+        return owned
+
     def default_config(self) -> Dict:
         """Default configuration if config file is not found"""
         return {
@@ -64,130 +290,213 @@ class MetricsCollector:
                 'gitea_url': 'http://172.16.0.78:8888',
                 'repositories': ['edge1-config', 'edge2-config']
             },
-            'collection_interval': 30
+            'collection_interval': 30,
+            'collection_jitter': 0.1,
+            'probe_timeout': 5,
+            'max_connections': 32
         }
 
-    def check_edge_site_connectivity(self, site: str, config: Dict) -> bool:
-        """Check if edge site is reachable"""
-        try:
-            # Simple ping check
-            result = subprocess.run(
-                ['ping', '-c', '1', '-W', '3', config['ip']],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except Exception as e:
-            logger.error(f"Error checking connectivity to {site}: {e}")
-            return False
+    def setting(self, name: str, default):
+        """Read a collector setting from the top level or the monitoring section"""
+        if name in self.config:
+            return self.config[name]
+        return self.config.get('monitoring', {}).get(name, default)
 
-    def check_slo_service(self, site: str, config: Dict) -> bool:
-        """Check SLO service availability"""
+    async def probe_tcp(self, site: str, host: str, port: int, deadline: float) -> bool:
+        """Open and close a TCP connection; a refused connection still proves the host is up"""
+        start_time = time.monotonic()
+        result = 'up'
         try:
-            start_time = time.time()
-            url = f"http://{config['ip']}:{config['slo_port']}/health"
-            response = requests.get(url, timeout=5)
-            response_time.labels(service='slo', site=site).observe(time.time() - start_time)
-            return response.status_code == 200
-        except Exception as e:
-            logger.error(f"Error checking SLO service on {site}: {e}")
-            return False
-
-    def check_o2ims_service(self, site: str, config: Dict) -> bool:
-        """Check O2IMS service availability"""
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=deadline)
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionRefusedError:
+            result = 'refused'
+        except asyncio.TimeoutError:
+            result = 'timeout'
+        except OSError as e:
+            logger.debug(f"TCP probe of {site} {host}:{port} failed: {e}")
+            result = 'error'
+        probe_latency.labels(probe='tcp', site=site, result=result).observe(time.monotonic() - start_time)
+        return result in ('up', 'refused')
+
+    async def probe_http(self, client: httpx.AsyncClient, service: str, site: str, url: str,
+                         deadline: float) -> bool:
+        """GET a service endpoint through the shared client within the deadline"""
+        start_time = time.monotonic()
+        result = 'error'
         try:
-            start_time = time.time()
-            url = f"http://{config['ip']}:{config['o2ims_port']}/metrics"
-            response = requests.get(url, timeout=5)
-            response_time.labels(service='o2ims', site=site).observe(time.time() - start_time)
-            return response.status_code == 200
-        except Exception as e:
-            logger.error(f"Error checking O2IMS service on {site}: {e}")
-            return False
+            response = await asyncio.wait_for(client.get(url), timeout=deadline)
+            result = 'up' if response.status_code == 200 else 'error'
+            response_time.labels(service=service, site=site).observe(time.monotonic() - start_time)
+        except asyncio.TimeoutError:
+            result = 'timeout'
+            logger.error(f"Error checking {service} service on {site}: deadline of {deadline}s exceeded")
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
+            logger.error(f"Error checking {service} service on {site}: {e!r}")
+        probe_latency.labels(probe=service, site=site, result=result).observe(time.monotonic() - start_time)
+        return result == 'up'
+
+    async def check_site(self, client: httpx.AsyncClient, site: str, config: Dict,
+                         deadline: float) -> Dict[str, bool]:
+        """Probe reachability and both services of one site concurrently"""
+        ip = config['ip']
+        ports = config.get('probe_ports') or [config['slo_port'], config['o2ims_port']]
+        tcp, slo_up, o2ims_up = await asyncio.gather(
+            asyncio.gather(*(self.probe_tcp(site, ip, port, deadline) for port in ports)),
+            self.probe_http(client, 'slo', site, f"http://{ip}:{config['slo_port']}/health", deadline),
+            self.probe_http(client, 'o2ims', site, f"http://{ip}:{config['o2ims_port']}/metrics", deadline),
+        )
+        site_up = any(tcp) or slo_up or o2ims_up
+
+        edge_site_up.labels(site=site).set(1 if site_up else 0)
+        slo_service_up.labels(site=site).set(1 if slo_up else 0)
+        o2ims_service_up.labels(site=site).set(1 if o2ims_up else 0)
+        if site_up:
+            logger.info(f"  {site}: Site={site_up}, SLO={slo_up}, O2IMS={o2ims_up}")
+        else:
+            logger.warning(f"  {site}: Site unreachable")
+        return {'site': site_up, 'slo': slo_up, 'o2ims': o2ims_up}
+
+    def site_check_failed(self, site: str, error: BaseException) -> Dict[str, bool]:
+        """Record a site whose check raised (e.g. a misconfigured entry) as down"""
+        logger.error(f"Error checking site {site}: {error!r}")
+        edge_site_up.labels(site=site).set(0)
+        slo_service_up.labels(site=site).set(0)
+        o2ims_service_up.labels(site=site).set(0)
+        return {'site': False, 'slo': False, 'o2ims': False}
+
+    def start_rootsync_informer(self) -> Optional[Informer]:
+        """Watch RootSyncs into a local cache; None falls back to kubectl each cycle"""
+        if self.rootsync_informer is None and self.use_informer:
+            namespace = self.gitops_config.get('rootsync_namespace', 'config-management-system')
+            try:
+                api = KubeApi.from_environment(self.gitops_config.get('kube_context'))
+            except Exception as e:
+                logger.warning(f"RootSync informer unavailable, falling back to kubectl: {e}")
+                self.use_informer = False
+                return None
+            self.rootsync_informer = Informer(api, ROOTSYNC, namespace).start()
+        return self.rootsync_informer
+
+    def list_rootsyncs(self) -> Optional[List[Dict]]:
+        """RootSync objects from the informer cache, or from one kubectl call"""
+        informer = self.start_rootsync_informer()
+        if informer is not None and informer.synced.is_set():
+            return informer.store.list()
+
+        namespace = self.gitops_config.get('rootsync_namespace', 'config-management-system')
+        result = subprocess.run(['kubectl', 'get', 'rootsync', '-n', namespace, '-o', 'json'],
+                                capture_output=True, text=True, timeout=10)
+        if result.returncode != 0:
+            logger.error(f"Error listing RootSyncs: {result.stderr.strip()}")
+            return None
+        return json.loads(result.stdout).get('items', [])
+
+    @staticmethod
+    def repo_synced(repo: str, rootsyncs: List[Dict]) -> bool:
+        """Whether the RootSyncs pulling from repo have synced (any RootSync if none references it)"""
+        referencing = [
+            rs for rs in rootsyncs
+            if rs.get('metadata', {}).get('name') == repo
+            or rs.get('spec', {}).get('git', {}).get('repo', '').rstrip('/').removesuffix('.git').endswith(f"/{repo}")
+        ]
+        return any(rootsync_synced(rs) for rs in referencing or rootsyncs)
 
     def check_gitops_sync_status(self) -> Dict[str, bool]:
         """Check GitOps synchronization status"""
         sync_status = {}
 
         try:
-            for repo in self.gitops_config.get('repositories', []):
-                try:
-                    # Check if RootSync is healthy via kubectl
-                    result = subprocess.run([
-                        'kubectl', 'get', 'rootsync', '-n', 'config-management-system',
-                        '-o', 'jsonpath={.items[*].status.sync.lastUpdate}'
-                    ], capture_output=True, text=True, timeout=10)
-
-                    if result.returncode == 0 and result.stdout.strip():
-                        # If we get a timestamp, sync is working
-                        sync_status[repo] = True
-                        gitops_sync_status.labels(repository=repo).set(1)
-                    else:
-                        sync_status[repo] = False
-                        gitops_sync_status.labels(repository=repo).set(0)
-                        gitops_sync_failures.labels(repository=repo).inc()
-
-                except Exception as e:
-                    logger.error(f"Error checking sync status for {repo}: {e}")
-                    sync_status[repo] = False
-                    gitops_sync_status.labels(repository=repo).set(0)
-
+            rootsyncs = self.list_rootsyncs()
         except Exception as e:
             logger.error(f"Error checking GitOps sync: {e}")
+            rootsyncs = None
 
-        return sync_status
-
-    def collect_all_metrics(self):
-        """Collect all metrics from configured sources"""
-        logger.info("Starting metrics collection cycle")
-
-        # Check edge sites
-        for site, config in self.edge_sites.items():
-            logger.info(f"Checking {site} ({config['ip']})")
-
-            # Site connectivity
-            site_up = self.check_edge_site_connectivity(site, config)
-            edge_site_up.labels(site=site).set(1 if site_up else 0)
-
-            if site_up:
-                # SLO service
-                slo_up = self.check_slo_service(site, config)
-                slo_service_up.labels(site=site).set(1 if slo_up else 0)
-
-                # O2IMS service
-                o2ims_up = self.check_o2ims_service(site, config)
-                o2ims_service_up.labels(site=site).set(1 if o2ims_up else 0)
-
-                logger.info(f"  {site}: Site={site_up}, SLO={slo_up}, O2IMS={o2ims_up}")
+        for repo in self.gitops_config.get('repositories', []):
+            if rootsyncs is not None and self.repo_synced(repo, rootsyncs):
+                sync_status[repo] = True
+                gitops_sync_status.labels(repository=repo).set(1)
             else:
-                logger.warning(f"  {site}: Site unreachable")
-                slo_service_up.labels(site=site).set(0)
-                o2ims_service_up.labels(site=site).set(0)
-
-        # Check GitOps sync
-        sync_status = self.check_gitops_sync_status()
-        logger.info(f"GitOps sync status: {sync_status}")
+                sync_status[repo] = False
+                gitops_sync_status.labels(repository=repo).set(0)
+                gitops_sync_failures.labels(repository=repo).inc()
 
-        logger.info("Metrics collection cycle completed")
+        return sync_status
 
-    def run(self, port: int = 8000):
+    async def collect_all_metrics(self, client: httpx.AsyncClient) -> Dict[str, Dict[str, bool]]:
+        """Collect all metrics of this instance's shard in one concurrent cycle"""
+        start_time = time.monotonic()
+        deadline = float(self.setting('probe_timeout', 5))
+        owned = await self.update_shard(deadline)
+        sites = {site: config for site, config in self.edge_sites.items() if site in owned}
+        logger.info(f"Starting metrics collection cycle for {len(sites)} of {len(self.edge_sites)} sites")
+
+        # GitOps check may fall back to kubectl, so it runs in a worker thread
+        sync_task = None
+        if self.owns_gitops:
+            sync_task = asyncio.ensure_future(asyncio.to_thread(self.check_gitops_sync_status))
+        # One broken site entry must not abort the cycle for the others
+        results = await asyncio.gather(
+            *(self.check_site(client, site, config, deadline) for site, config in sites.items()),
+            return_exceptions=True,
+        )
+        results = [
+            self.site_check_failed(site, result) if isinstance(result, Exception) else result
+            for site, result in zip(sites, results)
+        ]
+        if sync_task is not None:
+            sync_status = await sync_task
+            logger.info(f"GitOps sync status: {sync_status}")
+
+        duration = time.monotonic() - start_time
+        collection_cycle_seconds.observe(duration)
+        collection_last_cycle_seconds.set(duration)
+        logger.info(f"Metrics collection cycle completed in {duration:.3f}s")
+        return dict(zip(sites, results))
+
+    def create_client(self) -> httpx.AsyncClient:
+        """Keep-alive HTTP client shared by all probes of all cycles"""
+        max_connections = int(self.setting('max_connections', 32))
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        return httpx.AsyncClient(timeout=float(self.setting('probe_timeout', 5)), limits=limits)
+
+    async def run_async(self, once: bool = False):
+        """Run collection cycles on a fixed, jittered schedule"""
+        collection_interval = float(self.setting('collection_interval', 30))
+        jitter = float(self.setting('collection_jitter', 0.1))
+        logger.info(f"Starting metrics collection as {self.instance_id} with {collection_interval}s interval "
+                    f"(jitter {jitter:.0%})")
+
+        async with self.create_client() as client:
+            # Cycles start at a fixed cadence, each offset by a random jitter so
+            # collectors restarted together do not probe the sites in lockstep
+            scheduled = time.monotonic()
+            offset = 0.0 if once else random.uniform(0, jitter) * collection_interval
+            while True:
+                await asyncio.sleep(max(0.0, scheduled + offset - time.monotonic()))
+                try:
+                    self.reload_config()
+                    await self.collect_all_metrics(client)
+                except Exception as e:
+                    logger.error(f"Error in metrics collection: {e}")
+                if once:
+                    return
+                collection_interval = float(self.setting('collection_interval', 30))
+                jitter = float(self.setting('collection_jitter', 0.1))
+                # A cycle overrunning the interval starts the next one right away
+                scheduled = max(scheduled + collection_interval, time.monotonic())
+                offset = random.uniform(-jitter, jitter) * collection_interval
+
+    def run(self, once: bool = False):
         """Start the metrics collector server"""
-        logger.info(f"Starting Prometheus metrics server on port {port}")
-        start_http_server(port)
+        logger.info(f"Starting Prometheus metrics server on port {self.metrics_port}")
+        start_http_server(self.metrics_port)
 
-        collection_interval = self.config.get('collection_interval', 30)
-        logger.info(f"Starting metrics collection with {collection_interval}s interval")
-
-        while True:
-            try:
-                self.collect_all_metrics()
-                time.sleep(collection_interval)
-            except KeyboardInterrupt:
-                logger.info("Metrics collector stopped by user")
-                break
-            except Exception as e:
-                logger.error(f"Error in metrics collection: {e}")
-                time.sleep(collection_interval)
+        try:
+            asyncio.run(self.run_async(once))
+        except KeyboardInterrupt:
+            logger.info("Metrics collector stopped by user")
 
 def create_monitoring_config():
     """Create default monitoring configuration file"""
@@ -209,7 +518,15 @@ def create_monitoring_config():
             'repositories': ['edge1-config', 'edge2-config']
         },
         'collection_interval': 30,
-        'metrics_port': 8000
+        'collection_jitter': 0.1,
+        'probe_timeout': 5,
+        'max_connections': 32,
+        'metrics_port': 8000,
+        'sharding': {
+            'peers': [],
+            'peer_dns': '',
+            'virtual_nodes': 128
+        }
     }
 
     config_file = '/home/ubuntu/nephio-intent-to-o2-demo/configs/monitoring-config.yaml'
@@ -227,6 +544,7 @@ if __name__ == "__main__":
                        default='/home/ubuntu/nephio-intent-to-o2-demo/configs/monitoring-config.yaml',
                        help='Configuration file path')
     parser.add_argument('--create-config', action='store_true', help='Create default config file')
+    parser.add_argument('--once', action='store_true', help='Run a single collection cycle and exit')
 
     args = parser.parse_args()
 
@@ -234,5 +552,5 @@ if __name__ == "__main__":
         create_monitoring_config()
         exit(0)
 
-    collector = MetricsCollector(args.config)
-    collector.run(args.port)
\ No newline at end of file
+    collector = MetricsCollector(args.config, args.port)
+    collector.run(args.once)
\ No newline at end of file
@@ -11,16 +11,22 @@ import time
 import argparse
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+if TYPE_CHECKING:
+    # Imported where used: the informer needs httpx and PyYAML, which only --watch requires
+    from k8s_informer import Informer
+
 
 class EdgeVerifier:
     """Verifies edge site deployments and PR readiness"""
 
-    def __init__(self, project_root: Path, timeout: int = 300):
+    def __init__(self, project_root: Path, timeout: int = 300, pr_informer: Optional["Informer"] = None):
         self.project_root = project_root
         self.timeout = timeout
+        # Optional ProvisioningRequest informer; when synced, PR checks read its cache
+        self.pr_informer = pr_informer
         self.artifacts_dir = project_root / "artifacts"
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -52,6 +58,19 @@ class EdgeVerifier:
             "ready": False
         }
 
+        if self.pr_informer is not None and self.pr_informer.synced.is_set():
+            from k8s_informer import provisioning_request_ready, provisioning_request_status
+
+            for item in self.pr_informer.store.list(namespace):
+                pr_name = item.get("metadata", {}).get("name", "")
+                if edge_site in pr_name or item.get("spec", {}).get("targetCluster") == edge_site:
+                    results["provisioningRequests"].append({
+                        "name": pr_name,
+                        "status": provisioning_request_status(item),
+                        "ready": provisioning_request_ready(item)
+                    })
+            return self._summarize_prs(results)
+
         # Try o2imsctl first
         cmd = ["o2imsctl", "pr", "list", "-n", namespace, "-o", "json"]
         returncode, stdout, stderr = self.run_command(cmd)
@@ -107,7 +126,10 @@ class EdgeVerifier:
                 if results["provisioningRequests"]:
                     break
 
-        # Check if any PR is ready
+        return self._summarize_prs(results)
+
+    def _summarize_prs(self, results: Dict) -> Dict:
+        """Add readiness totals to a PR status result"""
         results["ready"] = any(pr["ready"] for pr in results["provisioningRequests"])
         results["total"] = len(results["provisioningRequests"])
         results["readyCount"] = sum(1 for pr in results["provisioningRequests"] if pr["ready"])
@@ -319,6 +341,7 @@ class EdgeVerifier:
         print(f"{'='*60}\n")
 
         while time.time() - start_time < self.timeout:
+            version = self.pr_informer.store.version if self.pr_informer is not None else 0
             results = self.verify_multiple_edges(edge_sites, namespace)
 
             if results["overallStatus"] == "SUCCESS":
@@ -330,7 +353,11 @@ class EdgeVerifier:
             remaining = self.timeout - elapsed
             print(f"\r⏳ Progress: {results['summary']} | Elapsed: {elapsed}s | Remaining: {remaining}s", end="")
 
-            time.sleep(10)
+            if self.pr_informer is not None and self.pr_informer.synced.is_set():
+                # Re-verify as soon as a ProvisioningRequest changes
+                self.pr_informer.store.wait_for_change(version, min(10, remaining))
+            else:
+                time.sleep(10)
 
         print(f"\n✗ Timeout reached after {self.timeout} seconds")
         return False
@@ -386,6 +413,11 @@ def main():
         action="store_true",
         help="Wait for all edges to be ready"
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Read ProvisioningRequests from a list+watch cache instead of polling"
+    )
     parser.add_argument(
         "--output",
         choices=["json", "summary"],
@@ -397,7 +429,16 @@ def main():
 
     # Initialize verifier
     project_root = Path(__file__).parent.parent
-    verifier = EdgeVerifier(project_root, timeout=args.timeout)
+    pr_informer = None
+    if args.watch:
+        try:
+            from k8s_informer import PROVISIONINGREQUEST, Informer, KubeApi
+
+            pr_informer = Informer(KubeApi.from_environment(), PROVISIONINGREQUEST, args.namespace).start()
+            pr_informer.wait_for_sync(30)
+        except Exception as e:
+            print(f"⚠ ProvisioningRequest watch unavailable, polling instead: {e}")
+    verifier = EdgeVerifier(project_root, timeout=args.timeout, pr_informer=pr_informer)
 
     # Run verification
     if args.wait:
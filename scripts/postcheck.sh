@@ -227,6 +227,28 @@ wait_for_rootsync_reconciliation() {
     local check_interval=10
     local status_file="${EVIDENCE_DIR}/rootsync-status.json"
 
+    # Watch the ResourceGroup through the informer cache instead of polling kubectl;
+    # the polling loop below remains the fallback when the API server is unreachable
+    local informer="$(dirname "${BASH_SOURCE[0]}")/k8s_informer.py"
+    if [[ -f "$informer" ]] && command -v python3 &> /dev/null; then
+        local informer_rc=0
+        python3 "$informer" wait resourcegroup "$ROOTSYNC_NAME" -n "$ROOTSYNC_NAMESPACE" \
+            --timeout "$ROOTSYNC_TIMEOUT_SECONDS" --output "$status_file" >&2 || informer_rc=$?
+        case $informer_rc in
+            0)
+                log_info "✅ RootSync reconciliation completed successfully"
+                return 0
+                ;;
+            2)
+                log_error "❌ RootSync reconciliation timeout after ${ROOTSYNC_TIMEOUT_SECONDS} seconds"
+                return $EXIT_ROOTSYNC_TIMEOUT
+                ;;
+            *)
+                log_warn "RootSync watch unavailable (exit $informer_rc), polling with kubectl"
+                ;;
+        esac
+    fi
+
     while [[ $(date +%s) -lt $timeout_time ]]; do
         local current_time=$(date +%s)
         local elapsed=$((current_time - start_time))
@@ -92,9 +92,9 @@ check_prerequisites() {
     fi
 
     # Install Python dependencies if needed
-    if ! python3 -c "import prometheus_client, requests, yaml" 2>/dev/null; then
+    if ! python3 -c "import prometheus_client, httpx, yaml" 2>/dev/null; then
         log "Installing Python dependencies..."
-        pip3 install prometheus_client requests pyyaml || {
+        pip3 install prometheus_client httpx pyyaml || {
             error "Failed to install Python dependencies"
             exit 1
         }
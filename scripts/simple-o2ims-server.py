@@ -4,9 +4,18 @@ Simple O2IMS Mock Server - Minimal implementation using only Python standard lib
 No external dependencies required (no FastAPI, uvicorn, pydantic)
 
 This server provides basic O2IMS endpoints for testing and demo purposes.
+Provisioning requests can be created (singly or in bulk) and deleted; a
+background worker moves them through PENDING -> IN_PROGRESS -> COMPLETED/FAILED
+against the capacity of the edge site.
 """
 
+import argparse
+import heapq
 import json
+import math
+import os
+import random
+import time
 import uuid
 import logging
 import sys
@@ -30,6 +39,247 @@ logger = logging.getLogger(__name__)
 # Configuration
 PORT = 32080
 EDGE_SITE = "edge3"  # Will be customized per edge
+PROVISIONING_PATH = "o2ims_infrastructureProvisioningRequest"
+MAX_BULK_REQUESTS = 10000
+
+# Site capacity available to provisioning requests
+SITE_CAPACITY = {"cpu_cores": 128, "memory_gb": 512, "storage_gb": 4000}
+
+
+def stable_id(*parts):
+    """Deterministic UUID of an object of this edge site"""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, "o2ims://" + "/".join((EDGE_SITE,) + parts)))
+
+
+class LatencyDistribution:
+    """Phase duration in seconds: fixed:S, uniform:A,B, exponential:MEAN or lognormal:MEDIAN,SIGMA"""
+
+    PARAMETERS = {"fixed": 1, "uniform": 2, "exponential": 1, "lognormal": 2}
+
+    def __init__(self, spec):
+        kind, _, params = spec.partition(":")
+        try:
+            values = [float(value) for value in params.split(",")] if params else []
+        except ValueError:
+            values = []
+        if self.PARAMETERS.get(kind) != len(values) or any(value < 0 for value in values):
+            raise ValueError(f"Invalid latency distribution '{spec}'")
+        self.kind = kind
+        self.params = values
+
+    def sample(self, rng):
+        """Draw one duration"""
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "exponential":
+            return rng.expovariate(1 / self.params[0]) if self.params[0] else 0.0
+        median, sigma = self.params
+        return rng.lognormvariate(math.log(median), sigma) if median else 0.0
+
+
+class ProvisioningLifecycle:
+    """Provisioning requests of the edge site and the worker advancing them
+
+    Each transition is queued on a heap, due after a latency drawn from the
+    queue (PENDING) or provisioning (IN_PROGRESS) distribution. Starting to
+    provision reserves the requested capacity; requests that do not fit fail
+    with InsufficientCapacity, and failed or deleted requests release it.
+    """
+
+    def __init__(self, queue_latency, provision_latency, failure_rate=0.05, seed=0):
+        self.queue_latency = queue_latency
+        self.provision_latency = provision_latency
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.requests = {}
+        self.allocated = dict.fromkeys(SITE_CAPACITY, 0)
+        self._schedule = []
+        self._sequence = 0
+        self._condition = threading.Condition()
+
+    def seed_requests(self, dm_id):
+        """Add the site's completed 5G Core deployment"""
+        now = datetime.now(timezone.utc).isoformat()
+        capacity = {"cpu_cores": 16, "memory_gb": 64, "storage_gb": 200}
+        request_id = stable_id("request", "5g-core")
+        self.requests[request_id] = {
+            "infrastructure_request_id": request_id,
+            "name": f"5G-Core-{EDGE_SITE.upper()}",
+            "description": f"5G Core Network Functions deployment for {EDGE_SITE.upper()}",
+            "request_type": "NETWORK_FUNCTION_DEPLOYMENT",
+            "request_status": "COMPLETED",
+            "created_at": now,
+            "updated_at": now,
+            "requested_capacity": dict(capacity),
+            "allocated_capacity": dict(capacity),
+            "extensions": {
+                "deployment_manager_id": dm_id,
+                "edge_site": EDGE_SITE
+            }
+        }
+        self._account(None, capacity)
+
+    def create(self, dm_id, spec):
+        """Add a PENDING request from a creation body; raises ValueError if invalid"""
+        request = self._build(dm_id, spec)
+        with self._condition:
+            self._add(request)
+        return dict(request)
+
+    def bulk_create(self, dm_id, body):
+        """Create the listed requests plus count copies of the template; returns their ids
+
+        Every spec is validated before the first request is added, so an
+        invalid body creates nothing.
+        """
+        if not isinstance(body, dict):
+            raise ValueError("Bulk body must be an object")
+        specs = body.get("requests") or []
+        if not isinstance(specs, list):
+            raise ValueError("requests must be a list")
+        count = body.get("count", 0)
+        if isinstance(count, bool) or not isinstance(count, int) or count < 0:
+            raise ValueError("count must be a non-negative integer")
+        if len(specs) + count > MAX_BULK_REQUESTS:
+            raise ValueError(f"At most {MAX_BULK_REQUESTS} requests per bulk creation")
+        if count:
+            template = body.get("template")
+            if not isinstance(template, dict):
+                raise ValueError("count requires a template")
+            specs = specs + [{**template, "name": f"{template.get('name')}-{i}"} for i in range(count)]
+        requests = [self._build(dm_id, spec) for spec in specs]
+        with self._condition:
+            for request in requests:
+                self._add(request)
+        return [request["infrastructure_request_id"] for request in requests]
+
+    def delete(self, request_id):
+        """Remove a request, releasing its capacity; returns whether it existed"""
+        with self._condition:
+            request = self.requests.pop(request_id, None)
+            if request is None:
+                return False
+            self._account(request["allocated_capacity"], None)
+            return True
+
+    def get(self, request_id):
+        with self._condition:
+            request = self.requests.get(request_id)
+            return dict(request) if request else None
+
+    def list(self, status=None):
+        with self._condition:
+            return [
+                dict(request) for request in self.requests.values()
+                if status is None or request["request_status"].lower() == status.lower()
+            ]
+
+    def capacity(self):
+        """Total, allocated and available site capacity"""
+        with self._condition:
+            return {
+                "total": dict(SITE_CAPACITY),
+                "allocated": dict(self.allocated),
+                "available": {key: SITE_CAPACITY[key] - self.allocated[key] for key in SITE_CAPACITY}
+            }
+
+    def start(self):
+        """Run the lifecycle worker in a daemon thread"""
+        threading.Thread(target=self._run, name="provisioning-lifecycle", daemon=True).start()
+
+    def _build(self, dm_id, spec):
+        """New PENDING request from a creation body; raises ValueError if invalid"""
+        if not isinstance(spec, dict) or not isinstance(spec.get("name"), str):
+            raise ValueError("Provisioning request needs a name")
+        requested = spec.get("requested_capacity") or {}
+        if not isinstance(requested, dict) or not all(
+            isinstance(value, (int, float)) and value >= 0 for value in requested.values()
+        ):
+            raise ValueError("requested_capacity must map resources to non-negative numbers")
+        extensions = spec.get("extensions") or {}
+        if not isinstance(extensions, dict):
+            raise ValueError("extensions must be an object")
+        now = datetime.now(timezone.utc).isoformat()
+        return {
+            "infrastructure_request_id": str(uuid.uuid4()),
+            "name": spec["name"],
+            "description": spec.get("description"),
+            "request_type": spec.get("request_type", "NETWORK_FUNCTION_DEPLOYMENT"),
+            "request_status": "PENDING",
+            "created_at": now,
+            "updated_at": now,
+            "requested_capacity": requested,
+            "allocated_capacity": None,
+            "extensions": {
+                **extensions,
+                "deployment_manager_id": dm_id,
+                "edge_site": EDGE_SITE
+            }
+        }
+
+    def _add(self, request):
+        """Store a built request and queue its first transition (lock held)"""
+        request_id = request["infrastructure_request_id"]
+        self.requests[request_id] = request
+        self._schedule_at(time.monotonic() + self.queue_latency.sample(self.rng), request_id)
+
+    def _schedule_at(self, due, request_id):
+        self._sequence += 1
+        heapq.heappush(self._schedule, (due, self._sequence, request_id))
+        self._condition.notify()
+
+    def _account(self, held, allocated):
+        for key in SITE_CAPACITY:
+            self.allocated[key] += (allocated or {}).get(key, 0) - (held or {}).get(key, 0)
+
+    def _fits(self, request):
+        return all(
+            self.allocated[key] + request["requested_capacity"].get(key, 0) <= SITE_CAPACITY[key]
+            for key in SITE_CAPACITY
+        )
+
+    def _run(self):
+        with self._condition:
+            while True:
+                if not self._schedule:
+                    self._condition.wait()
+                    continue
+                delay = self._schedule[0][0] - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                _, _, request_id = heapq.heappop(self._schedule)
+                self._transition(request_id)
+
+    def _transition(self, request_id):
+        request = self.requests.get(request_id)
+        if request is None:
+            return
+        if request["request_status"] == "PENDING":
+            if not self._fits(request):
+                self._update(request, "FAILED", None, "InsufficientCapacity")
+                return
+            self._update(request, "IN_PROGRESS", dict(request["requested_capacity"]))
+            self._schedule_at(time.monotonic() + self.provision_latency.sample(self.rng), request_id)
+        elif request["request_status"] == "IN_PROGRESS":
+            if self.rng.random() < self.failure_rate:
+                self._update(request, "FAILED", None, "ProvisioningFailed")
+            else:
+                self._update(request, "COMPLETED", request["allocated_capacity"])
+
+    def _update(self, request, status, allocated, failure_reason=None):
+        self._account(request["allocated_capacity"], allocated)
+        request["request_status"] = status
+        request["allocated_capacity"] = allocated
+        request["updated_at"] = datetime.now(timezone.utc).isoformat()
+        if failure_reason:
+            request["extensions"] = {**request["extensions"], "failure_reason": failure_reason}
+        logger.debug(f"Provisioning request {request['infrastructure_request_id']} -> {status}")
+
+
+LIFECYCLE = None
 
 class O2IMSHandler(BaseHTTPRequestHandler):
     """HTTP request handler for O2IMS endpoints"""
@@ -57,9 +307,13 @@ class O2IMSHandler(BaseHTTPRequestHandler):
             elif path == "/o2ims_infrastructureInventory/v1/resourcePools":
                 self.handle_resource_pools(query_params)
             elif path.startswith("/o2ims_infrastructureInventory/v1/deploymentManagers/"):
-                if path.endswith("/o2ims_infrastructureProvisioningRequest"):
-                    dm_id = path.split("/")[-2]
+                dm_id, request_path = self.split_provisioning_path(path)
+                if request_path == []:
                     self.handle_provisioning_requests(dm_id, query_params)
+                elif request_path and request_path[0] != "bulk":
+                    self.handle_provisioning_request_by_id(dm_id, request_path[0])
+                elif path.endswith("/capacity"):
+                    self.handle_capacity(path.split("/")[-2])
                 else:
                     dm_id = path.split("/")[-1]
                     self.handle_deployment_manager_by_id(dm_id)
@@ -73,6 +327,70 @@ class O2IMSHandler(BaseHTTPRequestHandler):
             logger.error(f"Error handling request: {e}", exc_info=True)
             self.send_500(str(e))
 
+    def do_POST(self):
+        """Handle POST requests (provisioning request creation)"""
+        try:
+            path = urlparse(self.path).path
+            logger.info(f"POST request: {path}")
+            dm_id, request_path = self.split_provisioning_path(path)
+            if request_path not in ([], ["bulk"]):
+                self.send_404()
+                return
+            if not self.require_deployment_manager(dm_id):
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if request_path == ["bulk"]:
+                    ids = LIFECYCLE.bulk_create(dm_id, body)
+                    self.send_json_response({"created": len(ids), "ids": ids}, 201)
+                else:
+                    self.send_json_response(LIFECYCLE.create(dm_id, body), 201)
+            except ValueError as e:
+                self.send_error_response(400, str(e))
+
+        except Exception as e:
+            logger.error(f"Error handling request: {e}", exc_info=True)
+            self.send_500(str(e))
+
+    def do_DELETE(self):
+        """Handle DELETE requests (provisioning request removal)"""
+        try:
+            path = urlparse(self.path).path
+            logger.info(f"DELETE request: {path}")
+            dm_id, request_path = self.split_provisioning_path(path)
+            if not request_path or len(request_path) != 1:
+                self.send_404()
+                return
+            if not self.require_deployment_manager(dm_id):
+                return
+            if LIFECYCLE.delete(request_path[0]):
+                self.send_response(204)
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+            else:
+                self.send_error_response(404, f"Provisioning request {request_path[0]} not found")
+
+        except Exception as e:
+            logger.error(f"Error handling request: {e}", exc_info=True)
+            self.send_500(str(e))
+
+    @staticmethod
+    def split_provisioning_path(path):
+        """(dm_id, segments after the provisioning request collection), or (None, None)"""
+        parts = path.strip("/").split("/")
+        # o2ims_infrastructureInventory/v1/deploymentManagers/{dm}/o2ims_infrastructureProvisioningRequest[/...]
+        if len(parts) >= 5 and parts[2] == "deploymentManagers" and parts[4] == PROVISIONING_PATH:
+            return parts[3], parts[5:]
+        return None, None
+
+    def require_deployment_manager(self, dm_id):
+        """Send 404 and return False unless dm_id is this site's deployment manager"""
+        if dm_id != stable_id("deployment-manager"):
+            self.send_error_response(404, f"Deployment manager {dm_id} not found")
+            return False
+        return True
+
     def handle_health(self):
         """Health check endpoint"""
         response = {
@@ -80,7 +398,8 @@ class O2IMSHandler(BaseHTTPRequestHandler):
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "service": "O2IMS Mock Server",
             "version": "1.0.0",
-            "edge_site": self.edge_site
+            "edge_site": self.edge_site,
+            "provisioning_requests": len(LIFECYCLE.requests)
         }
         self.send_json_response(response)
 
@@ -99,8 +418,9 @@ class O2IMSHandler(BaseHTTPRequestHandler):
 
     def handle_deployment_managers(self, query_params):
         """List deployment managers"""
+        available = LIFECYCLE.capacity()["available"]
         managers = [{
-            "deployment_manager_id": str(uuid.uuid4()),
+            "deployment_manager_id": stable_id("deployment-manager"),
             "name": f"Kubernetes-{self.edge_site.upper()}",
             "description": f"Kubernetes deployment manager for {self.edge_site.upper()} edge site",
             "deployment_manager_type": "KUBERNETES",
@@ -120,9 +440,9 @@ class O2IMSHandler(BaseHTTPRequestHandler):
                 "total_cpu_cores": 128,
                 "total_memory_gb": 512,
                 "total_storage_gb": 4000,
-                "available_cpu_cores": 64,
-                "available_memory_gb": 256,
-                "available_storage_gb": 2000
+                "available_cpu_cores": available["cpu_cores"],
+                "available_memory_gb": available["memory_gb"],
+                "available_storage_gb": available["storage_gb"]
             },
             "extensions": {
                 "kubernetes_version": "v1.28.3",
@@ -137,9 +457,13 @@ class O2IMSHandler(BaseHTTPRequestHandler):
 
     def handle_resource_pools(self, query_params):
         """List resource pools"""
-        pools = [
+        self.send_json_response(self.resource_pools())
+
+    def resource_pools(self):
+        """The site's compute, storage and network resource pools"""
+        return [
             {
-                "resource_pool_id": str(uuid.uuid4()),
+                "resource_pool_id": stable_id("resource-pool", "compute"),
                 "name": f"{self.edge_site.upper()}-COMPUTE",
                 "description": f"Compute resource pool for {self.edge_site.upper()} edge site",
                 "location": f"Edge Site {self.edge_site} - Rack A",
@@ -158,7 +482,7 @@ class O2IMSHandler(BaseHTTPRequestHandler):
                 }
             },
             {
-                "resource_pool_id": str(uuid.uuid4()),
+                "resource_pool_id": stable_id("resource-pool", "storage"),
                 "name": f"{self.edge_site.upper()}-STORAGE",
                 "description": f"Storage resource pool for {self.edge_site.upper()} edge site",
                 "location": f"Edge Site {self.edge_site} - Rack B",
@@ -173,7 +497,7 @@ class O2IMSHandler(BaseHTTPRequestHandler):
                 }
             },
             {
-                "resource_pool_id": str(uuid.uuid4()),
+                "resource_pool_id": stable_id("resource-pool", "network"),
                 "name": f"{self.edge_site.upper()}-NETWORK",
                 "description": f"Network resource pool for {self.edge_site.upper()} edge site",
                 "location": f"Edge Site {self.edge_site} - Network Equipment",
@@ -191,10 +515,10 @@ class O2IMSHandler(BaseHTTPRequestHandler):
             }
         ]
 
-        self.send_json_response(pools)
-
     def handle_deployment_manager_by_id(self, dm_id):
         """Get specific deployment manager"""
+        if not self.require_deployment_manager(dm_id):
+            return
         manager = {
             "deployment_manager_id": dm_id,
             "name": f"Kubernetes-{self.edge_site.upper()}",
@@ -216,44 +540,33 @@ class O2IMSHandler(BaseHTTPRequestHandler):
 
     def handle_resource_pool_by_id(self, pool_id):
         """Get specific resource pool"""
-        pool = {
-            "resource_pool_id": pool_id,
-            "name": f"{self.edge_site.upper()}-COMPUTE",
-            "description": f"Compute resource pool for {self.edge_site.upper()} edge site",
-            "location": f"Edge Site {self.edge_site} - Rack A",
-            "resource_type_list": ["VIRTUAL_MACHINE", "CONTAINER"],
-            "resource_pool_type": "COMPUTE"
-        }
+        pool = next((pool for pool in self.resource_pools() if pool["resource_pool_id"] == pool_id), None)
+        if pool is None:
+            self.send_error_response(404, f"Resource pool {pool_id} not found")
+            return
         self.send_json_response(pool)
 
     def handle_provisioning_requests(self, dm_id, query_params):
         """Get provisioning requests for deployment manager"""
-        requests = [
-            {
-                "infrastructure_request_id": str(uuid.uuid4()),
-                "name": f"5G-Core-{self.edge_site.upper()}",
-                "description": f"5G Core Network Functions deployment for {self.edge_site.upper()}",
-                "request_type": "NETWORK_FUNCTION_DEPLOYMENT",
-                "request_status": "COMPLETED",
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "requested_capacity": {
-                    "cpu_cores": 16,
-                    "memory_gb": 64,
-                    "storage_gb": 200
-                },
-                "allocated_capacity": {
-                    "cpu_cores": 16,
-                    "memory_gb": 64,
-                    "storage_gb": 200
-                },
-                "extensions": {
-                    "deployment_manager_id": dm_id,
-                    "edge_site": self.edge_site
-                }
-            }
-        ]
-        self.send_json_response(requests)
+        if not self.require_deployment_manager(dm_id):
+            return
+        status = query_params.get("request_status", [None])[0]
+        self.send_json_response(LIFECYCLE.list(status))
+
+    def handle_provisioning_request_by_id(self, dm_id, request_id):
+        """Get specific provisioning request"""
+        if not self.require_deployment_manager(dm_id):
+            return
+        request = LIFECYCLE.get(request_id)
+        if request is None:
+            self.send_error_response(404, f"Provisioning request {request_id} not found")
+            return
+        self.send_json_response(request)
+
+    def handle_capacity(self, dm_id):
+        """Total, allocated and available site capacity"""
+        if self.require_deployment_manager(dm_id):
+            self.send_json_response(LIFECYCLE.capacity())
 
     def send_json_response(self, data, status_code=200):
         """Send JSON response"""
@@ -270,6 +583,18 @@ class O2IMSHandler(BaseHTTPRequestHandler):
         self.wfile.write(response_body.encode('utf-8'))
         logger.info(f"Response sent: {status_code}")
 
+    def send_error_response(self, status_code, title):
+        """Send an error response"""
+        error_response = {
+            "error": {
+                "status": status_code,
+                "title": title,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "path": self.path
+            }
+        }
+        self.send_json_response(error_response, status_code)
+
     def send_404(self):
         """Send 404 Not Found"""
         error_response = {
@@ -310,14 +635,35 @@ def set_edge_site(site_name):
     EDGE_SITE = site_name
     logger.info(f"Edge site set to: {site_name}")
 
+def create_lifecycle(queue_latency, provision_latency, failure_rate, seed):
+    """Create and start the provisioning lifecycle of the edge site"""
+    global LIFECYCLE
+    LIFECYCLE = ProvisioningLifecycle(
+        LatencyDistribution(queue_latency),
+        LatencyDistribution(provision_latency),
+        failure_rate=failure_rate,
+        seed=seed
+    )
+    LIFECYCLE.seed_requests(stable_id("deployment-manager"))
+    LIFECYCLE.start()
+    return LIFECYCLE
+
 def main():
     """Main server function"""
-    import sys
-
-    # Parse command line arguments
-    if len(sys.argv) > 1:
-        site_name = sys.argv[1]
-        set_edge_site(site_name)
+    parser = argparse.ArgumentParser(description="Simple O2IMS Mock Server")
+    parser.add_argument("site", nargs="?", default=EDGE_SITE, help="Edge site name")
+    parser.add_argument("--queue-latency", default=os.environ.get("O2IMS_QUEUE_LATENCY", "exponential:2"),
+                        help="Latency distribution of PENDING requests")
+    parser.add_argument("--provision-latency", default=os.environ.get("O2IMS_PROVISION_LATENCY", "lognormal:10,0.5"),
+                        help="Latency distribution of IN_PROGRESS requests")
+    parser.add_argument("--failure-rate", type=float, default=float(os.environ.get("O2IMS_FAILURE_RATE", "0.05")),
+                        help="Share of failed provisioning")
+    parser.add_argument("--seed", type=int, default=int(os.environ.get("O2IMS_LIFECYCLE_SEED", "0")),
+                        help="Seed of the lifecycle latencies and failures")
+    args = parser.parse_args()
+
+    set_edge_site(args.site)
+    create_lifecycle(args.queue_latency, args.provision_latency, args.failure_rate, args.seed)
 
     # Create and start server
     server_address = ('0.0.0.0', PORT)
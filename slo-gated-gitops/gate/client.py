@@ -0,0 +1,184 @@
+"""
+SLO Gate thin client.
+
+Standard-library-only client for a running gate daemon (daemon.py). Keeps
+the gate CLI contract: exit code 0 when all SLOs pass, 1 on violations or
+errors. Without a reachable daemon it falls back to running the gate
+in-process.
+
+Usage:
+    python client.py --slo "latency_p95_ms<=15" --url http://localhost:8080/metrics
+    python client.py --slo "latency_p95_ms<=15" --url ... --watch --until PASSED --timeout 600
+"""
+
+import argparse
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+EXIT_CODE_HEADER = "X-SLO-Gate-Exit-Code"
+
+DEFAULT_DAEMON = "http://127.0.0.1:8090"
+
+
+class DaemonUnavailable(Exception):
+    """Raised when the gate daemon cannot be reached."""
+
+    pass
+
+
+def daemon_address() -> str:
+    """Daemon base URL from SLO_GATE_DAEMON (default: http://127.0.0.1:8090)."""
+    return os.getenv("SLO_GATE_DAEMON", DEFAULT_DAEMON).rstrip("/")
+
+
+def evaluate(
+    slo: str,
+    url: Optional[str] = None,
+    site: Optional[str] = None,
+    daemon: Optional[str] = None,
+    timeout: float = 30,
+) -> Tuple[int, Dict[str, Any]]:
+    """
+    Evaluate an SLO string on the daemon.
+
+    Returns:
+        Tuple of gate exit code and verdict JSON
+
+    Raises:
+        DaemonUnavailable: If the daemon cannot be reached
+    """
+    body = {"slo": slo}
+    if url:
+        body["url"] = url
+    if site:
+        body["site"] = site
+    request = urllib.request.Request(
+        f"{daemon or daemon_address()}/evaluate",
+        data=json.dumps(body).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return int(response.headers[EXIT_CODE_HEADER]), json.load(response)
+    except urllib.error.HTTPError as e:
+        exit_code = e.headers.get(EXIT_CODE_HEADER)
+        if exit_code is None:
+            raise DaemonUnavailable(f"Unexpected response from daemon: HTTP {e.code}") from e
+        return int(exit_code), json.load(e)
+    except (OSError, ValueError) as e:
+        raise DaemonUnavailable(str(e)) from e
+
+
+def watch(
+    slo: str,
+    url: Optional[str] = None,
+    site: Optional[str] = None,
+    until: Optional[str] = None,
+    interval: float = 5,
+    timeout: Optional[float] = None,
+    daemon: Optional[str] = None,
+    on_verdict: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Follow verdict changes on the daemon's /watch stream.
+
+    Returns:
+        The last verdict received
+
+    Raises:
+        DaemonUnavailable: If the daemon cannot be reached
+    """
+    params = {"slo": slo, "interval": interval}
+    for key, value in (("url", url), ("site", site), ("until", until), ("timeout", timeout)):
+        if value is not None:
+            params[key] = value
+    stream_timeout = interval * 3 + 30
+    last: Dict[str, Any] = {}
+    try:
+        with urllib.request.urlopen(
+            f"{daemon or daemon_address()}/watch?{urlencode(params)}", timeout=stream_timeout
+        ) as response:
+            event = None
+            for raw in response:
+                line = raw.decode("utf-8").rstrip("\n")
+                if line.startswith("event: "):
+                    event = line[len("event: ") :]
+                elif line.startswith("data: ") and event == "verdict":
+                    last = json.loads(line[len("data: ") :])
+                    if on_verdict is not None:
+                        on_verdict(last)
+    except urllib.error.HTTPError as e:
+        raise DaemonUnavailable(f"Watch rejected: HTTP {e.code} {e.read().decode('utf-8')}") from e
+    except OSError as e:
+        raise DaemonUnavailable(str(e)) from e
+    return last
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Thin client entry point."""
+    parser = argparse.ArgumentParser(description="SLO Gate client for a running gate daemon")
+    parser.add_argument("--slo", required=True, help="SLO expression")
+    parser.add_argument("--url", help="Metrics endpoint URL (default: the daemon's --url)")
+    parser.add_argument("--site", help="Site the metrics belong to, for site-scoped clauses")
+    parser.add_argument("--timeout", type=float, default=30, help="Request timeout in seconds")
+    parser.add_argument("--daemon", help=f"Daemon URL (default: $SLO_GATE_DAEMON or {DEFAULT_DAEMON})")
+    parser.add_argument("--watch", action="store_true", help="Follow verdict changes")
+    parser.add_argument(
+        "--until",
+        choices=["PASSED", "FAILED"],
+        help="With --watch, stop once this verdict is reached",
+    )
+    parser.add_argument("--interval", type=float, default=5, help="With --watch, seconds between checks")
+    parser.add_argument(
+        "--no-fallback",
+        action="store_true",
+        help="Fail instead of running the gate in-process when no daemon is reachable",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        if args.watch:
+            verdict = watch(
+                args.slo,
+                args.url,
+                args.site,
+                args.until,
+                args.interval,
+                args.timeout if args.until else None,
+                args.daemon,
+                on_verdict=lambda v: print(json.dumps(v, sort_keys=True), flush=True),
+            )
+            target = args.until or "PASSED"
+            return 0 if verdict.get("slo_validation") == target else 1
+        exit_code, verdict = evaluate(args.slo, args.url, args.site, args.daemon, args.timeout)
+        print(json.dumps(verdict, indent=2, sort_keys=True))
+        return exit_code
+    except DaemonUnavailable as e:
+        if args.no_fallback or args.watch or not args.url:
+            print(json.dumps({"error": f"Gate daemon unavailable: {e}"}), file=sys.stderr)
+            return 1
+
+    # No daemon: run the full gate in-process with the same arguments
+    try:
+        from .gate import main as gate_main
+    except ImportError:  # run as a script from this directory
+        from gate import main as gate_main
+
+    sys.argv = ["gate", "--slo", args.slo, "--timeout", str(int(args.timeout))]
+    if args.site:
+        # Multi-site mode with one explicit target labels the metrics with
+        # the site; the daemon does not apply site overrides either
+        sys.argv += ["--site-url", f"{args.site}={args.url}", "--no-site-overrides"]
+    else:
+        sys.argv += ["--url", args.url]
+    return gate_main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
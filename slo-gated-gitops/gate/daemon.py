@@ -0,0 +1,425 @@
+"""
+SLO Gate daemon - long-running SLO evaluation service.
+
+Keeps Python, the HTTP connection pool and compiled SLO expressions warm
+between checks and caches metric snapshots per endpoint for a short TTL,
+so many CI checks within seconds share one upstream fetch.
+
+Endpoints:
+    GET  /health
+    POST /evaluate   body: {"slo": "...", "url": "...", "site": "edge1"}
+    GET  /evaluate?slo=...&url=...[&site=...]
+    GET  /watch?slo=...&url=...[&interval=5&until=PASSED&timeout=600]
+
+/evaluate answers with the verdict JSON and the gate exit code (0 pass,
+1 fail or error) in the X-SLO-Gate-Exit-Code header. /watch is a
+Server-Sent Events stream with one `verdict` event initially and one for
+every verdict change; with `until` the stream ends once that verdict is
+reached or after `timeout` seconds.
+
+Only the default URL and the URLs given with --allow-url can be evaluated;
+requests naming any other URL answer 400, so the daemon cannot be used to
+fetch arbitrary addresses.
+"""
+
+import argparse
+import json
+import signal
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from .gate import MetricsFetchError, compile_slo, fetch_metrics, logger
+except ImportError:  # run as a script from this directory
+    from gate import MetricsFetchError, compile_slo, fetch_metrics, logger
+
+EXIT_CODE_HEADER = "X-SLO-Gate-Exit-Code"
+
+# Refuse request bodies larger than this (bytes)
+MAX_BODY_SIZE = 64 * 1024
+
+
+class MetricsCache:
+    """Metric snapshots per endpoint, refreshed at most once per TTL.
+
+    Concurrent requests for the same endpoint wait for a single upstream
+    fetch instead of each issuing their own. Fetch errors are not cached.
+    At most `max_endpoints` endpoints are kept; the least recently used
+    one that is not being fetched is evicted first.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 2.0,
+        timeout: float = 10,
+        pool_size: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+        max_endpoints: int = 64,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds a snapshot is reused
+            timeout: Upstream request timeout in seconds
+            pool_size: Keep-alive connections kept per upstream host
+            clock: Monotonic clock (replaced in tests)
+            max_endpoints: Endpoints whose snapshots are kept
+        """
+        self.ttl = ttl
+        self.timeout = timeout
+        self.clock = clock
+        self.max_endpoints = max_endpoints
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._snapshots: Dict[str, Tuple[float, Dict[str, float]]] = {}
+        self._locks: "OrderedDict[str, threading.Lock]" = OrderedDict()
+        self._guard = threading.Lock()
+        self.fetches = 0
+
+    def get(self, url: str) -> Tuple[Dict[str, float], float, bool]:
+        """
+        Return metrics for an endpoint.
+
+        Returns:
+            Tuple of metrics, snapshot age in seconds and whether it was cached
+
+        Raises:
+            MetricsFetchError: If the endpoint cannot be fetched
+        """
+        with self._guard:
+            lock = self._locks.get(url)
+            if lock is None:
+                lock = self._locks[url] = threading.Lock()
+                self._evict()
+            else:
+                self._locks.move_to_end(url)
+        with lock:
+            snapshot = self._snapshots.get(url)
+            now = self.clock()
+            if snapshot is not None and now - snapshot[0] < self.ttl:
+                return snapshot[1], now - snapshot[0], True
+            metrics = fetch_metrics(url, self.timeout, self.session)
+            with self._guard:
+                self.fetches += 1
+                # Not stored if the endpoint was evicted while fetching
+                if self._locks.get(url) is lock:
+                    self._snapshots[url] = (self.clock(), metrics)
+            return metrics, 0.0, False
+
+    def _evict(self) -> None:
+        """Drop least recently used endpoints beyond max_endpoints (guard held)."""
+        for url in list(self._locks):
+            if len(self._locks) <= self.max_endpoints:
+                break
+            if not self._locks[url].locked():
+                del self._locks[url]
+                self._snapshots.pop(url, None)
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def close(self) -> None:
+        """Close pooled upstream connections."""
+        self.session.close()
+
+
+class GateService:
+    """Evaluates SLO expressions against cached metric snapshots."""
+
+    def __init__(
+        self,
+        cache: MetricsCache,
+        default_url: Optional[str] = None,
+        allowed_urls: Iterable[str] = (),
+    ):
+        """
+        Initialize service with a metrics cache.
+
+        Args:
+            cache: Metrics snapshot cache
+            default_url: Metrics URL used when a request gives none
+            allowed_urls: Further metrics URLs requests may name
+        """
+        self.cache = cache
+        self.default_url = default_url
+        self.allowed_urls = set(allowed_urls)
+        if default_url:
+            self.allowed_urls.add(default_url)
+
+    def evaluate(self, slo: str, url: Optional[str] = None, site: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Evaluate an SLO string against an endpoint's current metrics.
+
+        Returns:
+            Verdict with slo_validation PASSED, FAILED or ERROR and exit_code
+
+        Raises:
+            ValueError: If the SLO string is invalid, no URL is given or the
+                URL is not a configured metrics source
+        """
+        url = url or self.default_url
+        if not url:
+            raise ValueError("No metrics url given")
+        if url not in self.allowed_urls:
+            raise ValueError(f"Metrics url not allowed: {url}")
+        compiled = compile_slo(slo)
+
+        verdict: Dict[str, Any] = {"slo": slo, "url": url}
+        if site:
+            verdict["site"] = site
+        try:
+            metrics, age, cached = self.cache.get(url)
+            passed = compiled.evaluate(metrics, site)
+            violations = [] if passed else compiled.violations(metrics, site)
+        except MetricsFetchError as e:
+            verdict.update(slo_validation="ERROR", error=str(e), exit_code=1)
+            return verdict
+        except KeyError as e:
+            verdict.update(slo_validation="ERROR", error=e.args[0], exit_code=1)
+            return verdict
+
+        verdict.update(
+            slo_validation="PASSED" if passed else "FAILED",
+            violations=violations,
+            metrics=metrics,
+            snapshot_age_s=round(age, 3),
+            cached=cached,
+            exit_code=0 if passed else 1,
+        )
+        return verdict
+
+
+def _verdict_key(verdict: Dict[str, Any]) -> Tuple:
+    """What counts as a verdict change for /watch."""
+    return (
+        verdict["slo_validation"],
+        tuple(sorted(str(v["metric"]) for v in verdict.get("violations", []))),
+        verdict.get("error"),
+    )
+
+
+class GateRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the gate daemon."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "slo-gate-daemon/1.0"
+
+    def _send_json(self, status: int, body: Dict[str, Any], exit_code: Optional[int] = None) -> None:
+        payload = json.dumps(body, sort_keys=True).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if exit_code is not None:
+            self.send_header(EXIT_CODE_HEADER, str(exit_code))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _evaluate(self, params: Dict[str, str]) -> None:
+        if not params.get("slo") or not isinstance(params["slo"], str):
+            self._send_json(400, {"error": "Missing 'slo'"}, 1)
+            return
+        try:
+            verdict = self.server.service.evaluate(params["slo"], params.get("url"), params.get("site"))
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)}, 1)
+            return
+        self._send_json(200, verdict, verdict["exit_code"])
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        if url.path == "/health":
+            self._send_json(200, {"status": "healthy"})
+        elif url.path == "/evaluate":
+            self._evaluate(params)
+        elif url.path == "/watch":
+            self._watch(params)
+        else:
+            self._send_json(404, {"error": "Endpoint not found"})
+
+    def do_POST(self) -> None:  # noqa: N802
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_SIZE:
+            self.close_connection = True
+            self._send_json(413, {"error": "Request too large"})
+            return
+        body = self.rfile.read(length)
+        if url.path != "/evaluate":
+            self._send_json(404, {"error": "Endpoint not found"})
+            return
+        try:
+            params = json.loads(body or b"{}")
+            if not isinstance(params, dict):
+                raise ValueError("Request body must be a JSON object")
+        except ValueError as e:
+            self._send_json(400, {"error": f"Invalid request: {e}"}, 1)
+            return
+        self._evaluate(params)
+
+    def _watch(self, params: Dict[str, str]) -> None:
+        """Stream verdict changes as Server-Sent Events."""
+        slo = params.get("slo")
+        try:
+            interval = max(float(params.get("interval", 5)), 0.05)
+            timeout = float(params["timeout"]) if "timeout" in params else None
+            if not slo:
+                raise ValueError("Missing 'slo'")
+            self.server.service.evaluate(slo, params.get("url"), params.get("site"))
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)}, 1)
+            return
+
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        until = params.get("until")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        last_key = None
+        try:
+            while not self.server.stopping.is_set():
+                verdict = self.server.service.evaluate(slo, params.get("url"), params.get("site"))
+                key = _verdict_key(verdict)
+                if key != last_key:
+                    self._send_event("verdict", verdict)
+                    last_key = key
+                else:
+                    self.wfile.write(b": keep-alive\n\n")
+                    self.wfile.flush()
+                if until and verdict["slo_validation"] == until:
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    self._send_event("timeout", {"slo_validation": verdict["slo_validation"]})
+                    break
+                self.server.stopping.wait(interval)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _send_event(self, event: str, data: Dict[str, Any]) -> None:
+        self.wfile.write(f"event: {event}\ndata: {json.dumps(data, sort_keys=True)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("Request handled", extra={"url": self.path})
+
+
+class GateDaemon(ThreadingHTTPServer):
+    """Threaded HTTP server holding the gate service."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], service: GateService):
+        super().__init__(address, GateRequestHandler)
+        self.service = service
+        self.stopping = threading.Event()
+
+    def shutdown(self) -> None:
+        """Stop serving and end open /watch streams."""
+        self.stopping.set()
+        super().shutdown()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.service.cache.close()
+
+
+def create_daemon(
+    host: str = "127.0.0.1",
+    port: int = 8090,
+    ttl: float = 2.0,
+    timeout: float = 10,
+    default_url: Optional[str] = None,
+    allowed_urls: Iterable[str] = (),
+    max_endpoints: int = 64,
+) -> GateDaemon:
+    """
+    Create a gate daemon.
+
+    Args:
+        host: Listen address
+        port: Listen port (0 picks a free port)
+        ttl: Seconds metric snapshots are reused
+        timeout: Upstream metrics request timeout in seconds
+        default_url: Metrics URL used when a request gives none
+        allowed_urls: Further metrics URLs requests may name
+        max_endpoints: Endpoints whose snapshots are cached
+
+    Returns:
+        Server ready for serve_forever()
+    """
+    cache = MetricsCache(ttl, timeout, max_endpoints=max_endpoints)
+    return GateDaemon((host, port), GateService(cache, default_url, allowed_urls))
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Daemon entry point."""
+    parser = argparse.ArgumentParser(description="SLO Gate daemon - warm SLO evaluation service")
+    parser.add_argument("--host", default="127.0.0.1", help="Listen address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8090, help="Listen port (default: 8090)")
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=2.0,
+        help="Seconds a metrics snapshot is reused (default: 2)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=10,
+        help="Upstream metrics request timeout in seconds (default: 10)",
+    )
+    parser.add_argument("--url", help="Default metrics endpoint URL")
+    parser.add_argument(
+        "--allow-url",
+        action="append",
+        default=[],
+        help="Further metrics endpoint URL requests may name (repeatable)",
+    )
+    parser.add_argument(
+        "--max-endpoints",
+        type=int,
+        default=64,
+        help="Endpoints whose metric snapshots are cached (default: 64)",
+    )
+    args = parser.parse_args(argv)
+    if not args.url and not args.allow_url:
+        parser.error("at least one of --url or --allow-url is required")
+
+    daemon = create_daemon(
+        args.host, args.port, args.ttl, args.timeout, args.url, args.allow_url, args.max_endpoints
+    )
+
+    def handle_sigterm(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+    host, port = daemon.server_address[:2]
+    logger.info("SLO Gate daemon listening", extra={"url": f"http://{host}:{port}"})
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stopping.set()
+        daemon.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
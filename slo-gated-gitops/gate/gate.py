@@ -4,17 +4,41 @@ SLO Gate CLI Tool - Validates metrics against SLO thresholds.
 Fetches metrics from adapter and validates against SLO string.
 Returns exit code 0 for pass, 1 for fail (deterministic behavior).
 Logs in JSON format for machine parsing.
+
+In windowed mode the endpoint is polled into a fixed-size ring buffer and
+the gate stops as soon as a sequential probability ratio test settles
+whether the SLOs hold in a sustained way.
+
+In multi-site mode the metrics of every edge site are fetched concurrently
+through one pooled async HTTP client, each site is checked against the SLO
+string with its `site_overrides` applied, and a single aggregated verdict
+is printed as JSON.
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import math
 import re
 import sys
+import time
 from datetime import datetime
-from typing import Dict, List, Union
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+import httpx
+import numpy as np
 import requests
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_SITES_CONFIG = REPO_ROOT / "config" / "edge-sites-config.yaml"
+DEFAULT_THRESHOLDS_CONFIG = REPO_ROOT / "config" / "slo-thresholds.yaml"
+
+# Well-known metrics published by the job-query-adapter /metrics endpoint
+METRIC_KEYS = ("latency_p95_ms", "success_rate", "throughput_p95_mbps")
 
 
 class JSONFormatter(logging.Formatter):
@@ -30,7 +54,15 @@ class JSONFormatter(logging.Formatter):
         }
 
         # Add extra fields
-        for attr in ["slo_validation", "metrics", "violations", "duration_ms", "url"]:
+        for attr in [
+            "slo_validation",
+            "metrics",
+            "violations",
+            "duration_ms",
+            "url",
+            "sites",
+            "window",
+        ]:
             if hasattr(record, attr):
                 log_data[attr] = getattr(record, attr)
 
@@ -57,57 +89,486 @@ class MetricsFetchError(Exception):
     pass
 
 
-def parse_slo_string(slo_string: str) -> List[Dict[str, Union[str, float]]]:
+# Units accepted after SLO thresholds: dimension and scale to the base unit
+# of that dimension (ms, Mbps, ratio)
+SLO_UNITS: Dict[str, Tuple[str, float]] = {
+    "us": ("time", 1e-3),
+    "ms": ("time", 1.0),
+    "s": ("time", 1e3),
+    "bps": ("rate", 1e-6),
+    "kbps": ("rate", 1e-3),
+    "mbps": ("rate", 1.0),
+    "gbps": ("rate", 1e3),
+    "%": ("ratio", 1e-2),
+}
+
+# Metric name suffixes that declare the unit the metric is published in;
+# metrics without one are assumed to use the base unit
+_METRIC_UNIT_SUFFIXES = (
+    ("_ms", "ms"),
+    ("_us", "us"),
+    ("_seconds", "s"),
+    ("_s", "s"),
+    ("_kbps", "kbps"),
+    ("_mbps", "mbps"),
+    ("_gbps", "gbps"),
+    ("_bps", "bps"),
+    ("_percent", "%"),
+    ("_pct", "%"),
+)
+
+_COMPARISONS: Dict[str, Callable[[np.ndarray, float], np.ndarray]] = {
+    "<=": np.less_equal,
+    ">=": np.greater_equal,
+    "<": np.less,
+    ">": np.greater,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+# Aggregations reduce the sample axis of (sample sets, samples) arrays
+_AGGREGATES: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "last": lambda data: data[:, -1],
+    "avg": lambda data: np.nanmean(data, axis=1),
+    "mean": lambda data: np.nanmean(data, axis=1),
+    "min": lambda data: np.nanmin(data, axis=1),
+    "max": lambda data: np.nanmax(data, axis=1),
+}
+_PERCENTILE_FUNCTION = re.compile(r"^p(\d{1,2}(?:\.\d+)?)$")
+
+_SLO_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"|(?P<op><=|>=|==|!=|<|>)"
+    r"|(?P<and>&&|,)"
+    r"|(?P<or>\|\|)"
+    r"|(?P<not>!)"
+    r"|(?P<lparen>\()"
+    r"|(?P<rparen>\))"
+    r"|(?P<colon>:)"
+    r"|(?P<percent>%)"
+    r"|(?P<name>[A-Za-z_][\w.\-]*)"
+    r")"
+)
+_SLO_KEYWORDS = {"and": "and", "or": "or", "not": "not"}
+
+# Parsed expression nodes:
+#   ("cmp", site, function, metric, operator, threshold)
+#   ("and", (node, ...)), ("or", (node, ...)), ("not", node)
+SLONode = Tuple[Any, ...]
+
+
+def _aggregate(function: Optional[str]) -> Callable[[np.ndarray], np.ndarray]:
+    """Return the reducer for an aggregation function name (None = last sample)."""
+    if function is None:
+        return _AGGREGATES["last"]
+    if function in _AGGREGATES:
+        return _AGGREGATES[function]
+    q = float(_PERCENTILE_FUNCTION.match(function).group(1))
+
+    def percentile(data: np.ndarray) -> np.ndarray:
+        # nanpercentile is an order of magnitude slower; only pay for it with gaps
+        if np.isnan(data).any():
+            return np.nanpercentile(data, q, axis=1)
+        return np.percentile(data, q, axis=1)
+
+    return percentile
+
+
+def _tokenize_slo(slo_string: str) -> List[Tuple[str, str]]:
+    """Split an SLO expression into (kind, text) tokens."""
+    tokens = []
+    position = 0
+    end = len(slo_string.rstrip())
+    while position < end:
+        match = _SLO_TOKEN.match(slo_string, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid SLO format: unexpected input at '{slo_string[position:].strip()}'")
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "name" and text.lower() in _SLO_KEYWORDS:
+            kind = _SLO_KEYWORDS[text.lower()]
+        tokens.append((kind, text))
+        position = match.end()
+    return tokens
+
+
+def _convert_threshold(metric: str, value: float, unit: str) -> float:
+    """Scale a threshold given in `unit` into the unit the metric is published in."""
+    dimension, scale = SLO_UNITS[unit.lower()]
+    metric_unit = next(
+        (unit for suffix, unit in _METRIC_UNIT_SUFFIXES if metric.lower().endswith(suffix)),
+        None,
+    )
+    if metric_unit is None:
+        return value * scale
+    metric_dimension, metric_scale = SLO_UNITS[metric_unit]
+    if metric_dimension != dimension:
+        raise ValueError(f"Invalid SLO format: unit '{unit}' does not apply to {metric}")
+    return value * scale / metric_scale
+
+
+class _SLOParser:
+    """Recursive descent parser for SLO expressions.
+
+    Grammar (lowest precedence first; ',' is AND for compatibility):
+        or    := and (('OR' | '||') and)*
+        and   := unary (('AND' | '&&' | ',') unary)*
+        unary := ('NOT' | '!') unary | site ':' unary | '(' or ')' | cmp
+        cmp   := (function '(' metric ')' | metric) op number [unit]
     """
-    Parse SLO string into structured format.
 
-    Args:
-        slo_string: String like "latency_p95_ms<=15,success_rate>=0.995"
+    def __init__(self, slo_string: str):
+        self.source = slo_string
+        self.tokens = _tokenize_slo(slo_string)
+        self.position = 0
+
+    def _peek(self, offset: int = 0) -> Optional[str]:
+        index = self.position + offset
+        return self.tokens[index][0] if index < len(self.tokens) else None
+
+    def _take(self, kind: str) -> str:
+        if self._peek() != kind:
+            found = self.tokens[self.position][1] if self._peek() else "end of input"
+            raise ValueError(f"Invalid SLO format: expected {kind} but found '{found}' in {self.source}")
+        text = self.tokens[self.position][1]
+        self.position += 1
+        return text
+
+    def parse(self) -> SLONode:
+        if not self.tokens:
+            raise ValueError("Invalid SLO format: empty string")
+        node = self._parse_or(None)
+        if self._peek() is not None:
+            raise ValueError(
+                f"Invalid SLO format: unexpected '{self.tokens[self.position][1]}' in {self.source}"
+            )
+        return node
+
+    def _parse_chain(self, kind: str, parse_operand: Callable, site: Optional[str]) -> SLONode:
+        nodes = [parse_operand(site)]
+        while self._peek() == kind:
+            self.position += 1
+            # Tolerate trailing and doubled commas of the original format
+            if kind == "and" and self._peek() in (None, "and", "rparen"):
+                continue
+            nodes.append(parse_operand(site))
+        return nodes[0] if len(nodes) == 1 else (kind, tuple(nodes))
+
+    def _parse_or(self, site: Optional[str]) -> SLONode:
+        return self._parse_chain("or", self._parse_and, site)
+
+    def _parse_and(self, site: Optional[str]) -> SLONode:
+        return self._parse_chain("and", self._parse_unary, site)
+
+    def _parse_unary(self, site: Optional[str]) -> SLONode:
+        kind = self._peek()
+        if kind == "not":
+            self.position += 1
+            return ("not", self._parse_unary(site))
+        if kind == "lparen":
+            self.position += 1
+            node = self._parse_or(site)
+            self._take("rparen")
+            return node
+        if kind == "name" and self._peek(1) == "colon":
+            scope = self._take("name")
+            self.position += 1
+            return self._parse_unary(scope)
+        return self._parse_comparison(site)
+
+    def _parse_comparison(self, site: Optional[str]) -> SLONode:
+        function = None
+        metric = self._take("name")
+        if self._peek() == "lparen":
+            function = metric.lower()
+            if function not in _AGGREGATES and not _PERCENTILE_FUNCTION.match(function):
+                raise ValueError(f"Invalid SLO format: unknown function {metric}()")
+            self.position += 1
+            metric = self._take("name")
+            self._take("rparen")
+
+        operator = self._take("op")
+        threshold = float(self._take("number"))
+        if self._peek() == "percent" or (
+            self._peek() == "name" and self.tokens[self.position][1].lower() in SLO_UNITS
+        ):
+            unit = self.tokens[self.position][1]
+            self.position += 1
+            threshold = _convert_threshold(metric, threshold, unit)
+        return ("cmp", site, function, metric, operator, threshold)
+
+
+class _SampleSets:
+    """Metric arrays of shape (sample sets, samples) plus optional site labels."""
+
+    def __init__(self, samples: Dict[str, Any], sites: Optional[Sequence[str]] = None):
+        self._samples = samples
+        self._columns: Dict[str, np.ndarray] = {}
+        self.sites = None if sites is None else np.asarray(sites, dtype=object)
+        if self.sites is not None:
+            self.count = len(self.sites)
+        elif samples:
+            self.count = len(np.atleast_1d(next(iter(samples.values()))))
+        else:
+            self.count = 1
+
+    def column(self, metric: str) -> np.ndarray:
+        data = self._columns.get(metric)
+        if data is None:
+            if metric not in self._samples:
+                raise KeyError(f"Required metric '{metric}' not found in metrics data")
+            data = np.asarray(self._samples[metric], dtype=np.float64)
+            if data.ndim < 2:
+                data = data.reshape(-1, 1)
+            self._columns[metric] = data
+        return data
+
+    def in_scope(self, site: Optional[str]) -> Optional[np.ndarray]:
+        """Mask of sample sets a site-scoped clause applies to (None = all)."""
+        if site is None:
+            return None
+        if self.sites is None:
+            return np.zeros(self.count, dtype=bool)
+        return self.sites == site
+
+
+class CompiledSLO:
+    """
+    SLO expression compiled into NumPy evaluators.
+
+    Evaluation works on sample sets: every metric maps to an array of shape
+    (sample sets,) or (sample sets, samples). A bare metric compares the
+    last sample of each set, aggregation functions (avg, min, max, pNN)
+    reduce over the samples. Each clause is one vectorized comparison over
+    all sample sets. Clauses scoped to a site are neutral for every other
+    set: they drop out of AND/OR, NOT leaves them neutral, and an
+    expression that is neutral as a whole holds.
+    """
 
-    Returns:
-        List of dicts with metric, operator, threshold
+    def __init__(self, tree: SLONode, source: str = ""):
+        """Compile a parsed expression tree."""
+        self.tree = tree
+        self.source = source
+        self.clauses: List[Dict[str, Union[str, float]]] = []
+        self._plan = self._compile(tree)
+
+    # Compiled nodes mirror the parsed tree as (kind, evaluate, payload);
+    # evaluate returns (result, applies) boolean arrays, where `applies` is
+    # False for sample sets the node is neutral for
+
+    def _compile(self, node: SLONode) -> Tuple[Any, ...]:
+        kind = node[0]
+        if kind == "cmp":
+            return self._compile_comparison(node)
+        if kind == "not":
+            operand = self._compile(node[1])
+
+            def negate(sets: _SampleSets) -> Tuple[np.ndarray, np.ndarray]:
+                result, applies = operand[1](sets)
+                return np.logical_not(result), applies
+
+            return ("not", negate, operand)
+
+        operands = [self._compile(child) for child in node[1]]
+        is_and = kind == "and"
+
+        def evaluate(sets: _SampleSets) -> Tuple[np.ndarray, np.ndarray]:
+            # Neutral operands count as the identity of the connective
+            result = np.full(sets.count, is_and)
+            applies = np.zeros(sets.count, dtype=bool)
+            for operand in operands:
+                value, scope = operand[1](sets)
+                if is_and:
+                    result = result & (value | ~scope)
+                else:
+                    result = result | (value & scope)
+                applies = applies | scope
+            return result, applies
+
+        return (kind, evaluate, operands)
+
+    def _compile_comparison(self, node: SLONode) -> Tuple[Any, ...]:
+        _, site, function, metric, operator, threshold = node
+        clause: Dict[str, Union[str, float]] = {
+            "metric": metric,
+            "operator": operator,
+            "threshold": threshold,
+        }
+        if function:
+            clause["function"] = function
+        if site:
+            clause["site"] = site
+        self.clauses.append(clause)
+
+        aggregate = _aggregate(function)
+        compare = _COMPARISONS[operator]
+
+        def value(sets: _SampleSets) -> np.ndarray:
+            return aggregate(sets.column(metric))
+
+        def evaluate(sets: _SampleSets) -> Tuple[np.ndarray, np.ndarray]:
+            scope = sets.in_scope(site)
+            if scope is None:
+                scope = np.ones(sets.count, dtype=bool)
+            elif not scope.any():
+                return np.ones(sets.count, dtype=bool), scope
+            values = np.broadcast_to(value(sets), (sets.count,))
+            return compare(values, threshold) & ~np.isnan(values), scope
+
+        return ("cmp", evaluate, (clause, value))
+
+    def evaluate_many(
+        self, samples: Dict[str, Any], sites: Optional[Sequence[str]] = None
+    ) -> np.ndarray:
+        """
+        Evaluate the expression for every sample set in one pass.
+
+        Args:
+            samples: Metric name -> array of shape (sets,) or (sets, samples)
+            sites: Site label of each sample set, for site-scoped clauses
+
+        Returns:
+            Boolean array with one verdict per sample set
+
+        Raises:
+            KeyError: If a metric used by an applicable clause is missing
+        """
+        sets = _SampleSets(samples, sites)
+        result, applies = self._plan[1](sets)
+        return (result | ~applies).astype(bool)
+
+    def evaluate(self, metrics: Dict[str, float], site: Optional[str] = None) -> bool:
+        """Evaluate against a single metrics sample."""
+        return bool(self.evaluate_many(metrics, None if site is None else [site])[0])
+
+    def violations(
+        self, metrics: Dict[str, float], site: Optional[str] = None
+    ) -> List[Dict[str, Union[str, float]]]:
+        """
+        Return the clauses that make the expression fail for a sample, else [].
+
+        Clauses that hold but had to fail because they sit under NOT are
+        reported with `negated: True`.
+        """
+        sets = _SampleSets(metrics, None if site is None else [site])
+        result, applies = self._plan[1](sets)
+        if result[0] or not applies[0]:
+            return []
+        failed: List[Dict[str, Union[str, float]]] = []
+        self._blame(self._plan, sets, True, failed)
+        return failed
+
+    def _blame(
+        self,
+        node: Tuple[Any, ...],
+        sets: _SampleSets,
+        wanted: bool,
+        failed: List[Dict[str, Union[str, float]]],
+    ) -> None:
+        """Collect the clauses below `node`, which evaluated to `not wanted`."""
+        kind, _, payload = node
+        if kind == "cmp":
+            clause, value = payload
+            violation = {**clause, "actual": float(value(sets)[0])}
+            if not wanted:
+                violation["negated"] = True
+            failed.append(violation)
+            return
+        if kind == "not":
+            self._blame(payload, sets, not wanted, failed)
+            return
+        # Operands that disagree with the wanted value: the false ones of a
+        # failing AND, or every one of an AND that should not have held
+        for operand in payload:
+            result, applies = operand[1](sets)
+            if applies[0] and result[0] != wanted:
+                self._blame(operand, sets, wanted, failed)
+
+    def with_thresholds(self, thresholds: Dict[str, float]) -> "CompiledSLO":
+        """Return a copy with the thresholds of clauses on the given metrics replaced."""
+
+        def replace(node: SLONode) -> SLONode:
+            if node[0] == "cmp":
+                if node[3] in thresholds:
+                    return node[:5] + (thresholds[node[3]],)
+                return node
+            if node[0] == "not":
+                return ("not", replace(node[1]))
+            return (node[0], tuple(replace(child) for child in node[1]))
+
+        return CompiledSLO(replace(self.tree), self.source)
+
+    @classmethod
+    def from_clauses(cls, slos: List[Dict[str, Union[str, float]]]) -> "CompiledSLO":
+        """Compile a plain list of constraint dicts as their conjunction."""
+        nodes = tuple(
+            (
+                "cmp",
+                slo.get("site"),
+                slo.get("function"),
+                slo["metric"],
+                slo["operator"],
+                float(slo["threshold"]),
+            )
+            for slo in slos
+        )
+        return cls(nodes[0] if len(nodes) == 1 else ("and", nodes))
 
-    Raises:
-        ValueError: If SLO format is invalid
+
+class SLOExpression(list):
+    """
+    Parsed SLO string: the list of its constraint dicts plus the compiled
+    expression. Comma-separated strings compare equal to the plain list
+    returned by earlier versions.
     """
-    if not slo_string or not slo_string.strip():
-        raise ValueError("Invalid SLO format: empty string")
 
-    slos = []
+    def __init__(self, compiled: CompiledSLO):
+        super().__init__(dict(clause) for clause in compiled.clauses)
+        self.compiled = compiled
 
-    # Split by comma and process each constraint
-    for constraint in slo_string.split(","):
-        constraint = constraint.strip()
 
-        if not constraint:
-            continue
+@lru_cache(maxsize=256)
+def compile_slo(slo_string: str) -> CompiledSLO:
+    """
+    Parse and compile an SLO expression (cached per string).
 
-        # Match pattern: metric_name operator threshold
-        pattern = r"^(\w+)\s*(<=|>=|<|>|==)\s*([\d.]+)$"
-        match = re.match(pattern, constraint)
+    Examples:
+        "latency_p95_ms<=15,success_rate>=0.995"
+        "p95(latency_p95_ms) <= 20ms AND NOT success_rate < 99.5%"
+        "edge2:(latency_p95_ms <= 20) OR throughput_p95_mbps >= 1Gbps"
 
-        if not match:
-            raise ValueError(f"Invalid SLO format: {constraint}")
+    Raises:
+        ValueError: If the expression is invalid
+    """
+    if not slo_string or not slo_string.strip():
+        raise ValueError("Invalid SLO format: empty string")
+    return CompiledSLO(_SLOParser(slo_string).parse(), slo_string)
 
-        metric, operator, threshold_str = match.groups()
 
-        # Validate operator
-        if operator not in ["<=", ">=", "<", ">", "=="]:
-            raise ValueError(f"Invalid SLO format: unsupported operator {operator}")
+def parse_slo_string(slo_string: str) -> SLOExpression:
+    """
+    Parse SLO string into structured format.
 
-        try:
-            threshold = float(threshold_str)
-        except ValueError:
-            raise ValueError(
-                f"Invalid SLO format: threshold must be numeric in {constraint}"
-            )
+    Args:
+        slo_string: Expression like "latency_p95_ms<=15,success_rate>=0.995";
+            see compile_slo() for AND/OR/NOT, site scopes, units and functions
+
+    Returns:
+        List of dicts with metric, operator, threshold (plus function and
+        site where used), carrying the compiled expression as `.compiled`
 
-        slos.append({"metric": metric, "operator": operator, "threshold": threshold})
+    Raises:
+        ValueError: If SLO format is invalid
+    """
+    return SLOExpression(compile_slo(slo_string))
 
-    if not slos:
-        raise ValueError("Invalid SLO format: no valid constraints found")
 
-    return slos
+def _compiled(slos: List[Dict[str, Union[str, float]]]) -> CompiledSLO:
+    """Compiled expression of parse_slo_string output or a plain constraint list."""
+    if isinstance(slos, SLOExpression):
+        return slos.compiled
+    return CompiledSLO.from_clauses(slos)
 
 
 def validate_metrics_against_slos(
@@ -118,7 +579,7 @@ def validate_metrics_against_slos(
 
     Args:
         metrics: Dict of metric name -> value
-        slos: List of SLO constraints from parse_slo_string
+        slos: SLO constraints from parse_slo_string
 
     Returns:
         True if all SLOs pass
@@ -127,57 +588,66 @@ def validate_metrics_against_slos(
         SLOValidationError: If any SLO fails
         KeyError: If required metric is missing
     """
-    violations = []
-
-    for slo in slos:
-        metric_name = slo["metric"]
-        operator = slo["operator"]
-        threshold = slo["threshold"]
-
-        if metric_name not in metrics:
-            raise KeyError(f"Required metric '{metric_name}' not found in metrics data")
-
-        actual_value = metrics[metric_name]
-        passed = False
-
-        # Evaluate SLO constraint
-        if operator == "<=":
-            passed = actual_value <= threshold
-        elif operator == ">=":
-            passed = actual_value >= threshold
-        elif operator == "<":
-            passed = actual_value < threshold
-        elif operator == ">":
-            passed = actual_value > threshold
-        elif operator == "==":
-            passed = actual_value == threshold
-
-        if not passed:
-            violations.append(
-                {
-                    "metric": metric_name,
-                    "operator": operator,
-                    "threshold": threshold,
-                    "actual": actual_value,
-                }
-            )
-
-    if violations:
+    compiled = _compiled(slos)
+    if not compiled.evaluate(metrics):
         violation_details = [
-            f"{v['metric']} {v['operator']} {v['threshold']} (actual: {v['actual']})"
-            for v in violations
+            f"{'NOT ' if v.get('negated') else ''}{v['metric']} {v['operator']} {v['threshold']} "
+            f"(actual: {v['actual']})"
+            for v in compiled.violations(metrics)
         ]
         raise SLOValidationError(f"SLO violations: {', '.join(violation_details)}")
 
     return True
 
 
-def fetch_metrics(url: str) -> Dict[str, float]:
+def find_violations(
+    metrics: Dict[str, float],
+    slos: List[Dict[str, Union[str, float]]],
+    site: Optional[str] = None,
+) -> List[Dict[str, Union[str, float]]]:
+    """
+    Return the failing SLO constraints if the SLO expression fails, else [].
+
+    Args:
+        metrics: Dict of metric name -> value
+        slos: SLO constraints from parse_slo_string
+        site: Site the metrics belong to, for site-scoped constraints
+
+    Raises:
+        KeyError: If required metric is missing
+    """
+    return _compiled(slos).violations(metrics, site)
+
+
+def extract_metrics(data: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Extract every numeric top-level metric from a /metrics payload.
+
+    Raises:
+        MetricsFetchError: If a well-known adapter metric is null or not numeric
+    """
+    metrics = {}
+    for key, value in data.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics[key] = float(value)
+        elif key in METRIC_KEYS and value is None:
+            # The adapter reports null for a site without samples in its window
+            raise MetricsFetchError(f"No data for metric {key}")
+        elif key in METRIC_KEYS:
+            raise MetricsFetchError(f"Metric {key} is not numeric: {value}")
+    return metrics
+
+
+def fetch_metrics(
+    url: str, timeout: float = 30, session: Optional[requests.Session] = None
+) -> Dict[str, float]:
     """
     Fetch metrics from adapter endpoint.
 
     Args:
         url: Metrics endpoint URL
+        timeout: Request timeout in seconds
+        session: Reuse this session's pooled connections (repeated polling)
 
     Returns:
         Dict of metric name -> value
@@ -186,18 +656,13 @@ def fetch_metrics(url: str) -> Dict[str, float]:
         MetricsFetchError: If fetch fails
     """
     try:
-        response = requests.get(url, timeout=30)
+        response = (session or requests).get(url, timeout=timeout)
         response.raise_for_status()
 
         data = response.json()
 
         # Extract numeric metrics
-        metrics = {}
-        for key, value in data.items():
-            if key in ["latency_p95_ms", "success_rate", "throughput_p95_mbps"]:
-                if not isinstance(value, (int, float)):
-                    raise MetricsFetchError(f"Metric {key} is not numeric: {value}")
-                metrics[key] = float(value)
+        metrics = extract_metrics(data)
 
         logger.info(
             "Metrics fetched successfully",
@@ -212,6 +677,381 @@ def fetch_metrics(url: str) -> Dict[str, float]:
         raise MetricsFetchError(f"Invalid JSON response from {url}: {str(e)}")
 
 
+class MetricWindow:
+    """Fixed-size ring buffer of metric samples and their SLO outcomes."""
+
+    def __init__(self, metric_names: Sequence[str], size: int):
+        """
+        Initialize an empty window.
+
+        Args:
+            metric_names: Metrics kept per sample
+            size: Number of most recent samples kept
+        """
+        if size < 1:
+            raise ValueError("Window size must be at least 1")
+        self.metric_names = list(metric_names)
+        self.size = size
+        self.count = 0
+        self._values = np.full((size, len(self.metric_names)), np.nan)
+        self._passed = np.zeros(size, dtype=bool)
+
+    def __len__(self) -> int:
+        """Number of samples currently in the window."""
+        return min(self.count, self.size)
+
+    def append(self, metrics: Dict[str, float], passed: bool) -> None:
+        """Add a sample, overwriting the oldest one once the window is full."""
+        row = self.count % self.size
+        self._values[row] = [metrics.get(name, np.nan) for name in self.metric_names]
+        self._passed[row] = passed
+        self.count += 1
+
+    def evaluate(self, compiled: "CompiledSLO", metrics: Dict[str, float]) -> bool:
+        """
+        Evaluate an SLO expression at a new sample, before it is appended.
+
+        Bare metrics compare the new sample, aggregation functions such as
+        p95(latency_p95_ms) reduce over the window as it will be once the
+        sample is in, so they judge the sustained distribution.
+
+        Raises:
+            KeyError: If a metric used by an applicable clause is missing
+        """
+        kept = min(self.count, self.size - 1)
+        rows = np.arange(self.count - kept, self.count) % self.size
+        samples = {
+            name: np.append(self._values[rows, column], metrics[name])[np.newaxis]
+            for column, name in enumerate(self.metric_names)
+            if name in metrics
+        }
+        return bool(compiled.evaluate_many(samples)[0])
+
+    @property
+    def pass_ratio(self) -> float:
+        """Fraction of samples in the window that met every SLO."""
+        if not len(self):
+            return 0.0
+        return float(self._passed[: len(self)].mean())
+
+    def statistics(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Per-metric mean, percentiles and range over the window (NaNs ignored)."""
+        values = self._values[: len(self)]
+        stats: Dict[str, Dict[str, Optional[float]]] = {}
+        for column, name in enumerate(self.metric_names):
+            samples = values[:, column]
+            samples = samples[~np.isnan(samples)]
+            if not samples.size:
+                stats[name] = {"samples": 0}
+                continue
+            p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+            stats[name] = {
+                "samples": int(samples.size),
+                "mean": float(samples.mean()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+                "min": float(samples.min()),
+                "max": float(samples.max()),
+            }
+        return stats
+
+
+class SequentialTest:
+    """
+    Wald sequential probability ratio test on per-sample SLO outcomes.
+
+    Compares the hypotheses that samples pass with probability
+    `target + margin` (sustained pass) and `target - margin` (failing),
+    with error rates alpha (passing a failing service) and beta (failing a
+    healthy one).
+    """
+
+    def __init__(
+        self,
+        target: float = 0.95,
+        margin: float = 0.04,
+        alpha: float = 0.05,
+        beta: float = 0.05,
+    ):
+        """Precompute per-outcome log-likelihood ratios and decision bounds."""
+        good = min(target + margin, 1 - 1e-6)
+        bad = max(target - margin, 1e-6)
+        if not 0 < alpha < 1 or not 0 < beta < 1 or bad >= good:
+            raise ValueError("Invalid sequential test parameters")
+        self._pass_llr = math.log(good / bad)
+        self._fail_llr = math.log((1 - good) / (1 - bad))
+        self.upper = math.log((1 - beta) / alpha)
+        self.lower = math.log(beta / (1 - alpha))
+        self.llr = 0.0
+
+    def update(self, passed: bool) -> Optional[str]:
+        """Add one outcome; return "PASSED"/"FAILED" once settled, else None."""
+        self.llr += self._pass_llr if passed else self._fail_llr
+        if self.llr >= self.upper:
+            return "PASSED"
+        if self.llr <= self.lower:
+            return "FAILED"
+        return None
+
+
+def evaluate_window(
+    fetch: Callable[[], Dict[str, float]],
+    slos: List[Dict[str, Union[str, float]]],
+    window: int = 30,
+    max_samples: Optional[int] = None,
+    interval: float = 5.0,
+    min_pass_ratio: float = 0.95,
+    margin: float = 0.04,
+    alpha: float = 0.05,
+    beta: float = 0.05,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Dict[str, Any]:
+    """
+    Poll metrics until the SLO verdict is settled.
+
+    Every sample passes or fails as a whole: bare metrics are compared with
+    that sample and aggregation functions (p95(...), avg(...), ...) with the
+    window ending at it. After each sample a sequential test decides
+    whether enough evidence has accumulated; if `max_samples`
+    (default: twice the window) are taken without a decision, the verdict
+    is whether the window's pass ratio reaches `min_pass_ratio`. Fetch
+    errors and missing metrics count as failing samples.
+
+    Args:
+        fetch: Returns one metrics sample
+        slos: SLO constraints from parse_slo_string
+        window: Ring buffer size for aggregation functions, statistics and
+            the pass ratio
+        max_samples: Upper bound on samples taken
+        interval: Seconds between samples
+        min_pass_ratio: Required fraction of passing samples
+        margin: Half-width of the sequential test's indifference region
+        alpha: Probability of passing a service below min_pass_ratio - margin
+        beta: Probability of failing a service above min_pass_ratio + margin
+        sleep: Sleep function (replaced in tests)
+
+    Returns:
+        Verdict with the decision rule, pass ratio and window statistics
+    """
+    max_samples = max_samples or window * 2
+    compiled = _compiled(slos)
+    metric_window = MetricWindow(list(dict.fromkeys(str(slo["metric"]) for slo in slos)), window)
+    test = SequentialTest(min_pass_ratio, margin, alpha, beta)
+    fetch_errors = 0
+    decision = None
+
+    for sample in range(max_samples):
+        if sample:
+            sleep(interval)
+        try:
+            metrics = fetch()
+            passed = metric_window.evaluate(compiled, metrics)
+        except (MetricsFetchError, KeyError) as e:
+            logger.warning("Sample failed", extra={"error": str(e)})
+            metrics, passed = {}, False
+            fetch_errors += 1
+        metric_window.append(metrics, passed)
+
+        decision = test.update(passed)
+        if decision:
+            break
+
+    if decision:
+        rule = "sequential_test"
+    else:
+        rule = "window_pass_ratio"
+        decision = "PASSED" if metric_window.pass_ratio >= min_pass_ratio else "FAILED"
+
+    return {
+        "slo_validation": decision,
+        "decision_rule": rule,
+        "samples": metric_window.count,
+        "fetch_errors": fetch_errors,
+        "pass_ratio": metric_window.pass_ratio,
+        "min_pass_ratio": min_pass_ratio,
+        "log_likelihood_ratio": test.llr,
+        "statistics": metric_window.statistics(),
+    }
+
+
+def load_site_targets(
+    config_path: Path = DEFAULT_SITES_CONFIG,
+    sites: Optional[List[str]] = None,
+    service: str = "slo_service",
+    metrics_path: str = "/metrics",
+) -> Dict[str, str]:
+    """
+    Build metrics URLs for edge sites from an edge-sites-config.yaml file.
+
+    Args:
+        config_path: YAML file with an `edge_sites` mapping
+        sites: Only include these sites (default: all sites in the file)
+        service: Key under `services` holding the metrics port
+        metrics_path: HTTP path of the metrics endpoint
+
+    Returns:
+        Dict of site name -> metrics URL
+
+    Raises:
+        ValueError: If a site is unknown or has no such service port
+    """
+    with open(config_path) as f:
+        edge_sites = (yaml.safe_load(f) or {}).get("edge_sites", {})
+
+    targets = {}
+    for name in sites or sorted(edge_sites):
+        if name not in edge_sites:
+            raise ValueError(f"Unknown site '{name}' in {config_path}")
+        site = edge_sites[name]
+        port = (site.get("services") or {}).get(service)
+        if port is None:
+            raise ValueError(f"Site '{name}' has no '{service}' service port")
+        host = site.get("internal_ip") or site["ip"]
+        targets[name] = f"http://{host}:{port}{metrics_path}"
+    return targets
+
+
+def load_site_overrides(
+    config_path: Path = DEFAULT_THRESHOLDS_CONFIG,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Load per-site threshold overrides from slo-thresholds.yaml.
+
+    Nested keys are flattened to adapter metric names, e.g.
+    `latency: {p95_ms: 20}` becomes `latency_p95_ms: 20`.
+
+    Returns:
+        Dict of site name -> metric name -> threshold
+    """
+    with open(config_path) as f:
+        config = (yaml.safe_load(f) or {}).get("slo_config", {})
+
+    overrides = {}
+    for site, groups in (config.get("site_overrides") or {}).items():
+        overrides[site] = {
+            f"{group}_{key}": float(value)
+            for group, values in (groups or {}).items()
+            for key, value in (values or {}).items()
+        }
+    return overrides
+
+
+def apply_site_overrides(
+    slos: List[Dict[str, Union[str, float]]], overrides: Dict[str, float]
+) -> List[Dict[str, Union[str, float]]]:
+    """Replace thresholds of SLO constraints whose metric has a site override."""
+    if isinstance(slos, SLOExpression):
+        return SLOExpression(slos.compiled.with_thresholds(overrides)) if overrides else slos
+    return [
+        {**slo, "threshold": overrides[slo["metric"]]} if slo["metric"] in overrides else slo
+        for slo in slos
+    ]
+
+
+async def _gate_site(
+    client: httpx.AsyncClient,
+    site: str,
+    url: str,
+    slos: List[Dict[str, Union[str, float]]],
+    deadline: float,
+) -> Dict[str, Any]:
+    """Fetch one site's metrics within its deadline and evaluate its SLOs."""
+    result: Dict[str, Any] = {"site": site, "url": url, "slos": slos}
+    try:
+        response = await asyncio.wait_for(client.get(url), timeout=deadline)
+        response.raise_for_status()
+        metrics = extract_metrics(response.json())
+        compiled = _compiled(slos)
+        passed = compiled.evaluate(metrics, site)
+        violations = [] if passed else compiled.violations(metrics, site)
+    except asyncio.TimeoutError:
+        result.update(status="ERROR", error=f"Deadline of {deadline}s exceeded")
+        return result
+    except httpx.HTTPError as e:
+        result.update(status="ERROR", error=f"Failed to fetch metrics: {e}")
+        return result
+    except (json.JSONDecodeError, MetricsFetchError) as e:
+        result.update(status="ERROR", error=f"Invalid metrics response: {e}")
+        return result
+    except KeyError as e:
+        result.update(status="ERROR", error=e.args[0])
+        return result
+
+    result.update(
+        status="PASSED" if passed else "FAILED",
+        metrics=metrics,
+        violations=violations,
+    )
+    return result
+
+
+async def gate_sites_async(
+    targets: Dict[str, str],
+    slos: List[Dict[str, Union[str, float]]],
+    overrides: Optional[Dict[str, Dict[str, float]]] = None,
+    timeout: float = 30,
+    max_connections: int = 32,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> Dict[str, Any]:
+    """
+    Gate several sites concurrently through one pooled HTTP client.
+
+    Args:
+        targets: Site name -> metrics URL
+        slos: SLO constraints from parse_slo_string
+        overrides: Site name -> metric name -> threshold
+        timeout: Per-site deadline in seconds, covering connect and read
+        max_connections: Connection pool size
+        transport: Optional httpx transport (used by tests)
+
+    Returns:
+        Aggregated verdict with one entry per site, ordered by site name;
+        FAILED when there are no sites, so an empty selection never passes
+    """
+    overrides = overrides or {}
+    limits = httpx.Limits(
+        max_connections=max_connections, max_keepalive_connections=max_connections
+    )
+    async with httpx.AsyncClient(
+        timeout=timeout, limits=limits, transport=transport
+    ) as client:
+        results = await asyncio.gather(
+            *(
+                _gate_site(
+                    client,
+                    site,
+                    targets[site],
+                    apply_site_overrides(slos, overrides.get(site, {})),
+                    timeout,
+                )
+                for site in sorted(targets)
+            )
+        )
+
+    return {
+        "slo_validation": (
+            "PASSED"
+            if results and all(r["status"] == "PASSED" for r in results)
+            else "FAILED"
+        ),
+        "sites": {result.pop("site"): result for result in results},
+    }
+
+
+def gate_sites(
+    targets: Dict[str, str],
+    slos: List[Dict[str, Union[str, float]]],
+    overrides: Optional[Dict[str, Dict[str, float]]] = None,
+    timeout: float = 30,
+    max_connections: int = 32,
+) -> Dict[str, Any]:
+    """Synchronous wrapper around gate_sites_async()."""
+    return asyncio.run(
+        gate_sites_async(targets, slos, overrides, timeout, max_connections)
+    )
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create command line argument parser."""
     parser = argparse.ArgumentParser(
@@ -221,6 +1061,9 @@ def create_parser() -> argparse.ArgumentParser:
 Examples:
   %(prog)s --slo "latency_p95_ms<=15" --url http://localhost:8080/metrics
   %(prog)s --slo "latency_p95_ms<=15,success_rate>=0.995,throughput_p95_mbps>=200" --url http://adapter:8080/metrics
+  %(prog)s --slo "latency_p95_ms<=15" --sites-config config/edge-sites-config.yaml
+  %(prog)s --slo "latency_p95_ms<=15" --site edge1 --site edge2 --timeout 5
+  %(prog)s --slo "latency_p95_ms<=15" --site-url edge1=http://172.16.4.45:30090/metrics
 
 Exit Codes:
   0 - All SLOs pass
@@ -234,13 +1077,108 @@ Exit Codes:
         help='SLO string (e.g., "latency_p95_ms<=15,success_rate>=0.995")',
     )
 
-    parser.add_argument("--url", required=True, help="Metrics endpoint URL")
+    parser.add_argument("--url", help="Metrics endpoint URL (single-site mode)")
 
     parser.add_argument(
         "--timeout",
         type=int,
         default=30,
-        help="Request timeout in seconds (default: 30)",
+        help="Request timeout in seconds, per site in multi-site mode (default: 30)",
+    )
+
+    windowed = parser.add_argument_group(
+        "windowed mode",
+        "Poll --url repeatedly and require the SLOs to hold in a sustained way",
+    )
+    windowed.add_argument(
+        "--window",
+        type=int,
+        help="Enable windowed mode with a ring buffer of this many samples",
+    )
+    windowed.add_argument(
+        "--interval",
+        type=float,
+        default=5.0,
+        help="Seconds between samples (default: 5)",
+    )
+    windowed.add_argument(
+        "--max-samples",
+        type=int,
+        help="Stop after this many samples without an early decision (default: 2 x window)",
+    )
+    windowed.add_argument(
+        "--min-pass-ratio",
+        type=float,
+        default=0.95,
+        help="Required fraction of samples meeting every SLO (default: 0.95)",
+    )
+    windowed.add_argument(
+        "--sprt-margin",
+        type=float,
+        default=0.04,
+        help="Indifference margin around --min-pass-ratio for early stopping (default: 0.04)",
+    )
+    windowed.add_argument(
+        "--alpha",
+        type=float,
+        default=0.05,
+        help="Early-stop risk of passing a failing service (default: 0.05)",
+    )
+    windowed.add_argument(
+        "--beta",
+        type=float,
+        default=0.05,
+        help="Early-stop risk of failing a healthy service (default: 0.05)",
+    )
+
+    sites = parser.add_argument_group(
+        "multi-site mode", "Gate several edge sites concurrently (used when --url is not given)"
+    )
+    sites.add_argument(
+        "--sites-config",
+        type=Path,
+        help=f"Edge sites YAML file (default: {DEFAULT_SITES_CONFIG.relative_to(REPO_ROOT)})",
+    )
+    sites.add_argument(
+        "--site",
+        action="append",
+        dest="sites",
+        help="Only gate this site from the sites config (repeatable)",
+    )
+    sites.add_argument(
+        "--site-url",
+        action="append",
+        default=[],
+        metavar="SITE=URL",
+        help="Gate SITE at an explicit metrics URL (repeatable)",
+    )
+    sites.add_argument(
+        "--service",
+        default="slo_service",
+        help="Service port key in the sites config (default: slo_service)",
+    )
+    sites.add_argument(
+        "--metrics-path",
+        default="/metrics",
+        help="Metrics endpoint path on each site (default: /metrics)",
+    )
+    sites.add_argument(
+        "--thresholds-config",
+        type=Path,
+        default=DEFAULT_THRESHOLDS_CONFIG,
+        help="SLO thresholds YAML with site_overrides "
+        f"(default: {DEFAULT_THRESHOLDS_CONFIG.relative_to(REPO_ROOT)})",
+    )
+    sites.add_argument(
+        "--no-site-overrides",
+        action="store_true",
+        help="Apply the same SLO thresholds to every site",
+    )
+    sites.add_argument(
+        "--max-connections",
+        type=int,
+        default=32,
+        help="HTTP connection pool size (default: 32)",
     )
 
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
@@ -263,6 +1201,16 @@ def main() -> int:
     if args.verbose:
         logger.setLevel(logging.DEBUG)
 
+    if args.url is None:
+        if not (args.sites_config or args.sites or args.site_url):
+            parser.error("one of --url, --sites-config, --site or --site-url is required")
+        if args.window:
+            parser.error("--window requires --url")
+        return run_multi_site(args, start_time)
+
+    if args.window:
+        return run_windowed(args, start_time)
+
     logger.info(
         "SLO Gate starting",
         extra={
@@ -338,6 +1286,113 @@ def main() -> int:
         return 1
 
 
+def run_windowed(args: argparse.Namespace, start_time: datetime) -> int:
+    """
+    Poll --url into a window until the sustained SLO verdict is settled.
+
+    Returns:
+        Exit code: 0 for a sustained pass, 1 otherwise
+    """
+    try:
+        slos = parse_slo_string(args.slo)
+        session = requests.Session()
+        verdict = evaluate_window(
+            lambda: fetch_metrics(args.url, args.timeout, session),
+            slos,
+            window=args.window,
+            max_samples=args.max_samples,
+            interval=args.interval,
+            min_pass_ratio=args.min_pass_ratio,
+            margin=args.sprt_margin,
+            alpha=args.alpha,
+            beta=args.beta,
+        )
+    except ValueError as e:
+        logger.error(
+            "Windowed gate configuration error",
+            extra={"error": str(e), "slo_string": args.slo},
+        )
+        return 1
+
+    duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+    log = logger.info if verdict["slo_validation"] == "PASSED" else logger.error
+    log(
+        f"Windowed SLO validation {verdict['slo_validation']}",
+        extra={
+            "slo_validation": verdict["slo_validation"],
+            "window": verdict,
+            "url": args.url,
+            "duration_ms": duration_ms,
+        },
+    )
+    return 0 if verdict["slo_validation"] == "PASSED" else 1
+
+
+def run_multi_site(args: argparse.Namespace, start_time: datetime) -> int:
+    """
+    Gate all requested sites and print the aggregated verdict as JSON.
+
+    Returns:
+        Exit code: 0 if every site passes, 1 otherwise
+    """
+    try:
+        slos = parse_slo_string(args.slo)
+
+        targets = {}
+        if args.sites_config or args.sites:
+            targets.update(
+                load_site_targets(
+                    args.sites_config or DEFAULT_SITES_CONFIG,
+                    args.sites,
+                    args.service,
+                    args.metrics_path,
+                )
+            )
+        for entry in args.site_url:
+            site, sep, url = entry.partition("=")
+            if not sep or not site or not url:
+                raise ValueError(f"Invalid --site-url (expected SITE=URL): {entry}")
+            targets[site] = url
+        if not targets:
+            raise ValueError("No sites to gate: the site selection resolved to no targets")
+
+        overrides = {}
+        # A missing default thresholds file (gate used outside this repo) is
+        # not an error; an explicitly given one must exist
+        if not args.no_site_overrides and (
+            args.thresholds_config != DEFAULT_THRESHOLDS_CONFIG
+            or args.thresholds_config.exists()
+        ):
+            overrides = load_site_overrides(args.thresholds_config)
+    except (ValueError, OSError, yaml.YAMLError) as e:
+        logger.error("Multi-site configuration error", extra={"error": str(e)})
+        return 1
+
+    logger.info(
+        "Multi-site SLO Gate starting",
+        extra={"sites": targets, "timeout": args.timeout},
+    )
+
+    verdict = gate_sites(
+        targets, slos, overrides, args.timeout, args.max_connections
+    )
+
+    duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+    log = logger.info if verdict["slo_validation"] == "PASSED" else logger.error
+    log(
+        f"Multi-site SLO validation {verdict['slo_validation']}",
+        extra={
+            "slo_validation": verdict["slo_validation"],
+            "sites": {site: r["status"] for site, r in verdict["sites"].items()},
+            "duration_ms": duration_ms,
+        },
+    )
+
+    # The verdict has no timestamps or durations so reruns diff cleanly
+    print(json.dumps(verdict, indent=2, sort_keys=True))
+    return 0 if verdict["slo_validation"] == "PASSED" else 1
+
+
 if __name__ == "__main__":
     exit_code = main()
     sys.exit(exit_code)
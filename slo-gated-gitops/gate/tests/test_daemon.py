@@ -0,0 +1,271 @@
+"""
+Tests for the SLO gate daemon and its thin client.
+
+A local HTTP server stands in for the metrics adapter and counts upstream
+hits, so snapshot caching, verdicts, the watch stream and the client exit
+codes are exercised end to end over real sockets.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from gate import client
+from gate.daemon import EXIT_CODE_HEADER, MetricsCache, create_daemon
+
+
+class FakeAdapter(ThreadingHTTPServer):
+    """Metrics adapter serving a mutable metrics dict."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeAdapterHandler)
+        self.metrics = {"latency_p95_ms": 12.0, "success_rate": 0.999, "throughput_p95_mbps": 250.0}
+        self.hits = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/metrics"
+
+
+class FakeAdapterHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        self.server.hits += 1
+        if self.path.split("?")[0] != "/metrics":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        payload = json.dumps(self.server.metrics).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(server):
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.fixture
+def adapter():
+    server = FakeAdapter()
+    serve(server)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def daemon(adapter):
+    server = create_daemon(port=0, ttl=60, timeout=2, default_url=adapter.url)
+    serve(server)
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestMetricsCache:
+    """Test the per-endpoint snapshot cache."""
+
+    def test_snapshot_reused_within_ttl(self, adapter):
+        """Test one upstream fetch per TTL and refresh after expiry."""
+        now = [0.0]
+        cache = MetricsCache(ttl=2.0, clock=lambda: now[0])
+
+        assert cache.get(adapter.url)[2] is False
+        now[0] = 1.5
+        metrics, age, cached = cache.get(adapter.url)
+        assert cached is True and age == 1.5
+        now[0] = 2.5
+        assert cache.get(adapter.url)[2] is False
+        assert adapter.hits == cache.fetches == 2
+        cache.close()
+
+    def test_endpoints_are_bounded(self, adapter):
+        """Test least recently used endpoints are evicted beyond max_endpoints."""
+        cache = MetricsCache(ttl=60, max_endpoints=2)
+        urls = [f"{adapter.url}?n={n}" for n in range(3)]
+
+        cache.get(urls[0])
+        cache.get(urls[1])
+        cache.get(urls[0])
+        cache.get(urls[2])
+
+        assert len(cache) == 2
+        assert cache.get(urls[0])[2] is True
+        assert cache.get(urls[1])[2] is False
+        cache.close()
+
+    def test_concurrent_requests_share_one_fetch(self, adapter):
+        """Test simultaneous lookups of a cold endpoint fetch it once."""
+        cache = MetricsCache(ttl=60)
+        threads = [threading.Thread(target=cache.get, args=(adapter.url,)) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert adapter.hits == 1
+        cache.close()
+
+
+class TestEvaluate:
+    """Test the /evaluate endpoint."""
+
+    def test_pass_and_fail_verdicts(self, daemon, adapter):
+        """Test verdicts and exit code headers, sharing one upstream fetch."""
+        passed = requests.post(f"{daemon.base_url}/evaluate", json={"slo": "latency_p95_ms<=15"})
+        failed = requests.get(
+            f"{daemon.base_url}/evaluate",
+            params={"slo": "latency_p95_ms<=10 AND success_rate>=0.99", "url": adapter.url},
+        )
+
+        assert passed.status_code == 200
+        assert passed.headers[EXIT_CODE_HEADER] == "0"
+        assert passed.json()["slo_validation"] == "PASSED"
+        assert failed.headers[EXIT_CODE_HEADER] == "1"
+        assert [v["metric"] for v in failed.json()["violations"]] == ["latency_p95_ms"]
+        assert failed.json()["cached"] is True
+        assert adapter.hits == 1
+
+    @pytest.mark.parametrize(
+        "body",
+        [{"slo": "latency_p95_ms <=="}, {}, {"slo": ["latency_p95_ms<=15"]}],
+    )
+    def test_bad_requests(self, daemon, body):
+        """Test invalid SLO strings answer 400 with exit code 1."""
+        response = requests.post(f"{daemon.base_url}/evaluate", json=body)
+
+        assert response.status_code == 400
+        assert response.headers[EXIT_CODE_HEADER] == "1"
+
+    def test_negated_clause_fails(self, daemon):
+        """Test an expression failing only through NOT is FAILED."""
+        verdict = requests.post(
+            f"{daemon.base_url}/evaluate",
+            json={"slo": "latency_p95_ms<=15 AND NOT success_rate < 0.9995"},
+        )
+
+        assert verdict.headers[EXIT_CODE_HEADER] == "1"
+        assert verdict.json()["slo_validation"] == "FAILED"
+        assert verdict.json()["violations"][0]["negated"] is True
+
+    def test_unconfigured_urls_are_rejected(self, daemon, adapter):
+        """Test URLs other than the configured sources answer 400 without a fetch."""
+        response = requests.post(
+            f"{daemon.base_url}/evaluate",
+            json={"slo": "latency_p95_ms<=15", "url": "http://169.254.169.254/latest/meta-data"},
+        )
+
+        assert response.status_code == 400
+        assert "not allowed" in response.json()["error"]
+        assert adapter.hits == 0
+
+    def test_fetch_errors_are_error_verdicts(self, daemon, adapter):
+        """Test unreachable metrics and missing metrics give ERROR."""
+        missing_url = adapter.url.replace("/metrics", "/missing")
+        daemon.service.allowed_urls.add(missing_url)
+        unreachable = requests.post(
+            f"{daemon.base_url}/evaluate",
+            json={"slo": "latency_p95_ms<=15", "url": missing_url},
+        ).json()
+        missing = requests.post(f"{daemon.base_url}/evaluate", json={"slo": "error_budget<=1"}).json()
+
+        assert unreachable["slo_validation"] == "ERROR"
+        assert unreachable["exit_code"] == 1
+        assert missing["slo_validation"] == "ERROR"
+        assert "error_budget" in missing["error"]
+
+
+class TestWatch:
+    """Test the /watch Server-Sent Events stream."""
+
+    def test_events_on_verdict_change_until_target(self, daemon, adapter):
+        """Test a verdict event per change and the stream ending on `until`."""
+        daemon.service.cache.ttl = 0
+        adapter.metrics["latency_p95_ms"] = 30.0
+        verdicts = []
+
+        def recover(verdict):
+            verdicts.append(verdict["slo_validation"])
+            adapter.metrics["latency_p95_ms"] = 12.0
+
+        last = client.watch(
+            "latency_p95_ms<=15",
+            until="PASSED",
+            interval=0.05,
+            timeout=10,
+            daemon=daemon.base_url,
+            on_verdict=recover,
+        )
+
+        assert verdicts == ["FAILED", "PASSED"]
+        assert last["slo_validation"] == "PASSED"
+
+    def test_timeout_ends_stream(self, daemon):
+        """Test the stream ends after `timeout` with the verdict unchanged."""
+        response = requests.get(
+            f"{daemon.base_url}/watch",
+            params={"slo": "latency_p95_ms<=10", "until": "PASSED", "interval": 0.05, "timeout": 0.2},
+            timeout=5,
+        )
+        events = [line for line in response.text.splitlines() if line.startswith("event: ")]
+
+        assert events == ["event: verdict", "event: timeout"]
+
+
+class TestClient:
+    """Test the thin client CLI."""
+
+    def test_exit_codes_follow_daemon(self, daemon, capsys):
+        """Test the client returns the daemon's gate exit code."""
+        args = ["--daemon", daemon.base_url, "--no-fallback"]
+
+        assert client.main(["--slo", "latency_p95_ms<=15"] + args) == 0
+        assert json.loads(capsys.readouterr().out)["slo_validation"] == "PASSED"
+        assert client.main(["--slo", "latency_p95_ms<=10"] + args) == 1
+        assert client.main(["--slo", "latency_p95_ms <=="] + args) == 1
+
+    def test_no_daemon_without_fallback(self, adapter):
+        """Test an unreachable daemon fails with --no-fallback."""
+        args = ["--slo", "latency_p95_ms<=15", "--url", adapter.url, "--daemon", "http://127.0.0.1:9"]
+
+        assert client.main(args + ["--no-fallback"]) == 1
+        assert adapter.hits == 0
+
+    def test_fallback_runs_gate_in_process(self, adapter):
+        """Test an unreachable daemon falls back to the full gate."""
+        args = ["--slo", "latency_p95_ms<=15", "--url", adapter.url, "--daemon", "http://127.0.0.1:9"]
+
+        with patch("sys.argv", ["client"]):
+            assert client.main(args) == 0
+            assert client.main(["--slo", "latency_p95_ms<=10"] + args[2:]) == 1
+        assert adapter.hits == 2
+
+    def test_fallback_passes_site(self, adapter):
+        """Test the in-process fallback evaluates site-scoped clauses for --site."""
+        args = [
+            "--slo",
+            "edge2:latency_p95_ms<=10",
+            "--url",
+            adapter.url,
+            "--daemon",
+            "http://127.0.0.1:9",
+        ]
+
+        with patch("sys.argv", ["client"]):
+            assert client.main(args + ["--site", "edge1"]) == 0
+            assert client.main(args + ["--site", "edge2"]) == 1
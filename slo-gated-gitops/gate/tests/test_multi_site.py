@@ -0,0 +1,230 @@
+"""
+Tests for the multi-site SLO gate mode.
+
+Site metrics endpoints are served by an httpx mock transport, so the
+concurrent fetching, per-site deadlines and site overrides are exercised
+without network access.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from gate.gate import (
+    apply_site_overrides,
+    gate_sites_async,
+    load_site_overrides,
+    load_site_targets,
+    main,
+    parse_slo_string,
+)
+
+SITE_METRICS = {
+    "edge1": {"latency_p95_ms": 12.0, "success_rate": 0.999, "throughput_p95_mbps": 260.0},
+    "edge2": {"latency_p95_ms": 18.0, "success_rate": 0.998, "throughput_p95_mbps": 210.0},
+    "edge3": {"latency_p95_ms": 40.0, "success_rate": 0.990, "throughput_p95_mbps": 150.0},
+}
+
+
+def make_transport(delays=None, status=None):
+    """Mock transport answering /metrics for each site host."""
+    delays = delays or {}
+    status = status or {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        site = request.url.host
+        await asyncio.sleep(delays.get(site, 0))
+        if status.get(site, 200) != 200:
+            return httpx.Response(status[site])
+        return httpx.Response(200, json={**SITE_METRICS[site], "timestamp": "t"})
+
+    return httpx.MockTransport(handler)
+
+
+def run_gate(targets, slo, overrides=None, timeout=5, **transport_options):
+    """Run the async gate against the mock transport."""
+    return asyncio.run(
+        gate_sites_async(
+            targets,
+            parse_slo_string(slo),
+            overrides,
+            timeout=timeout,
+            transport=make_transport(**transport_options),
+        )
+    )
+
+
+TARGETS = {site: f"http://{site}/metrics" for site in SITE_METRICS}
+
+
+class TestSiteConfiguration:
+    """Test loading sites and overrides from YAML."""
+
+    def test_load_site_targets(self, tmp_path):
+        """Test URLs are built from internal IPs and service ports."""
+        config = tmp_path / "sites.yaml"
+        config.write_text(
+            "edge_sites:\n"
+            "  edge2:\n"
+            "    ip: 10.0.0.2\n"
+            "    services: {slo_service: 30090}\n"
+            "  edge1:\n"
+            "    ip: 10.0.0.1\n"
+            "    internal_ip: 192.168.0.1\n"
+            "    services: {slo_service: 30090, prometheus: 9090}\n"
+        )
+
+        assert load_site_targets(config) == {
+            "edge1": "http://192.168.0.1:30090/metrics",
+            "edge2": "http://10.0.0.2:30090/metrics",
+        }
+        assert load_site_targets(config, ["edge1"], "prometheus", "/api") == {
+            "edge1": "http://192.168.0.1:9090/api"
+        }
+        with pytest.raises(ValueError):
+            load_site_targets(config, ["edge9"])
+
+    def test_repository_site_overrides(self):
+        """Test overrides in config/slo-thresholds.yaml flatten to metric names."""
+        overrides = load_site_overrides()
+
+        assert overrides["edge1"] == {"throughput_p95_mbps": 250.0}
+        assert overrides["edge2"] == {"latency_p95_ms": 20.0}
+
+    def test_apply_site_overrides_keeps_operator(self):
+        """Test only thresholds of overridden metrics change."""
+        slos = parse_slo_string("latency_p95_ms<=15,success_rate>=0.995")
+
+        assert apply_site_overrides(slos, {"latency_p95_ms": 20.0, "other": 1.0}) == [
+            {"metric": "latency_p95_ms", "operator": "<=", "threshold": 20.0},
+            {"metric": "success_rate", "operator": ">=", "threshold": 0.995},
+        ]
+
+
+class TestMultiSiteGate:
+    """Test concurrent multi-site evaluation."""
+
+    def test_overrides_produce_per_site_verdicts(self):
+        """Test edge2 passes only because of its relaxed latency override."""
+        verdict = run_gate(
+            TARGETS,
+            "latency_p95_ms<=15,throughput_p95_mbps>=200",
+            overrides={"edge1": {"throughput_p95_mbps": 250.0}, "edge2": {"latency_p95_ms": 20.0}},
+        )
+
+        assert verdict["slo_validation"] == "FAILED"
+        assert list(verdict["sites"]) == ["edge1", "edge2", "edge3"]
+        assert verdict["sites"]["edge1"]["status"] == "PASSED"
+        assert verdict["sites"]["edge2"]["status"] == "PASSED"
+        assert verdict["sites"]["edge3"]["status"] == "FAILED"
+        assert {v["metric"] for v in verdict["sites"]["edge3"]["violations"]} == {
+            "latency_p95_ms",
+            "throughput_p95_mbps",
+        }
+
+    def test_all_sites_pass(self):
+        """Test the aggregated verdict passes when every site passes."""
+        verdict = run_gate(TARGETS, "success_rate>=0.98")
+
+        assert verdict["slo_validation"] == "PASSED"
+
+    def test_no_sites_fail(self):
+        """Test an empty site selection never passes."""
+        verdict = run_gate({}, "success_rate>=0.98")
+
+        assert verdict == {"slo_validation": "FAILED", "sites": {}}
+
+    def test_sites_are_fetched_concurrently_with_deadlines(self):
+        """Test a slow site hits its deadline without delaying the others."""
+        start = time.perf_counter()
+        verdict = run_gate(
+            TARGETS,
+            "success_rate>=0.98",
+            timeout=0.3,
+            delays={"edge1": 0.2, "edge2": 0.2, "edge3": 5},
+        )
+        elapsed = time.perf_counter() - start
+
+        # Sequential fetching would take at least 0.2 + 0.2 + 0.3 seconds
+        assert elapsed < 0.65
+
+        assert verdict["sites"]["edge1"]["status"] == "PASSED"
+        assert verdict["sites"]["edge2"]["status"] == "PASSED"
+        assert verdict["sites"]["edge3"]["status"] == "ERROR"
+        assert "Deadline" in verdict["sites"]["edge3"]["error"]
+
+    def test_http_errors_and_missing_metrics_are_site_errors(self):
+        """Test fetch failures fail only the affected site."""
+        verdict = run_gate(
+            {"edge1": TARGETS["edge1"], "edge2": TARGETS["edge2"]},
+            "success_rate>=0.98,error_budget<=1",
+            status={"edge1": 503},
+        )
+
+        assert verdict["sites"]["edge1"]["status"] == "ERROR"
+        assert "503" in verdict["sites"]["edge1"]["error"]
+        assert verdict["sites"]["edge2"]["status"] == "ERROR"
+        assert "error_budget" in verdict["sites"]["edge2"]["error"]
+
+    def test_verdict_is_deterministic(self):
+        """Test repeated runs produce identical verdict JSON."""
+        first = run_gate(TARGETS, "latency_p95_ms<=15", delays={"edge1": 0.05})
+        second = run_gate(TARGETS, "latency_p95_ms<=15", delays={"edge3": 0.05})
+
+        assert json.dumps(first, sort_keys=True) == json.dumps(second, sort_keys=True)
+
+
+class TestMultiSiteCLI:
+    """Test the CLI multi-site mode."""
+
+    def test_main_prints_verdict_and_exit_code(self, capsys):
+        """Test --site-url targets, the printed verdict and the exit code."""
+        transport = make_transport()
+        original = httpx.AsyncClient.__init__
+
+        def init_with_mock(self, *args, **kwargs):
+            kwargs["transport"] = transport
+            original(self, *args, **kwargs)
+
+        args = [
+            "gate",
+            "--slo",
+            "latency_p95_ms<=15",
+            "--site-url",
+            "edge1=http://edge1/metrics",
+            "--site-url",
+            "edge2=http://edge2/metrics",
+        ]
+        with patch.object(httpx.AsyncClient, "__init__", init_with_mock):
+            with patch("sys.argv", args):
+                exit_code = main()
+
+        verdict = json.loads(capsys.readouterr().out)
+        # edge2 passes through its latency override in config/slo-thresholds.yaml
+        assert exit_code == 0
+        assert verdict["sites"]["edge2"]["slos"][0]["threshold"] == 20.0
+
+        with patch.object(httpx.AsyncClient, "__init__", init_with_mock):
+            with patch("sys.argv", args + ["--no-site-overrides"]):
+                assert main() == 1
+
+    def test_main_requires_a_target(self):
+        """Test that either --url or a site selection is required."""
+        with patch("sys.argv", ["gate", "--slo", "latency_p95_ms<=15"]):
+            with pytest.raises(SystemExit):
+                main()
+
+    def test_main_fails_for_empty_sites_config(self, tmp_path, capsys):
+        """Test a sites config without sites exits non-zero without a verdict."""
+        config = tmp_path / "sites.yaml"
+        config.write_text("edge_sites: {}\n")
+
+        args = ["gate", "--slo", "latency_p95_ms<=15", "--sites-config", str(config)]
+        with patch("sys.argv", args):
+            assert main() == 1
+
+        assert capsys.readouterr().out == ""
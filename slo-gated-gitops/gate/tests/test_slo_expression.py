@@ -0,0 +1,264 @@
+"""
+Tests for the compiled SLO expression language.
+
+Covers boolean operators, units, aggregation functions, site scopes, the
+parse cache and vectorized evaluation over many sample sets.
+"""
+
+import numpy as np
+import pytest
+
+from gate.gate import (
+    apply_site_overrides,
+    compile_slo,
+    extract_metrics,
+    find_violations,
+    parse_slo_string,
+    validate_metrics_against_slos,
+    MetricsFetchError,
+    SLOValidationError,
+)
+
+METRICS = {"latency_p95_ms": 12.0, "success_rate": 0.997, "throughput_p95_mbps": 220.0}
+
+
+class TestParsing:
+    """Test expression parsing."""
+
+    def test_comma_list_is_backward_compatible(self):
+        """Test comma-separated constraints still parse to plain dicts."""
+        result = parse_slo_string("latency_p95_ms<=15,success_rate>=0.995")
+
+        assert result == [
+            {"metric": "latency_p95_ms", "operator": "<=", "threshold": 15.0},
+            {"metric": "success_rate", "operator": ">=", "threshold": 0.995},
+        ]
+
+    def test_units_convert_to_metric_units(self):
+        """Test thresholds are scaled into the unit of the metric name."""
+        result = parse_slo_string(
+            "latency_p95_ms < 0.02 s AND throughput_p95_mbps >= 1Gbps AND success_rate >= 99.5%"
+        )
+
+        assert [clause["threshold"] for clause in result] == pytest.approx([20.0, 1000.0, 0.995])
+
+    def test_unit_dimension_mismatch(self):
+        """Test a time unit on a bit-rate metric is rejected."""
+        with pytest.raises(ValueError, match="Invalid SLO format"):
+            parse_slo_string("throughput_p95_mbps >= 5ms")
+
+    def test_functions_and_sites_are_recorded(self):
+        """Test clause dicts carry function and site when used."""
+        result = parse_slo_string("edge2:p95(latency_p95_ms) <= 20")
+
+        assert result == [
+            {
+                "metric": "latency_p95_ms",
+                "operator": "<=",
+                "threshold": 20.0,
+                "function": "p95",
+                "site": "edge2",
+            }
+        ]
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "(latency_p95_ms <= 15",
+            "median(latency_p95_ms) <= 15",
+            "latency_p95_ms <= 15 OR",
+            "NOT",
+            "latency_p95_ms <= 15 success_rate >= 1",
+        ],
+    )
+    def test_invalid_expressions(self, expression):
+        """Test malformed expressions raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid SLO format"):
+            parse_slo_string(expression)
+
+    def test_parse_cache(self):
+        """Test the same string compiles once."""
+        assert compile_slo("error_budget <= 3") is compile_slo("error_budget <= 3")
+        assert parse_slo_string("error_budget <= 3").compiled is compile_slo("error_budget <= 3")
+
+
+class TestEvaluation:
+    """Test evaluation of compiled expressions."""
+
+    def test_boolean_operators_and_precedence(self):
+        """Test AND binds tighter than OR and NOT applies to one clause."""
+        expression = compile_slo(
+            "latency_p95_ms <= 10 AND success_rate >= 0.99 OR throughput_p95_mbps >= 200"
+        )
+        negated = compile_slo("NOT latency_p95_ms > 15 && !(success_rate < 0.99)")
+
+        assert expression.evaluate(METRICS) is True
+        assert expression.evaluate({**METRICS, "throughput_p95_mbps": 100.0}) is False
+        assert negated.evaluate(METRICS) is True
+        assert negated.evaluate({**METRICS, "latency_p95_ms": 16.0}) is False
+
+    def test_violations_only_when_expression_fails(self):
+        """Test a satisfied OR reports no violations, a failed one its clauses."""
+        slos = parse_slo_string("latency_p95_ms <= 10 OR success_rate >= 0.99")
+
+        assert find_violations(METRICS, slos) == []
+        failing = {**METRICS, "success_rate": 0.9}
+        assert [v["metric"] for v in find_violations(failing, slos)] == [
+            "latency_p95_ms",
+            "success_rate",
+        ]
+        with pytest.raises(SLOValidationError, match="latency_p95_ms"):
+            validate_metrics_against_slos(failing, slos)
+
+    def test_site_scoped_clauses(self):
+        """Test scoped clauses constrain only their site."""
+        slos = parse_slo_string("edge2:latency_p95_ms <= 20, latency_p95_ms <= 30")
+        metrics = {**METRICS, "latency_p95_ms": 25.0}
+
+        assert find_violations(metrics, slos, site="edge1") == []
+        assert find_violations(metrics, slos, site="edge2")[0]["site"] == "edge2"
+        # Metrics of other sites are never looked up for scoped clauses
+        assert find_violations(METRICS, parse_slo_string("edge9:other_metric <= 1")) == []
+
+    def test_failing_not_clause_is_reported(self):
+        """Test a clause that fails only through NOT fails the gate and is reported."""
+        slos = parse_slo_string("p95(latency_p95_ms) <= 20ms AND NOT success_rate < 99.5%")
+        failing = {**METRICS, "success_rate": 0.99}
+
+        assert slos.compiled.evaluate(failing) is False
+        assert find_violations(failing, slos) == [
+            {
+                "metric": "success_rate",
+                "operator": "<",
+                "threshold": pytest.approx(0.995),
+                "actual": 0.99,
+                "negated": True,
+            }
+        ]
+        with pytest.raises(SLOValidationError, match="NOT success_rate"):
+            validate_metrics_against_slos(failing, slos)
+        assert validate_metrics_against_slos(METRICS, slos) is True
+
+    def test_negated_or_reports_holding_operands(self):
+        """Test NOT over OR blames the operands that held."""
+        slos = parse_slo_string("NOT (latency_p95_ms > 20 OR success_rate < 0.99)")
+        failing = {**METRICS, "latency_p95_ms": 25.0}
+
+        assert [(v["metric"], v.get("negated")) for v in find_violations(failing, slos)] == [
+            ("latency_p95_ms", True)
+        ]
+
+    def test_site_scoped_not_is_neutral_elsewhere(self):
+        """Test NOT over a scoped clause has no effect outside its site."""
+        slos = parse_slo_string("NOT edge2:latency_p95_ms > 20")
+        slow = {**METRICS, "latency_p95_ms": 25.0}
+        compiled = slos.compiled
+
+        assert compiled.evaluate(slow) is True
+        assert compiled.evaluate(slow, site="edge1") is True
+        assert compiled.evaluate(slow, site="edge2") is False
+        assert compiled.evaluate(METRICS, site="edge2") is True
+        assert find_violations(slow, slos, site="edge1") == []
+        assert find_violations(slow, slos, site="edge2")[0]["negated"] is True
+        assert validate_metrics_against_slos(slow, slos) is True
+        assert compiled.evaluate_many(
+            {"latency_p95_ms": [25.0, 25.0, 12.0]}, sites=["edge1", "edge2", "edge2"]
+        ).tolist() == [True, False, True]
+
+    def test_scoped_clause_drops_out_of_or(self):
+        """Test a scoped OR operand does not satisfy the expression for other sites."""
+        compiled = compile_slo("edge2:latency_p95_ms <= 30 OR success_rate >= 0.999")
+        metrics = {**METRICS, "latency_p95_ms": 25.0}
+
+        assert compiled.evaluate(metrics, site="edge2") is True
+        assert compiled.evaluate(metrics, site="edge1") is False
+
+    def test_missing_metric_raises_key_error(self):
+        """Test arbitrary metric names are looked up and must exist."""
+        with pytest.raises(KeyError, match="error_budget"):
+            validate_metrics_against_slos(METRICS, parse_slo_string("error_budget <= 3"))
+
+    def test_aggregations_reduce_samples(self):
+        """Test avg/max/pNN reduce the sample axis, bare metrics use the last sample."""
+        samples = {"latency_p95_ms": [[10.0, 12.0, 30.0], [10.0, 11.0, 12.0]]}
+
+        assert compile_slo("avg(latency_p95_ms) <= 15").evaluate_many(samples).tolist() == [
+            False,
+            True,
+        ]
+        assert compile_slo("p50(latency_p95_ms) <= 12").evaluate_many(samples).tolist() == [
+            True,
+            True,
+        ]
+        assert compile_slo("latency_p95_ms <= 12").evaluate_many(samples).tolist() == [
+            False,
+            True,
+        ]
+        assert compile_slo("max(latency_p95_ms) < 30").evaluate_many(samples).tolist() == [
+            False,
+            True,
+        ]
+
+    def test_nan_samples_fail_their_clause(self):
+        """Test missing measurements never satisfy a comparison."""
+        result = compile_slo("latency_p95_ms != 5").evaluate_many({"latency_p95_ms": [np.nan, 1]})
+
+        assert result.tolist() == [False, True]
+
+    def test_vectorized_matches_per_sample_evaluation(self):
+        """Test evaluate_many agrees with evaluating each sample set alone."""
+        rng = np.random.default_rng(35)
+        expression = compile_slo(
+            "p95(latency_p95_ms) <= 20ms AND NOT success_rate < 99.5% "
+            "OR edge2:(throughput_p95_mbps >= 1Gbps)"
+        )
+        samples = {
+            "latency_p95_ms": rng.uniform(0, 40, (400, 8)),
+            "success_rate": rng.uniform(0.99, 1, (400, 8)),
+            "throughput_p95_mbps": rng.uniform(0, 2000, (400, 8)),
+        }
+        sites = ["edge1", "edge2"] * 200
+
+        vectorized = expression.evaluate_many(samples, sites)
+        single = [
+            bool(
+                expression.evaluate_many(
+                    {name: values[i : i + 1] for name, values in samples.items()}, [sites[i]]
+                )[0]
+            )
+            for i in range(400)
+        ]
+
+        assert vectorized.tolist() == single
+        assert 0 < vectorized.sum() < 400
+
+
+class TestIntegration:
+    """Test the expression engine inside the gate helpers."""
+
+    def test_site_overrides_keep_expression_structure(self):
+        """Test overrides replace thresholds inside OR/NOT expressions."""
+        slos = parse_slo_string("latency_p95_ms <= 15 OR NOT success_rate < 0.999")
+        overridden = apply_site_overrides(slos, {"latency_p95_ms": 20.0})
+        metrics = {**METRICS, "latency_p95_ms": 18.0, "success_rate": 0.99}
+
+        assert find_violations(metrics, slos)
+        assert find_violations(metrics, overridden) == []
+        assert overridden[0]["threshold"] == 20.0
+
+    def test_extract_metrics_keeps_arbitrary_numeric_metrics(self):
+        """Test every numeric metric is extracted, not just three fixed keys."""
+        payload = {
+            **METRICS,
+            "error_budget": 2,
+            "timestamp": "2025-01-01T00:00:00Z",
+            "healthy": True,
+            "metadata": {"site": "edge1"},
+        }
+
+        assert extract_metrics(payload) == {**METRICS, "error_budget": 2.0}
+
+    def test_extract_metrics_rejects_metrics_without_data(self):
+        """Test a null adapter metric (no samples for the site) fails the fetch."""
+        with pytest.raises(MetricsFetchError, match="No data for metric success_rate"):
+            extract_metrics({**METRICS, "success_rate": None})
@@ -0,0 +1,232 @@
+"""
+Tests for windowed sustained-SLO evaluation.
+
+Samples come from scripted fetch functions and sleeping is disabled, so
+the ring buffer, the sequential test and the fallback window decision are
+exercised deterministically.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gate.gate import (
+    MetricsFetchError,
+    MetricWindow,
+    SequentialTest,
+    evaluate_window,
+    main,
+    parse_slo_string,
+)
+
+SLOS = parse_slo_string("latency_p95_ms<=15,success_rate>=0.995")
+GOOD = {"latency_p95_ms": 10.0, "success_rate": 0.999}
+BAD = {"latency_p95_ms": 30.0, "success_rate": 0.999}
+
+
+def scripted(samples):
+    """Fetch function returning samples in order (exceptions are raised)."""
+    iterator = iter(samples)
+
+    def fetch():
+        sample = next(iterator)
+        if isinstance(sample, Exception):
+            raise sample
+        return sample
+
+    return fetch
+
+
+class TestMetricWindow:
+    """Test the ring buffer."""
+
+    def test_keeps_most_recent_samples(self):
+        """Test old samples are overwritten once the window is full."""
+        window = MetricWindow(["latency_p95_ms"], size=4)
+        for value in range(10):
+            window.append({"latency_p95_ms": float(value)}, passed=value >= 8)
+
+        stats = window.statistics()["latency_p95_ms"]
+        assert len(window) == 4
+        assert window.count == 10
+        assert stats["min"] == 6.0
+        assert stats["max"] == 9.0
+        assert stats["p50"] == pytest.approx(7.5)
+        assert window.pass_ratio == 0.5
+
+    def test_missing_values_are_ignored_in_statistics(self):
+        """Test failed fetches do not distort percentiles."""
+        window = MetricWindow(["latency_p95_ms", "success_rate"], size=3)
+        window.append({"latency_p95_ms": 5.0}, passed=False)
+        window.append({}, passed=False)
+
+        stats = window.statistics()
+        assert stats["latency_p95_ms"]["samples"] == 1
+        assert stats["success_rate"] == {"samples": 0}
+
+    def test_evaluate_aggregates_over_window(self):
+        """Test aggregation functions see the window plus the new sample."""
+        window = MetricWindow(["latency_p95_ms"], size=3)
+        compiled = parse_slo_string("max(latency_p95_ms)<=15").compiled
+        for value in [20.0, 10.0, 10.0]:
+            window.append({"latency_p95_ms": value}, passed=True)
+
+        # The 20 ms sample drops out as the new one comes in
+        assert window.evaluate(compiled, {"latency_p95_ms": 10.0})
+        assert not window.evaluate(compiled, {"latency_p95_ms": 16.0})
+        with pytest.raises(KeyError):
+            window.evaluate(compiled, {})
+
+    def test_rejects_empty_window(self):
+        """Test window size must be positive."""
+        with pytest.raises(ValueError):
+            MetricWindow(["latency_p95_ms"], size=0)
+
+
+class TestSequentialTest:
+    """Test the SPRT decision bounds."""
+
+    def test_consecutive_passes_settle_pass(self):
+        """Test a run of passing samples eventually settles PASSED."""
+        test = SequentialTest(target=0.95, margin=0.04)
+        decisions = [test.update(True) for _ in range(40)]
+
+        first = next(i for i, d in enumerate(decisions) if d)
+        assert decisions[first] == "PASSED"
+        assert 10 < first < 40
+
+    def test_two_failures_settle_fail(self):
+        """Test failures are strong evidence at a high pass target."""
+        test = SequentialTest(target=0.95, margin=0.04)
+
+        assert test.update(False) is None
+        assert test.update(False) == "FAILED"
+
+    def test_invalid_parameters(self):
+        """Test degenerate hypotheses are rejected."""
+        with pytest.raises(ValueError):
+            SequentialTest(target=0.5, margin=0.0)
+
+
+class TestEvaluateWindow:
+    """Test polling until the verdict is settled."""
+
+    def test_sustained_failure_stops_early(self):
+        """Test failing samples stop the poll long before max_samples."""
+        sleep = MagicMock()
+        verdict = evaluate_window(
+            scripted([BAD] * 100), SLOS, window=10, max_samples=100, sleep=sleep
+        )
+
+        assert verdict["slo_validation"] == "FAILED"
+        assert verdict["decision_rule"] == "sequential_test"
+        assert verdict["samples"] == 2
+        assert sleep.call_count == 1
+
+    def test_sustained_pass_stops_early(self):
+        """Test healthy samples settle PASSED before max_samples."""
+        verdict = evaluate_window(
+            scripted([GOOD] * 100), SLOS, window=10, max_samples=100, sleep=lambda _: None
+        )
+
+        assert verdict["slo_validation"] == "PASSED"
+        assert verdict["decision_rule"] == "sequential_test"
+        assert verdict["samples"] < 100
+        assert verdict["statistics"]["latency_p95_ms"]["p95"] == 10.0
+
+    def test_undecided_falls_back_to_window_pass_ratio(self):
+        """Test the window pass ratio decides when the test is not settled."""
+        samples = [GOOD] * 9 + [BAD]
+        verdict = evaluate_window(
+            scripted(samples),
+            SLOS,
+            window=10,
+            max_samples=10,
+            min_pass_ratio=0.9,
+            margin=0.05,
+            sleep=lambda _: None,
+        )
+
+        assert verdict["decision_rule"] == "window_pass_ratio"
+        assert verdict["pass_ratio"] == pytest.approx(0.9)
+        assert verdict["slo_validation"] == "PASSED"
+
+    def test_window_percentile_tolerates_spikes(self):
+        """Test a p80 constraint passes samples a per-sample check fails."""
+        samples = ([GOOD] * 4 + [BAD]) * 12
+        per_sample = evaluate_window(
+            scripted(samples), SLOS, window=20, max_samples=60, sleep=lambda _: None
+        )
+        windowed = evaluate_window(
+            scripted(samples),
+            parse_slo_string("p80(latency_p95_ms)<=15,success_rate>=0.995"),
+            window=20,
+            max_samples=60,
+            sleep=lambda _: None,
+        )
+
+        assert per_sample["slo_validation"] == "FAILED"
+        assert windowed["slo_validation"] == "PASSED"
+        assert windowed["pass_ratio"] == 1.0
+
+    def test_window_percentile_fails_sustained_breach(self):
+        """Test a p95 constraint fails once breaches exceed 5% of the window."""
+        samples = [GOOD] * 10 + ([GOOD] * 3 + [BAD]) * 10
+        verdict = evaluate_window(
+            scripted(samples),
+            parse_slo_string("p95(latency_p95_ms)<=15"),
+            window=20,
+            max_samples=50,
+            sleep=lambda _: None,
+        )
+
+        assert verdict["slo_validation"] == "FAILED"
+
+    def test_negated_clause_fails_samples(self):
+        """Test samples failing only through NOT are not accepted."""
+        slos = parse_slo_string("latency_p95_ms <= 15 AND NOT success_rate < 0.995")
+        verdict = evaluate_window(
+            scripted([{**GOOD, "success_rate": 0.99}] * 100),
+            slos,
+            window=10,
+            max_samples=100,
+            sleep=lambda _: None,
+        )
+
+        assert verdict["slo_validation"] == "FAILED"
+        assert verdict["pass_ratio"] == 0.0
+
+    def test_fetch_errors_count_as_failures(self):
+        """Test fetch errors and missing metrics fail their samples."""
+        samples = [MetricsFetchError("down"), {"latency_p95_ms": 1.0}] + [GOOD] * 10
+        verdict = evaluate_window(
+            scripted(samples), SLOS, window=10, max_samples=12, sleep=lambda _: None
+        )
+
+        assert verdict["slo_validation"] == "FAILED"
+        assert verdict["fetch_errors"] == 2
+
+
+class TestWindowedCLI:
+    """Test the CLI windowed mode."""
+
+    @patch("gate.gate.fetch_metrics")
+    def test_main_windowed_exit_codes(self, mock_fetch):
+        """Test windowed mode passes and fails through the exit code."""
+        args = ["gate", "--slo", "latency_p95_ms<=15", "--url", "http://x/metrics"]
+        args += ["--window", "5", "--interval", "0"]
+
+        mock_fetch.return_value = GOOD
+        with patch("sys.argv", args):
+            assert main() == 0
+
+        mock_fetch.return_value = BAD
+        with patch("sys.argv", args):
+            assert main() == 1
+
+    def test_window_requires_url(self):
+        """Test windowed mode is single-URL only."""
+        args = ["gate", "--slo", "latency_p95_ms<=15", "--site-url", "e=http://e", "--window", "5"]
+        with patch("sys.argv", args):
+            with pytest.raises(SystemExit):
+                main()
@@ -2,16 +2,30 @@
 Job Query Adapter - Minimal Flask app for SLO metrics.
 
 Provides /metrics endpoint with latency_p95_ms, success_rate, throughput_p95_mbps.
-Implements configurable metrics for testing and JSON logging for machine parsing.
+Metrics are computed from job samples posted to /ingest (streaming quantile
+sketches over a sliding window per site and slice); without samples the
+configurable static values are served, except for a selected site or slice,
+whose missing metrics are reported as null. Computed metrics are recorded per site
+into ring-buffer history served by /metrics/range. JSON logging for machine
+parsing.
 """
 
 import json
 import logging
 import os
+import time
 from datetime import datetime
 from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
-from flask import Flask, jsonify
+from flask import Flask, jsonify, request
+
+try:
+    from .sketches import DEFAULT_KEY, MetricsStore
+    from .timeseries import TimeSeriesStore
+except ImportError:  # run as a script from this directory
+    from sketches import DEFAULT_KEY, MetricsStore
+    from timeseries import TimeSeriesStore
 
 
 # Configure JSON logging for machine parsing
@@ -32,6 +46,10 @@ class JSONFormatter(logging.Formatter):
             log_data["metrics"] = record.metrics
         if hasattr(record, "duration_ms"):
             log_data["duration_ms"] = record.duration_ms
+        if hasattr(record, "ingest"):
+            log_data["ingest"] = record.ingest
+        if hasattr(record, "requests"):
+            log_data["requests"] = record.requests
 
         return json.dumps(log_data)
 
@@ -70,9 +88,140 @@ current_metrics_config = MetricsConfig(
 )
 
 
-def create_app() -> Flask:
+def create_metrics_store() -> MetricsStore:
+    """Create the sample store from environment configuration."""
+    return MetricsStore(
+        window_seconds=float(os.environ.get("ADAPTER_WINDOW_SECONDS", "300")),
+        bucket_count=int(os.environ.get("ADAPTER_WINDOW_BUCKETS", "30")),
+        relative_accuracy=float(os.environ.get("ADAPTER_SKETCH_ACCURACY", "0.01")),
+        max_series=int(os.environ.get("ADAPTER_MAX_SERIES", "1024")),
+    )
+
+
+def create_history() -> TimeSeriesStore:
+    """Create the metric history from environment configuration."""
+    return TimeSeriesStore(
+        capacity=int(os.environ.get("ADAPTER_HISTORY_CAPACITY", "8640")),
+        resolution=float(os.environ.get("ADAPTER_HISTORY_RESOLUTION", "10")),
+        directory=os.environ.get("ADAPTER_HISTORY_DIR") or None,
+    )
+
+
+def collect_metrics(
+    store: MetricsStore, site: Optional[str] = None, slice_id: Optional[str] = None
+) -> dict:
+    """
+    Compute the served metrics for a site/slice selection.
+
+    Without a selection, metrics without samples in the window fall back to
+    the static configuration and are listed in ``metadata.static_metrics``.
+    The static values describe no particular site or slice, so for a
+    selection such metrics are null and listed in ``metadata.missing_metrics``.
+
+    Returns:
+        Dict with latency_p95_ms, success_rate, throughput_p95_mbps and metadata
+    """
+    summary = store.summary(site, slice_id)
+    selected = site is not None or slice_id is not None
+    metrics_data = {}
+    static_metrics = []
+    missing_metrics = []
+    for name in ("latency_p95_ms", "success_rate", "throughput_p95_mbps"):
+        value = getattr(summary, name)
+        if value is None and selected:
+            missing_metrics.append(name)
+        elif value is None:
+            value = getattr(current_metrics_config, name)
+            static_metrics.append(name)
+        metrics_data[name] = value
+    metrics_data["metadata"] = {
+        "adapter_version": "1.0.0",
+        "source": "job-query-adapter",
+        "sample_count": summary.sample_count,
+        "window_seconds": store.window_seconds,
+        "static_metrics": static_metrics,
+        "missing_metrics": missing_metrics,
+    }
+    if site is not None:
+        metrics_data["metadata"]["site"] = site
+    if slice_id is not None:
+        metrics_data["metadata"]["slice"] = slice_id
+    return metrics_data
+
+
+def ingested_sites(samples: Iterable[Any], site: Optional[str] = None) -> set:
+    """Sites an ingest batch records samples for."""
+    return {
+        str(sample.get("site") or site or DEFAULT_KEY)
+        for sample in samples
+        if isinstance(sample, dict)
+    }
+
+
+def record_history(
+    history: TimeSeriesStore, store: MetricsStore, sites: Iterable[str]
+) -> None:
+    """Record the current sample-based metrics of sites into the history."""
+    now = store.clock()
+    for site in sites:
+        if not history.due(site, now):
+            continue
+        summary = store.summary(site)
+        values = {
+            name: getattr(summary, name)
+            for name in ("latency_p95_ms", "success_rate", "throughput_p95_mbps")
+            if getattr(summary, name) is not None
+        }
+        if values:
+            history.record(site, now, values)
+
+
+def _parse_time(value: str) -> float:
+    """Epoch seconds or RFC 3339 timestamp."""
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def range_query(
+    history: TimeSeriesStore, args: Mapping[str, str], now: Optional[float] = None
+) -> Tuple[int, Dict[str, Any]]:
+    """
+    Answer a /metrics/range request.
+
+    Parameters: ``start``/``end`` (epoch seconds or RFC 3339, default the last
+    hour), ``step`` (seconds, default 60), ``agg`` (comma-separated avg, min,
+    max, count, pNN; default avg), ``metric`` and ``site`` (comma-separated,
+    default all).
+
+    Returns:
+        Tuple of HTTP status and response body
+    """
+    now = time.time() if now is None else now
+    try:
+        end = _parse_time(args["end"]) if args.get("end") else now
+        start = _parse_time(args["start"]) if args.get("start") else end - 3600
+        step = float(args.get("step") or 60)
+        aggregations = (args.get("agg") or "avg").split(",")
+        metrics = args["metric"].split(",") if args.get("metric") else None
+        sites = args["site"].split(",") if args.get("site") else None
+        series = history.query(start, end, step, aggregations, metrics, sites)
+    except ValueError as e:
+        return 400, {"error": str(e)}
+    return 200, {"start": start, "end": end, "step": step, "series": series}
+
+
+def create_app(
+    metrics_store: Optional[MetricsStore] = None,
+    history: Optional[TimeSeriesStore] = None,
+) -> Flask:
     """Create and configure Flask application."""
     app = Flask(__name__)
+    store = metrics_store or create_metrics_store()
+    history = history or create_history()
+    app.extensions["metrics_store"] = store
+    app.extensions["metrics_history"] = history
 
     # Configuration from environment (following .env.example pattern)
     app.config.update(
@@ -91,17 +240,20 @@ def create_app() -> Flask:
         """
         Metrics endpoint providing SLO metrics.
 
+        Query parameters ``site`` and ``slice`` restrict the metrics to the
+        samples of one site and/or slice; metrics without samples in the
+        window are then null. Without them such metrics fall back to the
+        static configuration.
+
         Returns:
             JSON with latency_p95_ms, success_rate, throughput_p95_mbps
         """
         start_time = datetime.utcnow()
-
+        site = request.args.get("site")
+        slice_id = request.args.get("slice")
         metrics_data = {
             "timestamp": start_time.isoformat() + "Z",
-            "latency_p95_ms": current_metrics_config.latency_p95_ms,
-            "success_rate": current_metrics_config.success_rate,
-            "throughput_p95_mbps": current_metrics_config.throughput_p95_mbps,
-            "metadata": {"adapter_version": "1.0.0", "source": "job-query-adapter"},
+            **collect_metrics(store, site, slice_id),
         }
 
         # Log metrics request in JSON format for machine parsing
@@ -117,6 +269,68 @@ def create_app() -> Flask:
 
         return jsonify(metrics_data)
 
+    @app.route("/metrics/range")
+    def metrics_range():
+        """
+        Recorded metric history, downsampled into fixed steps.
+
+        Returns:
+            JSON with one series per site and metric
+        """
+        status, body = range_query(history, request.args)
+        return jsonify(body), status
+
+    @app.route("/ingest", methods=["POST"])
+    def ingest():
+        """
+        Ingest a batch of raw job samples.
+
+        Body: ``{"site": "edge1", "slice": "embb", "samples": [{"latency_ms":
+        8.2, "success": true, "throughput_mbps": 240.0, "timestamp": ...}]}``
+        or a bare list of samples. Invalid samples are rejected individually.
+
+        Returns:
+            JSON with accepted and rejected counts
+        """
+        body = request.get_json(silent=True)
+        if isinstance(body, list):
+            body = {"samples": body}
+        if not isinstance(body, dict) or not isinstance(body.get("samples"), list):
+            error = "Body must be a list of samples or an object with 'samples'"
+            return jsonify({"error": error}), 400
+
+        accepted, errors = store.ingest(
+            body["samples"], body.get("site"), body.get("slice")
+        )
+        if accepted:
+            record_history(
+                history, store, ingested_sites(body["samples"], body.get("site"))
+            )
+        result = {"accepted": accepted, "rejected": len(errors), "errors": errors[:10]}
+        logger.info(
+            "Samples ingested",
+            extra={"ingest": {"accepted": accepted, "rejected": len(errors)}},
+        )
+        return jsonify(result), 200 if accepted or not errors else 400
+
+    @app.route("/sketches", methods=["GET"])
+    def export_sketches():
+        """Export the window sketches for merging into another adapter."""
+        return jsonify(store.export())
+
+    @app.route("/sketches", methods=["POST"])
+    def merge_sketches():
+        """Merge the exported sketches of another adapter instance."""
+        state = request.get_json(silent=True)
+        if not isinstance(state, dict):
+            return jsonify({"error": "Body must be exported sketch state"}), 400
+        try:
+            merged = store.merge(state)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        record_history(history, store, {s["site"] for s in state.get("series", [])})
+        return jsonify({"merged_samples": merged})
+
     @app.errorhandler(404)
     def not_found(error):
         """Handle 404 errors."""
@@ -158,7 +372,10 @@ def main():
         },
     )
 
-    app.run(host=host, port=port, debug=debug)
+    try:
+        app.run(host=host, port=port, debug=debug)
+    finally:
+        app.extensions["metrics_history"].flush()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,427 @@
+"""
+Job Query Adapter - ASGI serving mode for high scrape rates.
+
+Serves the same endpoints as the Flask app, but keeps the /metrics payload
+pre-serialized: it is only recomputed when samples are ingested, a window
+bucket rolls over or the static config changes, and only re-encoded when the
+values actually differ. Responses carry an ETag and answer If-None-Match with
+304; Prometheus text exposition is served for `Accept: text/plain` or
+`?format=prometheus`. Request logging is aggregated per interval (optionally
+with a sampled per-request record) instead of one record per scrape.
+
+Run with:
+    python asgi.py
+    uvicorn asgi:app --host 0.0.0.0 --port 8080 --no-access-log
+"""
+
+import hashlib
+import json
+import os
+import random
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+try:
+    from . import adapter as _adapter
+    from .sketches import MetricsStore
+    from .timeseries import TimeSeriesStore
+except ImportError:  # run as a script from this directory
+    import adapter as _adapter
+    from sketches import MetricsStore
+    from timeseries import TimeSeriesStore
+
+logger = _adapter.logger
+
+# Refuse request bodies larger than this (bytes)
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+PROMETHEUS_CONTENT_TYPE = b"text/plain; version=0.0.4; charset=utf-8"
+JSON_CONTENT_TYPE = b"application/json"
+
+PROMETHEUS_METRICS = [
+    ("latency_p95_ms", "95th percentile job latency in milliseconds"),
+    ("success_rate", "Ratio of successful jobs (0.0-1.0)"),
+    ("throughput_p95_mbps", "95th percentile job throughput in Mbps"),
+]
+PROMETHEUS_PREFIX = "job_query_adapter_"
+
+
+@dataclass
+class RenderedMetrics:
+    """Pre-serialized /metrics representations of one set of values."""
+
+    values: Dict[str, Any]
+    json_body: bytes
+    json_etag: bytes
+    prometheus_body: bytes
+    prometheus_etag: bytes
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_metrics(values: Dict[str, Any]) -> RenderedMetrics:
+    """Serialize metric values to JSON and Prometheus text with ETags."""
+    digest = hashlib.blake2b(
+        json.dumps(values, sort_keys=True).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    json_body = json.dumps(
+        {"timestamp": datetime.utcnow().isoformat() + "Z", **values}
+    ).encode("utf-8")
+
+    metadata = values["metadata"]
+    labels = ",".join(
+        f'{name}="{_escape_label(metadata[name])}"'
+        for name in ("site", "slice")
+        if name in metadata
+    )
+    labels = f"{{{labels}}}" if labels else ""
+    lines: List[str] = []
+    for name, description in PROMETHEUS_METRICS:
+        metric = PROMETHEUS_PREFIX + name
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} gauge")
+        # Metrics without data are left out of the exposition, not zeroed
+        if values[name] is not None:
+            lines.append(f"{metric}{labels} {float(values[name])!r}")
+    metric = PROMETHEUS_PREFIX + "sample_count"
+    lines.append(f"# HELP {metric} Job samples in the sliding window")
+    lines.append(f"# TYPE {metric} gauge")
+    lines.append(f"{metric}{labels} {metadata['sample_count']}")
+
+    return RenderedMetrics(
+        values=values,
+        json_body=json_body,
+        json_etag=f'"{digest}"'.encode("ascii"),
+        prometheus_body=("\n".join(lines) + "\n").encode("utf-8"),
+        prometheus_etag=f'"{digest}-prom"'.encode("ascii"),
+    )
+
+
+class MetricsRenderer:
+    """Caches rendered /metrics payloads per (site, slice) selection."""
+
+    def __init__(self, store: MetricsStore, max_entries: int = 256):
+        """
+        Initialize renderer.
+
+        Args:
+            store: Sample store the metrics are computed from
+            max_entries: Number of site/slice selections kept
+        """
+        self.store = store
+        self.max_entries = max_entries
+        self.renders = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(
+        self, site: Optional[str] = None, slice_id: Optional[str] = None
+    ) -> RenderedMetrics:
+        """Return the current payload, recomputing only when inputs changed."""
+        config = _adapter.current_metrics_config
+        key = (
+            self.store.state_key(),
+            config.latency_p95_ms,
+            config.success_rate,
+            config.throughput_p95_mbps,
+        )
+        selection = (site, slice_id)
+        entry = self._entries.get(selection)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        values = _adapter.collect_metrics(self.store, site, slice_id)
+        if entry is not None and entry[1].values == values:
+            rendered = entry[1]
+        else:
+            rendered = render_metrics(values)
+            self.renders += 1
+        self._entries[selection] = (key, rendered)
+        self._entries.move_to_end(selection)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return rendered
+
+
+class RequestLog:
+    """Aggregated request logging.
+
+    Counts requests per endpoint and status and emits one summary record per
+    interval. With a sample rate, that fraction of requests is also logged
+    individually.
+    """
+
+    def __init__(
+        self,
+        interval: float = 10.0,
+        sample_rate: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.interval = interval
+        self.sample_rate = sample_rate
+        self.clock = clock
+        self.counts: Counter = Counter()
+        self._next_flush = clock() + interval
+
+    def record(self, path: str, status: int, duration_ms: float) -> None:
+        """Count one served request."""
+        self.counts[(path, status)] += 1
+        if self.sample_rate and random.random() < self.sample_rate:
+            logger.info(
+                "Request served (sampled)",
+                extra={
+                    "requests": {"endpoint": path, "status": status},
+                    "duration_ms": duration_ms,
+                },
+            )
+        if self.clock() >= self._next_flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Log and reset the counts since the last flush."""
+        self._next_flush = self.clock() + self.interval
+        if not self.counts:
+            return
+        summary = [
+            {"endpoint": path, "status": status, "count": count}
+            for (path, status), count in sorted(self.counts.items())
+        ]
+        self.counts.clear()
+        logger.info("Requests served", extra={"requests": summary})
+
+
+def _etag_matches(etag: bytes, if_none_match: bytes) -> bool:
+    """Weak If-None-Match comparison (RFC 9110 13.1.2)."""
+    if if_none_match.strip() == b"*":
+        return True
+    return any(
+        tag.strip().removeprefix(b"W/") == etag for tag in if_none_match.split(b",")
+    )
+
+
+def _json(body: Any) -> bytes:
+    return json.dumps(body).encode("utf-8")
+
+
+HEALTH_BODY = _json({"status": "healthy"})
+NOT_FOUND_BODY = _json({"error": "Endpoint not found"})
+
+
+class AdapterASGI:
+    """ASGI application for the job-query-adapter."""
+
+    def __init__(
+        self,
+        store: Optional[MetricsStore] = None,
+        request_log: Optional[RequestLog] = None,
+        history: Optional[TimeSeriesStore] = None,
+    ):
+        """
+        Initialize application.
+
+        Args:
+            store: Sample store (default: from environment configuration)
+            request_log: Request log aggregator (default: from environment)
+            history: Metric history (default: from environment configuration)
+        """
+        self.store = store or _adapter.create_metrics_store()
+        self.history = history or _adapter.create_history()
+        self.renderer = MetricsRenderer(self.store)
+        self.request_log = request_log or RequestLog(
+            interval=float(os.environ.get("ADAPTER_LOG_INTERVAL", "10")),
+            sample_rate=float(os.environ.get("ADAPTER_LOG_SAMPLE_RATE", "0")),
+        )
+
+    async def __call__(
+        self, scope: Dict[str, Any], receive: Callable, send: Callable
+    ) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        start = time.perf_counter()
+        path = scope["path"]
+        method = scope["method"]
+        if path == "/metrics" and method in ("GET", "HEAD"):
+            status = await self._metrics(scope, send)
+        elif path == "/metrics/range" and method == "GET":
+            status = await self._range(scope, send)
+        elif path == "/health" and method in ("GET", "HEAD"):
+            status = await self._send(send, 200, HEALTH_BODY)
+        elif path == "/ingest" and method == "POST":
+            status = await self._ingest(receive, send)
+        elif path == "/sketches" and method == "GET":
+            status = await self._send(send, 200, _json(self.store.export()))
+        elif path == "/sketches" and method == "POST":
+            status = await self._merge(receive, send)
+        else:
+            status = await self._send(send, 404, NOT_FOUND_BODY)
+        self.request_log.record(path, status, (time.perf_counter() - start) * 1000)
+
+    async def _lifespan(self, receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.request_log.flush()
+                self.history.flush()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _metrics(self, scope: Dict[str, Any], send: Callable) -> int:
+        site = slice_id = None
+        prometheus = False
+        if scope["query_string"]:
+            query = parse_qs(scope["query_string"].decode("latin-1"))
+            site = query.get("site", [None])[-1]
+            slice_id = query.get("slice", [None])[-1]
+            prometheus = query.get("format", [None])[-1] == "prometheus"
+
+        if_none_match = None
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value
+            elif name == b"accept" and (
+                b"text/plain" in value or b"openmetrics" in value
+            ):
+                prometheus = True
+
+        rendered = self.renderer.get(site, slice_id)
+        if prometheus:
+            body, etag = rendered.prometheus_body, rendered.prometheus_etag
+            content_type = PROMETHEUS_CONTENT_TYPE
+        else:
+            body, etag = rendered.json_body, rendered.json_etag
+            content_type = JSON_CONTENT_TYPE
+
+        if if_none_match is not None and _etag_matches(etag, if_none_match):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [(b"etag", etag), (b"cache-control", b"no-cache")],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return 304
+
+        return await self._send(
+            send,
+            200,
+            b"" if scope["method"] == "HEAD" else body,
+            content_type,
+            [(b"etag", etag), (b"cache-control", b"no-cache")],
+            len(body),
+        )
+
+    async def _range(self, scope: Dict[str, Any], send: Callable) -> int:
+        query = parse_qs(scope["query_string"].decode("latin-1"))
+        args = {name: values[-1] for name, values in query.items()}
+        status, body = _adapter.range_query(self.history, args)
+        return await self._send(send, status, _json(body))
+
+    async def _ingest(self, receive: Callable, send: Callable) -> int:
+        body = await self._read_json(receive)
+        if isinstance(body, list):
+            body = {"samples": body}
+        if not isinstance(body, dict) or not isinstance(body.get("samples"), list):
+            error = "Body must be a list of samples or an object with 'samples'"
+            return await self._send(send, 400, _json({"error": error}))
+
+        accepted, errors = self.store.ingest(
+            body["samples"], body.get("site"), body.get("slice")
+        )
+        if accepted:
+            sites = _adapter.ingested_sites(body["samples"], body.get("site"))
+            _adapter.record_history(self.history, self.store, sites)
+        result = {"accepted": accepted, "rejected": len(errors), "errors": errors[:10]}
+        status = 200 if accepted or not errors else 400
+        return await self._send(send, status, _json(result))
+
+    async def _merge(self, receive: Callable, send: Callable) -> int:
+        state = await self._read_json(receive)
+        if not isinstance(state, dict):
+            error = "Body must be exported sketch state"
+            return await self._send(send, 400, _json({"error": error}))
+        try:
+            merged = self.store.merge(state)
+        except ValueError as e:
+            return await self._send(send, 400, _json({"error": str(e)}))
+        sites = {series["site"] for series in state.get("series", [])}
+        _adapter.record_history(self.history, self.store, sites)
+        return await self._send(send, 200, _json({"merged_samples": merged}))
+
+    @staticmethod
+    async def _read_json(receive: Callable) -> Any:
+        """Read a JSON request body; None if missing, too large or invalid."""
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return None
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_SIZE:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                break
+        try:
+            return json.loads(b"".join(chunks))
+        except ValueError:
+            return None
+
+    @staticmethod
+    async def _send(
+        send: Callable,
+        status: int,
+        body: bytes,
+        content_type: bytes = JSON_CONTENT_TYPE,
+        headers: Optional[List[Tuple[bytes, bytes]]] = None,
+        content_length: Optional[int] = None,
+    ) -> int:
+        length = len(body) if content_length is None else content_length
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", content_type),
+                    (b"content-length", str(length).encode("ascii")),
+                    *(headers or []),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+        return status
+
+
+def create_asgi_app(store: Optional[MetricsStore] = None) -> AdapterASGI:
+    """Create the ASGI application."""
+    return AdapterASGI(store)
+
+
+app = create_asgi_app()
+
+
+def main():
+    """Run the ASGI app with uvicorn."""
+    import uvicorn
+
+    host = os.environ.get("ADAPTER_HOST", "0.0.0.0")
+    port = int(os.environ.get("ADAPTER_PORT", "8080"))
+    logger.info("Starting job-query-adapter (ASGI)", extra={"host": host, "port": port})
+    uvicorn.run(app, host=host, port=port, access_log=False, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,482 @@
+"""
+Streaming metric aggregation for the job-query-adapter.
+
+Raw job samples (latency, success, throughput) are folded into mergeable
+DDSketch quantile sketches held in sliding time windows per (site, slice).
+Memory is bounded by the window bucket count and the sketch bin limit, not by
+the number of samples, and the exported state of several adapter instances
+can be merged into one.
+"""
+
+import math
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Samples without a site or slice are recorded under this name
+DEFAULT_KEY = "default"
+
+# Site and slice names accepted from clients
+_SERIES_NAME = re.compile(r"^[A-Za-z0-9_.:-]{1,64}$")
+
+
+class DDSketch:
+    """Relative-error quantile sketch (Masson et al., VLDB 2019).
+
+    Values are counted in logarithmic bins of ratio gamma, so every quantile
+    is returned within ``relative_accuracy`` of a true sample value. When more
+    than ``max_bins`` bins are in use the lowest ones are collapsed, which
+    keeps memory constant and the upper quantiles exact to the guarantee.
+    Sketches with the same accuracy merge by adding bin counts.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_bins < 1:
+            raise ValueError("max_bins must be positive")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a non-negative value."""
+        if value < 0 or math.isnan(value):
+            raise ValueError(f"Sketch values must be non-negative, got {value}")
+        if value < 1e-9:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + count
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        self.count += count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def _collapse(self) -> None:
+        """Fold the lowest bins into the lowest bin that is kept."""
+        keys = sorted(self.bins)
+        excess = len(keys) - self.max_bins
+        folded = sum(self.bins.pop(key) for key in keys[:excess])
+        self.bins[keys[excess]] += folded
+
+    def merge(self, other: "DDSketch") -> None:
+        """Add the counts of another sketch to this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the q-quantile (0 <= q <= 1), or None if the sketch is empty."""
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if self.count == 0:
+            return None
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                value = 2 * self.gamma**key / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable sketch state."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "count": self.count,
+            "zero_count": self.zero_count,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "bins": {str(key): count for key, count in self.bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], max_bins: int = 2048) -> "DDSketch":
+        """Restore a sketch from ``to_dict`` output."""
+        sketch = cls(float(data["relative_accuracy"]), max_bins)
+        sketch.bins = {
+            int(key): int(count) for key, count in data.get("bins", {}).items()
+        }
+        if len(sketch.bins) > max_bins:
+            sketch._collapse()
+        sketch.zero_count = int(data.get("zero_count", 0))
+        sketch.count = sketch.zero_count + sum(sketch.bins.values())
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        return sketch
+
+
+@dataclass
+class SampleBucket:
+    """Aggregates of the samples in one time slice of a window."""
+
+    latency: DDSketch
+    throughput: DDSketch
+    total: int = 0
+    successes: int = 0
+
+    def merge(self, other: "SampleBucket") -> None:
+        """Add another bucket's aggregates."""
+        self.latency.merge(other.latency)
+        self.throughput.merge(other.throughput)
+        self.total += other.total
+        self.successes += other.successes
+
+
+@dataclass
+class WindowSummary:
+    """Metrics computed from the samples of a window."""
+
+    sample_count: int
+    latency_p95_ms: Optional[float]
+    success_rate: Optional[float]
+    throughput_p95_mbps: Optional[float]
+
+
+@dataclass
+class SlidingWindow:
+    """Ring of time buckets covering the last ``window_seconds``.
+
+    Buckets are keyed by absolute epoch slot (timestamp // bucket width), so
+    windows of different adapter instances with the same layout align and
+    merge bucket by bucket.
+    """
+
+    window_seconds: float = 300.0
+    bucket_count: int = 30
+    relative_accuracy: float = 0.01
+    max_bins: int = 2048
+    buckets: Dict[int, SampleBucket] = field(default_factory=dict)
+
+    @property
+    def bucket_width(self) -> float:
+        return self.window_seconds / self.bucket_count
+
+    def _slot(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_width)
+
+    def _bucket(self, slot: int) -> SampleBucket:
+        bucket = self.buckets.get(slot)
+        if bucket is None:
+            bucket = self.buckets[slot] = SampleBucket(
+                DDSketch(self.relative_accuracy, self.max_bins),
+                DDSketch(self.relative_accuracy, self.max_bins),
+            )
+        return bucket
+
+    def expire(self, now: float) -> None:
+        """Drop buckets that fell out of the window."""
+        oldest = self._slot(now) - self.bucket_count + 1
+        for slot in [slot for slot in self.buckets if slot < oldest]:
+            del self.buckets[slot]
+
+    def add(
+        self,
+        timestamp: float,
+        latency_ms: float,
+        success: bool,
+        throughput_mbps: Optional[float] = None,
+    ) -> None:
+        """Record one sample in the bucket of its timestamp."""
+        bucket = self._bucket(self._slot(timestamp))
+        bucket.latency.add(latency_ms)
+        if throughput_mbps is not None:
+            bucket.throughput.add(throughput_mbps)
+        bucket.total += 1
+        bucket.successes += int(success)
+
+    def merge_bucket(self, slot: int, other: SampleBucket) -> None:
+        """Merge an exported bucket into the bucket of the same slot."""
+        self._bucket(slot).merge(other)
+
+    def collect(self, now: float, into: Optional[SampleBucket] = None) -> SampleBucket:
+        """Merge all buckets inside the window into one."""
+        oldest = self._slot(now) - self.bucket_count + 1
+        total = into or SampleBucket(
+            DDSketch(self.relative_accuracy, self.max_bins),
+            DDSketch(self.relative_accuracy, self.max_bins),
+        )
+        for slot, bucket in self.buckets.items():
+            if slot >= oldest:
+                total.merge(bucket)
+        return total
+
+
+class MetricsStore:
+    """Thread-safe sliding-window sketches per (site, slice)."""
+
+    def __init__(
+        self,
+        window_seconds: float = 300.0,
+        bucket_count: int = 30,
+        relative_accuracy: float = 0.01,
+        max_bins: int = 2048,
+        max_series: int = 1024,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            window_seconds: Length of the sliding window
+            bucket_count: Number of time buckets the window is split into
+            relative_accuracy: Relative error bound of the quantile sketches
+            max_bins: Bin limit of each sketch
+            max_series: Number of (site, slice) windows holding samples at once
+            clock: Epoch clock (replaced in tests)
+        """
+        if window_seconds <= 0 or bucket_count < 1:
+            raise ValueError("Window length and bucket count must be positive")
+        if max_series < 1:
+            raise ValueError("max_series must be positive")
+        self.window_seconds = window_seconds
+        self.bucket_count = bucket_count
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.max_series = max_series
+        self.clock = clock
+        self._windows: Dict[Tuple[str, str], SlidingWindow] = {}
+        self._lock = threading.Lock()
+        self._version = 0
+
+    def state_key(self) -> Tuple[int, int]:
+        """
+        Key that changes whenever ``summary`` results may change.
+
+        Combines a counter of ingests/merges with the current time bucket,
+        since buckets leave the window as time passes.
+        """
+        bucket_width = self.window_seconds / self.bucket_count
+        return self._version, int(self.clock() // bucket_width)
+
+    def _window(self, key: Tuple[str, str]) -> SlidingWindow:
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = SlidingWindow(
+                self.window_seconds,
+                self.bucket_count,
+                self.relative_accuracy,
+                self.max_bins,
+            )
+        return window
+
+    def _expire(self, now: float) -> None:
+        """Drop buckets that left the window, and windows left without buckets."""
+        for key, window in list(self._windows.items()):
+            window.expire(now)
+            if not window.buckets:
+                del self._windows[key]
+
+    def ingest(
+        self,
+        samples: Iterable[Dict[str, Any]],
+        site: Optional[str] = None,
+        slice_id: Optional[str] = None,
+    ) -> Tuple[int, List[str]]:
+        """
+        Record a batch of raw job samples.
+
+        Each sample needs ``latency_ms`` (>= 0) and ``success`` (bool) and may
+        carry ``throughput_mbps``, an epoch ``timestamp`` (default: now) and
+        its own ``site``/``slice`` overriding the batch ones. Samples older
+        than the window are dropped; future timestamps count as now. Site and
+        slice names are 1-64 letters, digits, ``_``, ``.``, ``:`` or ``-``;
+        samples of a new series are rejected while ``max_series`` series hold
+        samples.
+
+        Returns:
+            Tuple of accepted count and one error message per rejected sample
+        """
+        now = self.clock()
+        oldest = now - self.window_seconds
+        accepted = 0
+        errors: List[str] = []
+        with self._lock:
+            self._expire(now)
+            for index, sample in enumerate(samples):
+                try:
+                    parsed = _parse_sample(sample)
+                    key = (
+                        _series_name(sample.get("site") or site, "site"),
+                        _series_name(sample.get("slice") or slice_id, "slice"),
+                    )
+                except (TypeError, ValueError) as e:
+                    errors.append(f"sample {index}: {e}")
+                    continue
+                timestamp = min(parsed[0] if parsed[0] is not None else now, now)
+                if timestamp <= oldest:
+                    errors.append(f"sample {index}: timestamp outside the window")
+                    continue
+                if key not in self._windows and len(self._windows) >= self.max_series:
+                    errors.append(
+                        f"sample {index}: series limit of {self.max_series} reached"
+                    )
+                    continue
+                self._window(key).add(timestamp, *parsed[1:])
+                accepted += 1
+            self._version += 1
+        return accepted, errors
+
+    def summary(
+        self, site: Optional[str] = None, slice_id: Optional[str] = None
+    ) -> WindowSummary:
+        """Compute served metrics over the window, optionally for one site/slice."""
+        now = self.clock()
+        with self._lock:
+            total = None
+            for (window_site, window_slice), window in self._windows.items():
+                if site is not None and window_site != site:
+                    continue
+                if slice_id is not None and window_slice != slice_id:
+                    continue
+                total = window.collect(now, total)
+        if total is None or total.total == 0:
+            return WindowSummary(0, None, None, None)
+        return WindowSummary(
+            sample_count=total.total,
+            latency_p95_ms=total.latency.quantile(0.95),
+            success_rate=total.successes / total.total,
+            throughput_p95_mbps=total.throughput.quantile(0.95),
+        )
+
+    def export(self) -> Dict[str, Any]:
+        """JSON-serializable window state, for merging into another instance."""
+        now = self.clock()
+        with self._lock:
+            self._expire(now)
+            series = []
+            for (site, slice_id), window in sorted(self._windows.items()):
+                series.append({
+                    "site": site,
+                    "slice": slice_id,
+                    "buckets": [
+                        {
+                            "slot": slot,
+                            "total": bucket.total,
+                            "successes": bucket.successes,
+                            "latency": bucket.latency.to_dict(),
+                            "throughput": bucket.throughput.to_dict(),
+                        }
+                        for slot, bucket in sorted(window.buckets.items())
+                    ],
+                })
+        return {
+            "window_seconds": self.window_seconds,
+            "bucket_count": self.bucket_count,
+            "relative_accuracy": self.relative_accuracy,
+            "series": series,
+        }
+
+    def merge(self, state: Dict[str, Any]) -> int:
+        """
+        Merge another instance's ``export`` output into this store.
+
+        Returns:
+            Number of samples merged
+
+        Raises:
+            ValueError: If the window layout or sketch accuracy differs, the
+                state is malformed or its new series exceed ``max_series``
+        """
+        expected = (self.window_seconds, self.bucket_count, self.relative_accuracy)
+        layout = tuple(
+            state.get(name)
+            for name in ("window_seconds", "bucket_count", "relative_accuracy")
+        )
+        if layout != expected:
+            raise ValueError(
+                "Cannot merge state with window_seconds/bucket_count/"
+                f"relative_accuracy {layout}, expected {expected}"
+            )
+        buckets = []
+        try:
+            for series in state.get("series", []):
+                key = (
+                    _series_name(series["site"], "site"),
+                    _series_name(series["slice"], "slice"),
+                )
+                for data in series["buckets"]:
+                    bucket = SampleBucket(
+                        DDSketch.from_dict(data["latency"], self.max_bins),
+                        DDSketch.from_dict(data["throughput"], self.max_bins),
+                        int(data["total"]),
+                        int(data["successes"]),
+                    )
+                    buckets.append((key, int(data["slot"]), bucket))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid sketch state: {e}") from e
+
+        now = self.clock()
+        with self._lock:
+            self._expire(now)
+            new_series = {key for key, _, _ in buckets} - self._windows.keys()
+            if len(self._windows) + len(new_series) > self.max_series:
+                raise ValueError(
+                    f"Merging {len(new_series)} new series exceeds the series "
+                    f"limit of {self.max_series}"
+                )
+            for key, slot, bucket in buckets:
+                self._window(key).merge_bucket(slot, bucket)
+            self._version += 1
+            # Merged buckets may already be outside the window
+            self._expire(now)
+        return sum(bucket.total for _, _, bucket in buckets)
+
+
+def _parse_sample(sample: Any) -> Tuple[Optional[float], float, bool, Optional[float]]:
+    """Validate a raw sample into (timestamp, latency_ms, success, throughput_mbps)."""
+    if not isinstance(sample, dict):
+        raise TypeError("sample must be an object")
+    latency = _non_negative(sample.get("latency_ms"), "latency_ms")
+    success = sample.get("success")
+    if not isinstance(success, bool):
+        raise TypeError("success must be a boolean")
+    throughput = sample.get("throughput_mbps")
+    if throughput is not None:
+        throughput = _non_negative(throughput, "throughput_mbps")
+    timestamp = sample.get("timestamp")
+    if timestamp is not None:
+        timestamp = _non_negative(timestamp, "timestamp")
+    return timestamp, latency, success, throughput
+
+
+def _series_name(value: Any, name: str) -> str:
+    """Validate a client-supplied site or slice name (empty means the default)."""
+    if value is None or value == "":
+        return DEFAULT_KEY
+    if not isinstance(value, str) or not _SERIES_NAME.match(value):
+        raise ValueError(f"{name} must be 1-64 letters, digits, '_', '.', ':' or '-'")
+    return value
+
+
+def _non_negative(value: Any, name: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"{name} must be a number")
+    if not value >= 0 or math.isinf(value):
+        raise ValueError(f"{name} must be a finite non-negative number")
+    return float(value)
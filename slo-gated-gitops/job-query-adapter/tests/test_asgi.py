@@ -0,0 +1,209 @@
+"""
+Tests for the job-query-adapter ASGI serving mode.
+
+Requests go through httpx's ASGI transport, so the app is exercised without
+a server process.
+"""
+
+import asyncio
+import logging
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from asgi import AdapterASGI, RequestLog
+from sketches import MetricsStore
+
+
+class FakeClock:
+    """Settable clock."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def app(clock):
+    return AdapterASGI(MetricsStore(clock=clock), RequestLog(interval=3600))
+
+
+def request(app, method, url, **kwargs):
+    """Send one request to the ASGI app."""
+
+    async def send():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://adapter") as client:
+            return await client.request(method, url, **kwargs)
+
+    return asyncio.run(send())
+
+
+class TestMetrics:
+    """Test the pre-serialized /metrics endpoint."""
+
+    def test_json_matches_flask_payload(self, app):
+        """Test the JSON body has the same fields as the Flask endpoint."""
+        response = request(app, "GET", "/metrics")
+        data = response.json()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert set(data) == {
+            "timestamp",
+            "latency_p95_ms",
+            "success_rate",
+            "throughput_p95_mbps",
+            "metadata",
+        }
+        assert data["metadata"]["static_metrics"] == [
+            "latency_p95_ms",
+            "success_rate",
+            "throughput_p95_mbps",
+        ]
+
+    def test_payload_rendered_once_until_values_change(self, app, clock):
+        """Test scrapes reuse the serialized payload and ETag."""
+        first = request(app, "GET", "/metrics")
+        for _ in range(20):
+            again = request(app, "GET", "/metrics")
+        assert again.content == first.content
+        assert app.renderer.renders == 1
+
+        # A bucket rollover without value changes keeps the payload
+        clock.now += 60
+        assert request(app, "GET", "/metrics").content == first.content
+        assert app.renderer.renders == 1
+
+        request(app, "POST", "/ingest", json=[{"latency_ms": 4.0, "success": True}])
+        changed = request(app, "GET", "/metrics")
+        assert changed.headers["etag"] != first.headers["etag"]
+        assert changed.json()["latency_p95_ms"] == 4.0
+        assert app.renderer.renders == 2
+
+    def test_config_change_invalidates_payload(self, app):
+        """Test the static config is part of the cache key."""
+        before = request(app, "GET", "/metrics").json()
+        with patch("adapter.current_metrics_config") as config:
+            config.latency_p95_ms = 42.0
+            config.success_rate = 0.9
+            config.throughput_p95_mbps = 1.0
+            after = request(app, "GET", "/metrics").json()
+
+        assert before["latency_p95_ms"] != 42.0
+        assert after["latency_p95_ms"] == 42.0
+
+    def test_if_none_match_returns_304(self, app):
+        """Test conditional requests with current, weak and stale ETags."""
+        etag = request(app, "GET", "/metrics").headers["etag"]
+
+        not_modified = request(app, "GET", "/metrics", headers={"If-None-Match": etag})
+        weak = request(app, "GET", "/metrics", headers={"If-None-Match": f'"x", W/{etag}'})
+        stale = request(app, "GET", "/metrics", headers={"If-None-Match": '"stale"'})
+
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+        assert weak.status_code == 304
+        assert stale.status_code == 200
+
+    def test_prometheus_exposition(self, app):
+        """Test text format by Accept header and query, with labels and own ETag."""
+        request(
+            app,
+            "POST",
+            "/ingest",
+            json={"site": "edge1", "slice": "embb", "samples": [{"latency_ms": 8.0, "success": True}]},
+        )
+        by_accept = request(app, "GET", "/metrics", headers={"Accept": "text/plain;version=0.0.4"})
+        by_query = request(app, "GET", "/metrics?format=prometheus&site=edge1&slice=embb")
+
+        assert by_accept.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "job_query_adapter_latency_p95_ms 8.0\n" in by_accept.text
+        assert "# TYPE job_query_adapter_success_rate gauge" in by_accept.text
+        assert 'job_query_adapter_sample_count{site="edge1",slice="embb"} 1' in by_query.text
+        assert by_accept.headers["etag"] != request(app, "GET", "/metrics").headers["etag"]
+        # No throughput samples: the selected series has no value to expose
+        assert "job_query_adapter_throughput_p95_mbps{" not in by_query.text
+
+    def test_head_request(self, app):
+        """Test HEAD returns headers only."""
+        response = request(app, "HEAD", "/metrics")
+
+        assert response.status_code == 200
+        assert response.content == b""
+        assert int(response.headers["content-length"]) > 0
+
+
+class TestOtherEndpoints:
+    """Test endpoints shared with the Flask app."""
+
+    def test_health_and_not_found(self, app):
+        assert request(app, "GET", "/health").json() == {"status": "healthy"}
+        assert request(app, "GET", "/nope").status_code == 404
+
+    def test_ingest_and_sketches(self, app, clock):
+        """Test ingestion errors and sketch export/merge."""
+        assert request(app, "POST", "/ingest", content=b"not json").status_code == 400
+        assert request(app, "POST", "/ingest", json=[{"success": True}]).status_code == 400
+        request(app, "POST", "/ingest", json=[{"latency_ms": 2.0, "success": True}] * 4)
+
+        state = request(app, "GET", "/sketches").json()
+        other = AdapterASGI(MetricsStore(clock=clock), RequestLog(interval=3600))
+
+        assert request(other, "POST", "/sketches", json=state).json() == {"merged_samples": 4}
+        assert request(other, "POST", "/sketches", json={}).status_code == 400
+
+    def test_metrics_range(self, app, clock):
+        """Test ingestion is recorded and served by /metrics/range."""
+        request(app, "POST", "/ingest", json=[{"latency_ms": 2.0, "success": True}])
+
+        data = request(
+            app, "GET", f"/metrics/range?start={clock.now - 60}&end={clock.now + 1}&step=61"
+        ).json()
+
+        assert {s["metric"] for s in data["series"]} == {"latency_p95_ms", "success_rate"}
+        assert request(app, "GET", "/metrics/range?step=-1").status_code == 400
+
+
+class TestRequestLog:
+    """Test aggregated request logging."""
+
+    def test_one_record_per_interval(self, caplog):
+        """Test requests are counted and flushed as one summary record."""
+        clock = FakeClock(0.0)
+        log = RequestLog(interval=10, clock=clock)
+        with caplog.at_level(logging.INFO):
+            for _ in range(500):
+                log.record("/metrics", 200, 0.1)
+            log.record("/metrics", 304, 0.1)
+            assert not [r for r in caplog.records if hasattr(r, "requests")]
+
+            clock.now = 10
+            log.record("/health", 200, 0.1)
+
+        records = [r for r in caplog.records if hasattr(r, "requests")]
+        assert len(records) == 1
+        assert records[0].requests == [
+            {"endpoint": "/health", "status": 200, "count": 1},
+            {"endpoint": "/metrics", "status": 200, "count": 500},
+            {"endpoint": "/metrics", "status": 304, "count": 1},
+        ]
+
+    def test_sampled_request_records(self, caplog):
+        """Test a sample rate of 1 logs every request individually."""
+        log = RequestLog(interval=3600, sample_rate=1.0)
+        with caplog.at_level(logging.INFO):
+            log.record("/metrics", 200, 0.1)
+
+        assert [r.requests for r in caplog.records if hasattr(r, "requests")] == [
+            {"endpoint": "/metrics", "status": 200}
+        ]
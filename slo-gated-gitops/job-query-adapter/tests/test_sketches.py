@@ -0,0 +1,265 @@
+"""
+Tests for streaming sample ingestion in job-query-adapter.
+
+Covers the DDSketch accuracy and merge guarantees, sliding-window expiry
+per site and slice, and the /ingest and /sketches endpoints.
+"""
+
+import json
+import random
+
+import pytest
+
+from adapter import create_app
+from sketches import DDSketch, MetricsStore
+
+
+class FakeClock:
+    """Settable epoch clock."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def exact_quantile(values, q):
+    """Lower quantile of sorted values, matching the sketch's rank rule."""
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestDDSketch:
+    """Test the quantile sketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test p50/p95/p99 stay within 1% of the exact values."""
+        rng = random.Random(37)
+        values = [rng.lognormvariate(2, 1) for _ in range(20000)]
+        sketch = DDSketch(0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            assert sketch.quantile(q) == pytest.approx(exact_quantile(values, q), rel=0.01)
+        assert sketch.quantile(0) == min(values)
+        assert sketch.quantile(1) == max(values)
+
+    def test_merge_equals_single_sketch(self):
+        """Test merged sketches answer like one sketch over all values."""
+        rng = random.Random(7)
+        values = [rng.uniform(0, 50) for _ in range(3000)]
+        whole, left, right = DDSketch(), DDSketch(), DDSketch()
+        for index, value in enumerate(values):
+            whole.add(value)
+            (left if index % 2 else right).add(value)
+        left.merge(right)
+
+        assert left.bins == whole.bins
+        assert left.quantile(0.95) == whole.quantile(0.95)
+        with pytest.raises(ValueError):
+            left.merge(DDSketch(0.05))
+
+    def test_memory_is_bounded(self):
+        """Test the bin count never exceeds max_bins, keeping upper quantiles."""
+        values = [10 ** (exponent / 100) for exponent in range(-300, 300)]
+        sketch = DDSketch(0.01, max_bins=64)
+        for value in values:
+            sketch.add(value)
+
+        assert len(sketch.bins) <= 64
+        assert sketch.quantile(0.99) == pytest.approx(exact_quantile(values, 0.99), rel=0.01)
+
+    def test_serialization_round_trip(self):
+        """Test to_dict/from_dict through JSON preserves the sketch."""
+        sketch = DDSketch()
+        for value in (0.0, 1.5, 3.0, 250.0):
+            sketch.add(value)
+
+        restored = DDSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        assert restored.quantile(0.5) == sketch.quantile(0.5)
+        assert restored.count == 4 and restored.zero_count == 1
+
+
+class TestMetricsStore:
+    """Test sliding windows per site and slice."""
+
+    def test_summary_per_site_and_slice(self):
+        """Test metrics are computed for the selected series only."""
+        store = MetricsStore(clock=FakeClock())
+        store.ingest(
+            [{"latency_ms": 10.0, "success": True, "throughput_mbps": 200.0}] * 9
+            + [{"latency_ms": 40.0, "success": False, "slice": "urllc"}],
+            site="edge1",
+            slice_id="embb",
+        )
+        store.ingest([{"latency_ms": 5.0, "success": True}], site="edge2")
+
+        embb = store.summary("edge1", "embb")
+        assert embb.sample_count == 9
+        assert embb.success_rate == 1.0
+        assert embb.latency_p95_ms == pytest.approx(10.0, rel=0.01)
+        assert store.summary("edge1").sample_count == 10
+        assert store.summary("edge1", "urllc").throughput_p95_mbps is None
+        assert store.summary(slice_id="default").sample_count == 1
+        assert store.summary().success_rate == pytest.approx(10 / 11)
+
+    def test_window_expiry(self):
+        """Test samples leave the window and stale samples are rejected."""
+        clock = FakeClock()
+        store = MetricsStore(window_seconds=60, bucket_count=6, clock=clock)
+        store.ingest([{"latency_ms": 10.0, "success": True}])
+        clock.now += 30
+        store.ingest([{"latency_ms": 20.0, "success": True}])
+
+        assert store.summary().sample_count == 2
+        clock.now += 40
+        assert store.summary().sample_count == 1
+        accepted, errors = store.ingest(
+            [{"latency_ms": 1.0, "success": True, "timestamp": clock.now - 120}]
+        )
+        assert accepted == 0 and "outside the window" in errors[0]
+
+    def test_empty_windows_are_evicted(self):
+        """Test series whose samples all left the window are dropped."""
+        clock = FakeClock()
+        store = MetricsStore(window_seconds=60, bucket_count=6, clock=clock)
+        store.ingest([{"latency_ms": 1.0, "success": True, "site": f"edge{i}"} for i in range(5)])
+        clock.now += 120
+        store.ingest([{"latency_ms": 1.0, "success": True}], site="edge9")
+
+        assert [s["site"] for s in store.export()["series"]] == ["edge9"]
+
+    def test_series_names_and_count_are_bounded(self):
+        """Test invalid site/slice names and series beyond the limit are rejected."""
+        clock = FakeClock()
+        store = MetricsStore(window_seconds=60, bucket_count=6, max_series=2, clock=clock)
+        accepted, errors = store.ingest([
+            {"latency_ms": 1.0, "success": True, "site": "edge1"},
+            {"latency_ms": 1.0, "success": True, "site": "x" * 65},
+            {"latency_ms": 1.0, "success": True, "site": "edge1", "slice": {"id": 1}},
+            {"latency_ms": 1.0, "success": True, "site": "edge2"},
+            {"latency_ms": 1.0, "success": True, "site": "edge3"},
+            {"latency_ms": 1.0, "success": True, "site": "edge1"},
+        ])
+
+        assert accepted == 3
+        assert "site must be" in errors[0] and "slice must be" in errors[1]
+        assert errors[2] == "sample 4: series limit of 2 reached"
+        other = MetricsStore(window_seconds=60, bucket_count=6, clock=clock)
+        other.ingest([{"latency_ms": 1.0, "success": True}], site="edge3")
+        with pytest.raises(ValueError, match="series limit"):
+            store.merge(other.export())
+
+        # Room frees up once the old series leave the window
+        clock.now += 120
+        assert store.ingest([{"latency_ms": 1.0, "success": True}], site="edge3")[0] == 1
+        other.ingest([{"latency_ms": 1.0, "success": True}], site="edge4")
+        assert store.merge(other.export()) == 1
+
+    def test_invalid_samples_are_rejected(self):
+        """Test each invalid sample is reported without failing the batch."""
+        store = MetricsStore(clock=FakeClock())
+        accepted, errors = store.ingest([
+            {"latency_ms": 1.0, "success": True},
+            {"latency_ms": -1.0, "success": True},
+            {"latency_ms": 1.0, "success": "yes"},
+            {"latency_ms": "1", "success": True},
+            "not a sample",
+        ])
+
+        assert accepted == 1
+        assert [error.split(":")[0] for error in errors] == [
+            "sample 1",
+            "sample 2",
+            "sample 3",
+            "sample 4",
+        ]
+
+    def test_merge_instances(self):
+        """Test exported state of two instances merges into one view."""
+        clock = FakeClock()
+        first = MetricsStore(clock=clock)
+        second = MetricsStore(clock=clock)
+        first.ingest([{"latency_ms": 10.0, "success": True}] * 50, site="edge1")
+        second.ingest([{"latency_ms": 30.0, "success": False}] * 50, site="edge1")
+        second.ingest([{"latency_ms": 30.0, "success": True}], site="edge2")
+
+        merged = first.merge(json.loads(json.dumps(second.export())))
+
+        assert merged == 51
+        assert first.summary("edge1").success_rate == 0.5
+        assert first.summary("edge1").latency_p95_ms == pytest.approx(30.0, rel=0.01)
+        with pytest.raises(ValueError, match="Cannot merge"):
+            first.merge(MetricsStore(window_seconds=60, clock=clock).export())
+
+
+class TestIngestEndpoints:
+    """Test the HTTP ingestion and merge endpoints."""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app(MetricsStore(clock=FakeClock()))
+        app.config["TESTING"] = True
+        return app.test_client()
+
+    def test_metrics_computed_from_ingested_samples(self, client):
+        """Test /metrics serves sketch metrics once samples arrive."""
+        samples = [
+            {"latency_ms": float(i), "success": i != 0, "throughput_mbps": 100.0 + i}
+            for i in range(100)
+        ]
+        response = client.post("/ingest", json={"site": "edge1", "slice": "embb", "samples": samples})
+
+        assert response.get_json()["accepted"] == 100
+        data = client.get("/metrics?site=edge1").get_json()
+        assert data["latency_p95_ms"] == pytest.approx(94.0, rel=0.01)
+        assert data["success_rate"] == 0.99
+        assert data["throughput_p95_mbps"] == pytest.approx(194.0, rel=0.01)
+        assert data["metadata"]["sample_count"] == 100
+        assert data["metadata"]["static_metrics"] == []
+
+    def test_metrics_fall_back_to_static_config(self, client):
+        """Test metrics without samples serve the configured values."""
+        client.post("/ingest", json=[{"latency_ms": 3.0, "success": True}])
+
+        partial = client.get("/metrics").get_json()
+
+        assert partial["latency_p95_ms"] == 3.0
+        assert partial["metadata"]["static_metrics"] == ["throughput_p95_mbps"]
+        assert partial["metadata"]["missing_metrics"] == []
+
+    def test_selected_series_without_samples_has_no_data(self, client):
+        """Test a selected site or slice never serves the configured values."""
+        client.post("/ingest", json={"site": "edge1", "samples": [{"latency_ms": 3.0, "success": True}]})
+
+        data = client.get("/metrics?site=edge9").get_json()
+        partial = client.get("/metrics?site=edge1").get_json()
+
+        assert data["metadata"]["sample_count"] == 0
+        assert data["latency_p95_ms"] is None and data["success_rate"] is None
+        assert len(data["metadata"]["missing_metrics"]) == 3
+        assert data["metadata"]["static_metrics"] == []
+        assert partial["latency_p95_ms"] == 3.0
+        assert partial["throughput_p95_mbps"] is None
+        assert partial["metadata"]["missing_metrics"] == ["throughput_p95_mbps"]
+
+    def test_bad_batches(self, client):
+        """Test malformed bodies and fully invalid batches answer 400."""
+        assert client.post("/ingest", json={"samples": "x"}).status_code == 400
+        assert client.post("/ingest", data="not json").status_code == 400
+        response = client.post("/ingest", json=[{"success": True}])
+        assert response.status_code == 400
+        assert response.get_json()["rejected"] == 1
+
+    def test_sketch_export_and_merge(self, client):
+        """Test /sketches round-trips between adapter instances."""
+        client.post("/ingest", json=[{"latency_ms": 7.0, "success": True}] * 3)
+        state = client.get("/sketches").get_json()
+
+        other = create_app(MetricsStore(clock=FakeClock())).test_client()
+        assert other.post("/sketches", json=state).get_json() == {"merged_samples": 3}
+        assert other.get("/metrics").get_json()["metadata"]["sample_count"] == 3
+        assert other.post("/sketches", json={"series": []}).status_code == 400
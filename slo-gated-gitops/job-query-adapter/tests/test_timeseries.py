@@ -0,0 +1,177 @@
+"""
+Tests for the metric history ring buffers and /metrics/range.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from adapter import create_app
+from sketches import MetricsStore
+from timeseries import RingSeries, TimeSeriesStore, downsample
+
+
+class FakeClock:
+    """Settable epoch clock."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRingSeries:
+    """Test the fixed-capacity ring buffer."""
+
+    def test_overwrites_oldest(self):
+        """Test only the newest `capacity` points are kept."""
+        series = RingSeries(4)
+        for t in range(10):
+            series.append(float(t), t * 10.0)
+
+        timestamps, values = series.points(0, 100)
+        assert sorted(timestamps.tolist()) == [6.0, 7.0, 8.0, 9.0]
+        assert sorted(values.tolist()) == [60.0, 70.0, 80.0, 90.0]
+        assert series.last_timestamp() == 9.0
+
+    def test_memory_mapped_file_survives_reopen(self, tmp_path):
+        """Test a reopened file continues writing after the newest point."""
+        path = str(tmp_path / "latency.ring")
+        series = RingSeries(3, path)
+        for t in range(5):
+            series.append(float(t), float(t))
+        series.flush()
+        del series
+
+        reopened = RingSeries(3, path)
+        assert reopened.size == 3
+        assert reopened.last_timestamp() == 4.0
+        reopened.append(5.0, 5.0)
+        assert sorted(reopened.points(0, 10)[0].tolist()) == [3.0, 4.0, 5.0]
+
+        with pytest.raises(ValueError, match="capacity"):
+            RingSeries(5, path)
+
+
+class TestDownsample:
+    """Test vectorized step aggregation."""
+
+    def test_aggregations_match_numpy(self):
+        """Test each step agrees with per-step NumPy reductions."""
+        rng = np.random.default_rng(39)
+        timestamps = rng.uniform(0, 100, 5000)
+        values = rng.normal(50, 10, 5000)
+
+        result = downsample(
+            timestamps, values, 0, 100, 7, ["avg", "min", "max", "p95", "count"]
+        )
+
+        for i in range(15):
+            in_step = values[(timestamps >= i * 7) & (timestamps < (i + 1) * 7)]
+            assert result["avg"][i] == pytest.approx(in_step.mean())
+            assert result["min"][i] == in_step.min()
+            assert result["max"][i] == in_step.max()
+            assert result["p95"][i] == pytest.approx(np.percentile(in_step, 95))
+            assert result["count"][i] == len(in_step)
+
+    def test_empty_steps_are_nan(self):
+        result = downsample(np.array([5.0]), np.array([1.0]), 0, 30, 10, ["avg"])
+
+        assert result["avg"][0] == 1.0
+        assert np.isnan(result["avg"][1:]).all()
+
+
+class TestTimeSeriesStore:
+    """Test recording and range queries."""
+
+    def test_resolution_and_query(self):
+        """Test points closer than the resolution are skipped."""
+        store = TimeSeriesStore(capacity=100, resolution=10)
+        assert store.record("edge1", 0, {"latency_p95_ms": 5.0})
+        assert not store.record("edge1", 5, {"latency_p95_ms": 50.0})
+        for t in range(10, 60, 10):
+            store.record("edge1", t, {"latency_p95_ms": float(t)})
+        store.record("edge2", 0, {"success_rate": 0.99})
+
+        series = store.query(0, 60, 30, ["max", "count"], sites=["edge1"])
+
+        assert series == [
+            {
+                "site": "edge1",
+                "metric": "latency_p95_ms",
+                "timestamps": [0.0, 30.0],
+                "max": [20.0, 50.0],
+                "count": [3, 3],
+            }
+        ]
+
+    def test_query_validation(self):
+        store = TimeSeriesStore()
+        with pytest.raises(ValueError, match="maximum"):
+            store.query(0, 100000, 1)
+        with pytest.raises(ValueError, match="aggregation"):
+            store.query(0, 10, 1, ["median"])
+        with pytest.raises(ValueError):
+            store.query(10, 0, 1)
+        extreme = [(0, math.inf, 1), (math.nan, 10, 1), (0, 10, math.inf), (-1e308, 1e308, 1)]
+        for bounds in extreme:
+            with pytest.raises(ValueError):
+                store.query(*bounds)
+
+    def test_persisted_history_reloads(self, tmp_path):
+        """Test a new store over the same directory sees earlier series."""
+        first = TimeSeriesStore(capacity=10, resolution=1, directory=str(tmp_path))
+        first.record("edge/1", 100, {"latency_p95_ms": 7.0, "success_rate": 1.0})
+        first.flush()
+
+        second = TimeSeriesStore(capacity=10, resolution=1, directory=str(tmp_path))
+
+        assert second.sites() == ["edge/1"]
+        assert second.metrics() == ["latency_p95_ms", "success_rate"]
+        assert not second.due("edge/1", 100.5)
+        assert second.query(0, 200, 200, ["avg"], ["latency_p95_ms"])[0]["avg"] == [7.0]
+
+
+class TestRangeEndpoint:
+    """Test /metrics/range on the Flask app."""
+
+    def test_ingest_records_history(self, tmp_path):
+        """Test ingested metrics show up as a downsampled range."""
+        clock = FakeClock()
+        history = TimeSeriesStore(resolution=10, directory=str(tmp_path))
+        client = create_app(MetricsStore(clock=clock), history).test_client()
+        for latency in (10.0, 20.0, 30.0):
+            sample = {"latency_ms": latency, "success": True}
+            client.post("/ingest", json={"site": "edge1", "samples": [sample]})
+            clock.now += 10
+
+        response = client.get(
+            f"/metrics/range?start={clock.now - 60}&end={clock.now}&step=60"
+            "&metric=latency_p95_ms&agg=min,max,count"
+        )
+        data = response.get_json()
+
+        assert response.status_code == 200
+        series = data["series"][0]
+        assert series["site"] == "edge1"
+        assert series["count"] == [3]
+        assert series["min"] == [pytest.approx(10.0, rel=0.01)]
+        # Lower-rank p95 over the window samples [10, 20, 30]
+        assert series["max"] == [pytest.approx(20.0, rel=0.01)]
+
+    def test_rfc3339_and_bad_parameters(self):
+        app = create_app(MetricsStore(clock=FakeClock()), TimeSeriesStore())
+        client = app.test_client()
+
+        ok = client.get(
+            "/metrics/range?start=2025-01-01T00:00:00Z&end=2025-01-01T01:00:00Z"
+        )
+        assert ok.status_code == 200
+        assert ok.get_json()["start"] == 1735689600.0
+        assert client.get("/metrics/range?step=0").status_code == 400
+        assert client.get("/metrics/range?agg=mode").status_code == 400
+        assert client.get("/metrics/range?start=yesterday").status_code == 400
+        for bound in ("end=inf", "start=nan", "start=-1e308&end=1e308", "step=inf"):
+            assert client.get(f"/metrics/range?{bound}").status_code == 400
@@ -0,0 +1,304 @@
+"""
+Metric history for the job-query-adapter.
+
+Each (site, metric) series is a fixed-capacity ring buffer of timestamps and
+values held in NumPy arrays. With a directory configured the arrays are
+memory-mapped files, so recent history survives adapter restarts. Range
+queries downsample a series into fixed steps with vectorized
+min/max/avg/percentile aggregation.
+"""
+
+import math
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote, unquote
+
+import numpy as np
+
+AGGREGATIONS = ("avg", "min", "max", "count")
+_PERCENTILE = re.compile(r"^p(\d{1,2}(?:\.\d+)?)$")
+
+# Refuse range queries producing more points than this per series
+MAX_POINTS = 11000
+
+_SUFFIX = ".ring"
+_SITE_PREFIX = "site-"
+_METRIC_NAME = re.compile(r"^\w+$")
+
+
+def validate_aggregation(name: str) -> None:
+    """Raise ValueError unless name is avg, min, max, count or pNN."""
+    if name not in AGGREGATIONS and not _PERCENTILE.match(name):
+        raise ValueError(
+            f"Unknown aggregation '{name}' (expected avg, min, max, count or pNN)"
+        )
+
+
+class RingSeries:
+    """Fixed-capacity ring buffer of (timestamp, value) points.
+
+    Storage is a (2, capacity) float64 array, timestamps in row 0 and values
+    in row 1, with NaN timestamps marking unused slots. Points are expected
+    in time order; the write position is recovered from the newest timestamp
+    when a persisted file is reopened.
+    """
+
+    def __init__(self, capacity: int, path: Optional[str] = None):
+        """
+        Initialize series.
+
+        Args:
+            capacity: Number of points kept
+            path: Memory-mapped backing file (None keeps the series in memory)
+
+        Raises:
+            ValueError: If an existing file has a different capacity
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self.path = path
+        if path is None:
+            self.data = np.full((2, capacity), np.nan)
+        elif os.path.exists(path):
+            expected = 2 * capacity * 8
+            if os.path.getsize(path) != expected:
+                raise ValueError(
+                    f"History file {path} does not match capacity {capacity}"
+                )
+            self.data = np.memmap(path, np.float64, "r+", shape=(2, capacity))
+        else:
+            self.data = np.memmap(path, np.float64, "w+", shape=(2, capacity))
+            self.data[:] = np.nan
+
+        timestamps = self.data[0]
+        used = ~np.isnan(timestamps)
+        self.size = int(used.sum())
+        self.head = int(np.nanargmax(timestamps) + 1) % capacity if self.size else 0
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a point, overwriting the oldest one when full."""
+        self.data[0, self.head] = timestamp
+        self.data[1, self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def last_timestamp(self) -> Optional[float]:
+        """Timestamp of the newest point."""
+        if not self.size:
+            return None
+        return float(self.data[0, (self.head - 1) % self.capacity])
+
+    def points(self, start: float, end: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamps and values with start <= t < end (unordered)."""
+        timestamps = self.data[0]
+        mask = (timestamps >= start) & (timestamps < end)
+        return np.asarray(timestamps[mask]), np.asarray(self.data[1][mask])
+
+    def flush(self) -> None:
+        """Write a memory-mapped series to disk."""
+        if isinstance(self.data, np.memmap):
+            self.data.flush()
+
+
+def downsample(
+    timestamps: np.ndarray,
+    values: np.ndarray,
+    start: float,
+    end: float,
+    step: float,
+    aggregations: Iterable[str],
+) -> Dict[str, np.ndarray]:
+    """
+    Aggregate points into fixed steps [start + i*step, start + (i+1)*step).
+
+    All aggregations are computed for every step at once: points are sorted
+    by (step, value) and each step is a contiguous group, so min/max/pNN are
+    index lookups and avg a weighted bincount. Steps without points are NaN
+    (count is 0).
+
+    Returns:
+        Dict of aggregation name -> array with one entry per step
+    """
+    steps = math.ceil((end - start) / step)
+    index = ((timestamps - start) // step).astype(np.int64)
+    order = np.lexsort((values, index))
+    index, values = index[order], values[order]
+    counts = np.bincount(index, minlength=steps)
+    first = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    present = counts > 0
+
+    result: Dict[str, np.ndarray] = {}
+    for name in aggregations:
+        validate_aggregation(name)
+        out = np.full(steps, np.nan)
+        if name == "count":
+            result[name] = counts.astype(np.float64)
+            continue
+        if name == "avg":
+            sums = np.bincount(index, weights=values, minlength=steps)
+            out[present] = sums[present] / counts[present]
+        elif name == "min":
+            out[present] = values[first[present]]
+        elif name == "max":
+            out[present] = values[first[present] + counts[present] - 1]
+        else:
+            q = float(_PERCENTILE.match(name).group(1)) / 100
+            position = first[present] + q * (counts[present] - 1)
+            low = np.floor(position).astype(np.int64)
+            high = np.ceil(position).astype(np.int64)
+            fraction = position - low
+            out[present] = values[low] * (1 - fraction) + values[high] * fraction
+        result[name] = out
+    return result
+
+
+class TimeSeriesStore:
+    """Ring-buffer series per (site, metric), optionally persisted."""
+
+    def __init__(
+        self,
+        capacity: int = 8640,
+        resolution: float = 10.0,
+        directory: Optional[str] = None,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            capacity: Points kept per series
+            resolution: Minimum seconds between recorded points of a site
+            directory: Directory for memory-mapped series files (None: memory)
+        """
+        self.capacity = capacity
+        self.resolution = resolution
+        self.directory = directory
+        self._series: Dict[Tuple[str, str], RingSeries] = {}
+        self._last_recorded: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            for site_dir in sorted(os.listdir(directory)):
+                if not site_dir.startswith(_SITE_PREFIX):
+                    continue
+                site = unquote(site_dir[len(_SITE_PREFIX) :])
+                for name in sorted(os.listdir(os.path.join(directory, site_dir))):
+                    if name.endswith(_SUFFIX):
+                        self._open(site, name[: -len(_SUFFIX)])
+            for (site, _), series in self._series.items():
+                last = series.last_timestamp()
+                if last is not None:
+                    self._last_recorded[site] = max(
+                        self._last_recorded.get(site, last), last
+                    )
+
+    def _open(self, site: str, metric: str) -> RingSeries:
+        series = self._series.get((site, metric))
+        if series is None:
+            path = None
+            if self.directory:
+                site_dir = os.path.join(
+                    self.directory, _SITE_PREFIX + quote(site, safe="")
+                )
+                os.makedirs(site_dir, exist_ok=True)
+                path = os.path.join(site_dir, metric + _SUFFIX)
+            series = self._series[(site, metric)] = RingSeries(self.capacity, path)
+        return series
+
+    def due(self, site: str, now: float) -> bool:
+        """Whether a new point for the site would respect the resolution."""
+        last = self._last_recorded.get(site)
+        return last is None or now - last >= self.resolution
+
+    def record(self, site: str, timestamp: float, metrics: Dict[str, float]) -> bool:
+        """
+        Record metric values of a site, at most once per resolution.
+
+        Returns:
+            Whether the point was recorded
+        """
+        for metric in metrics:
+            if not _METRIC_NAME.match(metric):
+                raise ValueError(f"Invalid metric name '{metric}'")
+        with self._lock:
+            if not self.due(site, timestamp):
+                return False
+            for metric, value in metrics.items():
+                self._open(site, metric).append(timestamp, float(value))
+            self._last_recorded[site] = timestamp
+            return True
+
+    def sites(self) -> List[str]:
+        """Sites with recorded series."""
+        return sorted({site for site, _ in self._series})
+
+    def metrics(self) -> List[str]:
+        """Metric names with recorded series."""
+        return sorted({metric for _, metric in self._series})
+
+    def query(
+        self,
+        start: float,
+        end: float,
+        step: float,
+        aggregations: Iterable[str] = ("avg",),
+        metrics: Optional[Iterable[str]] = None,
+        sites: Optional[Iterable[str]] = None,
+    ) -> List[Dict]:
+        """
+        Downsampled series in [start, end) for the selected metrics and sites.
+
+        Returns:
+            One dict per series with site, metric, timestamps (step starts)
+            and one list per aggregation (None for empty steps)
+
+        Raises:
+            ValueError: For non-finite bounds, an empty range, a non-positive
+                step, too many points or an unknown aggregation
+        """
+        if not all(map(math.isfinite, (start, end, step))):
+            raise ValueError("Range start, end and step must be finite")
+        if step <= 0 or end <= start:
+            raise ValueError("Range needs start < end and a positive step")
+        # Compared before rounding: the quotient overflows to inf for extreme spans
+        if (end - start) / step > MAX_POINTS:
+            raise ValueError(f"Range exceeds the maximum of {MAX_POINTS} points")
+        steps = math.ceil((end - start) / step)
+        aggregations = list(aggregations)
+        for name in aggregations:
+            validate_aggregation(name)
+
+        bucket_starts = (start + step * np.arange(steps)).tolist()
+        metrics = set(metrics) if metrics else None
+        sites = set(sites) if sites else None
+        result = []
+        with self._lock:
+            selected = [
+                (key, series)
+                for key, series in sorted(self._series.items())
+                if (sites is None or key[0] in sites)
+                and (metrics is None or key[1] in metrics)
+            ]
+            points = [(key, series.points(start, end)) for key, series in selected]
+        for (site, metric), (timestamps, values) in points:
+            aggregated = downsample(
+                timestamps, values, start, end, step, aggregations
+            )
+            entry = {"site": site, "metric": metric, "timestamps": bucket_starts}
+            for name, column in aggregated.items():
+                if name == "count":
+                    entry[name] = column.astype(np.int64).tolist()
+                else:
+                    entry[name] = [
+                        None if math.isnan(v) else v for v in column.tolist()
+                    ]
+            result.append(entry)
+        return result
+
+    def flush(self) -> None:
+        """Write memory-mapped series to disk."""
+        with self._lock:
+            for series in self._series.values():
+                series.flush()
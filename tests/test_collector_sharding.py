@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for consistent-hash sharding of edge sites across metrics collectors
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+pytest.importorskip("prometheus_client")
+import monitoring_metrics_collector
+from monitoring_metrics_collector import GITOPS_SHARD_KEY, HashRing, MetricsCollector
+
+
+SITES = [f"edge{i}" for i in range(1000)]
+
+
+class TestHashRing(unittest.TestCase):
+    """Test site ownership on the ring"""
+
+    def test_balanced_partition(self):
+        """Test every site has one owner and shares are roughly equal"""
+        members = [f"10.0.0.{i}:8000" for i in range(5)]
+        ring = HashRing(members)
+        counts = {member: 0 for member in members}
+        for site in SITES:
+            counts[ring.owner(site)] += 1
+
+        self.assertEqual(sum(counts.values()), len(SITES))
+        for count in counts.values():
+            self.assertLess(abs(count - 200), 60)
+
+    def test_membership_change_moves_only_affected_sites(self):
+        """Test a joining member takes about 1/N of the sites and moves no others"""
+        before = HashRing(["a:8000", "b:8000", "c:8000"])
+        after = HashRing(["a:8000", "b:8000", "c:8000", "d:8000"])
+
+        moved = [site for site in SITES if before.owner(site) != after.owner(site)]
+
+        self.assertTrue(all(after.owner(site) == "d:8000" for site in moved))
+        self.assertLess(len(moved), len(SITES) * 0.35)
+        self.assertEqual(HashRing([]).owner("edge1"), None)
+
+
+class TestCollectorShard(unittest.TestCase):
+    """Test MetricsCollector shard selection and config reload"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config_file = os.path.join(self.tmp.name, "monitoring-config.yaml")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_config(self, sites, instance_id, peers=(), mtime=None):
+        config = {
+            "edge_sites": {site: {"ip": "127.0.0.1", "slo_port": 1, "o2ims_port": 2} for site in sites},
+            "gitops": {"repositories": [], "use_informer": False},
+            "sharding": {"instance_id": instance_id, "peers": list(peers)},
+        }
+        with open(self.config_file, "w") as f:
+            yaml.safe_dump(config, f)
+        if mtime is not None:
+            os.utime(self.config_file, (mtime, mtime))
+
+    def test_unreachable_peers_leave_all_sites_to_self(self):
+        self.write_config(SITES[:50], "127.0.0.1:8000", peers=["127.0.0.1:1"])
+        collector = MetricsCollector(self.config_file)
+
+        owned = asyncio.run(collector.update_shard(0.5))
+
+        self.assertEqual(owned, set(SITES[:50]))
+        self.assertEqual(collector.ring.owner(GITOPS_SHARD_KEY), "127.0.0.1:8000")
+
+    def test_lost_shard_stops_exporting_its_gauges(self):
+        """Test moved sites and a moved GitOps key drop their series from this instance"""
+        self.write_config(SITES[:50], "self:8000")
+        collector = MetricsCollector(self.config_file)
+        peer = next(
+            f"peer{i}:8000" for i in range(100)
+            if HashRing(["self:8000", f"peer{i}:8000"]).owner(GITOPS_SHARD_KEY) != "self:8000"
+        )
+        metrics = monitoring_metrics_collector
+
+        def exported(gauge, label):
+            return {sample.labels[label] for sample in gauge.collect()[0].samples}
+
+        with mock.patch.object(collector, "discover_peers", mock.AsyncMock(return_value=["self:8000"])):
+            asyncio.run(collector.update_shard(0.5))
+        for site in SITES[:50]:
+            metrics.edge_site_up.labels(site=site).set(1)
+        metrics.gitops_sync_status.labels(repository="edge-gitops").set(1)
+
+        with mock.patch.object(collector, "discover_peers", mock.AsyncMock(return_value=sorted([peer, "self:8000"]))):
+            owned = asyncio.run(collector.update_shard(0.5))
+
+        self.assertFalse(collector.owns_gitops)
+        self.assertEqual(exported(metrics.edge_site_up, "site") & set(SITES[:50]), owned)
+        self.assertEqual(exported(metrics.gitops_sync_status, "repository"), set())
+
+    def test_loopback_hostname_resolves_to_outbound_address(self):
+        """Test a hostname mapped to 127.0.1.1 neither becomes the id nor a phantom peer"""
+        self.write_config(SITES[:50], None, peers=["10.0.0.5:8000", "127.0.1.1:8000", "10.0.0.6:8000"])
+        opened = []
+
+        async def open_connection(host, port):
+            opened.append(f"{host}:{port}")
+            writer = mock.Mock()
+            writer.wait_closed = mock.AsyncMock()
+            return None, writer
+
+        with mock.patch.dict(os.environ, {}, clear=False), \
+                mock.patch.object(monitoring_metrics_collector.socket, "gethostname", return_value="node1"), \
+                mock.patch.object(monitoring_metrics_collector.socket, "gethostbyname", return_value="127.0.1.1"), \
+                mock.patch.object(monitoring_metrics_collector.socket, "getaddrinfo",
+                                  return_value=[(None, None, None, "", ("127.0.1.1", 0))]), \
+                mock.patch.object(monitoring_metrics_collector, "outbound_address", return_value="10.0.0.5"), \
+                mock.patch.object(monitoring_metrics_collector.asyncio, "open_connection", open_connection):
+            os.environ.pop("POD_IP", None)
+            os.environ.pop("COLLECTOR_INSTANCE_ID", None)
+            collector = MetricsCollector(self.config_file)
+            members = asyncio.run(collector.discover_peers(0.5))
+
+        self.assertEqual(collector.instance_id, "10.0.0.5:8000")
+        self.assertEqual(members, ["10.0.0.5:8000", "10.0.0.6:8000"])
+        self.assertEqual(opened, ["10.0.0.6:8000"])
+
+    def test_reload_on_change_keeps_config_when_invalid(self):
+        self.write_config(SITES[:5], "self:8000", mtime=1000)
+        collector = MetricsCollector(self.config_file)
+        self.assertFalse(collector.reload_config())
+
+        self.write_config(SITES[:8], "self:8000", mtime=2000)
+        self.assertTrue(collector.reload_config())
+        self.assertEqual(len(collector.edge_sites), 8)
+
+        with open(self.config_file, "w") as f:
+            f.write("edge_sites: [")
+        os.utime(self.config_file, (3000, 3000))
+        self.assertFalse(collector.reload_config())
+        self.assertEqual(len(collector.edge_sites), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Tests for the list+watch informer cache against a local fake API server
+"""
+
+import json
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from k8s_informer import (
+    EXIT_READY,
+    EXIT_TIMEOUT,
+    EXIT_UNAVAILABLE,
+    PROVISIONINGREQUEST,
+    RESOURCEGROUP,
+    ROOTSYNC,
+    Informer,
+    KubeApi,
+    ResourceVersionExpired,
+    resourcegroup_reconciled,
+    wait_command,
+)
+from phase19b_multi_edge_verifier import EdgeVerifier
+
+
+class FakeApiServer:
+    """In-memory API server serving list and watch for custom resources"""
+
+    def __init__(self, history_limit: int = 100):
+        self.objects = {}  # path -> {name: obj}
+        self.events = []  # (resource_version, path, event)
+        self.resource_version = 0
+        self.history_limit = history_limit
+        self.changed = threading.Condition()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _emit(self, event_type, resource, namespace, obj):
+        path = resource.path(namespace)
+        with self.changed:
+            self.resource_version += 1
+            obj = json.loads(json.dumps(obj))
+            obj.setdefault("kind", resource.kind)
+            obj["metadata"]["namespace"] = namespace
+            obj["metadata"]["resourceVersion"] = str(self.resource_version)
+            objects = self.objects.setdefault(path, {})
+            if event_type == "DELETED":
+                objects.pop(obj["metadata"]["name"], None)
+            else:
+                objects[obj["metadata"]["name"]] = obj
+            self.events.append((self.resource_version, path, {"type": event_type, "object": obj}))
+            del self.events[: -self.history_limit]
+            self.changed.notify_all()
+        return obj
+
+    def apply(self, resource, namespace, obj):
+        name = obj["metadata"]["name"]
+        exists = name in self.objects.get(resource.path(namespace), {})
+        return self._emit("MODIFIED" if exists else "ADDED", resource, namespace, obj)
+
+    def delete(self, resource, namespace, name):
+        obj = self.objects[resource.path(namespace)][name]
+        return self._emit("DELETED", resource, namespace, obj)
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def send_json(self, status, body):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                name = None
+                if query.get("fieldSelector", "").startswith("metadata.name="):
+                    name = query["fieldSelector"].split("=", 1)[1]
+
+                def selected(obj):
+                    return name is None or obj["metadata"]["name"] == name
+
+                if query.get("watch") != "true":
+                    with fake.changed:
+                        items = [o for o in fake.objects.get(url.path, {}).values() if selected(o)]
+                        version = str(fake.resource_version)
+                    self.send_json(200, {"items": items, "metadata": {"resourceVersion": version}})
+                    return
+
+                since = int(query["resourceVersion"])
+                deadline = time.monotonic() + float(query.get("timeoutSeconds", 5))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                while time.monotonic() < deadline:
+                    with fake.changed:
+                        oldest = fake.events[0][0] if fake.events else fake.resource_version + 1
+                        if since < oldest - 1:
+                            gone = {"type": "ERROR", "object": {"code": 410, "message": "too old"}}
+                            pending = [gone]
+                        else:
+                            pending = [e for rv, p, e in fake.events
+                                       if rv > since and p == url.path and selected(e["object"])]
+                            since = max(since, fake.resource_version)
+                        if not pending:
+                            fake.changed.wait(deadline - time.monotonic())
+                            continue
+                    for event in pending:
+                        self.wfile.write(json.dumps(event).encode() + b"\n")
+                    self.wfile.flush()
+                    if pending[0]["type"] == "ERROR":
+                        return
+
+        return Handler
+
+
+def rootsync(name, repo, last_update=None):
+    obj = {"metadata": {"name": name}, "spec": {"git": {"repo": repo}}, "status": {}}
+    if last_update:
+        obj["status"]["sync"] = {"lastUpdate": last_update}
+    return obj
+
+
+def resourcegroup(name, generation, observed, stalled="False"):
+    return {
+        "metadata": {"name": name, "generation": generation},
+        "status": {
+            "observedGeneration": observed,
+            "conditions": [{"type": "Stalled", "status": stalled}],
+        },
+    }
+
+
+def wait_until(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.01)
+
+
+class TestInformer(unittest.TestCase):
+    """Test list+watch cache maintenance"""
+
+    def setUp(self):
+        self.server = FakeApiServer()
+        self.api = KubeApi(self.server.url)
+
+    def tearDown(self):
+        self.api.close()
+        self.server.close()
+
+    def test_list_then_watch_events(self):
+        """Test the cache and callbacks follow adds, updates and deletes"""
+        ns = "config-management-system"
+        self.server.apply(ROOTSYNC, ns, rootsync("edge1", "http://gitea/admin1/edge1-config"))
+        self.server.apply(ROOTSYNC, "other", rootsync("edge9", "http://gitea/admin1/edge9-config"))
+
+        events = []
+        informer = Informer(self.api, ROOTSYNC, ns, watch_timeout=1)
+        informer.add_event_handler(lambda t, obj, old: events.append((t, obj["metadata"]["name"])))
+        informer.start()
+        try:
+            self.assertTrue(informer.wait_for_sync(5))
+            self.assertEqual([o["metadata"]["name"] for o in informer.store.list()], ["edge1"])
+
+            self.server.apply(ROOTSYNC, ns, rootsync("edge1", "http://gitea/admin1/edge1-config", "t1"))
+            self.server.apply(ROOTSYNC, ns, rootsync("edge2", "http://gitea/admin1/edge2-config"))
+            self.server.delete(ROOTSYNC, ns, "edge2")
+            wait_until(lambda: len(events) == 4)
+        finally:
+            informer.stop()
+
+        self.assertEqual(
+            events,
+            [("ADDED", "edge1"), ("MODIFIED", "edge1"), ("ADDED", "edge2"), ("DELETED", "edge2")],
+        )
+        cached = informer.store.get("edge1", ns)
+        self.assertEqual(cached["status"]["sync"]["lastUpdate"], "t1")
+        self.assertIsNone(informer.store.get("edge2", ns))
+        self.assertEqual(informer.resource_version, str(self.server.resource_version))
+
+    def test_custom_index(self):
+        """Test objects are found by an index that tracks updates"""
+        informer = Informer(self.api, PROVISIONINGREQUEST, "default")
+        informer.store.add_index("cluster", lambda o: [o.get("spec", {}).get("targetCluster", "")])
+        self.server.apply(PROVISIONINGREQUEST, "default",
+                          {"metadata": {"name": "pr-a"}, "spec": {"targetCluster": "edge1"}})
+        informer.relist()
+        self.assertEqual(len(informer.store.by_index("cluster", "edge1")), 1)
+
+        self.server.apply(PROVISIONINGREQUEST, "default",
+                          {"metadata": {"name": "pr-a"}, "spec": {"targetCluster": "edge2"}})
+        informer.relist()
+        self.assertEqual(informer.store.by_index("cluster", "edge1"), [])
+        self.assertEqual(len(informer.store.by_index("cluster", "edge2")), 1)
+
+    def test_expired_watch_relists_and_reports_missed_changes(self):
+        """Test a 410 on watch leads to a relist that emits the differences"""
+        self.server.history_limit = 2
+        ns = "config-management-system"
+        for name in ("a", "b"):
+            self.server.apply(ROOTSYNC, ns, rootsync(name, f"http://gitea/{name}"))
+
+        informer = Informer(self.api, ROOTSYNC, ns, watch_timeout=1)
+        informer.relist()
+        self.server.delete(ROOTSYNC, ns, "a")
+        self.server.apply(ROOTSYNC, ns, rootsync("b", "http://gitea/b", "t2"))
+        self.server.apply(ROOTSYNC, ns, rootsync("c", "http://gitea/c"))
+
+        with self.assertRaises(ResourceVersionExpired):
+            informer.watch_once()
+
+        events = []
+        informer.add_event_handler(lambda t, obj, old: events.append((t, obj["metadata"]["name"])))
+        informer.relist()
+        self.assertEqual(sorted(events), [("ADDED", "c"), ("DELETED", "a"), ("MODIFIED", "b")])
+
+    def test_wait_for_predicate(self):
+        """Test waiting blocks until an update satisfies the predicate"""
+        ns = "config-management-system"
+        self.server.apply(RESOURCEGROUP, ns, resourcegroup("root-sync", 2, 1))
+        informer = Informer(self.api, RESOURCEGROUP, ns, watch_timeout=1).start()
+        try:
+            informer.wait_for_sync(5)
+            reconciled = lambda store: resourcegroup_reconciled(store.get("root-sync", ns) or {})
+            self.assertIsNone(informer.store.wait_for(reconciled, timeout=0.1))
+
+            threading.Timer(0.1, self.server.apply,
+                            (RESOURCEGROUP, ns, resourcegroup("root-sync", 2, 2))).start()
+            self.assertTrue(informer.store.wait_for(reconciled, timeout=5))
+        finally:
+            informer.stop()
+
+
+class TestWaitCommand(unittest.TestCase):
+    """Test the wait command used by postcheck.sh"""
+
+    def setUp(self):
+        self.server = FakeApiServer()
+        self.api = KubeApi(self.server.url, timeout=1)
+
+    def tearDown(self):
+        self.api.close()
+        self.server.close()
+
+    def test_ready_writes_status(self):
+        import tempfile
+
+        ns = "config-management-system"
+        self.server.apply(RESOURCEGROUP, ns, resourcegroup("intent-to-o2-rootsync", 3, 2))
+        self.server.apply(RESOURCEGROUP, ns, resourcegroup("unrelated", 1, 1))
+        threading.Timer(0.2, self.server.apply,
+                        (RESOURCEGROUP, ns, resourcegroup("intent-to-o2-rootsync", 3, 3))).start()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output = str(Path(tmp) / "rootsync-status.json")
+            code = wait_command(self.api, "resourcegroup", "intent-to-o2-rootsync", ns, 5, output)
+            status = json.loads(Path(output).read_text())
+
+        self.assertEqual(code, EXIT_READY)
+        self.assertEqual(status["status"]["observedGeneration"], 3)
+
+    def test_timeout_and_unavailable(self):
+        ns = "config-management-system"
+        self.server.apply(RESOURCEGROUP, ns, resourcegroup("stalled", 1, 1, stalled="True"))
+        self.assertEqual(wait_command(self.api, "resourcegroup", "stalled", ns, 0.3), EXIT_TIMEOUT)
+
+        unreachable = KubeApi("http://127.0.0.1:1", timeout=0.2)
+        self.assertEqual(wait_command(unreachable, "resourcegroup", "stalled", ns, 0.5), EXIT_UNAVAILABLE)
+
+
+class TestVerifierWithInformer(unittest.TestCase):
+    """Test EdgeVerifier reads ProvisioningRequests from the informer cache"""
+
+    def test_check_pr_status_from_cache(self):
+        import tempfile
+
+        server = FakeApiServer()
+        api = KubeApi(server.url)
+        server.apply(PROVISIONINGREQUEST, "default", {
+            "metadata": {"name": "intent-edge1-pr"},
+            "status": {"conditions": [{"type": "Ready", "status": "True"}]},
+        })
+        server.apply(PROVISIONINGREQUEST, "default", {
+            "metadata": {"name": "slice-b"},
+            "spec": {"targetCluster": "edge1"},
+            "status": {"phase": "Provisioning"},
+        })
+        informer = Informer(api, PROVISIONINGREQUEST, "default")
+        informer.relist()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            verifier = EdgeVerifier(Path(tmp), pr_informer=informer)
+            result = verifier.check_pr_status("edge1")
+        api.close()
+        server.close()
+
+        self.assertTrue(result["ready"])
+        self.assertEqual(result["total"], 2)
+        self.assertEqual(result["readyCount"], 1)
+        self.assertEqual(
+            {pr["name"]: pr["status"] for pr in result["provisioningRequests"]},
+            {"intent-edge1-pr": "Ready", "slice-b": "Provisioning"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
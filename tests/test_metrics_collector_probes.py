@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent edge probing and the collection schedule of the metrics collector
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+pytest.importorskip("prometheus_client")
+httpx = pytest.importorskip("httpx")
+import monitoring_metrics_collector
+from monitoring_metrics_collector import MetricsCollector
+
+
+class StopCollector(BaseException):
+    """Ends run_async; not an Exception, so the cycle error handler lets it through"""
+
+
+def closed_port() -> int:
+    """A local port nothing listens on"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class CollectorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config_file = os.path.join(self.tmp.name, "monitoring-config.yaml")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def collector(self, sites, **settings):
+        config = {
+            "edge_sites": sites,
+            "gitops": {"repositories": [], "use_informer": False},
+            "sharding": {"instance_id": "self:8000"},
+            **settings,
+        }
+        with open(self.config_file, "w") as f:
+            yaml.safe_dump(config, f)
+        return MetricsCollector(self.config_file)
+
+
+class TestSiteIsolation(CollectorTestCase):
+    """Test one misconfigured site does not abort the cycle for the others"""
+
+    def test_broken_sites_are_recorded_as_down(self):
+        port = closed_port()
+        collector = self.collector({
+            "edge1": {"ip": "127.0.0.1", "slo_port": port, "o2ims_port": port},
+            "missing-port": {"ip": "127.0.0.1", "slo_port": port},
+            "bad-url": {"ip": "bad[host", "slo_port": port, "o2ims_port": port},
+        }, probe_timeout=1)
+
+        async def collect():
+            async with collector.create_client() as client:
+                return await collector.collect_all_metrics(client)
+
+        results = asyncio.run(collect())
+
+        # A refused connection still proves the host is up
+        self.assertEqual(results["edge1"], {"site": True, "slo": False, "o2ims": False})
+        self.assertEqual(results["missing-port"], {"site": False, "slo": False, "o2ims": False})
+        self.assertEqual(results["bad-url"], {"site": False, "slo": False, "o2ims": False})
+        self.assertEqual(
+            monitoring_metrics_collector.edge_site_up.labels(site="missing-port")._value.get(), 0)
+
+
+class TestProbeDeadline(CollectorTestCase):
+    """Test a hanging service is cut off at the probe deadline"""
+
+    def test_silent_service_times_out(self):
+        async def scenario():
+            async def hang(reader, writer):
+                await reader.read()
+                writer.close()
+
+            server = await asyncio.start_server(hang, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            collector = self.collector({"edge1": {"ip": "127.0.0.1", "slo_port": port, "o2ims_port": port}})
+            try:
+                async with httpx.AsyncClient(timeout=30) as client:
+                    start = time.monotonic()
+                    result = await collector.check_site(client, "edge1", collector.edge_sites["edge1"], 0.2)
+                    return result, time.monotonic() - start
+            finally:
+                server.close()
+                await server.wait_closed()
+
+        result, elapsed = asyncio.run(scenario())
+
+        self.assertEqual(result, {"site": True, "slo": False, "o2ims": False})
+        self.assertLess(elapsed, 2)
+
+
+class TestSchedule(CollectorTestCase):
+    """Test cycles start on a fixed cadence offset by jitter"""
+
+    def test_jittered_cadence_and_overrun(self):
+        collector = self.collector({}, collection_interval=10, collection_jitter=0.1)
+        clock = SimpleNamespace(now=100.0)
+        durations = iter([1.0, 15.0])
+        starts = []
+
+        async def fake_sleep(delay):
+            self.assertGreaterEqual(delay, 0)
+            clock.now += delay
+
+        async def fake_collect(client):
+            starts.append(clock.now)
+            duration = next(durations, None)
+            if duration is None:
+                raise StopCollector
+            clock.now += duration
+            if len(starts) == 1:
+                raise RuntimeError("cycle failed")
+
+        collector.collect_all_metrics = fake_collect
+        collector.reload_config = lambda: False
+        with mock.patch.object(monitoring_metrics_collector, "time", SimpleNamespace(monotonic=lambda: clock.now)), \
+                mock.patch.object(asyncio, "sleep", fake_sleep), \
+                mock.patch.object(monitoring_metrics_collector.random, "uniform", side_effect=[0.05, -0.05, 0.05]):
+            with self.assertRaises(StopCollector):
+                asyncio.run(collector.run_async())
+
+        # Initial offset 0.5s; a failed cycle keeps the cadence (110 - 0.5);
+        # the 15s cycle overruns, so the next starts right after it (+0.5)
+        self.assertEqual(starts, [100.5, 109.5, 125.0])
+
+    def test_once_starts_immediately(self):
+        collector = self.collector({})
+        calls = []
+
+        async def fake_collect(client):
+            calls.append(client)
+
+        collector.collect_all_metrics = fake_collect
+        with mock.patch.object(monitoring_metrics_collector.random, "uniform") as uniform:
+            asyncio.run(collector.run_async(once=True))
+
+        self.assertEqual(len(calls), 1)
+        uniform.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the date-partitioned Parquet history of nightly regression metrics
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+pytest.importorskip("pyarrow")
+from metrics_history import HistoryStore, normalize_metrics
+
+
+def night(day, runs=4):
+    """Results file contents for one night of runs"""
+    return {
+        "timestamp": f"2025-09-{day:02d}T03:00:00Z",
+        "metrics": [
+            {
+                "timestamp": f"2025-09-{day:02d}T02:{i:02d}:00Z",
+                "pipeline_id": f"nightly-{day}-{i}",
+                "ci_run": str(100 + day),
+                "site": ["edge1", "edge2"][i % 2],
+                "service_type": "enhanced-mobile-broadband",
+                "metrics": {
+                    "pipeline_success": i != 1,
+                    "total_duration_ms": 1000.0 + day * 10 + i,
+                    "sync_latency_ms": 30.0 + i,
+                    "success_rate": 1.0,
+                },
+            }
+            for i in range(runs)
+        ],
+    }
+
+
+class TestHistoryStore(unittest.TestCase):
+    """Test ingesting results and reading them back by column and date"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        self.store = HistoryStore(self.root / "history")
+
+    def write(self, name, data):
+        path = self.root / name
+        path.write_text(json.dumps(data))
+        return path
+
+    def test_ingest_partitions_by_date_and_is_idempotent(self):
+        """Test each night lands in its date partition and re-ingesting adds nothing"""
+        first = self.write("night1.json", night(1))
+        second = self.write("night2.json", night(2))
+
+        self.assertEqual(self.store.ingest(first), 4)
+        self.assertEqual(self.store.ingest(second), 4)
+        self.assertEqual(self.store.ingest(first), 0)
+
+        self.assertEqual(self.store.dates(), ["2025-09-01", "2025-09-02"])
+        self.assertEqual(len(self.store.read(["timestamp"])), 8)
+
+    def test_round_trip_matches_json_loading(self):
+        """Test stored records read back with the same values and dtypes as normalize_metrics"""
+        data = night(3)
+        self.store.ingest(self.write("night3.json", data))
+
+        expected = normalize_metrics(data["metrics"], ids=True)
+        stored = self.store.read()
+
+        self.assertEqual(list(stored.columns), list(expected.columns))
+        self.assertEqual(stored["site"].dtype.name, "category")
+        self.assertEqual(stored["total_duration_ms"].dtype, expected["total_duration_ms"].dtype)
+        self.assertEqual(stored["pipeline_id"].tolist(), expected["pipeline_id"].tolist())
+        self.assertEqual(stored["timestamp"].tolist(), expected["timestamp"].tolist())
+        self.assertTrue(stored["pipeline_success"].equals(expected["pipeline_success"]))
+
+    def test_read_selects_columns_and_dates(self):
+        """Test only requested columns and dates in range are returned"""
+        for day in (1, 2, 3):
+            self.store.ingest(self.write(f"night{day}.json", night(day)))
+
+        df = self.store.read(["timestamp", "total_duration_ms"], since="2025-09-02", until="2025-09-02")
+
+        self.assertEqual(list(df.columns), ["timestamp", "total_duration_ms"])
+        self.assertEqual(df["timestamp"].dt.day.unique().tolist(), [2])
+        self.assertEqual(len(HistoryStore(self.root / "missing").read(["timestamp"])), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
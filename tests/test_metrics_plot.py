@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Tests for loading, aggregation and cached, per-chart rendering of nightly regression reports
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+pytest.importorskip("matplotlib")
+pytest.importorskip("pandas")
+pytest.importorskip("seaborn")
+import numpy as np
+import pandas as pd
+from matplotlib import cbook
+from metrics_history import normalize_metrics
+from metrics_plot import (DASHBOARD_CHARTS, TREND_CHARTS, MetricsPlotter, box_stats, column_means,
+                          downsample)
+
+
+def nightly_records(count=12):
+    """One night of runs across two sites and two service types"""
+    return [
+        {
+            "timestamp": f"2025-09-01T02:{i * 4:02d}:00Z",
+            "site": ["edge1", "edge2"][i % 2],
+            "service_type": ["enhanced-mobile-broadband", "massive-machine-type"][i // 2 % 2],
+            "metrics": {
+                "pipeline_success": i != 5,
+                "total_duration_ms": 1200.0 + 10 * i,
+                "intent_generation_ms": 40.0 + i,
+                "krm_translation_ms": 120.0 + i,
+                "sync_latency_ms": 30.0 + i % 4,
+                "pr_ready_time_ms": 800.0 + 5 * i,
+                "stages_total": 7,
+                "stages_completed": 7 if i != 5 else 3,
+                "stages_failed": 0 if i != 5 else 1,
+                "success_rate": 1.0 if i != 5 else 0.43,
+                "postcheck_pass": i != 5,
+            },
+        }
+        for i in range(count)
+    ]
+
+
+class TestAggregations(unittest.TestCase):
+    """Test the aggregations behind the charts against plain NumPy and matplotlib"""
+
+    def test_column_means_skip_nan_in_float64(self):
+        df = pd.DataFrame({
+            "a": np.array([0.1, np.nan, 0.2, 0.3], dtype="float32"),
+            "b": np.full(4, np.nan, dtype="float32"),
+        })
+
+        with np.errstate(all="ignore"), pytest.warns(RuntimeWarning):
+            means = column_means(df, ["a", "b"])
+
+        self.assertEqual(means["a"], np.mean(df["a"].dropna().to_numpy(dtype="float64")))
+        self.assertTrue(np.isnan(means["b"]))
+
+    def test_downsample_keeps_short_frames(self):
+        frame = pd.DataFrame({"x": [3.0, 1.0, 2.0]}, index=[7, 8, 9])
+
+        result = downsample(frame, ["x"], max_points=3)
+
+        self.assertEqual(result["x"].tolist(), [3.0, 1.0, 2.0])
+        self.assertEqual(result.index.tolist(), [0, 1, 2])
+
+    def test_downsample_averages_consecutive_rows(self):
+        timestamps = pd.date_range("2025-09-01", periods=10, freq="min", tz="UTC")
+        frame = pd.DataFrame({"timestamp": timestamps, "x": np.arange(10, dtype="float32")})
+
+        result = downsample(frame, ["timestamp", "x"], max_points=4)
+
+        # Buckets of 3, 2, 3 and 2 rows
+        self.assertEqual(result["x"].tolist(), [1.0, 3.5, 6.0, 8.5])
+        self.assertEqual(result["timestamp"].iloc[0], timestamps[1])
+        self.assertEqual(len(downsample(frame, ["x"], max_points=7)), 7)
+
+    def test_box_stats_match_matplotlib(self):
+        rng = np.random.default_rng(3)
+        values = np.concatenate([rng.normal(100, 10, 200), [400.0, -150.0], rng.normal(50, 5, 50)])
+        sites = pd.Categorical(["edge1"] * 202 + ["edge2"] * 50)
+        df = pd.DataFrame({"site": sites, "pr_ready_time_ms": values})
+
+        stats = box_stats(df, "site", "pr_ready_time_ms")
+
+        self.assertEqual([s["label"] for s in stats], ["edge1", "edge2"])
+        for site, computed in zip(["edge1", "edge2"], stats):
+            expected = cbook.boxplot_stats(df.loc[df["site"] == site, "pr_ready_time_ms"].to_numpy())[0]
+            for key in ("q1", "med", "q3", "whislo", "whishi"):
+                self.assertAlmostEqual(computed[key], expected[key], places=9, msg=f"{site} {key}")
+            self.assertEqual(computed["fliers"], [])
+
+
+class TestLoader(unittest.TestCase):
+    """Test records are flattened into typed columns and filtered by run date"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.input = Path(self.tmp.name) / "metrics.json"
+
+    def test_normalize_types_across_chunks(self):
+        records = nightly_records(5)
+        del records[1]["metrics"]["sync_latency_ms"]
+        del records[2]["metrics"]["postcheck_pass"]
+        records[3]["metrics"]["success_rate"] = "n/a"
+
+        df = normalize_metrics(records, chunk_size=2)
+
+        self.assertEqual(str(df["timestamp"].dt.tz), "UTC")
+        self.assertEqual(df["site"].dtype, "category")
+        self.assertEqual(df["site"].cat.categories.tolist(), ["edge1", "edge2"])
+        self.assertEqual(df["service_type"].dtype, "category")
+        self.assertEqual(df["total_duration_ms"].dtype, np.float32)
+        self.assertEqual(df["postcheck_pass"].tolist(), [True, True, False, True, True])
+        self.assertTrue(np.isnan(df["sync_latency_ms"][1]))
+        self.assertTrue(np.isnan(df["success_rate"][3]))
+        self.assertEqual(len(normalize_metrics([])), 0)
+
+    def load(self, data, **kwargs):
+        self.input.write_text(json.dumps(data))
+        plotter = MetricsPlotter(self.input, Path(self.tmp.name) / "report", jobs=1, **kwargs)
+        return plotter, plotter.load_data()
+
+    def test_since_until_keep_inclusive_dates(self):
+        records = nightly_records(3)
+        for record, day in zip(records, ["2025-08-31", "2025-09-01", "2025-09-02"]):
+            record["timestamp"] = f"{day}T23:59:59Z"
+
+        plotter, loaded = self.load({"metrics": records, "run": 7}, since="2025-09-01", until="2025-09-02")
+
+        self.assertTrue(loaded)
+        self.assertEqual(plotter.df["timestamp"].dt.day.tolist(), [1, 2])
+        self.assertEqual(plotter.df.index.tolist(), [0, 1])
+        self.assertEqual(plotter.data, {"run": 7})
+
+    def test_missing_metrics_key_fails(self):
+        _, loaded = self.load({"results": []})
+
+        self.assertFalse(loaded)
+
+
+class TestChartCache(unittest.TestCase):
+    """Test charts are only redrawn when their data slice changes"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.input = Path(self.tmp.name) / "metrics.json"
+        self.output = Path(self.tmp.name) / "report"
+
+    def render(self, records, **kwargs):
+        self.input.write_text(json.dumps({"metrics": records}))
+        plotter = MetricsPlotter(self.input, self.output, jobs=1, **kwargs)
+        self.assertTrue(plotter.load_data())
+        plotter.render_charts()
+        self.assertIsNotNone(plotter.create_performance_dashboard())
+        self.assertIsNotNone(plotter.create_kpi_trends())
+        return plotter
+
+    def test_unchanged_data_reuses_every_chart(self):
+        """Test a second run draws nothing and keeps one image per chart"""
+        first = self.render(nightly_records())
+        second = self.render(nightly_records())
+
+        self.assertEqual(set(first.redrawn), set(DASHBOARD_CHARTS) | set(TREND_CHARTS))
+        self.assertEqual(second.redrawn, [])
+        self.assertEqual(len(list((self.output / "charts").glob("*.png"))), len(second.charts))
+        self.assertTrue((self.output / "performance_dashboard.png").exists())
+        self.assertTrue((self.output / "kpi_trends.png").exists())
+
+    def test_changed_field_redraws_only_its_charts(self):
+        """Test a PR ready time change redraws the two PR charts and prunes their old images"""
+        self.render(nightly_records())
+        records = nightly_records()
+        records[3]["metrics"]["pr_ready_time_ms"] += 400
+        plotter = self.render(records)
+
+        self.assertEqual(sorted(plotter.redrawn), ["pr_ready_by_site", "pr_ready_trend"])
+        self.assertEqual(len(list((self.output / "charts").glob("pr_ready_trend-*.png"))), 1)
+
+    def test_force_redraws(self):
+        self.render(nightly_records())
+        plotter = self.render(nightly_records(), force=True)
+
+        self.assertEqual(len(plotter.redrawn), len(DASHBOARD_CHARTS) + len(TREND_CHARTS))
+
+
+if __name__ == "__main__":
+    unittest.main()
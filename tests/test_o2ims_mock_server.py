@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Tests for the O2IMS mock server inventory, lifecycle, watch and fault injection
+
+The server module is loaded from mock-services/o2ims-mock-server.py and
+exercised through FastAPI's TestClient; the lifecycle simulator and the
+event log are driven directly.
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+from fastapi.testclient import TestClient
+
+MODULE_PATH = Path(__file__).parent.parent / "mock-services" / "o2ims-mock-server.py"
+
+# The default edge1-4 inventory, whatever the calling environment selects
+os.environ.pop("O2IMS_SYNTHETIC_SITES", None)
+os.environ.pop("O2IMS_FAULT_PROFILE", None)
+_spec = importlib.util.spec_from_file_location("o2ims_mock_server", MODULE_PATH)
+server = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(server)
+
+BASE = "/o2ims_infrastructureInventory/v1"
+PROVISIONING = server.InventoryStore.PROVISIONING_REQUESTS
+
+
+@pytest.fixture
+def client():
+    # Not entered as a context manager: the lifecycle task stays off and
+    # tests advance the simulator themselves
+    return TestClient(server.app)
+
+
+@pytest.fixture
+def faults():
+    """Restore the app's fault profile after a test replaces it"""
+    original = server.faults
+    yield
+    server.faults = original
+
+
+def edge1_manager():
+    return str(server.mock_data.deployment_manager_ids["edge1"])
+
+
+def walk(client, url, **params):
+    """Ids of all pages of a list endpoint, following X-Next-Cursor"""
+    ids, pages = [], 0
+    response = client.get(url, params=params)
+    while True:
+        assert response.status_code == 200
+        ids += [item["resource_pool_id"] for item in response.json()]
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return ids, pages
+        response = client.get(url, params={**params, "cursor": cursor})
+
+
+class TestIndexedStore:
+    """Test lists and lookups served from the precomputed store"""
+
+    def test_filtered_list_follows_the_index(self, client):
+        pools = client.get(f"{BASE}/resourcePools", params={"resource_pool_type": "COMPUTE"}).json()
+
+        assert pools
+        assert {pool["resource_pool_type"] for pool in pools} == {"COMPUTE"}
+        assert [pool["resource_pool_id"] for pool in pools] == server.inventory.ids(
+            server.InventoryStore.RESOURCE_POOLS, {"resource_pool_type": "compute"}
+        )
+
+    def test_get_by_id(self, client):
+        pool_id = server.inventory.ids(server.InventoryStore.RESOURCE_POOLS)[0]
+
+        assert client.get(f"{BASE}/resourcePools/{pool_id}").json()["resource_pool_id"] == pool_id
+        assert client.get(f"{BASE}/resourcePools/unknown").status_code == 404
+
+    def test_changes_invalidate_cached_lists(self):
+        store = server.InventoryStore.from_generator(server.MockDataGenerator())
+        before, _ = store.page(server.InventoryStore.RESOURCE_POOLS)
+        pool_id = store.ids(server.InventoryStore.RESOURCE_POOLS)[0]
+
+        store.delete(server.InventoryStore.RESOURCE_POOLS, pool_id)
+        after, _ = store.page(server.InventoryStore.RESOURCE_POOLS)
+
+        assert len(json.loads(after)) == len(json.loads(before)) - 1
+        assert pool_id not in store.ids(server.InventoryStore.RESOURCE_POOLS)
+
+
+class TestCursorPagination:
+    """Test cursor round trips on the indexed and the synthetic inventory"""
+
+    def test_cursor_walk_returns_every_object_once(self, client):
+        everything = [pool["resource_pool_id"] for pool in client.get(f"{BASE}/resourcePools").json()]
+
+        ids, pages = walk(client, f"{BASE}/resourcePools", limit=5)
+
+        assert ids == everything
+        assert pages == -(-len(everything) // 5)
+
+    def test_cursor_of_another_query_is_rejected(self, client):
+        first = client.get(f"{BASE}/resourcePools", params={"limit": 2, "resource_pool_type": "COMPUTE"})
+        cursor = first.headers["X-Next-Cursor"]
+
+        other = client.get(f"{BASE}/resourcePools", params={"limit": 2, "cursor": cursor})
+        garbage = client.get(f"{BASE}/resourcePools", params={"cursor": "not-a-cursor"})
+
+        assert other.status_code == 400
+        assert "does not belong" in other.json()["error"]["title"]
+        assert garbage.status_code == 400
+
+    def test_synthetic_inventory_round_trip(self):
+        inventory = server.SyntheticInventory(sites=120, seed=7)
+        filters = {"resource_pool_type": "STORAGE"}
+        expected = inventory.ids(server.InventoryStore.RESOURCE_POOLS, filters)
+
+        ids, cursor = [], None
+        while True:
+            body, cursor = inventory.page(server.InventoryStore.RESOURCE_POOLS, filters, limit=17, cursor=cursor)
+            ids += [pool["resource_pool_id"] for pool in json.loads(body)]
+            if cursor is None:
+                break
+
+        assert ids == expected
+        _, cursor = inventory.page(server.InventoryStore.RESOURCE_POOLS, filters, limit=17)
+        with pytest.raises(ValueError, match="does not belong"):
+            inventory.page(server.InventoryStore.RESOURCE_POOLS, None, limit=17, cursor=cursor)
+
+
+class TestLifecycleCapacity:
+    """Test capacity accounting of the provisioning lifecycle"""
+
+    @pytest.fixture
+    def lifecycle(self):
+        store = server.InventoryStore.from_generator(server.MockDataGenerator())
+        simulator = server.ProvisioningSimulator(
+            store,
+            server.LatencyDistribution("fixed:1"),
+            server.LatencyDistribution("fixed:2"),
+            failure_rate=0,
+            clock=lambda: 0.0,
+        )
+        simulator.adopt()
+        manager_id = store.ids(server.InventoryStore.DEPLOYMENT_MANAGERS)[0]
+        return store, simulator, manager_id
+
+    @staticmethod
+    def create(simulator, manager_id, cpu):
+        spec = server.ProvisioningRequestCreate(name=f"cpu-{cpu}", requested_capacity={"cpu_cores": cpu})
+        return str(simulator.create(manager_id, spec).infrastructure_request_id)
+
+    def test_allocation_follows_transitions(self, lifecycle):
+        store, simulator, manager_id = lifecycle
+        # Seeded: COMPLETED holds 16 cores, IN_PROGRESS 6 of 8, PENDING none of 4
+        assert simulator.capacity(manager_id)["allocated"]["cpu_cores"] == 22
+
+        request_id = self.create(simulator, manager_id, 10)
+        simulator.advance(1)
+        assert store.get(PROVISIONING, request_id).request_status == "IN_PROGRESS"
+        assert simulator.capacity(manager_id)["allocated"]["cpu_cores"] == 22 + 4 + 10
+
+        simulator.advance(3)
+        assert store.get(PROVISIONING, request_id).request_status == "COMPLETED"
+        assert simulator.capacity(manager_id)["allocated"]["cpu_cores"] == 16 + 8 + 4 + 10
+
+        simulator.delete(request_id)
+        assert simulator.capacity(manager_id)["allocated"]["cpu_cores"] == 16 + 8 + 4
+
+    def test_request_beyond_capacity_fails(self, lifecycle):
+        store, simulator, manager_id = lifecycle
+        total = simulator.capacity(manager_id)["total"]["cpu_cores"]
+
+        request_id = self.create(simulator, manager_id, total)
+        simulator.advance(1)
+
+        request = store.get(PROVISIONING, request_id)
+        assert request.request_status == "FAILED"
+        assert request.extensions["failure_reason"] == "InsufficientCapacity"
+        assert request.allocated_capacity is None
+
+    def test_adopted_request_rechecks_capacity_on_completion(self, lifecycle):
+        store, simulator, manager_id = lifecycle
+        adopted = store.ids(PROVISIONING, {"request_status": "IN_PROGRESS"}, scope=manager_id)[0]
+        total = simulator.capacity(manager_id)["total"]["cpu_cores"]
+
+        # Fills the site up to one core once the seeded PENDING request starts
+        self.create(simulator, manager_id, total - 16 - 6 - 4 - 1)
+        simulator.advance(1)
+        simulator.advance(2)
+
+        request = store.get(PROVISIONING, adopted)
+        assert request.request_status == "FAILED"
+        assert request.extensions["failure_reason"] == "InsufficientCapacity"
+        assert simulator.capacity(manager_id)["allocated"]["cpu_cores"] == total - 1 - 6
+
+    def test_bulk_requests_are_bounded(self, client):
+        url = f"{BASE}/deploymentManagers/{edge1_manager()}/o2ims_infrastructureProvisioningRequest/bulk"
+        too_many = [{"name": f"r{i}"} for i in range(server.MAX_BULK_REQUESTS + 1)]
+
+        assert client.post(url, json={"requests": too_many}).status_code == 422
+        combined = client.post(url, json={"requests": [{"name": "r"}], "template": {"name": "t"},
+                                          "count": server.MAX_BULK_REQUESTS})
+        assert combined.status_code == 400
+
+
+class TestWatch:
+    """Test resourceVersion resume and expiry of the event log"""
+
+    @staticmethod
+    def frames(log, version, count, **kwargs):
+        async def collect():
+            stream = log.watch(version, heartbeat=0.01, **kwargs)
+            return [await stream.__anext__() for _ in range(count)]
+
+        return asyncio.run(collect())
+
+    @staticmethod
+    def record(log, count):
+        pool = server.MockDataGenerator().generate_resource_pools()[0]
+        for i in range(count):
+            log.record("MODIFIED", server.InventoryStore.RESOURCE_POOLS, str(i), pool, scope=f"dm{i % 2}")
+
+    def test_resume_after_version(self):
+        log = server.EventLog(capacity=10)
+        self.record(log, 5)
+
+        frames = self.frames(log, 2, 4)
+
+        assert [frame.split(b"\n")[0] for frame in frames[:3]] == [b"id: 3", b"id: 4", b"id: 5"]
+        assert frames[3] == b": keepalive\n\n"
+
+    def test_resume_filters_scope(self):
+        log = server.EventLog(capacity=10)
+        self.record(log, 5)
+
+        frames = self.frames(log, 0, 2, scope="dm1")
+
+        assert [frame.split(b"\n")[0] for frame in frames] == [b"id: 2", b"id: 4"]
+
+    def test_expired_version_ends_with_410(self):
+        log = server.EventLog(capacity=3)
+        self.record(log, 5)
+
+        frames = self.frames(log, 1, 1)
+
+        assert frames[0].startswith(b"event: ERROR")
+        assert b'"code":410' in frames[0]
+        assert not log.expired(2)
+
+    def test_future_version_is_rejected(self, client):
+        response = client.get(f"{BASE}/watch", params={"resourceVersion": server.events.version + 1})
+
+        assert response.status_code == 400
+
+    def test_lists_carry_the_resource_version(self, client):
+        response = client.get(f"{BASE}/resourcePools")
+
+        assert response.headers["X-Resource-Version"] == str(server.events.version)
+
+
+class TestFaultInjection:
+    """Test fault profile rules and their effect on requests"""
+
+    def test_first_matching_rule_applies(self):
+        profile = server.FaultProfile.from_dict({
+            "default": {"latency": "fixed:0.5"},
+            "rules": [
+                {"path": f"{BASE}/resourcePools*", "methods": ["get"], "error_rate": 1, "error_status": 503},
+                {"path": f"{BASE}/*", "reset_rate": 1},
+            ],
+        })
+
+        pools = profile.decide("GET", f"{BASE}/resourcePools")
+        posted = profile.decide("POST", f"{BASE}/resourcePools")
+        other = profile.decide("GET", "/other")
+
+        assert (pools.error_status, pools.reset) == (503, False)
+        assert (posted.error_status, posted.reset) == (None, True)
+        assert (other.delay, other.error_status) == (0.5, None)
+        assert profile.decide("GET", "/health") is None
+
+    def test_same_seed_same_faults(self):
+        data = {"seed": 3, "default": {"latency": "exponential:0.1", "error_rate": 0.3}}
+
+        def decisions():
+            profile = server.FaultProfile.from_dict(data)
+            return [
+                (d.delay, d.error_status) if d else None
+                for d in (profile.decide("GET", f"{BASE}/status") for _ in range(50))
+            ]
+
+        assert decisions() == decisions()
+
+    def test_only_real_throttles_are_counted(self):
+        profile = server.FaultProfile.from_dict({
+            "rules": [{"path": "/errors", "error_rate": 1, "bandwidth_kbps": 64}],
+            "default": {"bandwidth_kbps": 64},
+        })
+
+        profile.decide("GET", "/errors")
+        profile.decide("GET", "/slow")
+
+        assert profile.injected == {"delayed": 0, "errors": 1, "resets": 0, "throttled": 1}
+
+    @pytest.mark.parametrize(
+        "profile",
+        [
+            {"rules": "all"},
+            {"rules": [{"path": "*", "error_rate": 2}]},
+            {"default": {"colour": "red"}},
+            {"default": {"latency_cap": "5"}},
+            {"default": {"bandwidth_kbps": "64"}},
+            {"default": {"error_rate": "0.5"}},
+            {"default": {"error_status": 503.0}},
+            {"rules": [{"path": "*", "methods": "GET"}]},
+            {"rules": [{"path": 3}]},
+            {"default": {"latency": 0.5}},
+        ],
+    )
+    def test_invalid_profiles_are_rejected(self, profile):
+        with pytest.raises(ValueError):
+            server.FaultProfile.from_dict(profile)
+
+    def test_injected_errors_spare_health_and_admin(self, client, faults):
+        replaced = client.put("/admin/faults", content=json.dumps({
+            "rules": [{"path": "*", "error_rate": 1, "error_status": 429}],
+        }))
+
+        assert replaced.status_code == 200
+        assert client.get(f"{BASE}/resourcePools").status_code == 429
+        assert client.get("/health").status_code == 200
+        assert client.get("/admin/faults").json()["injected"]["errors"] == 1
+        assert client.put("/admin/faults", content="rules: 3").status_code == 400
+        assert client.put("/admin/faults", content='default: {latency_cap: "5"}').status_code == 400
+        assert client.get(f"{BASE}/resourcePools").status_code == 429
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Tests for the provisioning lifecycle of the standard-library O2IMS server
+
+The server module is loaded from scripts/simple-o2ims-server.py; the
+lifecycle is exercised directly and through the HTTP routes of a server
+bound to an ephemeral port.
+"""
+
+import importlib.util
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+MODULE_PATH = Path(__file__).parent.parent / "scripts" / "simple-o2ims-server.py"
+
+_spec = importlib.util.spec_from_file_location("simple_o2ims_server", MODULE_PATH)
+server = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(server)
+
+DM_ID = server.stable_id("deployment-manager")
+
+
+def make_lifecycle(latency="fixed:3600"):
+    """Lifecycle with the seeded 5G Core request; the default latency keeps requests PENDING"""
+    lifecycle = server.ProvisioningLifecycle(
+        server.LatencyDistribution(latency),
+        server.LatencyDistribution(latency),
+        failure_rate=0,
+    )
+    lifecycle.seed_requests(DM_ID)
+    return lifecycle
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.01)
+
+
+class TestProvisioningLifecycle:
+    """Test creation, validation and capacity accounting"""
+
+    def test_create_validates_the_body(self):
+        lifecycle = make_lifecycle()
+
+        request = lifecycle.create(DM_ID, {"name": "upf", "requested_capacity": {"cpu_cores": 4}})
+
+        assert request["request_status"] == "PENDING"
+        assert request["extensions"]["deployment_manager_id"] == DM_ID
+        invalid = [{}, {"name": "x", "requested_capacity": {"cpu_cores": -1}}, {"name": "x", "extensions": "edge"}]
+        for body in invalid:
+            with pytest.raises(ValueError):
+                lifecycle.create(DM_ID, body)
+        assert len(lifecycle.requests) == 2
+
+    def test_bulk_create_is_all_or_nothing(self):
+        lifecycle = make_lifecycle()
+        body = {"requests": [{"name": "a"}, {"name": "b", "requested_capacity": {"cpu_cores": "four"}}]}
+
+        with pytest.raises(ValueError, match="requested_capacity"):
+            lifecycle.bulk_create(DM_ID, body)
+
+        assert len(lifecycle.requests) == 1
+
+    def test_bulk_create_expands_the_template(self):
+        lifecycle = make_lifecycle()
+
+        ids = lifecycle.bulk_create(DM_ID, {"requests": [{"name": "a"}], "template": {"name": "t"}, "count": 3})
+
+        assert [lifecycle.get(i)["name"] for i in ids] == ["a", "t-0", "t-1", "t-2"]
+
+    @pytest.mark.parametrize("body", [
+        {"template": {"name": "t"}, "count": 3_000_000},
+        {"requests": [{"name": "a"}], "template": {"name": "t"}, "count": 10_000},
+        {"count": True, "template": {"name": "t"}},
+        {"requests": {"name": "a"}},
+        {"count": 2},
+    ])
+    def test_bulk_create_rejects_bad_counts_before_building(self, body):
+        lifecycle = make_lifecycle()
+
+        start = time.perf_counter()
+        with pytest.raises(ValueError):
+            lifecycle.bulk_create(DM_ID, body)
+
+        assert time.perf_counter() - start < 0.1
+        assert len(lifecycle.requests) == 1
+
+    def test_requests_reserve_and_release_capacity(self):
+        lifecycle = make_lifecycle("fixed:0")
+        lifecycle.start()
+
+        request_id = lifecycle.create(DM_ID, {"name": "upf", "requested_capacity": {"cpu_cores": 10}})[
+            "infrastructure_request_id"
+        ]
+        wait_for(lambda: lifecycle.get(request_id)["request_status"] == "COMPLETED")
+        assert lifecycle.capacity()["allocated"]["cpu_cores"] == 16 + 10
+
+        assert lifecycle.delete(request_id)
+        assert lifecycle.capacity()["allocated"]["cpu_cores"] == 16
+        assert not lifecycle.delete(request_id)
+
+    def test_request_beyond_capacity_fails(self):
+        lifecycle = make_lifecycle("fixed:0")
+        lifecycle.start()
+
+        cpu = server.SITE_CAPACITY["cpu_cores"]
+        request_id = lifecycle.create(DM_ID, {"name": "big", "requested_capacity": {"cpu_cores": cpu}})[
+            "infrastructure_request_id"
+        ]
+        wait_for(lambda: lifecycle.get(request_id)["request_status"] == "FAILED")
+
+        request = lifecycle.get(request_id)
+        assert request["extensions"]["failure_reason"] == "InsufficientCapacity"
+        assert lifecycle.capacity()["allocated"]["cpu_cores"] == 16
+
+
+class TestProvisioningRoutes:
+    """Test the provisioning request endpoints over HTTP"""
+
+    @pytest.fixture
+    def base_url(self, monkeypatch):
+        monkeypatch.setattr(server, "LIFECYCLE", make_lifecycle())
+        httpd = server.ThreadedHTTPServer(("127.0.0.1", 0), server.O2IMSHandler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        yield f"http://127.0.0.1:{httpd.server_address[1]}/o2ims_infrastructureInventory/v1/deploymentManagers"
+        httpd.shutdown()
+        httpd.server_close()
+
+    @staticmethod
+    def call(method, url, body=None):
+        data = None if body is None else json.dumps(body).encode()
+        request = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request) as response:
+                payload = response.read()
+                return response.status, json.loads(payload) if payload else None
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_create_get_and_delete(self, base_url):
+        collection = f"{base_url}/{DM_ID}/{server.PROVISIONING_PATH}"
+
+        status, created = self.call("POST", collection, {"name": "upf"})
+        assert status == 201
+        request_url = f"{collection}/{created['infrastructure_request_id']}"
+
+        assert self.call("GET", request_url) == (200, created)
+        assert len(self.call("GET", f"{collection}?request_status=pending")[1]) == 1
+        assert self.call("DELETE", request_url) == (204, None)
+        assert self.call("GET", request_url)[0] == 404
+
+    def test_bulk_create(self, base_url):
+        collection = f"{base_url}/{DM_ID}/{server.PROVISIONING_PATH}"
+
+        status, body = self.call("POST", f"{collection}/bulk", {"template": {"name": "t"}, "count": 5})
+        assert (status, body["created"]) == (201, 5)
+
+        status, body = self.call("POST", f"{collection}/bulk", {"requests": [{"name": "a"}, {}]})
+        assert status == 400
+        assert "name" in body["error"]["title"]
+        assert len(self.call("GET", collection)[1]) == 1 + 5
+
+    def test_capacity_and_unknown_manager(self, base_url):
+        status, capacity = self.call("GET", f"{base_url}/{DM_ID}/capacity")
+
+        assert status == 200
+        assert capacity["allocated"]["cpu_cores"] == 16
+        assert self.call("POST", f"{base_url}/unknown/{server.PROVISIONING_PATH}", {"name": "a"})[0] == 404
@@ -8,12 +8,29 @@ It includes schema validation, CLI interface, and TIO compatibility mode.
 __version__ = "0.1.0"
 __author__ = "Nephio Intent Pipeline Team"
 
-from .validator import TMF921Validator, ValidationError, ValidationResult
-from .expectations import ExpectationParser, Expectation
-from .compliance import TIOComplianceChecker, ComplianceResult
-
 __all__ = [
     "TMF921Validator", "ValidationError", "ValidationResult",
-    "ExpectationParser", "Expectation", 
+    "ExpectationParser", "Expectation", "ExpectationIndex",
     "TIOComplianceChecker", "ComplianceResult"
 ]
+
+# Public names are imported lazily so that the thin validation client does
+# not pay for importing jsonschema when a validation server is running
+_EXPORTS = {
+    "TMF921Validator": "validator",
+    "ValidationError": "validator",
+    "ValidationResult": "validator",
+    "ExpectationParser": "expectations",
+    "Expectation": "expectations",
+    "ExpectationIndex": "expectations",
+    "TIOComplianceChecker": "compliance",
+    "ComplianceResult": "compliance",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
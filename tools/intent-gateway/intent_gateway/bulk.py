@@ -0,0 +1,310 @@
+"""
+Intent Gateway bulk validation.
+
+Validates whole intent corpora (a directory of JSON files, a glob pattern
+or an NDJSON stream) across a process pool. Each worker compiles the
+TMF921 schema once and optionally runs the TIO compliance checker on the
+same parsed document. Documents are shipped to workers in chunks and
+results are yielded in input order, with a bounded number of chunks in
+flight so memory stays flat regardless of corpus size.
+"""
+
+import glob
+import json
+import re
+import sys
+import time
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, TextIO
+
+from .compliance import TIOComplianceChecker
+from .validator import TMF921Validator, ValidationError
+
+# (source, kind, payload) where kind is "file" (payload is a path) or
+# "line" (payload is one raw NDJSON line)
+BulkTask = tuple[str, str, str]
+
+_FIELD_INDEX = re.compile(r"(?<=\.)\d+(?=[.'])")
+
+_worker_validator: TMF921Validator | None = None
+_worker_checker: TIOComplianceChecker | None = None
+_worker_max_errors: int | None = None
+
+
+def iter_bulk_tasks(source: str, stdin: TextIO | None = None) -> Iterator[BulkTask]:
+    """
+    Yield validation tasks for a directory, glob pattern or NDJSON stream.
+
+    ``-`` reads NDJSON from stdin, ``*.ndjson``/``*.jsonl`` files are read
+    line by line, directories yield their ``*.json`` files and anything
+    else is expanded as a glob pattern. Files are yielded in sorted order.
+    Inputs are enumerated exactly like tmf921_to_28312.batch.iter_batch_tasks;
+    the gateway installs without the converter, so this is its own copy.
+
+    Raises:
+        FileNotFoundError: If the input matches nothing
+    """
+    if source == "-":
+        yield from _iter_ndjson_lines("<stdin>", stdin or sys.stdin)
+        return
+
+    path = Path(source)
+    if path.is_dir():
+        for file_path in sorted(path.glob("*.json")):
+            yield (str(file_path), "file", str(file_path))
+    elif path.is_file() and path.suffix in (".ndjson", ".jsonl"):
+        with open(path) as f:
+            yield from _iter_ndjson_lines(str(path), f)
+    elif path.is_file():
+        yield (str(path), "file", str(path))
+    else:
+        matches = sorted(glob.iglob(source, recursive=True))
+        if not matches:
+            raise FileNotFoundError(f"No intents found for input: {source}")
+        for match in matches:
+            yield (match, "file", match)
+
+
+def _iter_ndjson_lines(name: str, stream: TextIO) -> Iterator[BulkTask]:
+    """Yield one task per non-blank NDJSON line."""
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield (f"{name}:{line_number}", "line", line)
+
+
+def _init_worker(
+    schema_path: str | None,
+    tio_mode: str | None,
+    compliance: bool,
+    max_errors: int | None,
+) -> None:
+    """Compile the per-process validator (and compliance checker) once."""
+    global _worker_validator, _worker_checker, _worker_max_errors
+    _worker_validator = TMF921Validator(Path(schema_path) if schema_path else None)
+    if tio_mode:
+        _worker_validator.set_tio_mode(tio_mode)
+    _worker_checker = TIOComplianceChecker(tio_mode or "strict") if compliance else None
+    _worker_max_errors = max_errors
+
+
+def validate_task(task: BulkTask) -> dict[str, Any]:
+    """
+    Validate a single task with the worker's validator.
+
+    Returns:
+        Result record with status 'valid', 'invalid' or 'error'
+    """
+    source, kind, payload = task
+    record: dict[str, Any] = {"source": source}
+
+    try:
+        if kind == "line":
+            document = payload
+        else:
+            with open(payload, "rb") as f:
+                document = f.read()
+        intent_data = json.loads(document)
+    except FileNotFoundError:
+        record.update(status="error", message=f"File not found: {payload}")
+        return record
+    except (OSError, UnicodeDecodeError) as e:
+        record.update(status="error", message=f"Cannot read {source}: {e}")
+        return record
+    except json.JSONDecodeError as e:
+        record.update(status="error", message=f"Invalid JSON: {e}")
+        return record
+
+    if _worker_validator is None:
+        _init_worker(None, None, False, None)
+
+    try:
+        result = _worker_validator.validate(intent_data, max_errors=_worker_max_errors)
+    except ValidationError as e:
+        record.update(status="error", message=str(e))
+        return record
+
+    record["intent_id"] = result.intent_id
+    if result.is_valid:
+        record["status"] = "valid"
+    else:
+        record.update(status="invalid", errors=result.errors)
+
+    if _worker_checker is not None:
+        compliance = _worker_checker.check_compliance(intent_data)
+        record["compliance"] = {
+            "compliant": compliance.compliant,
+            "api_version": compliance.api_version,
+            "errors": compliance.errors,
+            "warnings": compliance.warnings,
+        }
+    return record
+
+
+def _validate_chunk(chunk: list[BulkTask]) -> list[dict[str, Any]]:
+    """Validate a chunk of tasks in a worker process."""
+    return [validate_task(task) for task in chunk]
+
+
+def is_failure(record: dict[str, Any]) -> bool:
+    """Check if a record failed validation or compliance."""
+    if record["status"] != "valid":
+        return True
+    return not record.get("compliance", {}).get("compliant", True)
+
+
+class BulkSummary:
+    """Aggregate statistics over a validated corpus."""
+
+    def __init__(self, top_errors: int = 10):
+        """Initialize empty summary."""
+        self.total = 0
+        self.valid = 0
+        self.invalid = 0
+        self.errors = 0
+        self.non_compliant = 0
+        self.compliance_checked = False
+        self.stopped_early = False
+        self.top_errors = top_errors
+        # Array indices in field paths are collapsed so the counter is
+        # bounded by the number of distinct error shapes
+        self._error_messages: Counter = Counter()
+        self._started = time.perf_counter()
+        self.elapsed_seconds = 0.0
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Fold one result record into the summary."""
+        self.total += 1
+        status = record["status"]
+        if status == "valid":
+            self.valid += 1
+        elif status == "invalid":
+            self.invalid += 1
+            for error in record.get("errors", []):
+                self._error_messages[_FIELD_INDEX.sub("*", error)] += 1
+        else:
+            self.errors += 1
+
+        if "compliance" in record:
+            self.compliance_checked = True
+            if not record["compliance"]["compliant"]:
+                self.non_compliant += 1
+        self.elapsed_seconds = time.perf_counter() - self._started
+
+    @property
+    def exit_code(self) -> int:
+        """CLI exit code: 1 if any document errored, 2 if any failed, else 0."""
+        if self.errors:
+            return 1
+        if self.invalid or self.non_compliant:
+            return 2
+        return 0
+
+    def to_dict(self, deterministic: bool = False) -> dict[str, Any]:
+        """Return the summary as a JSON-serializable dict."""
+        output: dict[str, Any] = {
+            "total": self.total,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "errors": self.errors,
+            "stopped_early": self.stopped_early,
+            "most_common_errors": [
+                {"message": message, "count": count}
+                for message, count in self._error_messages.most_common(self.top_errors)
+            ],
+        }
+        if self.compliance_checked:
+            output["non_compliant"] = self.non_compliant
+        if not deterministic:
+            output["elapsed_seconds"] = round(self.elapsed_seconds, 6)
+            output["documents_per_second"] = (
+                round(self.total / self.elapsed_seconds, 1) if self.elapsed_seconds > 0 else None
+            )
+        return output
+
+
+def _chunks(tasks: Iterable[BulkTask], size: int) -> Iterator[list[BulkTask]]:
+    """Group tasks into lists of at most ``size``."""
+    chunk: list[BulkTask] = []
+    for task in tasks:
+        chunk.append(task)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_validation_results(
+    tasks: Iterable[BulkTask],
+    schema_path: Path | None = None,
+    tio_mode: str | None = None,
+    compliance: bool = False,
+    max_errors: int | None = None,
+    workers: int = 1,
+    chunk_size: int = 64,
+    max_in_flight: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Validate tasks and yield result records in input order.
+
+    With ``workers`` > 1 the documents are validated in a process pool in
+    chunks of ``chunk_size``; no more than ``max_in_flight`` chunks
+    (default: 2 per worker) are queued at once. Closing the generator
+    early cancels queued chunks, which is how fail-fast stops the pool.
+
+    Raises:
+        ValidationError: If the schema cannot be loaded
+    """
+    initargs = (str(schema_path) if schema_path else None, tio_mode, compliance, max_errors)
+    # Compile the schema in this process first so a bad schema fails fast
+    _init_worker(*initargs)
+
+    if workers <= 1:
+        for task in tasks:
+            yield validate_task(task)
+        return
+
+    window = max_in_flight or workers * 2
+    pending: deque[Future] = deque()
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=initargs
+    )
+    try:
+        for chunk in _chunks(tasks, chunk_size):
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_validate_chunk, chunk))
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def run_bulk_validation(
+    tasks: Iterable[BulkTask],
+    write: Any,
+    fail_fast: bool = False,
+    **options: Any,
+) -> BulkSummary:
+    """
+    Validate tasks, passing each result record to ``write`` in input order.
+
+    With ``fail_fast`` the run stops after the first invalid, non-compliant
+    or unreadable document. Remaining keyword arguments are passed to
+    iter_validation_results().
+    """
+    summary = BulkSummary()
+    results = iter_validation_results(tasks, **options)
+    try:
+        for record in results:
+            summary.add(record)
+            write(record)
+            if fail_fast and is_failure(record):
+                summary.stopped_early = True
+                break
+    finally:
+        results.close()
+    return summary
@@ -11,11 +11,16 @@ import sys
 import traceback
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 
-from .validator import TMF921Validator, ValidationError
+if TYPE_CHECKING:
+    from .validator import TMF921Validator
+
+DEFAULT_SCHEMA_PATH = (
+    Path(__file__).parent.parent.parent.parent / "guardrails" / "schemas" / "tmf921.json"
+)
 
 
 def intent_exit(code: int) -> None:
@@ -38,7 +43,14 @@ def output_json(data: dict[str, Any]) -> None:
     click.echo(json.dumps(data, indent=2, sort_keys=True))
 
 
-def create_error_output(message: str, status: str = "error") -> dict[str, Any]:
+def is_deterministic() -> bool:
+    """Check if deterministic output (no timestamps) is requested, e.g. for testing."""
+    return os.getenv("INTENT_GATEWAY_DETERMINISTIC") == "true"
+
+
+def create_error_output(
+    message: str, status: str = "error", deterministic: bool | None = None
+) -> dict[str, Any]:
     """Create standardized error output."""
     output = {
         "status": status,
@@ -46,14 +58,17 @@ def create_error_output(message: str, status: str = "error") -> dict[str, Any]:
     }
 
     # Add timestamp unless in deterministic mode (for testing)
-    if os.getenv("INTENT_GATEWAY_DETERMINISTIC") != "true":
+    if not (is_deterministic() if deterministic is None else deterministic):
         output["timestamp"] = datetime.now(timezone.utc).isoformat()
 
     return output
 
 
 def create_success_output(
-    intent_id: str, tio_mode: str | None = None, verbose: bool = False
+    intent_id: str,
+    tio_mode: str | None = None,
+    verbose: bool = False,
+    deterministic: bool | None = None,
 ) -> dict[str, Any]:
     """Create standardized success output."""
     output = {
@@ -62,7 +77,7 @@ def create_success_output(
     }
 
     # Add timestamp unless in deterministic mode (for testing)
-    if os.getenv("INTENT_GATEWAY_DETERMINISTIC") != "true":
+    if not (is_deterministic() if deterministic is None else deterministic):
         output["timestamp"] = datetime.now(timezone.utc).isoformat()
 
     if tio_mode:
@@ -77,7 +92,9 @@ def create_success_output(
     return output
 
 
-def create_validation_error_output(errors: list, intent_id: str | None = None) -> dict[str, Any]:
+def create_validation_error_output(
+    errors: list, intent_id: str | None = None, deterministic: bool | None = None
+) -> dict[str, Any]:
     """Create standardized validation error output."""
     output = {
         "status": "invalid",
@@ -86,12 +103,51 @@ def create_validation_error_output(errors: list, intent_id: str | None = None) -
     }
 
     # Add timestamp unless in deterministic mode (for testing)
-    if os.getenv("INTENT_GATEWAY_DETERMINISTIC") != "true":
+    if not (is_deterministic() if deterministic is None else deterministic):
         output["timestamp"] = datetime.now(timezone.utc).isoformat()
 
     return output
 
 
+def validate_intent_text(
+    validator: "TMF921Validator",
+    text: str | bytes,
+    tio_mode: str | None = None,
+    verbose: bool = False,
+    deterministic: bool | None = None,
+) -> tuple[int, dict[str, Any]]:
+    """
+    Validate a raw JSON intent document with an already configured validator.
+
+    Shared by the CLI and the validation server so both produce identical
+    output. Returns the exit code (0 valid, 1 error, 2 invalid) and the
+    JSON output document.
+    """
+    from .validator import ValidationError
+
+    try:
+        try:
+            intent_data = json.loads(text)
+        except json.JSONDecodeError as e:
+            return 1, create_error_output(f"Invalid JSON in file: {e}", deterministic=deterministic)
+
+        result = validator.validate(intent_data)
+
+        if result.is_valid:
+            return 0, create_success_output(
+                result.intent_id, tio_mode or "strict", verbose, deterministic
+            )
+        return 2, create_validation_error_output(result.errors, result.intent_id, deterministic)
+
+    except ValidationError as e:
+        return 1, create_error_output(str(e), deterministic=deterministic)
+    except Exception as e:
+        error_msg = f"Unexpected error: {str(e)}"
+        if verbose:
+            error_msg += f"\n{traceback.format_exc()}"
+        return 1, create_error_output(error_msg, deterministic=deterministic)
+
+
 @click.group()
 @click.version_option(version="0.1.0", prog_name="intent-gateway")
 def cli():
@@ -115,47 +171,54 @@ def cli():
 @click.option(
     "--verbose", "-v", is_flag=True, help="Enable verbose output with additional validation details"
 )
-def validate(file: Path, tio_mode: str | None, verbose: bool):
-    """Validate TMF921 intent against JSON schema."""
-    try:
-        # Load schema
-        schema_path = (
-            Path(__file__).parent.parent.parent.parent / "guardrails" / "schemas" / "tmf921.json"
-        )
-        validator = TMF921Validator(schema_path)
-
-        # Set TIO mode if specified
-        if tio_mode:
-            validator.set_tio_mode(tio_mode)
+@click.option(
+    "--no-server",
+    is_flag=True,
+    envvar="INTENT_GATEWAY_NO_SERVER",
+    help="Always validate in-process, even if a validation server is running",
+)
+def validate(file: Path, tio_mode: str | None, verbose: bool, no_server: bool):
+    """Validate TMF921 intent against JSON schema.
 
+    Requests are routed through a running `intent-gateway serve` instance
+    when one is reachable, otherwise the intent is validated in-process.
+    """
+    try:
         # Check if file exists
         if not file.exists():
             output_json(create_error_output(f"File not found: {file}"))
             intent_exit(1)
 
-        # Load intent file
+        with open(file, "rb") as f:
+            document = f.read()
+
+        if not no_server:
+            from .client import validate_via_server
+
+            routed = validate_via_server(document, tio_mode, verbose, is_deterministic())
+            if routed is not None:
+                exit_code, body = routed
+                click.echo(body)
+                intent_exit(exit_code)
+
+        from .validator import TMF921Validator, ValidationError
+
         try:
-            with open(file) as f:
-                intent_data = json.load(f)
-        except json.JSONDecodeError as e:
-            output_json(create_error_output(f"Invalid JSON in file: {e}"))
+            validator = TMF921Validator(DEFAULT_SCHEMA_PATH)
+        except ValidationError as e:
+            output_json(create_error_output(str(e)))
             intent_exit(1)
 
-        # Validate intent
-        result = validator.validate(intent_data)
+        # Set TIO mode if specified
+        if tio_mode:
+            validator.set_tio_mode(tio_mode)
 
-        if result.is_valid:
-            # Success case
-            output_json(create_success_output(result.intent_id, tio_mode or "strict", verbose))
-            intent_exit(0)
-        else:
-            # Validation error case
-            output_json(create_validation_error_output(result.errors, result.intent_id))
-            intent_exit(2)
+        exit_code, output = validate_intent_text(validator, document, tio_mode, verbose)
+        output_json(output)
+        intent_exit(exit_code)
 
-    except ValidationError as e:
-        output_json(create_error_output(str(e)))
-        intent_exit(1)
+    except SystemExit:
+        raise
     except Exception as e:
         # Unexpected error
         error_msg = f"Unexpected error: {str(e)}"
@@ -165,6 +228,169 @@ def validate(file: Path, tio_mode: str | None, verbose: bool):
         intent_exit(1)
 
 
+@cli.command("validate-many")
+@click.option(
+    "--input",
+    "-i",
+    "source",
+    required=True,
+    help="Directory of *.json intents, glob pattern, NDJSON file, or '-' for NDJSON on stdin",
+)
+@click.option(
+    "--tio-mode",
+    type=click.Choice(["fake", "strict"]),
+    help="TIO mode: 'fake' bypasses validation, 'strict' enforces full validation",
+)
+@click.option(
+    "--compliance", is_flag=True, help="Also run the TIO compliance check on every intent"
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=os.cpu_count() or 1,
+    show_default="CPU count",
+    help="Validation worker processes",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=64,
+    show_default=True,
+    help="Documents sent to a worker at a time",
+)
+@click.option(
+    "--max-errors",
+    type=click.IntRange(min=1),
+    help="Stop collecting schema errors for a document after this many",
+)
+@click.option(
+    "--fail-fast", is_flag=True, help="Stop at the first invalid, non-compliant or unreadable intent"
+)
+@click.option(
+    "--output",
+    "-o",
+    default="-",
+    show_default=True,
+    help="NDJSON file for per-intent results ('-' for stdout)",
+)
+@click.option("--summary", type=click.Path(path_type=Path), help="Also write aggregate stats here")
+@click.option(
+    "--schema",
+    type=click.Path(path_type=Path),
+    help="TMF921 JSON schema (default: guardrails/schemas/tmf921.json)",
+)
+def validate_many(
+    source: str,
+    tio_mode: str | None,
+    compliance: bool,
+    workers: int,
+    chunk_size: int,
+    max_errors: int | None,
+    fail_fast: bool,
+    output: str,
+    summary: Path | None,
+    schema: Path | None,
+):
+    """Validate a corpus of TMF921 intents across worker processes.
+
+    Writes one compact JSON result per intent in input order, then the
+    aggregate stats to stderr. Exits 1 if any intent could not be read or
+    parsed, 2 if any intent is invalid (or non-compliant), otherwise 0.
+    """
+    from .bulk import iter_bulk_tasks, run_bulk_validation
+    from .validator import ValidationError
+
+    out = sys.stdout if output == "-" else open(output, "w")
+
+    def write(record: dict[str, Any]) -> None:
+        out.write(json.dumps(record, sort_keys=True) + "\n")
+
+    try:
+        stats = run_bulk_validation(
+            iter_bulk_tasks(source),
+            write,
+            fail_fast=fail_fast,
+            schema_path=schema or DEFAULT_SCHEMA_PATH,
+            tio_mode=tio_mode,
+            compliance=compliance,
+            max_errors=max_errors,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+    except (FileNotFoundError, ValidationError) as e:
+        output_json(create_error_output(str(e)))
+        intent_exit(1)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        else:
+            out.flush()
+
+    stats_output = stats.to_dict(deterministic=is_deterministic())
+    stats_text = json.dumps(stats_output, indent=2, sort_keys=True)
+    click.echo(stats_text, err=True)
+    if summary:
+        summary.parent.mkdir(parents=True, exist_ok=True)
+        summary.write_text(stats_text + "\n")
+    intent_exit(stats.exit_code)
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path),
+    help="Unix socket to listen on (default: $INTENT_GATEWAY_SOCKET or <tmpdir>/intent-gateway.sock)",
+)
+@click.option("--host", help="Listen on TCP host instead of a Unix socket")
+@click.option("--port", type=int, default=8765, show_default=True, help="TCP port used with --host")
+@click.option(
+    "--schema",
+    type=click.Path(path_type=Path),
+    help="TMF921 JSON schema (default: guardrails/schemas/tmf921.json)",
+)
+@click.option(
+    "--cache-size",
+    type=int,
+    default=4096,
+    show_default=True,
+    help="Number of validation results to cache (0 disables caching)",
+)
+def serve(
+    socket_path: Path | None, host: str | None, port: int, schema: Path | None, cache_size: int
+):
+    """Run a long-lived validation server with a compiled validator."""
+    import signal
+
+    from .server import create_server
+
+    try:
+        server = create_server(
+            socket_path=None if host else socket_path,
+            host=host,
+            port=port,
+            schema_path=schema or DEFAULT_SCHEMA_PATH,
+            cache_size=cache_size,
+        )
+    except Exception as e:
+        output_json(create_error_output(f"Failed to start server: {e}"))
+        intent_exit(1)
+
+    def handle_sigterm(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+    click.echo(f"intent-gateway serving on {server.address_description}", err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown_and_cleanup()
+    intent_exit(0)
+
+
 def main():
     """Main CLI entry point."""
     try:
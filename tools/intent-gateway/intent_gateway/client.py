@@ -0,0 +1,226 @@
+"""
+Intent Gateway validation client.
+
+Thin, standard-library-only client for a running `intent-gateway serve`
+instance. The server answers over HTTP on a Unix socket (default) or TCP;
+the exit code travels in the X-Intent-Gateway-Exit-Code response header so
+the client keeps the CLI contract: 0 (valid), 1 (error), 2 (invalid).
+
+Usage:
+    python -m intent_gateway.client --file samples/tmf921/valid_01.json
+"""
+
+import argparse
+import http.client
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from urllib.parse import urlencode
+
+EXIT_CODE_HEADER = "X-Intent-Gateway-Exit-Code"
+
+# Connecting to a local server is instant; a short timeout keeps the
+# fallback to in-process validation fast when the server is wedged
+DEFAULT_TIMEOUT = 5.0
+
+
+def default_socket_path() -> Path:
+    """Unix socket path used by both the server and the client."""
+    return Path(
+        os.getenv(
+            "INTENT_GATEWAY_SOCKET",
+            os.path.join(tempfile.gettempdir(), "intent-gateway.sock"),
+        )
+    )
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: Path, timeout: float = DEFAULT_TIMEOUT):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class ServerUnavailable(Exception):
+    """Raised when no validation server can be reached."""
+
+    pass
+
+
+class GatewayClient:
+    """Client for the intent-gateway validation server."""
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        host: str | None = None,
+        port: int | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """
+        Initialize client.
+
+        Args:
+            socket_path: Unix socket of the server (default: default_socket_path())
+            host: TCP host of the server; takes precedence over socket_path
+            port: TCP port used with host
+            timeout: Socket timeout in seconds
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._connection: http.client.HTTPConnection | None = None
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._connection is None:
+            if self.host:
+                self._connection = http.client.HTTPConnection(
+                    self.host, self.port, timeout=self.timeout
+                )
+            else:
+                if not self.socket_path.exists():
+                    raise ServerUnavailable(f"No server socket at {self.socket_path}")
+                self._connection = UnixHTTPConnection(self.socket_path, self.timeout)
+        return self._connection
+
+    def _request(
+        self, method: str, path: str, body: bytes | None = None
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        connection = self._connect()
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            return response, response.read()
+        except (OSError, http.client.HTTPException) as e:
+            self.close()
+            raise ServerUnavailable(str(e)) from e
+
+    def close(self) -> None:
+        """Close the persistent connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def health(self) -> bool:
+        """Check if the server is up."""
+        try:
+            response, _ = self._request("GET", "/health")
+        except ServerUnavailable:
+            return False
+        return response.status == 200
+
+    def validate(
+        self,
+        document: bytes | str,
+        tio_mode: str | None = None,
+        verbose: bool = False,
+        deterministic: bool = False,
+    ) -> tuple[int, str]:
+        """
+        Validate a raw JSON intent document on the server.
+
+        Returns:
+            Tuple of exit code and the JSON output text
+
+        Raises:
+            ServerUnavailable: If the server cannot be reached
+        """
+        if isinstance(document, str):
+            document = document.encode("utf-8")
+
+        params = {}
+        if tio_mode:
+            params["tio_mode"] = tio_mode
+        if verbose:
+            params["verbose"] = "true"
+        if deterministic:
+            params["deterministic"] = "true"
+        path = "/validate" + (f"?{urlencode(params)}" if params else "")
+
+        response, body = self._request("POST", path, document)
+        exit_code = response.getheader(EXIT_CODE_HEADER)
+        if exit_code is None:
+            raise ServerUnavailable(f"Unexpected response from server: HTTP {response.status}")
+        return int(exit_code), body.decode("utf-8")
+
+
+def validate_via_server(
+    document: bytes,
+    tio_mode: str | None = None,
+    verbose: bool = False,
+    deterministic: bool = False,
+) -> tuple[int, str] | None:
+    """
+    Validate through a running server, or return None if none is reachable.
+
+    The server address comes from INTENT_GATEWAY_SERVER (host:port) or the
+    Unix socket in INTENT_GATEWAY_SOCKET.
+    """
+    address = os.getenv("INTENT_GATEWAY_SERVER")
+    if address:
+        host, _, port = address.rpartition(":")
+        client = GatewayClient(host=host or "localhost", port=int(port))
+    else:
+        client = GatewayClient()
+
+    try:
+        return client.validate(document, tio_mode, verbose, deterministic)
+    except ServerUnavailable:
+        return None
+    finally:
+        client.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Thin client entry point; falls back to the full CLI without a server."""
+    parser = argparse.ArgumentParser(
+        prog="intent-gateway-client",
+        description="Validate a TMF921 intent through a running intent-gateway server",
+    )
+    parser.add_argument("--file", "-f", required=True, help="Path to TMF921 intent JSON file")
+    parser.add_argument("--tio-mode", choices=["fake", "strict"], help="TIO mode")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    args = parser.parse_args(argv)
+
+    path = Path(args.file)
+    if path.exists():
+        routed = validate_via_server(
+            path.read_bytes(),
+            args.tio_mode,
+            args.verbose,
+            os.getenv("INTENT_GATEWAY_DETERMINISTIC") == "true",
+        )
+        if routed is not None:
+            exit_code, body = routed
+            sys.stdout.write(body + "\n")
+            sys.exit(exit_code)
+
+    # No server (or missing file): defer to the full CLI for identical output
+    from .cli import main as cli_main
+
+    cli_args = ["validate", "--file", args.file, "--no-server"]
+    if args.tio_mode:
+        cli_args += ["--tio-mode", args.tio_mode]
+    if args.verbose:
+        cli_args.append("--verbose")
+    sys.argv = ["intent-gateway"] + cli_args
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,96 @@ TMF921 Intent Expectations Parser.
 Provides parsing and validation for intent expectations and outcomes.
 """
 
+import re
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
+import numpy as np
+
+# KPI name and comparison at the start of a targetCondition, e.g. "latency <= 1 ms"
+_TARGET_CONDITION = re.compile(r'^(\w+)\s*[<>=]+\s*')
+
+_NUMBER = re.compile(r'^\s*([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s*([A-Za-z%]*)\s*$')
+
+# Operator codes stored in ExpectationIndex.operators
+OPERATOR_CODES: Dict[str, int] = {
+    "lessThan": 0,
+    "lessThanOrEqual": 1,
+    "greaterThan": 2,
+    "greaterThanOrEqual": 3,
+    "equal": 4,
+    "notEqual": 5,
+}
+
+# Alternative spellings accepted in the old expectedValue format
+_OPERATOR_ALIASES: Dict[str, str] = {
+    "<": "lessThan",
+    "<=": "lessThanOrEqual",
+    ">": "greaterThan",
+    ">=": "greaterThanOrEqual",
+    "=": "equal",
+    "==": "equal",
+    "!=": "notEqual",
+}
+
+# Fulfillment by operator (rows) and sign of value - threshold (-1, 0, +1)
+_OPERATOR_TRUTH = np.array([
+    [True, False, False],
+    [True, True, False],
+    [False, False, True],
+    [False, True, True],
+    [False, True, False],
+    [True, False, True],
+], dtype=bool)
+
+# Multipliers to canonical units (ms, Mbps, unitless ratio). The gateway
+# installs on its own, so this mirrors tmf921_to_28312.units instead of
+# importing it; tests/test_expectations.py checks the two stay equal.
+UNIT_SCALES: Dict[str, tuple[str, float]] = {
+    "us": ("ms", 1e-3),
+    "ms": ("ms", 1.0),
+    "s": ("ms", 1e3),
+    "bps": ("Mbps", 1e-6),
+    "kbps": ("Mbps", 1e-3),
+    "mbps": ("Mbps", 1.0),
+    "gbps": ("Mbps", 1e3),
+    "%": ("", 1e-2),
+}
+
+# Metric names published by the job-query-adapter and the KPIs they measure
+DEFAULT_METRIC_ALIASES: Dict[str, str] = {
+    "latency_p95_ms": "latency",
+    "throughput_p95_mbps": "throughput",
+}
+
+
+def normalize_value(value: Any, unit: str | None = None) -> tuple[float, str]:
+    """
+    Convert a KPI value to canonical units.
+
+    Args:
+        value: Number or numeric string, optionally with a unit suffix ("10ms")
+        unit: Unit of the value; takes precedence over a suffix
+
+    Returns:
+        Tuple of scaled value and canonical unit (unknown units are kept unscaled)
+
+    Raises:
+        ValueError: If the value is not numeric
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        number, suffix = float(value), ""
+    else:
+        match = _NUMBER.match(str(value))
+        if match is None:
+            raise ValueError(f"Non-numeric KPI value: {value!r}")
+        number, suffix = float(match.group(1)), match.group(2)
+
+    unit = (unit or suffix or "").strip()
+    canonical_unit, scale = UNIT_SCALES.get(unit.lower(), (unit, 1.0))
+    return number * scale, canonical_unit
+
 
 @dataclass
 class Expectation:
@@ -66,8 +153,7 @@ class ExpectationParser:
             
             if target_condition and target_value:
                 # Extract KPI name from target condition (e.g., "latency <= 1 ms" -> "latency")
-                import re
-                kpi_match = re.match(r'^(\w+)\s*[<>=]+\s*', target_condition)
+                kpi_match = _TARGET_CONDITION.match(target_condition)
                 if kpi_match:
                     expectation.kpi_name = kpi_match.group(1)
                 
@@ -88,4 +174,148 @@ class ExpectationParser:
             
             expectations.append(expectation)
             
-        return expectations
\ No newline at end of file
+        return expectations
+
+
+class ExpectationIndex:
+    """
+    Compiled, vectorized index of measurable expectations.
+
+    Each measurable expectation becomes one row of three parallel NumPy
+    arrays: KPI id (position in ``kpi_names``), operator code and threshold
+    in canonical units. Checking every expectation against a metrics
+    vector is then a single gather, subtract and table lookup.
+    """
+
+    def __init__(
+        self,
+        expectations: Iterable[Expectation],
+        metric_aliases: Mapping[str, str] | None = None,
+    ):
+        """
+        Compile expectations into arrays.
+
+        Args:
+            expectations: Parsed expectations; ones that are not measurable or
+                have a non-numeric value or unknown operator are kept in ``skipped``
+            metric_aliases: Maps metric names to KPI names (default: adapter metric names);
+                metrics named like a KPI always match directly
+        """
+        self.metric_aliases = dict(
+            DEFAULT_METRIC_ALIASES if metric_aliases is None else metric_aliases
+        )
+        self.expectation_ids: list[str] = []
+        self.units: list[str] = []
+        self.kpi_names: list[str] = []
+        self.skipped: list[Expectation] = []
+        kpi_positions: dict[str, int] = {}
+        kpi_ids: list[int] = []
+        operators: list[int] = []
+        thresholds: list[float] = []
+
+        for expectation in expectations:
+            operator = _OPERATOR_ALIASES.get(expectation.operator, expectation.operator)
+            if not expectation.is_measurable() or operator not in OPERATOR_CODES:
+                self.skipped.append(expectation)
+                continue
+            try:
+                threshold, unit = normalize_value(expectation.kpi_value, expectation.kpi_unit)
+            except ValueError:
+                self.skipped.append(expectation)
+                continue
+
+            if expectation.kpi_name not in kpi_positions:
+                kpi_positions[expectation.kpi_name] = len(self.kpi_names)
+                self.kpi_names.append(expectation.kpi_name)
+            self.expectation_ids.append(expectation.expectation_id)
+            self.units.append(unit)
+            kpi_ids.append(kpi_positions[expectation.kpi_name])
+            operators.append(OPERATOR_CODES[operator])
+            thresholds.append(threshold)
+
+        self._kpi_positions = kpi_positions
+        self.kpi_ids = np.array(kpi_ids, dtype=np.intp)
+        self.operators = np.array(operators, dtype=np.int8)
+        self.thresholds = np.array(thresholds, dtype=np.float64)
+
+    @classmethod
+    def from_intent(
+        cls,
+        intent_data: Dict[str, Any],
+        metric_aliases: Mapping[str, str] | None = None,
+    ) -> "ExpectationIndex":
+        """Parse and compile the expectations of a TMF921 intent."""
+        return cls(ExpectationParser().parse(intent_data), metric_aliases)
+
+    def __len__(self) -> int:
+        """Number of indexed expectations."""
+        return len(self.expectation_ids)
+
+    def metrics_vector(
+        self,
+        metrics: Mapping[str, Any],
+        units: Mapping[str, str] | None = None,
+    ) -> np.ndarray:
+        """
+        Build the KPI vector for a metrics sample.
+
+        Args:
+            metrics: Metric name to value; non-numeric values are ignored
+            units: Optional unit per metric name; values without one are
+                assumed to be in canonical units already
+
+        Returns:
+            Array aligned with ``kpi_names``; KPIs without a measurement are NaN
+        """
+        vector = np.full(len(self.kpi_names), np.nan)
+        for name, value in metrics.items():
+            position = self._kpi_positions.get(self.metric_aliases.get(name, name))
+            if position is None or isinstance(value, bool):
+                continue
+            unit = units.get(name) if units else None
+            if unit:
+                try:
+                    value, _ = normalize_value(value, unit)
+                except ValueError:
+                    continue
+            elif not isinstance(value, (int, float)):
+                continue
+            vector[position] = value
+        return vector
+
+    def evaluate(self, values: np.ndarray) -> np.ndarray:
+        """
+        Check every expectation against KPI vectors.
+
+        Args:
+            values: KPI vector from metrics_vector(), or a 2-D array with one
+                KPI vector per row to evaluate many samples at once
+
+        Returns:
+            Boolean fulfillment per expectation (one row per sample for 2-D
+            input); expectations whose KPI is unmeasured (NaN) are not fulfilled
+        """
+        difference = np.asarray(values, dtype=np.float64)[..., self.kpi_ids] - self.thresholds
+        missing = np.isnan(difference)
+        sign = np.sign(difference, where=~missing, out=np.zeros_like(difference))
+        fulfilled = _OPERATOR_TRUTH[self.operators, sign.astype(np.intp) + 1]
+        fulfilled &= ~missing
+        return fulfilled
+
+    def check(
+        self,
+        metrics: Mapping[str, Any],
+        units: Mapping[str, str] | None = None,
+    ) -> dict[str, bool]:
+        """Check a metrics sample; returns fulfillment by expectation id."""
+        fulfilled = self.evaluate(self.metrics_vector(metrics, units))
+        return dict(zip(self.expectation_ids, fulfilled.tolist()))
+
+    def violations(
+        self,
+        metrics: Mapping[str, Any],
+        units: Mapping[str, str] | None = None,
+    ) -> list[str]:
+        """Return ids of expectations not fulfilled by a metrics sample."""
+        fulfilled = self.evaluate(self.metrics_vector(metrics, units))
+        return [self.expectation_ids[i] for i in np.flatnonzero(~fulfilled).tolist()]
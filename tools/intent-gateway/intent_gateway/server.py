@@ -0,0 +1,226 @@
+"""
+Intent Gateway validation server.
+
+Keeps the TMF921 schema loaded and the Draft 2020-12 validator compiled
+for the lifetime of the process, so each validation request only pays for
+JSON parsing and schema evaluation. Serves HTTP over a Unix socket
+(default) or TCP:
+
+    GET  /health                                   -> {"status": "healthy"}
+    POST /validate[?tio_mode=&verbose=&deterministic=]  (body: intent JSON)
+
+Validation responses carry the CLI output document as the body and the CLI
+exit code (0/1/2) in the X-Intent-Gateway-Exit-Code header.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from .cli import create_error_output, validate_intent_text
+from .client import EXIT_CODE_HEADER, default_socket_path
+from .validator import TMF921Validator
+
+# Refuse request bodies larger than this (bytes)
+MAX_DOCUMENT_SIZE = 16 * 1024 * 1024
+
+# Number of validation results remembered per server
+DEFAULT_CACHE_SIZE = 4096
+
+
+class ValidationService:
+    """Warm validators shared by all request handler threads.
+
+    Schema evaluation dominates the cost of a request, so results for
+    documents seen before (pipelines re-validate unchanged intents) are
+    kept in an LRU cache keyed by a digest of the raw document. Only
+    definitive outcomes (valid/invalid) are cached.
+    """
+
+    def __init__(self, schema_path: Path | None = None, cache_size: int = DEFAULT_CACHE_SIZE):
+        """Load the schema and compile one validator per TIO mode."""
+        strict = TMF921Validator(schema_path)
+        fake = TMF921Validator(schema_path)
+        fake.set_tio_mode("fake")
+        self._validators = {None: strict, "strict": strict, "fake": fake}
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, tuple[int, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validate(
+        self,
+        document: bytes,
+        tio_mode: str | None = None,
+        verbose: bool = False,
+        deterministic: bool | None = None,
+    ) -> tuple[int, dict[str, Any]]:
+        """Validate a raw JSON document; returns exit code and output."""
+        validator = self._validators.get(tio_mode)
+        if validator is None:
+            return 1, create_error_output(
+                f"Invalid TIO mode: {tio_mode}", deterministic=deterministic
+            )
+
+        key = (hashlib.blake2b(document, digest_size=16).digest(), tio_mode, verbose, deterministic)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            exit_code, output = cached
+            output = dict(output)
+            if "timestamp" in output:
+                output["timestamp"] = datetime.now(timezone.utc).isoformat()
+            return exit_code, output
+
+        exit_code, output = validate_intent_text(
+            validator, document, tio_mode, verbose, deterministic
+        )
+        if exit_code in (0, 2) and self.cache_size > 0:
+            with self._lock:
+                self._cache[key] = (exit_code, output)
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return exit_code, output
+
+
+class GatewayRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for health and validation requests."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "intent-gateway/0.1.0"
+
+    def _send_json(self, status: int, body: str, exit_code: int | None = None) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if exit_code is not None:
+            self.send_header(EXIT_CODE_HEADER, str(exit_code))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:  # noqa: N802
+        if urlsplit(self.path).path == "/health":
+            self._send_json(200, json.dumps({"status": "healthy"}))
+        else:
+            self._send_json(404, json.dumps({"error": "Endpoint not found"}))
+
+    def do_POST(self) -> None:  # noqa: N802
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+
+        if url.path != "/validate":
+            self.rfile.read(length)
+            self._send_json(404, json.dumps({"error": "Endpoint not found"}))
+            return
+        if length > MAX_DOCUMENT_SIZE:
+            self.close_connection = True
+            self._send_json(413, json.dumps({"error": "Document too large"}))
+            return
+
+        document = self.rfile.read(length)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        deterministic = params.get("deterministic") == "true"
+        exit_code, output = self.server.service.validate(
+            document,
+            tio_mode=params.get("tio_mode"),
+            verbose=params.get("verbose") == "true",
+            deterministic=deterministic,
+        )
+        self._send_json(200, json.dumps(output, indent=2, sort_keys=True), exit_code)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Requests are answered in microseconds; per-request logging would dominate
+        pass
+
+
+class _GatewayServerMixin:
+    """Shared lifecycle helpers for the Unix socket and TCP servers."""
+
+    daemon_threads = True
+    service: ValidationService
+    address_description: str
+
+    def shutdown_and_cleanup(self) -> None:
+        """Close the listening socket and remove the Unix socket file."""
+        self.server_close()
+        if isinstance(self.server_address, str) and os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+class UnixGatewayServer(_GatewayServerMixin, socketserver.ThreadingUnixStreamServer):
+    """Threaded HTTP server on a Unix domain socket."""
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) style client address
+        return request, ("unix", 0)
+
+
+class TCPGatewayServer(_GatewayServerMixin, socketserver.ThreadingMixIn, HTTPServer):
+    """Threaded HTTP server on TCP."""
+
+    pass
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    """Remove a leftover socket file, refusing if a server still answers on it."""
+    if not socket_path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+    except OSError:
+        socket_path.unlink()
+    else:
+        raise RuntimeError(f"A server is already listening on {socket_path}")
+    finally:
+        probe.close()
+
+
+def create_server(
+    socket_path: Path | None = None,
+    host: str | None = None,
+    port: int = 8765,
+    schema_path: Path | None = None,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+) -> UnixGatewayServer | TCPGatewayServer:
+    """
+    Create a validation server with a warm validator.
+
+    Args:
+        socket_path: Unix socket to listen on (default: default_socket_path())
+        host: Listen on TCP host:port instead of a Unix socket
+        port: TCP port used with host (0 picks a free port)
+        schema_path: TMF921 JSON schema
+        cache_size: Number of validation results to cache (0 disables)
+
+    Returns:
+        Server ready for serve_forever()
+    """
+    service = ValidationService(schema_path, cache_size)
+
+    server: UnixGatewayServer | TCPGatewayServer
+    if host:
+        server = TCPGatewayServer((host, port), GatewayRequestHandler)
+        bound_host, bound_port = server.server_address[:2]
+        server.address_description = f"http://{bound_host}:{bound_port}"
+    else:
+        socket_path = Path(socket_path or default_socket_path())
+        _remove_stale_socket(socket_path)
+        server = UnixGatewayServer(str(socket_path), GatewayRequestHandler)
+        os.chmod(socket_path, 0o600)
+        server.address_description = f"unix://{socket_path}"
+
+    server.service = service
+    return server
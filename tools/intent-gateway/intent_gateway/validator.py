@@ -51,6 +51,8 @@ class TMF921Validator:
         
         self.schema_path = schema_path
         self.schema = self._load_schema()
+        # Compiled once; Draft202012Validator is stateless between documents
+        self._validator = Draft202012Validator(self.schema)
         self.tio_mode: str | None = None
 
     def _load_schema(self) -> dict[str, Any]:
@@ -79,12 +81,13 @@ class TMF921Validator:
         """
         self.tio_mode = mode
 
-    def validate(self, intent_data: Any) -> ValidationResult:
+    def validate(self, intent_data: Any, max_errors: int | None = None) -> ValidationResult:
         """
         Validate intent data against TMF921 schema.
 
         Args:
             intent_data: Intent data to validate
+            max_errors: Stop collecting errors after this many (None for all)
 
         Returns:
             ValidationResult with validation status and details
@@ -106,17 +109,19 @@ class TMF921Validator:
             )
 
         # Perform actual schema validation
-        validator = Draft202012Validator(self.schema)
         errors = []
 
-        # Collect all validation errors
-        for error in validator.iter_errors(intent_data):
+        # Collect validation errors; iter_errors is lazy, so a cap also
+        # skips evaluating the rest of the document
+        for error in self._validator.iter_errors(intent_data):
             if error.absolute_path:
                 path_str = ".".join(str(p) for p in error.absolute_path)
                 error_msg = f"Field '{path_str}': {error.message}"
             else:
                 error_msg = error.message
             errors.append(error_msg)
+            if max_errors is not None and len(errors) >= max_errors:
+                break
 
         # Handle empty data specially
         if not intent_data:
@@ -0,0 +1,194 @@
+"""
+Test suite for intent-gateway bulk validation.
+
+This module tests the validate-many command and the bulk validation
+helpers: input discovery, ordering across worker processes, fail-fast,
+per-document error caps and aggregate stats.
+"""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from intent_gateway.bulk import iter_bulk_tasks, run_bulk_validation
+
+SAMPLES_DIR = Path(__file__).parent.parent / "samples" / "tmf921"
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    """NDJSON corpus alternating valid and invalid intents plus one bad line."""
+    valid = json.loads((SAMPLES_DIR / "valid_01.json").read_text())
+    invalid = json.loads((SAMPLES_DIR / "invalid_01.json").read_text())
+    lines = []
+    for index in range(20):
+        document = dict(valid if index % 2 == 0 else invalid)
+        document["id"] = f"intent-{index:03d}"
+        lines.append(json.dumps(document))
+    lines.insert(10, "{ not json")
+    path = tmp_path / "corpus.ndjson"
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def collect(tasks, **options) -> tuple[list[dict], dict]:
+    """Run bulk validation and return records and deterministic stats."""
+    records: list[dict] = []
+    summary = run_bulk_validation(tasks, records.append, **options)
+    return records, summary.to_dict(deterministic=True)
+
+
+class TestBulkTasks:
+    """Test input discovery."""
+
+    def test_directory_yields_sorted_json_files(self):
+        """Test directories yield their JSON files in sorted order."""
+        tasks = list(iter_bulk_tasks(str(SAMPLES_DIR)))
+
+        assert [Path(task[0]).name for task in tasks] == ["invalid_01.json", "valid_01.json"]
+        assert all(kind == "file" for _, kind, _ in tasks)
+
+    def test_ndjson_skips_blank_lines(self, tmp_path: Path):
+        """Test NDJSON sources are numbered by line, skipping blanks."""
+        path = tmp_path / "intents.jsonl"
+        path.write_text('{"id": "a"}\n\n{"id": "b"}\n')
+
+        assert [task[0] for task in iter_bulk_tasks(str(path))] == [
+            f"{path}:1",
+            f"{path}:3",
+        ]
+
+    def test_missing_input_raises(self, tmp_path: Path):
+        """Test an input matching nothing raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            list(iter_bulk_tasks(str(tmp_path / "missing-*.json")))
+
+    def test_matches_converter_batch_inputs(self, tmp_path: Path):
+        """Test inputs are enumerated exactly like the converter's batch mode."""
+        batch = pytest.importorskip("tmf921_to_28312.batch")
+        (tmp_path / "b.json").write_text("{}")
+        (tmp_path / "a.json").write_text("{}")
+        stream = tmp_path / "intents.ndjson"
+        stream.write_text('{"id": "a"}\n\n{"id": "b"}\n')
+
+        for source in (str(tmp_path), str(tmp_path / "*.json"), str(stream)):
+            assert list(iter_bulk_tasks(source)) == list(batch.iter_batch_tasks(source))
+
+
+class TestBulkValidation:
+    """Test bulk validation results and stats."""
+
+    def test_serial_results_and_stats(self, corpus: Path):
+        """Test per-intent statuses and aggregate counts."""
+        records, stats = collect(iter_bulk_tasks(str(corpus)))
+
+        assert len(records) == 21
+        assert records[0]["status"] == "valid"
+        assert records[1]["status"] == "invalid"
+        assert records[1]["errors"]
+        assert records[10]["status"] == "error"
+        assert "json" in records[10]["message"].lower()
+        assert stats["total"] == 21
+        assert stats["valid"] == 10
+        assert stats["invalid"] == 10
+        assert stats["errors"] == 1
+        assert stats["stopped_early"] is False
+        assert stats["most_common_errors"][0]["count"] == 10
+        assert "elapsed_seconds" not in stats
+
+    def test_parallel_matches_serial_order(self, corpus: Path):
+        """Test worker processes yield the same records in input order."""
+        serial, _ = collect(iter_bulk_tasks(str(corpus)))
+        parallel, _ = collect(iter_bulk_tasks(str(corpus)), workers=2, chunk_size=3)
+
+        assert parallel == serial
+
+    def test_fail_fast_stops_at_first_failure(self, corpus: Path):
+        """Test fail-fast stops after the first failing document."""
+        records, stats = collect(
+            iter_bulk_tasks(str(corpus)), fail_fast=True, workers=2, chunk_size=2
+        )
+
+        assert [record["status"] for record in records] == ["valid", "invalid"]
+        assert stats["stopped_early"] is True
+
+    def test_max_errors_caps_errors_per_document(self, corpus: Path):
+        """Test the per-document error cap."""
+        records, _ = collect(iter_bulk_tasks(str(corpus)), max_errors=1)
+
+        assert all(len(record.get("errors", [])) <= 1 for record in records)
+        assert len(records[1]["errors"]) == 1
+
+    def test_compliance_results_are_attached(self, corpus: Path):
+        """Test compliance checking runs on the same parsed documents."""
+        records, stats = collect(iter_bulk_tasks(str(corpus)), compliance=True)
+
+        assert "compliance" in records[0]
+        assert "compliance" not in records[10]
+        assert stats["non_compliant"] == sum(
+            1 for record in records if "compliance" in record and not record["compliance"]["compliant"]
+        )
+
+    def test_fake_mode_accepts_everything_parseable(self, corpus: Path):
+        """Test fake TIO mode bypasses schema validation in workers."""
+        _, stats = collect(iter_bulk_tasks(str(corpus)), tio_mode="fake", workers=2)
+
+        assert stats["valid"] == 20
+        assert stats["errors"] == 1
+
+
+class TestValidateManyCLI:
+    """Test the validate-many command."""
+
+    def run_cli(self, args: list[str]) -> subprocess.CompletedProcess:
+        """Helper to run the CLI deterministically."""
+        env = {
+            **os.environ,
+            "PYTHONPATH": str(Path(__file__).parent.parent),
+            "INTENT_GATEWAY_DETERMINISTIC": "true",
+        }
+        return subprocess.run(
+            ["python3", "-m", "intent_gateway.cli", "validate-many"] + args,
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent,
+            env=env,
+        )
+
+    def test_directory_with_invalid_intent_exits_two(self, tmp_path: Path):
+        """Test NDJSON output, stats file and exit code 2 for invalid intents."""
+        summary = tmp_path / "summary.json"
+        result = self.run_cli(
+            ["--input", str(SAMPLES_DIR), "--workers", "2", "--summary", str(summary)]
+        )
+
+        assert result.returncode == 2
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [record["status"] for record in records] == ["invalid", "valid"]
+        stats = json.loads(summary.read_text())
+        assert stats == json.loads(result.stderr)
+        assert stats["total"] == 2
+
+    def test_valid_only_exits_zero(self):
+        """Test a fully valid corpus exits with code 0."""
+        result = self.run_cli(["--input", str(SAMPLES_DIR / "valid_*.json"), "--workers", "1"])
+
+        assert result.returncode == 0
+        assert json.loads(result.stdout)["status"] == "valid"
+
+    def test_unreadable_document_exits_one(self, corpus: Path):
+        """Test a malformed document makes the run exit with code 1."""
+        result = self.run_cli(["--input", str(corpus), "--workers", "1"])
+
+        assert result.returncode == 1
+        assert len(result.stdout.splitlines()) == 21
+
+    def test_missing_input_exits_one(self, tmp_path: Path):
+        """Test a missing input exits with code 1 and a JSON error."""
+        result = self.run_cli(["--input", str(tmp_path / "nothing")])
+
+        assert result.returncode == 1
+        assert json.loads(result.stdout)["status"] == "error"
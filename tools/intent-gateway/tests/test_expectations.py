@@ -0,0 +1,181 @@
+"""
+Test suite for the compiled expectation index.
+
+This module tests unit normalization and the vectorized evaluation of
+parsed TMF921 expectations against metric samples.
+"""
+
+import numpy as np
+import pytest
+
+from intent_gateway.expectations import (
+    DEFAULT_METRIC_ALIASES,
+    UNIT_SCALES,
+    Expectation,
+    ExpectationIndex,
+    ExpectationParser,
+    normalize_value,
+)
+
+
+def make_intent(conditions: list[tuple[str, str, str]]) -> dict:
+    """Build a TMF921 intent from (targetCondition, value, unit) triples."""
+    return {
+        "id": "intent-kpi",
+        "expectation": [
+            {
+                "id": f"exp-{index:03d}",
+                "expectationType": "DeliveryExpectation",
+                "targetCondition": condition,
+                "targetValue": {"value": value, "unit": unit},
+            }
+            for index, (condition, value, unit) in enumerate(conditions)
+        ],
+    }
+
+
+class TestNormalizeValue:
+    """Test conversion to canonical units."""
+
+    def test_scales_to_canonical_units(self):
+        """Test time, bit rate and percentage scaling."""
+        assert normalize_value("1", "s") == (1000.0, "ms")
+        assert normalize_value("2.5", "Gbps") == (2500.0, "Mbps")
+        assert normalize_value("99.9", "%") == (pytest.approx(0.999), "")
+        assert normalize_value("10ms") == (10.0, "ms")
+
+    def test_unknown_unit_is_kept(self):
+        """Test unknown units pass through unscaled."""
+        assert normalize_value(5, "pps") == (5.0, "pps")
+
+    def test_non_numeric_value_raises(self):
+        """Test non-numeric values raise ValueError."""
+        with pytest.raises(ValueError):
+            normalize_value("fast")
+
+    def test_tables_match_the_converter(self):
+        """Test the unit and alias tables equal the 28.312 converter's copy."""
+        units = pytest.importorskip("tmf921_to_28312.units")
+
+        assert UNIT_SCALES == units.UNIT_SCALES
+        assert DEFAULT_METRIC_ALIASES == units.DEFAULT_METRIC_ALIASES
+
+
+class TestExpectationIndex:
+    """Test the vectorized expectation index."""
+
+    @pytest.fixture
+    def index(self) -> ExpectationIndex:
+        """Index over latency, throughput and availability expectations."""
+        return ExpectationIndex.from_intent(make_intent([
+            ("latency <= 10 ms", "10", "ms"),
+            ("latency < 0.005 s", "0.005", "s"),
+            ("throughput >= 1 Gbps", "1", "Gbps"),
+            ("availability > 99.9 %", "99.9", "%"),
+        ]))
+
+    def test_arrays_use_canonical_units(self, index: ExpectationIndex):
+        """Test KPI ids, operator codes and thresholds."""
+        assert index.kpi_names == ["latency", "throughput", "availability"]
+        assert index.kpi_ids.tolist() == [0, 0, 1, 2]
+        assert index.operators.tolist() == [1, 0, 3, 2]
+        assert index.thresholds.tolist() == pytest.approx([10.0, 5.0, 1000.0, 0.999])
+        assert index.units == ["ms", "ms", "Mbps", ""]
+
+    def test_check_and_violations(self, index: ExpectationIndex):
+        """Test fulfillment of a single metrics sample."""
+        metrics = {"latency": 7.0, "throughput": 1200.0, "availability": 0.95}
+
+        assert index.check(metrics) == {
+            "exp-000": True,
+            "exp-001": False,
+            "exp-002": True,
+            "exp-003": False,
+        }
+        assert index.violations(metrics) == ["exp-001", "exp-003"]
+
+    def test_metric_aliases_and_units(self, index: ExpectationIndex):
+        """Test adapter metric names and per-metric units are normalized."""
+        vector = index.metrics_vector(
+            {"latency_p95_ms": 0.004, "throughput_p95_mbps": 2, "metadata": {"site": "edge1"}},
+            units={"latency_p95_ms": "s", "throughput_p95_mbps": "Gbps"},
+        )
+
+        assert vector[:2].tolist() == pytest.approx([4.0, 2000.0])
+        assert np.isnan(vector[2])
+
+    def test_non_numeric_metrics_are_ignored(self, index: ExpectationIndex):
+        """Test non-numeric values are ignored, with or without a unit."""
+        vector = index.metrics_vector(
+            {"latency": "n/a", "throughput": "fast", "packet_loss": True},
+            units={"latency": "ms"},
+        )
+
+        assert np.isnan(vector).all()
+
+    def test_missing_kpi_is_not_fulfilled(self, index: ExpectationIndex):
+        """Test expectations on unmeasured KPIs are not fulfilled."""
+        assert index.violations({"latency": 1.0, "throughput": 5000.0}) == ["exp-003"]
+
+    def test_evaluate_many_samples(self, index: ExpectationIndex):
+        """Test 2-D input evaluates one row per sample."""
+        samples = np.array([
+            [1.0, 2000.0, 1.0],
+            [20.0, 10.0, 0.5],
+        ])
+
+        fulfilled = index.evaluate(samples)
+
+        assert fulfilled.shape == (2, 4)
+        assert fulfilled.tolist() == [[True, True, True, True], [False, False, False, False]]
+
+    def test_equality_operators_from_old_format(self):
+        """Test symbolic operators of the expectedValue format."""
+        index = ExpectationIndex([
+            Expectation("a", "t", kpi_name="slices", kpi_value="3", operator="=="),
+            Expectation("b", "t", kpi_name="slices", kpi_value="3", operator="!="),
+        ])
+
+        assert index.check({"slices": 3}) == {"a": True, "b": False}
+        assert index.check({"slices": 4}) == {"a": False, "b": True}
+
+    def test_unusable_expectations_are_skipped(self):
+        """Test non-measurable and non-numeric expectations are skipped."""
+        expectations = [
+            Expectation("a", "t"),
+            Expectation("b", "t", kpi_name="mode", kpi_value="fast", operator="equal"),
+            Expectation("c", "t", kpi_name="latency", kpi_value="5", operator="between"),
+            Expectation("d", "t", kpi_name="latency", kpi_value="5", operator="lessThan"),
+        ]
+
+        index = ExpectationIndex(expectations)
+
+        assert index.expectation_ids == ["d"]
+        assert [e.expectation_id for e in index.skipped] == ["a", "b", "c"]
+
+    def test_large_index_matches_scalar_evaluation(self):
+        """Test vectorized results agree with a per-expectation loop."""
+        rng = np.random.default_rng(921)
+        symbols = ["<", "<=", ">", ">=", "="]
+        conditions = [
+            (f"kpi{i % 50} {symbols[i % 5]} {v}", str(v), "")
+            for i, v in enumerate(rng.integers(0, 100, 5000).tolist())
+        ]
+        parsed = ExpectationParser().parse(make_intent(conditions))
+        index = ExpectationIndex(parsed)
+        metrics = {f"kpi{k}": float(v) for k, v in enumerate(rng.integers(0, 100, 50).tolist())}
+
+        checks = {
+            "lessThan": lambda a, b: a < b,
+            "lessThanOrEqual": lambda a, b: a <= b,
+            "greaterThan": lambda a, b: a > b,
+            "greaterThanOrEqual": lambda a, b: a >= b,
+            "equal": lambda a, b: a == b,
+        }
+        expected = {
+            e.expectation_id: checks[e.operator](metrics[e.kpi_name], float(e.kpi_value))
+            for e in parsed
+        }
+
+        assert len(index) == 5000
+        assert index.check(metrics) == expected
@@ -0,0 +1,165 @@
+"""
+Test suite for the intent-gateway validation server and thin client.
+
+This module tests that validation routed through a long-running server
+keeps the CLI output and exit code contract (0/1/2).
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from intent_gateway.client import GatewayClient, ServerUnavailable, validate_via_server
+from intent_gateway.server import ValidationService, create_server
+
+SAMPLES_DIR = Path(__file__).parent.parent / "samples" / "tmf921"
+
+
+@pytest.fixture
+def socket_path():
+    """Short Unix socket path (AF_UNIX paths are length limited)."""
+    with tempfile.TemporaryDirectory(prefix="igw-") as temp_dir:
+        yield Path(temp_dir) / "gw.sock"
+
+
+@pytest.fixture
+def server(socket_path: Path):
+    """Validation server running in a background thread."""
+    server = create_server(socket_path=socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.shutdown_and_cleanup()
+    thread.join(timeout=5)
+
+
+class TestValidationService:
+    """Test the warm validation service."""
+
+    def test_valid_invalid_and_malformed_documents(self):
+        """Test exit codes for valid, invalid and malformed documents."""
+        service = ValidationService()
+
+        valid_code, valid_output = service.validate((SAMPLES_DIR / "valid_01.json").read_bytes())
+        invalid_code, _ = service.validate((SAMPLES_DIR / "invalid_01.json").read_bytes())
+        malformed_code, malformed_output = service.validate(b"{ invalid json ")
+
+        assert valid_code == 0
+        assert valid_output["status"] == "valid"
+        assert invalid_code == 2
+        assert malformed_code == 1
+        assert "json" in malformed_output["message"].lower()
+
+    def test_cached_results_refresh_timestamp(self):
+        """Test cached results are reused with a fresh timestamp."""
+        service = ValidationService(cache_size=1)
+        document = (SAMPLES_DIR / "valid_01.json").read_bytes()
+
+        first_code, first = service.validate(document)
+        second_code, second = service.validate(document)
+
+        assert first_code == second_code == 0
+        assert first is not second
+        assert {k: v for k, v in first.items() if k != "timestamp"} == {
+            k: v for k, v in second.items() if k != "timestamp"
+        }
+
+    def test_cache_is_bounded(self):
+        """Test the LRU cache never exceeds its size."""
+        service = ValidationService(cache_size=2)
+        for index in range(5):
+            service.validate(json.dumps({"id": f"intent-{index}"}).encode())
+
+        assert len(service._cache) == 2
+
+    def test_invalid_tio_mode(self):
+        """Test unknown TIO modes are reported as errors."""
+        exit_code, output = ValidationService().validate(b"{}", tio_mode="bogus")
+
+        assert exit_code == 1
+        assert output["status"] == "error"
+
+
+class TestGatewayServer:
+    """Test the validation server over a Unix socket."""
+
+    def test_health(self, server, socket_path: Path):
+        """Test the health endpoint."""
+        assert GatewayClient(socket_path=socket_path).health() is True
+
+    def test_validate_exit_codes(self, server, socket_path: Path):
+        """Test exit codes are carried back to the client."""
+        client = GatewayClient(socket_path=socket_path)
+        try:
+            valid_code, valid_body = client.validate((SAMPLES_DIR / "valid_01.json").read_bytes())
+            invalid_code, _ = client.validate((SAMPLES_DIR / "invalid_01.json").read_bytes())
+            fake_code, fake_body = client.validate(
+                (SAMPLES_DIR / "invalid_01.json").read_bytes(), tio_mode="fake", deterministic=True
+            )
+        finally:
+            client.close()
+
+        assert valid_code == 0
+        assert json.loads(valid_body)["status"] == "valid"
+        assert invalid_code == 2
+        assert fake_code == 0
+        assert "timestamp" not in json.loads(fake_body)
+
+    def test_refuses_second_server_on_same_socket(self, server, socket_path: Path):
+        """Test a live socket is not replaced by a second server."""
+        with pytest.raises(RuntimeError):
+            create_server(socket_path=socket_path)
+
+    def test_client_without_server(self, socket_path: Path):
+        """Test the client reports an unavailable server."""
+        assert GatewayClient(socket_path=socket_path).health() is False
+        with pytest.raises(ServerUnavailable):
+            GatewayClient(socket_path=socket_path).validate(b"{}")
+
+    def test_validate_via_server_falls_back(self, socket_path: Path, monkeypatch):
+        """Test routing returns None when no server is running."""
+        monkeypatch.setenv("INTENT_GATEWAY_SOCKET", str(socket_path))
+        monkeypatch.delenv("INTENT_GATEWAY_SERVER", raising=False)
+
+        assert validate_via_server(b"{}") is None
+
+
+class TestCLIRouting:
+    """Test that the CLI routes through a running server."""
+
+    def run_cli(self, args: list[str], socket_path: Path) -> subprocess.CompletedProcess:
+        """Run the CLI pointing at the test server socket."""
+        env = {
+            **os.environ,
+            "PYTHONPATH": str(Path(__file__).parent.parent),
+            "INTENT_GATEWAY_SOCKET": str(socket_path),
+            "INTENT_GATEWAY_DETERMINISTIC": "true",
+        }
+        env.pop("INTENT_GATEWAY_NO_SERVER", None)
+        return subprocess.run(
+            ["python3", "-m", "intent_gateway.cli"] + args,
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent,
+            env=env,
+        )
+
+    @pytest.mark.parametrize(
+        "sample,exit_code", [("valid_01.json", 0), ("invalid_01.json", 2)]
+    )
+    def test_routed_output_matches_local(self, server, socket_path: Path, sample, exit_code):
+        """Test routed and in-process validation give identical results."""
+        args = ["validate", "--file", str(SAMPLES_DIR / sample)]
+
+        routed = self.run_cli(args, socket_path)
+        local = self.run_cli(args + ["--no-server"], socket_path)
+
+        assert len(server.service._cache) == 1
+        assert routed.returncode == local.returncode == exit_code
+        assert routed.stdout == local.stdout
@@ -0,0 +1,224 @@
+"""
+Tests for bulk streaming conversion of TMF921 intents.
+
+This module tests batch input discovery, pooled conversion, sharded
+output and the aggregated coverage summary.
+"""
+
+import io
+import json
+import tempfile
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from tmf921_to_28312.batch import (
+    BatchSummary,
+    ShardedNDJSONWriter,
+    iter_batch_tasks,
+    run_batch
+)
+from tmf921_to_28312.cli import convert_batch_command, main
+
+
+def make_intent(index: int) -> dict:
+    """Build a minimal convertible TMF921 intent."""
+    return {
+        "id": f"batch-intent-{index:03d}",
+        "intentType": "ServiceIntent",
+        "customField": index,
+        "intentSpecification": {
+            "intentExpectations": [
+                {
+                    "expectationType": "deliver",
+                    "expectationTargets": [
+                        {"targetName": "latency", "targetCondition": "lessThan", "targetValue": "10"}
+                    ]
+                }
+            ]
+        }
+    }
+
+
+@pytest.fixture
+def intent_dir():
+    """Directory with five intent files."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for index in range(5):
+            (Path(temp_dir) / f"intent_{index}.json").write_text(json.dumps(make_intent(index)))
+        yield Path(temp_dir)
+
+
+class TestBatchInputs:
+    """Test discovery of batch inputs."""
+    
+    def test_directory_input_sorted(self, intent_dir):
+        """Test a directory yields its JSON files in sorted order."""
+        tasks = list(iter_batch_tasks(str(intent_dir)))
+        
+        assert [Path(task[0]).name for task in tasks] == [f"intent_{i}.json" for i in range(5)]
+        assert all(task[1] == "file" for task in tasks)
+    
+    def test_glob_input(self, intent_dir):
+        """Test glob patterns are expanded."""
+        tasks = list(iter_batch_tasks(str(intent_dir / "intent_[12].json")))
+        
+        assert len(tasks) == 2
+    
+    def test_ndjson_stdin_skips_blank_lines(self):
+        """Test NDJSON on stdin yields one task per non-blank line."""
+        stream = io.StringIO(json.dumps(make_intent(0)) + "\n\n" + json.dumps(make_intent(1)) + "\n")
+        
+        tasks = list(iter_batch_tasks("-", stdin=stream))
+        
+        assert [task[0] for task in tasks] == ["<stdin>:1", "<stdin>:3"]
+        assert all(task[1] == "line" for task in tasks)
+    
+    def test_missing_input(self):
+        """Test a pattern without matches raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            list(iter_batch_tasks("/nonexistent/*.json"))
+
+
+class TestRunBatch:
+    """Test pooled batch conversion."""
+    
+    def test_in_process_conversion(self, intent_dir):
+        """Test single-worker conversion emits one record per intent."""
+        records = []
+        
+        summary = run_batch(iter_batch_tasks(str(intent_dir)), records.append)
+        
+        assert summary.total == 5
+        assert summary.succeeded == 5
+        assert [r["intent_id"] for r in records] == [f"batch-intent-{i:03d}" for i in range(5)]
+        assert all(len(r["expectations"]) == 1 for r in records)
+    
+    def test_process_pool_preserves_order(self, intent_dir):
+        """Test multi-worker conversion keeps input order with a small window."""
+        records = []
+        
+        summary = run_batch(
+            iter_batch_tasks(str(intent_dir)), records.append, workers=2, max_in_flight=2
+        )
+        
+        assert summary.succeeded == 5
+        assert [r["intent_id"] for r in records] == [f"batch-intent-{i:03d}" for i in range(5)]
+    
+    def test_invalid_lines_are_reported(self):
+        """Test invalid JSON and unsupported intents become failed records."""
+        stream = io.StringIO(
+            "{not json}\n"
+            + json.dumps({"id": "x", "intentType": "OtherIntent"}) + "\n"
+            + json.dumps(make_intent(0)) + "\n"
+        )
+        records = []
+        
+        summary = run_batch(iter_batch_tasks("-", stdin=stream), records.append)
+        
+        assert summary.failed == 2
+        assert summary.succeeded == 1
+        assert "Invalid JSON" in records[0]["error_message"]
+        assert "Unsupported intent type" in records[1]["error_message"]
+    
+    def test_progress_callback(self, intent_dir):
+        """Test progress is reported periodically and at the end."""
+        totals = []
+        
+        run_batch(
+            iter_batch_tasks(str(intent_dir)), lambda record: None,
+            progress=lambda summary: totals.append(summary.total), progress_every=2
+        )
+        
+        assert totals == [2, 4, 5]
+
+    def test_progress_every_must_be_positive(self, intent_dir):
+        """Test a zero progress interval is rejected before converting."""
+        with pytest.raises(ValueError, match="progress_every"):
+            run_batch(iter_batch_tasks(str(intent_dir)), lambda record: None, progress_every=0)
+
+
+class TestBatchSummary:
+    """Test aggregated coverage statistics."""
+    
+    def test_collapses_array_indices(self):
+        """Test unmapped paths are aggregated across array indices."""
+        summary = BatchSummary()
+        for index in range(3):
+            summary.add({
+                "success": True,
+                "expectations": [{}],
+                "delta_report": {
+                    "unmapped_fields": [{"tmf921_path": f"items[{index}].extra"}],
+                    "conversion_summary": {
+                        "total_fields_processed": 4,
+                        "successfully_mapped": 3,
+                        "unmapped_count": 1
+                    }
+                }
+            })
+        summary.add({"success": False})
+        
+        result = summary.to_dict()
+        
+        assert result["total_intents"] == 4
+        assert result["failed"] == 1
+        assert result["mapping_coverage"] == 0.75
+        assert result["most_common_unmapped"] == [{"tmf921_path": "items[*].extra", "count": 3}]
+
+
+class TestShardedWriter:
+    """Test sharded NDJSON output."""
+    
+    def test_rolls_over_shards(self):
+        """Test records are split into fixed-size shards."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            writer = ShardedNDJSONWriter(Path(temp_dir), shard_size=2)
+            for index in range(5):
+                writer.write({"index": index})
+            writer.close()
+            
+            shards = sorted(Path(temp_dir).glob("results-*.ndjson"))
+            assert [len(s.read_text().splitlines()) for s in shards] == [2, 2, 1]
+
+
+class TestConvertBatchCommand:
+    """Test the convert-batch CLI command."""
+    
+    def test_convert_batch_to_file(self, intent_dir):
+        """Test batch conversion writes NDJSON and summary files."""
+        output_file = intent_dir / "out" / "results.ndjson"
+        output_file.parent.mkdir()
+        summary_file = intent_dir / "out" / "summary.json"
+        args = Namespace(
+            input=str(intent_dir / "*.json"), output=str(output_file), shard_dir=None,
+            shard_size=1000, mapping=None, workers=1, summary=str(summary_file),
+            progress_every=100, quiet=True
+        )
+        
+        exit_code = convert_batch_command(args)
+        
+        assert exit_code == 0
+        assert len(output_file.read_text().splitlines()) == 5
+        assert json.loads(summary_file.read_text())["succeeded"] == 5
+    
+    def test_convert_batch_missing_input(self):
+        """Test batch conversion fails cleanly for missing input."""
+        args = Namespace(
+            input="/nonexistent/*.json", output="-", shard_dir=None, shard_size=1000,
+            mapping=None, workers=1, summary=None, progress_every=100, quiet=True
+        )
+        
+        assert convert_batch_command(args) == 1
+
+    @pytest.mark.parametrize("option", ["--progress-every", "--shard-size"])
+    def test_convert_batch_rejects_zero_counts(self, option, capsys):
+        """Test the CLI rejects zero progress and shard sizes at parse time."""
+        argv = ["tmf921-to-28312", "convert-batch", "--input", "x.ndjson", option, "0"]
+        with patch("sys.argv", argv), pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 2
+        assert "must be at least 1" in capsys.readouterr().err
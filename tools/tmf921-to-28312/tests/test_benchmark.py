@@ -0,0 +1,133 @@
+"""
+Tests for the converter scaling benchmark.
+
+This module runs the benchmark at a tiny scale and tests baseline
+regression detection.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from tmf921_to_28312.benchmark import (
+    SCENARIOS,
+    compare_to_baseline,
+    generate_intent,
+    main,
+    run_benchmarks
+)
+from tmf921_to_28312.converter import TMF921To28312Converter
+
+
+def make_report(time_s: float, peak: int, scale: float = 1.0) -> dict:
+    """Build a single-stage benchmark report."""
+    return {
+        "scale": scale,
+        "scenarios": {
+            "many_expectations": {
+                "stages": {
+                    "convert": {
+                        "time_s_median": time_s,
+                        "time_s_min": time_s,
+                        "peak_memory_bytes": peak
+                    }
+                }
+            }
+        }
+    }
+
+
+class TestGenerateIntent:
+    """Test synthetic intent generation."""
+    
+    def test_generated_intent_is_deterministic_and_convertible(self):
+        """Test generated intents are stable and convert successfully."""
+        intent = generate_intent(expectations=10, custom_fields=3, nesting_depth=5)
+        
+        assert intent == generate_intent(expectations=10, custom_fields=3, nesting_depth=5)
+        result = TMF921To28312Converter().convert(intent)
+        assert result.success is True
+        assert len(result.expectations) == 10
+        assert result.delta_report["conversion_summary"]["unmapped_count"] > 3
+
+
+class TestRunBenchmarks:
+    """Test the benchmark runner."""
+    
+    def test_report_structure(self):
+        """Test every scenario reports time and memory per stage."""
+        report = run_benchmarks(scale=0.01, repeat=1)
+        
+        assert set(report["scenarios"]) == set(SCENARIOS)
+        for scenario in report["scenarios"].values():
+            assert set(scenario["stages"]) == {"convert", "delta_report", "report_engine"}
+            for metrics in scenario["stages"].values():
+                assert metrics["time_s_min"] <= metrics["time_s_median"]
+                assert metrics["peak_memory_bytes"] > 0
+
+
+class TestCompareToBaseline:
+    """Test regression detection against a baseline."""
+    
+    def test_no_regression_within_threshold(self):
+        """Test changes within the thresholds are accepted."""
+        regressions = compare_to_baseline(make_report(0.15, 1100), make_report(0.1, 1000))
+        
+        assert regressions == []
+    
+    def test_time_regression(self):
+        """Test a slowdown beyond the threshold is flagged."""
+        regressions = compare_to_baseline(
+            make_report(0.3, 1000), make_report(0.1, 1000), threshold=1.0
+        )
+        
+        assert [r["metric"] for r in regressions] == ["time_s_min"]
+        assert regressions[0]["ratio"] == pytest.approx(3.0)
+    
+    def test_memory_regression(self):
+        """Test peak memory growth beyond the threshold is flagged."""
+        regressions = compare_to_baseline(
+            make_report(0.1, 2000), make_report(0.1, 1000), memory_threshold=0.2
+        )
+        
+        assert [r["metric"] for r in regressions] == ["peak_memory_bytes"]
+    
+    def test_tiny_timings_are_not_compared(self):
+        """Test timings below the noise floor are ignored."""
+        regressions = compare_to_baseline(make_report(0.004, 1000), make_report(0.001, 1000))
+        
+        assert regressions == []
+    
+    def test_different_scale_is_not_compared(self):
+        """Test baselines recorded at another scale are skipped."""
+        regressions = compare_to_baseline(
+            make_report(1.0, 9999), make_report(0.1, 1000, scale=0.5)
+        )
+        
+        assert regressions == []
+
+
+class TestBenchmarkMain:
+    """Test the benchmark CLI."""
+    
+    def test_update_then_compare_baseline(self):
+        """Test writing a baseline and comparing a run against it."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            baseline = Path(temp_dir) / "baseline.json"
+            output = Path(temp_dir) / "report.json"
+            common = [
+                "--baseline", str(baseline), "--scale", "0.01", "--repeat", "1",
+                "--scenario", "custom_fields"
+            ]
+            
+            assert main(common + ["--update-baseline", "--output", str(output)]) == 0
+            assert baseline.exists()
+            
+            exit_code = main(common + ["--output", str(output), "--memory-threshold", "10"])
+            
+            report = json.loads(output.read_text())
+            assert exit_code == 0
+            assert report["regressions"] == []
+            assert list(report["scenarios"]) == ["custom_fields"]
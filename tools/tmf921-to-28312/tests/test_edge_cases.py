@@ -16,6 +16,7 @@ from tmf921_to_28312.converter import (
     ConversionError,
     load_tmf921_intent,
     generate_delta_report,
+    DeltaReportMatcher,
     _matches_pattern,
     _count_fields
 )
@@ -340,6 +341,78 @@ class TestPatternMatching:
             assert isinstance(result, bool)
 
 
+class TestDeltaReportMatcher:
+    """Test the precompiled delta report matcher."""
+    
+    def test_first_matching_pattern_wins(self):
+        """Test that patterns are tried in mapping file order."""
+        matcher = DeltaReportMatcher({
+            "specific": {"pattern": "customField", "reason": "specific reason"},
+            "generic": {"pattern": "custom*", "reason": "generic reason"}
+        })
+        
+        assert matcher.match_unmapped("customField")["reason"] == "specific reason"
+        assert matcher.match_unmapped("customOther")["reason"] == "generic reason"
+        assert matcher.match_unmapped("otherField") is None
+    
+    def test_simple_pattern_list(self):
+        """Test matcher built from a plain list of patterns."""
+        matcher = DeltaReportMatcher(["customField", "*.testField"])
+        
+        assert matcher.match_unmapped("customField") is not None
+        assert matcher.match_unmapped("a[0].testField") is not None
+        assert matcher.match_unmapped("testField") is None
+    
+    def test_known_mapped_fields(self):
+        """Test known mapped fields match on full path or dotted suffix."""
+        matcher = DeltaReportMatcher()
+        
+        assert matcher.is_known_mapped("id") is True
+        assert matcher.is_known_mapped("intentSpecification.intentExpectations") is True
+        assert matcher.is_known_mapped("a[0].expectationObject.objectType") is True
+        assert matcher.is_known_mapped("identifier") is False
+        assert matcher.is_known_mapped("a[0]id") is False
+    
+    def test_delta_report_uses_given_matcher(self):
+        """Test generate_delta_report honours an explicit matcher."""
+        matcher = DeltaReportMatcher({"extra": {"pattern": "extra", "reason": "custom"}})
+        
+        delta_report = generate_delta_report({"id": "x", "extra": 1}, [], matcher=matcher)
+        
+        assert delta_report["unmapped_fields"] == [
+            {"tmf921_path": "extra", "value": 1, "type": "int", "reason": "custom"}
+        ]
+    
+    def test_delta_report_preserves_document_order(self):
+        """Test nested unmapped fields are reported in document order."""
+        intent = {"a": {"b": 1}, "c": [{"d": 2}], "e": 3}
+        
+        delta_report = generate_delta_report(intent, [])
+        
+        paths = [field["tmf921_path"] for field in delta_report["unmapped_fields"]]
+        assert paths == ["a", "a.b", "c", "c[0].d", "e"]
+    
+    def test_delta_report_beyond_recursion_limit(self):
+        """Test very deep nesting does not hit the recursion limit."""
+        deep_intent = {"id": "deep"}
+        current = deep_intent
+        for _ in range(5000):
+            current["level"] = {}
+            current = current["level"]
+        
+        delta_report = generate_delta_report(deep_intent, [])
+        
+        assert delta_report["conversion_summary"]["total_fields_processed"] == 5001
+    
+    def test_delta_report_rejects_circular_reference(self):
+        """Test circular references raise a conversion error."""
+        circular_intent = {"id": "circular"}
+        circular_intent["self_ref"] = circular_intent
+        
+        with pytest.raises(ConversionError):
+            generate_delta_report(circular_intent, [])
+
+
 class TestFieldCounting:
     """Test field counting utility function."""
     
@@ -0,0 +1,187 @@
+"""
+Tests for the metric-driven 28.312 IntentReport fulfillment engine.
+
+This module tests target value normalization, condition evaluation and
+incremental report transitions.
+"""
+
+import pytest
+
+from tmf921_to_28312.converter import ConversionError
+from tmf921_to_28312.reporting import (
+    IntentReportEngine,
+    parse_target_value
+)
+from tmf921_to_28312.schemas import validate_28312_report
+
+
+def make_expectation(index: int, attribute: str, condition: str, value: str) -> dict:
+    """Build a converted 28.312 expectation with a single target."""
+    return {
+        "intentExpectationId": f"intent-exp-{index}",
+        "intentExpectationType": "ServicePerformance",
+        "intentExpectationTarget": {
+            "targetAttribute": attribute,
+            "targetCondition": condition,
+            "targetValue": value
+        }
+    }
+
+
+class TestParseTargetValue:
+    """Test target value normalization to canonical units."""
+    
+    @pytest.mark.parametrize("value,expected", [
+        ("10ms", (10.0, 10.0, "ms")),
+        ("1.5s", (1500.0, 1500.0, "ms")),
+        ("1Gbps", (1000.0, 1000.0, "Mbps")),
+        ("100Mbps", (100.0, 100.0, "Mbps")),
+        ("99.9%", (pytest.approx(0.999), pytest.approx(0.999), "")),
+        ("10-20ms", (10.0, 20.0, "ms")),
+        ("42", (42.0, 42.0, "")),
+        (7, (7.0, 7.0, "")),
+    ])
+    def test_parse_target_value(self, value, expected):
+        """Test values and ranges are scaled to canonical units."""
+        assert parse_target_value(value) == expected
+    
+    def test_parse_invalid_target_value(self):
+        """Test unparseable values raise ConversionError."""
+        with pytest.raises(ConversionError):
+            parse_target_value("fast")
+
+
+class TestIntentReportEngine:
+    """Test incremental IntentReport generation."""
+    
+    def test_initial_reports_are_pending(self):
+        """Test all expectations start as pending measurement."""
+        engine = IntentReportEngine([make_expectation(0, "latency", "LESS_THAN", "10ms")])
+        
+        reports = engine.reports()
+        
+        assert len(reports) == 1
+        assert reports[0]["intentReportStatus"] == "NOT_FULFILLED"
+        assert reports[0]["notFulfilledReason"] == "PENDING_MEASUREMENT"
+        validate_28312_report(reports[0])
+    
+    @pytest.mark.parametrize("condition,value,fulfilled", [
+        ("LESS_THAN", 9.0, True),
+        ("LESS_THAN", 10.0, False),
+        ("LESS_THAN_OR_EQUAL", 10.0, True),
+        ("GREATER_THAN", 10.0, False),
+        ("GREATER_THAN_OR_EQUAL", 10.0, True),
+        ("EQUAL", 10.0, True),
+        ("NOT_EQUAL", 10.0, False),
+    ])
+    def test_conditions(self, condition, value, fulfilled):
+        """Test each target condition against a metric value."""
+        engine = IntentReportEngine([make_expectation(0, "latency", condition, "10ms")])
+        
+        transitions = engine.ingest({"latency": value}, timestamp="2024-01-01T00:00:00Z")
+        
+        assert len(transitions) == 1
+        assert transitions[0].previous_status == "PENDING"
+        assert transitions[0].status == ("FULFILLED" if fulfilled else "NOT_FULFILLED")
+        validate_28312_report(transitions[0].report)
+    
+    def test_between_condition(self):
+        """Test BETWEEN uses an inclusive range."""
+        engine = IntentReportEngine([make_expectation(0, "throughput", "BETWEEN", "100-200Mbps")])
+        
+        assert engine.ingest({"throughput": 150.0})[0].status == "FULFILLED"
+        assert engine.ingest({"throughput": 250.0})[0].status == "NOT_FULFILLED"
+        assert engine.ingest({"throughput": 200.0})[0].status == "FULFILLED"
+    
+    def test_only_transitions_are_emitted(self):
+        """Test repeated samples with the same outcome emit nothing."""
+        engine = IntentReportEngine([make_expectation(0, "latency", "LESS_THAN", "10ms")])
+        
+        assert len(engine.ingest({"latency": 5.0})) == 1
+        assert engine.ingest({"latency": 6.0}) == []
+        
+        transitions = engine.ingest({"latency": 15.0})
+        assert len(transitions) == 1
+        assert transitions[0].previous_status == "FULFILLED"
+        assert transitions[0].report["notFulfilledReason"] == "PERFORMANCE_DEGRADATION"
+    
+    def test_only_affected_attributes_are_evaluated(self):
+        """Test a sample only touches expectations on its metrics."""
+        engine = IntentReportEngine([
+            make_expectation(0, "latency", "LESS_THAN", "10ms"),
+            make_expectation(1, "throughput", "GREATER_THAN", "100Mbps")
+        ])
+        
+        transitions = engine.ingest({"throughput": 150.0})
+        
+        assert [t.expectation_id for t in transitions] == ["intent-exp-1"]
+        statuses = {r["intentExpectationId"]: r["intentReportStatus"] for r in engine.reports()}
+        assert statuses == {"intent-exp-0": "NOT_FULFILLED", "intent-exp-1": "FULFILLED"}
+    
+    def test_adapter_metric_aliases(self):
+        """Test job-query-adapter payloads map onto target attributes."""
+        engine = IntentReportEngine([
+            make_expectation(0, "latency", "LESS_THAN", "15ms"),
+            make_expectation(1, "throughput", "GREATER_THAN", "200Mbps")
+        ])
+        sample = {
+            "timestamp": "2024-01-01T00:00:00Z",
+            "latency_p95_ms": 10.0,
+            "success_rate": 0.998,
+            "throughput_p95_mbps": 250.0,
+            "metadata": {"source": "job-query-adapter"}
+        }
+        
+        transitions = engine.ingest(sample)
+        
+        assert {t.status for t in transitions} == {"FULFILLED"}
+        report = transitions[0].report
+        assert report["timestamp"] == "2024-01-01T00:00:00Z"
+        assert report["measurementData"][0]["measurementValue"] == "10ms"
+    
+    def test_many_expectations_mixed_conditions(self):
+        """Test a large group with mixed conditions evaluates correctly."""
+        expectations = [
+            make_expectation(i, "latency", "LESS_THAN" if i % 2 else "GREATER_THAN", f"{i}ms")
+            for i in range(10000)
+        ]
+        engine = IntentReportEngine(expectations)
+        
+        transitions = engine.ingest({"latency": 5000.0})
+        
+        fulfilled = {t.expectation_id for t in transitions if t.status == "FULFILLED"}
+        expected = {
+            f"intent-exp-{i}" for i in range(10000)
+            if (i % 2 and 5000 < i) or (not i % 2 and 5000 > i)
+        }
+        assert len(transitions) == 10000
+        assert fulfilled == expected
+    
+    def test_add_expectations_keeps_status(self):
+        """Test indexing more expectations keeps existing statuses."""
+        engine = IntentReportEngine([make_expectation(0, "latency", "LESS_THAN", "10ms")])
+        engine.ingest({"latency": 5.0})
+        
+        engine.add_expectations([make_expectation(1, "latency", "LESS_THAN", "1ms")])
+        transitions = engine.ingest({"latency": 5.0})
+        
+        assert len(engine) == 2
+        assert [t.expectation_id for t in transitions] == ["intent-exp-1"]
+    
+    def test_unsupported_condition(self):
+        """Test unknown target conditions are rejected."""
+        with pytest.raises(ConversionError):
+            IntentReportEngine([make_expectation(0, "latency", "APPROXIMATELY", "10ms")])
+
+    def test_unparseable_target_value_is_skipped(self):
+        """Test an unparseable targetValue does not abort indexing."""
+        bad = make_expectation(1, "latency", "LESS_THAN", ["10", "ms"])
+        engine = IntentReportEngine([
+            make_expectation(0, "latency", "LESS_THAN", "10ms"),
+            bad,
+            make_expectation(2, "throughput", "GREATER_THAN", "100Mbps"),
+        ])
+
+        assert len(engine) == 2
+        assert engine.skipped == [bad]
+        assert engine.target_attributes == ["latency", "throughput"]
@@ -0,0 +1,239 @@
+"""Bulk streaming conversion of TMF921 intent corpora.
+
+Inputs are read lazily from a directory, a glob pattern or an NDJSON
+stream and converted across a process pool. Each worker keeps a single
+warm TMF921To28312Converter, and at most a bounded window of intents is
+in flight at any time, so memory stays flat regardless of corpus size.
+Results are written in input order as NDJSON, optionally sharded.
+"""
+
+import glob
+import json
+import re
+import sys
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, Optional, TextIO, Tuple
+
+from .converter import ConversionError, TMF921To28312Converter, load_tmf921_intent
+
+# (source, kind, payload) where kind is "file" (payload is a path) or
+# "line" (payload is one raw NDJSON line)
+BatchTask = Tuple[str, str, str]
+
+_ARRAY_INDEX = re.compile(r"\[\d+\]")
+
+_worker_converter: Optional[TMF921To28312Converter] = None
+
+
+def iter_batch_tasks(source: str, stdin: Optional[TextIO] = None) -> Iterator[BatchTask]:
+    """Yield conversion tasks for a directory, glob pattern or NDJSON stream.
+
+    ``-`` reads NDJSON from stdin, ``*.ndjson``/``*.jsonl`` files are read
+    line by line, directories yield their ``*.json`` files and anything
+    else is expanded as a glob pattern. Files are yielded in sorted order.
+    """
+    if source == "-":
+        yield from _iter_ndjson_lines("<stdin>", stdin or sys.stdin)
+        return
+
+    path = Path(source)
+    if path.is_dir():
+        for file_path in sorted(path.glob("*.json")):
+            yield (str(file_path), "file", str(file_path))
+    elif path.is_file() and path.suffix in (".ndjson", ".jsonl"):
+        with open(path, 'r') as f:
+            yield from _iter_ndjson_lines(str(path), f)
+    elif path.is_file():
+        yield (str(path), "file", str(path))
+    else:
+        matches = sorted(glob.iglob(source, recursive=True))
+        if not matches:
+            raise FileNotFoundError(f"No TMF921 intents found for input: {source}")
+        for match in matches:
+            yield (match, "file", match)
+
+
+def _iter_ndjson_lines(name: str, stream: TextIO) -> Iterator[BatchTask]:
+    """Yield one task per non-blank NDJSON line."""
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield (f"{name}:{line_number}", "line", line)
+
+
+def _init_worker(mapping_file: Optional[str]) -> None:
+    """Create the per-process converter once."""
+    global _worker_converter
+    _worker_converter = TMF921To28312Converter(
+        mapping_file=Path(mapping_file) if mapping_file else None
+    )
+
+
+def _convert_task(task: BatchTask) -> Dict[str, Any]:
+    """Convert a single task with the worker's converter."""
+    source, kind, payload = task
+    record: Dict[str, Any] = {"source": source}
+
+    try:
+        if kind == "line":
+            try:
+                tmf921_intent = json.loads(payload)
+            except json.JSONDecodeError as e:
+                raise ConversionError(f"Invalid JSON in {source}: {e}")
+        else:
+            tmf921_intent = load_tmf921_intent(Path(payload))
+    except (FileNotFoundError, ConversionError) as e:
+        record.update(success=False, error_message=str(e))
+        return record
+
+    if _worker_converter is None:
+        _init_worker(None)
+    result = _worker_converter.convert(tmf921_intent)
+
+    if isinstance(tmf921_intent, dict):
+        record["intent_id"] = tmf921_intent.get("id")
+    record["success"] = result.success
+    if result.success:
+        record["expectations"] = result.expectations
+        record["reports"] = result.reports
+        record["delta_report"] = result.delta_report
+    else:
+        record["error_message"] = result.error_message
+    return record
+
+
+class BatchSummary:
+    """Coverage statistics aggregated over a whole corpus."""
+
+    def __init__(self, top_unmapped: int = 20):
+        """Initialize empty summary."""
+        self.total = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.expectations = 0
+        self.total_fields = 0
+        self.mapped_fields = 0
+        self.unmapped_fields = 0
+        self.top_unmapped = top_unmapped
+        # Array indices are collapsed to [*] so the counter is bounded by
+        # the number of distinct field shapes, not the corpus size
+        self._unmapped_paths: Counter = Counter()
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Fold one conversion record into the summary."""
+        self.total += 1
+        if not record.get("success"):
+            self.failed += 1
+            return
+
+        self.succeeded += 1
+        self.expectations += len(record.get("expectations", []))
+        summary = record.get("delta_report", {}).get("conversion_summary", {})
+        self.total_fields += summary.get("total_fields_processed", 0)
+        self.mapped_fields += summary.get("successfully_mapped", 0)
+        self.unmapped_fields += summary.get("unmapped_count", 0)
+        for field in record.get("delta_report", {}).get("unmapped_fields", []):
+            self._unmapped_paths[_ARRAY_INDEX.sub("[*]", field["tmf921_path"])] += 1
+
+    @property
+    def mapping_coverage(self) -> float:
+        """Fraction of fields mapped across all successful conversions."""
+        return self.mapped_fields / self.total_fields if self.total_fields > 0 else 1.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the summary as a JSON-serializable dict."""
+        return {
+            "total_intents": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "expectations_generated": self.expectations,
+            "total_fields_processed": self.total_fields,
+            "successfully_mapped": self.mapped_fields,
+            "unmapped_count": self.unmapped_fields,
+            "mapping_coverage": self.mapping_coverage,
+            "most_common_unmapped": [
+                {"tmf921_path": path, "count": count}
+                for path, count in self._unmapped_paths.most_common(self.top_unmapped)
+            ]
+        }
+
+
+class ShardedNDJSONWriter:
+    """Write records to numbered NDJSON shard files of a fixed size."""
+
+    def __init__(self, output_dir: Path, shard_size: int, prefix: str = "results"):
+        """Initialize writer; shards are opened lazily."""
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        self.output_dir = output_dir
+        self.shard_size = shard_size
+        self.prefix = prefix
+        self.shard_index = -1
+        self._count = 0
+        self._file: Optional[TextIO] = None
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Append a record, rolling over to a new shard when full."""
+        if self._file is None or self._count >= self.shard_size:
+            self.close()
+            self.shard_index += 1
+            shard_path = self.output_dir / f"{self.prefix}-{self.shard_index:05d}.ndjson"
+            self._file = open(shard_path, 'w')
+            self._count = 0
+        self._file.write(json.dumps(record) + "\n")
+        self._count += 1
+
+    def close(self) -> None:
+        """Close the current shard."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def run_batch(
+    tasks: Iterator[BatchTask],
+    write: Any,
+    mapping_file: Optional[str] = None,
+    workers: int = 1,
+    max_in_flight: Optional[int] = None,
+    progress: Optional[Any] = None,
+    progress_every: int = 100
+) -> BatchSummary:
+    """Convert tasks and pass each record to ``write`` in input order.
+
+    With ``workers`` > 1 the conversions run in a process pool; no more than
+    ``max_in_flight`` tasks (default: 4 per worker) are queued at once.
+    ``progress`` is called with the summary every ``progress_every`` records.
+    """
+    if progress_every < 1:
+        raise ValueError("progress_every must be at least 1")
+    summary = BatchSummary()
+
+    def emit(record: Dict[str, Any]) -> None:
+        summary.add(record)
+        write(record)
+        if progress is not None and summary.total % progress_every == 0:
+            progress(summary)
+
+    if workers <= 1:
+        _init_worker(mapping_file)
+        for task in tasks:
+            emit(_convert_task(task))
+    else:
+        window = max_in_flight or workers * 4
+        pending: Deque[Future] = deque()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(mapping_file,)
+        ) as executor:
+            for task in tasks:
+                if len(pending) >= window:
+                    emit(pending.popleft().result())
+                pending.append(executor.submit(_convert_task, task))
+            while pending:
+                emit(pending.popleft().result())
+
+    if progress is not None and summary.total % progress_every != 0:
+        progress(summary)
+    return summary
@@ -0,0 +1,319 @@
+"""Scaling benchmark and memory profile for the TMF921 to 28.312 converter.
+
+Synthetic intents are generated deterministically (many expectations,
+deep nesting, many custom fields) and each conversion stage is timed and
+profiled with tracemalloc. Results are written as JSON and compared with
+a stored baseline; any stage slower or heavier than the baseline by more
+than the threshold is reported as a regression and the run exits with 1.
+
+Usage:
+    python -m tmf921_to_28312.benchmark --output artifacts/benchmark.json
+    python -m tmf921_to_28312.benchmark --update-baseline
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .converter import TMF921To28312Converter, generate_delta_report
+from .reporting import IntentReportEngine
+
+DEFAULT_BASELINE = Path(__file__).parent.parent / "benchmarks" / "baseline.json"
+
+# Allowed relative slowdown before a stage counts as a regression; timings
+# on shared CI runners are noisy, tracemalloc peaks are deterministic
+DEFAULT_THRESHOLD = 1.0
+DEFAULT_MEMORY_THRESHOLD = 0.2
+
+# Stage timings below this are dominated by noise and never flagged
+MIN_COMPARABLE_SECONDS = 0.02
+
+
+def generate_intent(
+    expectations: int = 1000,
+    custom_fields: int = 0,
+    nesting_depth: int = 0,
+    targets_per_expectation: int = 1
+) -> Dict[str, Any]:
+    """Generate a deterministic synthetic TMF921 ServiceIntent."""
+    intent: Dict[str, Any] = {
+        "id": f"bench-intent-{expectations}-{custom_fields}-{nesting_depth}",
+        "intentType": "ServiceIntent",
+        "name": "Synthetic benchmark intent",
+        "category": "benchmark",
+        "validFor": {"startDateTime": "2024-01-01T00:00:00Z"},
+        "intentSpecification": {"intentExpectations": []}
+    }
+
+    for index in range(custom_fields):
+        intent[f"customField{index}"] = {"value": index, "tags": [f"tag-{index}"]}
+
+    if nesting_depth:
+        nested: Dict[str, Any] = {}
+        intent["extensions"] = nested
+        for level in range(nesting_depth):
+            nested["level"] = {"depth": level}
+            nested = nested["level"]
+
+    for index in range(expectations):
+        intent["intentSpecification"]["intentExpectations"].append({
+            "expectationType": "deliver",
+            "customExpectationField": f"custom-{index}",
+            "expectationObject": {
+                "objectType": "networkSlice",
+                "objectInstance": f"slice-{index % 64:03d}"
+            },
+            "expectationContext": [
+                {"contextParameter": "site", "contextValue": f"edge{index % 4 + 1}"}
+            ],
+            "expectationTargets": [
+                {
+                    "targetName": "latency" if target % 2 == 0 else "throughput",
+                    "targetCondition": "lessThan" if target % 2 == 0 else "greaterThan",
+                    "targetValue": str(10 + index % 90),
+                    "targetUnit": "ms" if target % 2 == 0 else "Mbps",
+                    "customTargetField": target
+                }
+                for target in range(targets_per_expectation)
+            ]
+        })
+
+    return intent
+
+
+# name -> generate_intent keyword arguments at scale 1.0
+SCENARIOS: Dict[str, Dict[str, int]] = {
+    "many_expectations": {"expectations": 5000},
+    "many_targets": {"expectations": 500, "targets_per_expectation": 20},
+    "custom_fields": {"expectations": 100, "custom_fields": 5000},
+    "deep_nesting": {"expectations": 100, "nesting_depth": 1000},
+}
+
+
+def _scaled(params: Dict[str, int], scale: float) -> Dict[str, int]:
+    """Scale scenario sizes, keeping at least one of each."""
+    return {key: max(1, int(value * scale)) for key, value in params.items()}
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Time func ``repeat`` times, then profile one extra run's peak memory."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "time_s_median": statistics.median(timings),
+        "time_s_min": min(timings),
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_scenario(
+    params: Dict[str, int],
+    repeat: int = 5,
+    converter: Optional[TMF921To28312Converter] = None
+) -> Dict[str, Any]:
+    """Benchmark every stage of one scenario."""
+    converter = converter or TMF921To28312Converter()
+    intent = generate_intent(**params)
+    result = converter.convert(intent)
+    if not result.success:
+        raise RuntimeError(f"Benchmark conversion failed: {result.error_message}")
+
+    expectations = result.expectations
+    samples = [
+        {"latency": float(i % 100), "throughput": float(i * 7 % 120)} for i in range(100)
+    ]
+
+    def ingest_samples() -> None:
+        engine = IntentReportEngine(expectations)
+        for sample in samples:
+            engine.ingest(sample, timestamp="2024-01-01T00:00:00Z")
+
+    stages = {
+        "convert": lambda: converter.convert(intent),
+        "delta_report": lambda: generate_delta_report(
+            intent, expectations, matcher=converter.delta_matcher
+        ),
+        "report_engine": ingest_samples,
+    }
+
+    return {
+        "parameters": params,
+        "expectations_generated": len(expectations),
+        "unmapped_count": result.delta_report["conversion_summary"]["unmapped_count"],
+        "stages": {name: _measure(func, repeat) for name, func in stages.items()},
+    }
+
+
+def run_benchmarks(
+    scale: float = 1.0,
+    repeat: int = 5,
+    scenarios: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Run the selected scenarios and return a machine-readable report."""
+    converter = TMF921To28312Converter()
+    selected = scenarios or list(SCENARIOS)
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "repeat": repeat,
+        "scenarios": {
+            name: run_scenario(_scaled(SCENARIOS[name], scale), repeat, converter)
+            for name in selected
+        },
+    }
+
+
+def compare_to_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """Return stages slower or heavier than the baseline beyond the thresholds.
+
+    Scenarios or stages missing from the baseline, and baselines recorded
+    at a different scale, are not compared.
+    """
+    regressions: List[Dict[str, Any]] = []
+    if baseline.get("scale") != report.get("scale"):
+        return regressions
+
+    for name, scenario in report["scenarios"].items():
+        baseline_stages = baseline.get("scenarios", {}).get(name, {}).get("stages", {})
+        for stage, metrics in scenario["stages"].items():
+            reference = baseline_stages.get(stage)
+            if not reference:
+                continue
+            # The fastest run is the least noisy estimate of the stage cost
+            checks = [(
+                "time_s_min", metrics["time_s_min"], reference["time_s_min"], threshold
+            )]
+            if reference["time_s_min"] < MIN_COMPARABLE_SECONDS:
+                checks = []
+            checks.append((
+                "peak_memory_bytes", metrics["peak_memory_bytes"],
+                reference["peak_memory_bytes"], memory_threshold
+            ))
+            for metric, current, previous, allowed in checks:
+                if previous > 0 and current > previous * (1 + allowed):
+                    regressions.append({
+                        "scenario": name,
+                        "stage": stage,
+                        "metric": metric,
+                        "baseline": previous,
+                        "current": current,
+                        "ratio": current / previous,
+                    })
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark TMF921 to 28.312 conversion time and memory"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        help="Write the JSON benchmark report to this file (default: stdout)"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=str(DEFAULT_BASELINE),
+        help="Baseline JSON file to compare against (default: benchmarks/baseline.json)"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store this run as the new baseline instead of comparing"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative slowdown, e.g. 0.5 for +50%% (default: 1.0)"
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=DEFAULT_MEMORY_THRESHOLD,
+        help="Allowed relative peak memory growth (default: 0.2)"
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply scenario sizes by this factor (default: 1.0)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timed runs per stage (default: 5)"
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Run only this scenario (repeatable)"
+    )
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(scale=args.scale, repeat=args.repeat, scenarios=args.scenario)
+    baseline_path = Path(args.baseline)
+
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote baseline to: {baseline_path}", file=sys.stderr)
+        report["regressions"] = []
+    elif baseline_path.exists():
+        with open(baseline_path, 'r') as f:
+            baseline = json.load(f)
+        report["regressions"] = compare_to_baseline(
+            report, baseline, args.threshold, args.memory_threshold
+        )
+    else:
+        print(f"No baseline found at: {baseline_path}", file=sys.stderr)
+        report["regressions"] = []
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+    for regression in report["regressions"]:
+        print(
+            f"REGRESSION {regression['scenario']}/{regression['stage']} "
+            f"{regression['metric']}: {regression['baseline']:.6g} -> "
+            f"{regression['current']:.6g} ({regression['ratio']:.2f}x)",
+            file=sys.stderr
+        )
+    return 1 if report["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
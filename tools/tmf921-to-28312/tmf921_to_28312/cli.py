@@ -13,9 +13,21 @@ import argparse
 from pathlib import Path
 from typing import NoReturn, Optional
 
+from .batch import BatchSummary, ShardedNDJSONWriter, iter_batch_tasks, run_batch
 from .converter import TMF921To28312Converter, load_tmf921_intent, ConversionError
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def create_artifacts_dir(output_dir: Path) -> Path:
     """Create artifacts directory for outputs."""
     artifacts_dir = output_dir / "artifacts"
@@ -89,6 +101,64 @@ def convert_command(args: argparse.Namespace) -> int:
         return 1
 
 
+def convert_batch_command(args: argparse.Namespace) -> int:
+    """Handle the convert-batch command.
+
+    Records go to stdout (or --output) as NDJSON, or to --shard-dir as
+    sharded NDJSON files; progress and the coverage summary go to stderr.
+    """
+    def report_progress(summary: BatchSummary) -> None:
+        print(
+            f"Converted {summary.total} intent(s): {summary.succeeded} ok, "
+            f"{summary.failed} failed, coverage {summary.mapping_coverage:.2%}",
+            file=sys.stderr
+        )
+
+    output_file = None
+    writer = None
+    try:
+        if args.shard_dir:
+            writer = ShardedNDJSONWriter(Path(args.shard_dir), args.shard_size)
+            write = writer.write
+        else:
+            output_file = open(args.output, 'w') if args.output != "-" else sys.stdout
+
+            def write(record: dict) -> None:
+                output_file.write(json.dumps(record) + "\n")
+
+        summary = run_batch(
+            iter_batch_tasks(args.input),
+            write,
+            mapping_file=args.mapping,
+            workers=args.workers,
+            progress=None if args.quiet else report_progress,
+            progress_every=args.progress_every
+        )
+
+        summary_dict = summary.to_dict()
+        if args.summary:
+            with open(args.summary, 'w') as f:
+                json.dump(summary_dict, f, indent=2)
+        print(json.dumps(summary_dict, indent=2), file=sys.stderr)
+
+        return 0 if summary.failed == 0 else 1
+
+    except FileNotFoundError as e:
+        print(f"File not found: {e}", file=sys.stderr)
+        return 1
+    except ConversionError as e:
+        print(f"Conversion error: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Unexpected error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if writer is not None:
+            writer.close()
+        if output_file is not None and output_file is not sys.stdout:
+            output_file.close()
+
+
 def validate_command(args: argparse.Namespace) -> int:
     """Handle the validate command."""
     try:
@@ -144,6 +214,12 @@ Examples:
   # Convert with custom mapping file
   tmf921-to-28312 convert --input intent.json --mapping custom_mapping.yaml --output ./results
   
+  # Convert a directory of intents across 4 worker processes
+  tmf921-to-28312 convert-batch --input samples/tmf921/ --workers 4 --output results.ndjson
+  
+  # Convert an NDJSON stream from stdin into sharded output files
+  cat intents.ndjson | tmf921-to-28312 convert-batch --input - --shard-dir ./results --shard-size 1000
+  
   # Validate TMF921 intent format
   tmf921-to-28312 validate --input samples/tmf921/valid_01.json
 
@@ -173,6 +249,57 @@ Output Files:
     )
     convert_parser.set_defaults(func=convert_command)
     
+    # Convert-batch command
+    batch_parser = subparsers.add_parser(
+        "convert-batch", help="Convert a directory, glob or NDJSON stream of TMF921 intents"
+    )
+    batch_parser.add_argument(
+        "--input", "-i",
+        required=True,
+        help="Directory of *.json intents, glob pattern, NDJSON file, or '-' for NDJSON on stdin"
+    )
+    batch_parser.add_argument(
+        "--output", "-o",
+        default="-",
+        help="NDJSON output file, or '-' for stdout (default: stdout)"
+    )
+    batch_parser.add_argument(
+        "--shard-dir",
+        help="Write results as sharded NDJSON files into this directory instead of --output"
+    )
+    batch_parser.add_argument(
+        "--shard-size",
+        type=positive_int,
+        default=1000,
+        help="Records per shard file when using --shard-dir (default: 1000)"
+    )
+    batch_parser.add_argument(
+        "--mapping", "-m",
+        help="Path to custom mapping YAML file (default: built-in mapping)"
+    )
+    batch_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1, in-process)"
+    )
+    batch_parser.add_argument(
+        "--summary",
+        help="Also write the aggregated coverage summary JSON to this file"
+    )
+    batch_parser.add_argument(
+        "--progress-every",
+        type=positive_int,
+        default=100,
+        help="Report progress every N intents (default: 100)"
+    )
+    batch_parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Suppress progress output"
+    )
+    batch_parser.set_defaults(func=convert_batch_command)
+    
     # Validate command
     validate_parser = subparsers.add_parser("validate", help="Validate TMF921 intent format")
     validate_parser.add_argument(
@@ -7,10 +7,12 @@ Reference: 3GPP TS 28.312 V17.1.0 (2022-03) - Intent driven management services
 """
 
 import json
+import re
 import yaml
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 
 from .schemas import validate_28312_expectation, validate_28312_report
@@ -50,9 +52,10 @@ class TMF921To28312Converter:
     def __init__(self, mapping_file: Optional[Path] = None):
         """Initialize converter with mapping rules."""
         if mapping_file is None:
-            mapping_file = Path(__file__).parent.parent / "mappings" / "tmf921_to_28312.yaml"
+            mapping_file = _DEFAULT_MAPPING_FILE
         
         self._mapping_rules = self._load_mapping_rules(mapping_file)
+        self._delta_matcher = DeltaReportMatcher.from_mapping_rules(self._mapping_rules or {})
         self._tracked_fields: Set[str] = set()
     
     def _load_mapping_rules(self, mapping_file: Path) -> Dict[str, Any]:
@@ -70,6 +73,11 @@ class TMF921To28312Converter:
         """Get mapping rules."""
         return self._mapping_rules
     
+    @property
+    def delta_matcher(self) -> "DeltaReportMatcher":
+        """Get the delta report matcher compiled from the mapping rules."""
+        return self._delta_matcher
+    
     def convert(self, tmf921_intent: Dict[str, Any]) -> ConversionResult:
         """Convert TMF921 intent to 28.312 format."""
         try:
@@ -103,7 +111,9 @@ class TMF921To28312Converter:
             reports = self._generate_reports(expectations)
             
             # Generate delta report
-            delta_report = generate_delta_report(tmf921_intent, expectations)
+            delta_report = generate_delta_report(
+                tmf921_intent, expectations, matcher=self._delta_matcher
+            )
             
             return ConversionResult(
                 success=True,
@@ -274,96 +284,182 @@ def load_tmf921_intent(file_path: Path) -> Dict[str, Any]:
         raise ConversionError(f"Error loading TMF921 intent: {e}")
 
 
+_DEFAULT_MAPPING_FILE = Path(__file__).parent.parent / "mappings" / "tmf921_to_28312.yaml"
+
+_DEFAULT_UNMAPPED_REASON = "Field marked as unmapped in mapping rules"
+
+_UNKNOWN_FIELD_REASON = (
+    "Unknown field not defined in TMF921 standard mapping - no equivalent in 3GPP TS 28.312"
+)
+
+_UNKNOWN_FIELD_SUGGESTION = (
+    "Review if this field should be mapped to intentExpectationContext or handled as metadata"
+)
+
+# Fields consumed by the converter; matched against the full path or any
+# dotted suffix of it.
+_KNOWN_MAPPED_FIELDS = (
+    "id", "intentType", "name", "description",
+    "intentSpecification", "intentSpecification.intentExpectations",
+    "expectationType", "expectationObject", "expectationObject.objectType",
+    "expectationObject.objectInstance", "expectationTargets",
+    "targetName", "targetCondition", "targetValue", "targetUnit",
+    "expectationContext", "contextParameter", "contextValue"
+)
+
+
+class DeltaReportMatcher:
+    """Field path matcher compiled once from the ``unmapped_fields`` mapping rules.
+
+    All unmapped patterns are combined into a single regex with one named
+    group per pattern, so classifying a field path is one ``fullmatch`` call
+    and the first matching pattern (in mapping file order) wins. Known
+    mapped fields are checked with a set lookup and one ``endswith`` call,
+    independent of path length.
+    """
+
+    def __init__(self, unmapped_patterns: Optional[Any] = None):
+        """Compile matcher from the ``unmapped_fields`` section of the mapping rules."""
+        self._rules: List[Dict[str, Any]] = []
+        alternatives = []
+
+        if isinstance(unmapped_patterns, list):
+            # Simple pattern list form
+            unmapped_patterns = {str(pattern): pattern for pattern in unmapped_patterns}
+
+        for index, (field_name, field_info) in enumerate((unmapped_patterns or {}).items()):
+            if isinstance(field_info, dict):
+                pattern = field_info.get("pattern", field_name)
+                reason = field_info.get("reason", _DEFAULT_UNMAPPED_REASON)
+                suggested_mapping = field_info.get("suggested_mapping")
+            else:
+                # Backward compatibility with simple pattern list
+                pattern = field_info
+                reason = _DEFAULT_UNMAPPED_REASON
+                suggested_mapping = None
+
+            self._rules.append({"reason": reason, "suggested_mapping": suggested_mapping})
+            alternatives.append(f"(?P<p{index}>{_pattern_to_regex(str(pattern))})")
+
+        self._unmapped_regex = re.compile("|".join(alternatives)) if alternatives else None
+        self._known_fields = frozenset(_KNOWN_MAPPED_FIELDS)
+        self._known_suffixes = tuple(f".{field}" for field in _KNOWN_MAPPED_FIELDS)
+
+    @classmethod
+    def from_mapping_rules(cls, mapping_rules: Dict[str, Any]) -> "DeltaReportMatcher":
+        """Build matcher from a loaded mapping rules document."""
+        return cls(mapping_rules.get("unmapped_fields", {}))
+
+    def match_unmapped(self, path: str) -> Optional[Dict[str, Any]]:
+        """Return the reason/suggestion of the first unmapped pattern matching path."""
+        if self._unmapped_regex is None:
+            return None
+        match = self._unmapped_regex.fullmatch(path)
+        if match is None:
+            return None
+        return self._rules[int(match.lastgroup[1:])]
+
+    def is_known_mapped(self, path: str) -> bool:
+        """Check if path ends with a field consumed by the converter."""
+        return path in self._known_fields or path.endswith(self._known_suffixes)
+
+    def scan(self, tmf921_intent: Any) -> Tuple[List[Dict[str, Any]], int]:
+        """Collect unmapped fields and count all fields in a single traversal.
+
+        Fields are visited depth-first with an explicit stack, so deeply
+        nested intents cannot hit the recursion limit. Entries are emitted in
+        document order.
+        """
+        unmapped_fields: List[Dict[str, Any]] = []
+        total_fields = 0
+        # (value, path segment, depth, is_dict_field); a field's path is the
+        # concatenation of the segments on the current branch, joined only
+        # when the field is classified
+        stack: List[Tuple[Any, str, int, bool]] = [(tmf921_intent, "", 0, False)]
+        segments: List[str] = []
+        # Ids of the containers on the current path, used to detect cycles
+        ancestors: List[int] = []
+        ancestor_ids: Set[int] = set()
+
+        while stack:
+            value, segment, depth, is_dict_field = stack.pop()
+            del segments[depth:]
+            segments.append(segment)
+
+            if is_dict_field:
+                path = "".join(segments)
+                rule = self.match_unmapped(path)
+                if rule is not None:
+                    field_entry = {
+                        "tmf921_path": path,
+                        "value": value,
+                        "type": type(value).__name__,
+                        "reason": rule["reason"]
+                    }
+                    if rule["suggested_mapping"]:
+                        field_entry["suggested_mapping"] = rule["suggested_mapping"]
+                    unmapped_fields.append(field_entry)
+                elif not self.is_known_mapped(path):
+                    unmapped_fields.append({
+                        "tmf921_path": path,
+                        "value": value,
+                        "type": type(value).__name__,
+                        "reason": _UNKNOWN_FIELD_REASON,
+                        "suggested_mapping": _UNKNOWN_FIELD_SUGGESTION
+                    })
+
+            if not isinstance(value, (dict, list)):
+                continue
+
+            while len(ancestors) > depth:
+                ancestor_ids.discard(ancestors.pop())
+            if id(value) in ancestor_ids:
+                path = "".join(segments)
+                raise ConversionError(
+                    f"Circular reference detected at: {path}", {"path": path}
+                )
+            ancestors.append(id(value))
+            ancestor_ids.add(id(value))
+
+            if isinstance(value, dict):
+                total_fields += len(value)
+                stack.extend(
+                    (child, f".{key}" if depth else key, depth + 1, True)
+                    for key, child in reversed(value.items())
+                )
+            else:
+                stack.extend(
+                    (value[i], f"[{i}]", depth + 1, False)
+                    for i in range(len(value) - 1, -1, -1)
+                )
+
+        return unmapped_fields, total_fields
+
+
+@lru_cache(maxsize=None)
+def _default_delta_matcher() -> DeltaReportMatcher:
+    """Matcher for the built-in mapping file, compiled on first use."""
+    try:
+        with open(_DEFAULT_MAPPING_FILE, 'r') as f:
+            mapping_rules = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError):
+        mapping_rules = {}
+    return DeltaReportMatcher.from_mapping_rules(mapping_rules)
+
+
 def generate_delta_report(
     tmf921_intent: Dict[str, Any],
-    converted_expectations: List[Dict[str, Any]]
+    converted_expectations: List[Dict[str, Any]],
+    matcher: Optional[DeltaReportMatcher] = None
 ) -> Dict[str, Any]:
-    """Generate delta report for unmapped fields."""
-    unmapped_fields = []
-    
-    # Get unmapped field patterns from mapping rules
-    mapping_file = Path(__file__).parent.parent / "mappings" / "tmf921_to_28312.yaml"
-    try:
-        with open(mapping_file, 'r') as f:
-            mapping_rules = yaml.safe_load(f)
-    except:
-        mapping_rules = {}
-    
-    unmapped_patterns = mapping_rules.get("unmapped_fields", {})
-    
-    # Scan for unmapped fields
-    def scan_object(obj: Any, path: str = "") -> None:
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                current_path = f"{path}.{key}" if path else key
-                
-                # Check if this field is mapped or explicitly unmapped
-                is_known_field = False
-                
-                # Check if this field matches unmapped patterns
-                for field_name, field_info in unmapped_patterns.items():
-                    if isinstance(field_info, dict):
-                        pattern = field_info.get("pattern", field_name)
-                        reason = field_info.get("reason", "Field marked as unmapped in mapping rules")
-                        suggested_mapping = field_info.get("suggested_mapping")
-                    else:
-                        # Backward compatibility with simple pattern list
-                        pattern = field_info
-                        reason = "Field marked as unmapped in mapping rules"
-                        suggested_mapping = None
-                    
-                    if _matches_pattern(current_path, pattern):
-                        field_entry = {
-                            "tmf921_path": current_path,
-                            "value": value,
-                            "type": type(value).__name__,
-                            "reason": reason
-                        }
-                        if suggested_mapping:
-                            field_entry["suggested_mapping"] = suggested_mapping
-                        
-                        unmapped_fields.append(field_entry)
-                        is_known_field = True
-                        break
-                
-                # Check if it's a known mapped field
-                if not is_known_field:
-                    known_mapped_fields = [
-                        "id", "intentType", "name", "description",
-                        "intentSpecification", "intentSpecification.intentExpectations",
-                        "expectationType", "expectationObject", "expectationObject.objectType",
-                        "expectationObject.objectInstance", "expectationTargets", 
-                        "targetName", "targetCondition", "targetValue", "targetUnit",
-                        "expectationContext", "contextParameter", "contextValue"
-                    ]
-                    
-                    # Simple heuristic: if it's not a known mapped field and not explicitly unmapped,
-                    # treat it as unmapped custom field
-                    is_mapped = any(_matches_simple_pattern(current_path, mapped_pattern) 
-                                  for mapped_pattern in known_mapped_fields)
-                    
-                    if not is_mapped:
-                        unmapped_fields.append({
-                            "tmf921_path": current_path,
-                            "value": value,
-                            "type": type(value).__name__,
-                            "reason": f"Unknown field not defined in TMF921 standard mapping - no equivalent in 3GPP TS 28.312",
-                            "suggested_mapping": "Review if this field should be mapped to intentExpectationContext or handled as metadata"
-                        })
-                
-                # Recursively scan nested objects
-                if isinstance(value, (dict, list)):
-                    scan_object(value, current_path)
-        
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                current_path = f"{path}[{i}]"
-                scan_object(item, current_path)
-    
-    scan_object(tmf921_intent)
-    
-    # Calculate summary statistics
-    total_fields = _count_fields(tmf921_intent)
+    """Generate delta report for unmapped fields.
+
+    Uses the built-in mapping rules unless a precompiled matcher is given.
+    """
+    if matcher is None:
+        matcher = _default_delta_matcher()
+
+    unmapped_fields, total_fields = matcher.scan(tmf921_intent)
     mapped_fields = total_fields - len(unmapped_fields)
     
     return {
@@ -378,56 +474,36 @@ def generate_delta_report(
     }
 
 
-def _matches_simple_pattern(path: str, pattern: str) -> bool:
-    """Check if a field path matches a simple pattern (without regex)."""
-    return path == pattern or path.endswith(f".{pattern}")
+@lru_cache(maxsize=256)
+def _pattern_to_regex(pattern: str) -> str:
+    """Translate an unmapped field pattern to a regex source string.
+
+    ``[*]`` matches any array index and ``*`` matches any substring. A
+    pattern always matches itself literally.
+    """
+    literal = re.escape(pattern)
+    if '*' not in pattern:
+        return literal
+
+    regex_pattern = re.escape(pattern.replace('[*]', '__ARRAY_INDEX__'))
+    regex_pattern = regex_pattern.replace('__ARRAY_INDEX__', r'\[\d+\]')
+    regex_pattern = regex_pattern.replace(r'\*', '.*')
+    return f"{literal}|{regex_pattern}"
 
 
 def _matches_pattern(path: str, pattern: str) -> bool:
     """Check if a field path matches an unmapped pattern."""
-    import re
-    
-    # Simple exact match first
-    if path == pattern:
-        return True
-    
-    # Handle wildcards in pattern
-    if '*' in pattern:
-        # Build regex pattern step by step
-        regex_pattern = pattern
-        
-        # First replace [*] with a temporary placeholder
-        if '[*]' in regex_pattern:
-            regex_pattern = regex_pattern.replace('[*]', '__ARRAY_INDEX__')
-        
-        # Escape all regex special characters
-        regex_pattern = re.escape(regex_pattern)
-        
-        # Replace our placeholders with proper regex
-        regex_pattern = regex_pattern.replace('__ARRAY_INDEX__', r'\[\d+\]')
-        regex_pattern = regex_pattern.replace(r'\*', '.*')
-        
-        try:
-            return bool(re.match(f"^{regex_pattern}$", path))
-        except re.error:
-            # Fallback to simple matching
-            if pattern.count('*') == 1 and '[*]' not in pattern:
-                parts = pattern.split('*')
-                if len(parts) == 2:
-                    prefix, suffix = parts
-                    return path.startswith(prefix) and path.endswith(suffix)
-    
-    return False
+    return re.fullmatch(_pattern_to_regex(pattern), path) is not None
 
 
 def _count_fields(obj: Any, count: int = 0) -> int:
     """Count total number of fields in nested object."""
-    if isinstance(obj, dict):
-        count += len(obj)
-        for value in obj.values():
-            count = _count_fields(value, count)
-    elif isinstance(obj, list):
-        for item in obj:
-            count = _count_fields(item, count)
-    
-    return count
\ No newline at end of file
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            count += len(current)
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+    return count
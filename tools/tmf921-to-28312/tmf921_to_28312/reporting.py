@@ -0,0 +1,319 @@
+"""Metric-driven 3GPP TS 28.312 IntentReport fulfillment engine.
+
+Converted IntentExpectations are indexed by ``targetAttribute``. Each
+incoming metric sample only re-evaluates the expectations targeting the
+metrics it carries, with one vectorized threshold comparison per
+condition, and an updated IntentReport is emitted only for expectations
+whose fulfillment status changed.
+
+Target values are normalized to canonical units before comparison:
+milliseconds for time, Mbps for bit rates and plain ratios for
+percentages (``99.9%`` becomes ``0.999``). Samples are expected in the
+same units, which matches the job-query-adapter ``/metrics`` payload.
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from .converter import ConversionError
+from .units import DEFAULT_METRIC_ALIASES, UNIT_SCALES
+
+# Condition codes; expectations of a target group are sorted by code so
+# that each condition covers one contiguous slice of the group arrays
+CONDITION_CODES: Dict[str, int] = {
+    "LESS_THAN": 0,
+    "LESS_THAN_OR_EQUAL": 1,
+    "GREATER_THAN": 2,
+    "GREATER_THAN_OR_EQUAL": 3,
+    "EQUAL": 4,
+    "NOT_EQUAL": 5,
+    "BETWEEN": 6,
+}
+
+STATUS_PENDING = -1
+STATUS_NOT_FULFILLED = 0
+STATUS_FULFILLED = 1
+
+_STATUS_NAMES = {
+    STATUS_PENDING: "NOT_FULFILLED",
+    STATUS_NOT_FULFILLED: "NOT_FULFILLED",
+    STATUS_FULFILLED: "FULFILLED",
+}
+
+_TARGET_VALUE = re.compile(
+    r"^\s*(?P<low>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)"
+    r"(?:\s*(?:-|\.\.|,)\s*(?P<high>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?))?"
+    r"\s*(?P<unit>[A-Za-z%]*)\s*$"
+)
+
+
+def parse_target_value(value: Any) -> Tuple[float, float, str]:
+    """Parse a 28.312 targetValue into canonical ``(low, high, unit)``.
+
+    ``high`` equals ``low`` unless a range such as ``10-20ms`` is given.
+    Unknown units are kept as-is without scaling.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value), float(value), ""
+
+    match = _TARGET_VALUE.match(str(value))
+    if match is None:
+        raise ConversionError(f"Unparseable target value: {value}", {"targetValue": value})
+
+    low = float(match.group("low"))
+    high = float(match.group("high")) if match.group("high") else low
+    unit = match.group("unit")
+    canonical_unit, scale = UNIT_SCALES.get(unit.lower(), (unit, 1.0))
+    return low * scale, high * scale, canonical_unit
+
+
+class ReportTransition:
+    """Fulfillment status change of a single expectation."""
+
+    def __init__(
+        self,
+        expectation_id: str,
+        previous_status: str,
+        report: Dict[str, Any]
+    ):
+        """Initialize transition."""
+        self.expectation_id = expectation_id
+        self.previous_status = previous_status
+        self.report = report
+
+    @property
+    def status(self) -> str:
+        """New intentReportStatus."""
+        return self.report["intentReportStatus"]
+
+
+class _TargetGroup:
+    """Threshold arrays for all expectations sharing one targetAttribute."""
+
+    def __init__(self, rows: List[Tuple[int, int, float, float]]):
+        """Build arrays from ``(expectation_index, code, low, high)`` rows."""
+        rows.sort(key=lambda row: row[1])
+        self.expectation_index = np.array([row[0] for row in rows], dtype=np.int64)
+        codes = np.array([row[1] for row in rows], dtype=np.int8)
+        self.low = np.array([row[2] for row in rows], dtype=np.float64)
+        self.high = np.array([row[3] for row in rows], dtype=np.float64)
+        self.status = np.full(len(rows), STATUS_PENDING, dtype=np.int8)
+
+        bounds = np.searchsorted(codes, np.arange(len(CONDITION_CODES) + 1))
+        self.slices = [
+            (code, slice(int(bounds[code]), int(bounds[code + 1])))
+            for code in range(len(CONDITION_CODES))
+            if bounds[code + 1] > bounds[code]
+        ]
+
+        # Scratch buffers reused for every sample
+        self._fulfilled = np.empty(len(rows), dtype=bool)
+        self._between = np.empty(len(rows), dtype=bool)
+        self._changed = np.empty(len(rows), dtype=bool)
+
+    def evaluate(self, value: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Apply a metric value; return changed positions and their old statuses."""
+        fulfilled = self._fulfilled
+        for code, s in self.slices:
+            out = fulfilled[s]
+            low = self.low[s]
+            if code == 0:
+                np.greater(low, value, out=out)
+            elif code == 1:
+                np.greater_equal(low, value, out=out)
+            elif code == 2:
+                np.less(low, value, out=out)
+            elif code == 3:
+                np.less_equal(low, value, out=out)
+            elif code == 4:
+                np.equal(low, value, out=out)
+            elif code == 5:
+                np.not_equal(low, value, out=out)
+            else:
+                np.less_equal(low, value, out=out)
+                np.greater_equal(self.high[s], value, out=self._between[s])
+                np.logical_and(out, self._between[s], out=out)
+
+        np.not_equal(fulfilled, self.status, out=self._changed)
+        changed = np.flatnonzero(self._changed)
+        previous = self.status[changed]
+        if changed.size:
+            self.status[changed] = fulfilled[changed]
+        return changed, previous
+
+
+class IntentReportEngine:
+    """Incremental IntentReport generator driven by metric samples."""
+
+    def __init__(
+        self,
+        expectations: Iterable[Dict[str, Any]] = (),
+        metric_aliases: Optional[Mapping[str, str]] = None
+    ):
+        """Index expectations by target attribute.
+
+        ``metric_aliases`` maps sample metric names to target attributes;
+        metric names equal to a target attribute always match directly.
+        """
+        self.metric_aliases = dict(
+            DEFAULT_METRIC_ALIASES if metric_aliases is None else metric_aliases
+        )
+        self._expectation_ids: List[str] = []
+        self._report_ids: List[str] = []
+        self._units: List[str] = []
+        self._attributes: List[str] = []
+        self._rows: Dict[str, List[Tuple[int, int, float, float]]] = {}
+        self._groups: Dict[str, _TargetGroup] = {}
+        self._last_measurement: Dict[str, Tuple[float, str]] = {}
+        self._last_timestamp: Optional[str] = None
+        # Expectations left out of the index because their targetValue
+        # could not be parsed
+        self.skipped: List[Dict[str, Any]] = []
+
+        self.add_expectations(expectations)
+
+    def __len__(self) -> int:
+        """Number of indexed expectations."""
+        return len(self._expectation_ids)
+
+    def add_expectations(self, expectations: Iterable[Dict[str, Any]]) -> None:
+        """Index additional expectations; ones without a target are ignored.
+
+        Expectations with an unparseable targetValue are kept in ``skipped``
+        instead of failing the whole batch.
+        """
+        touched = set()
+        for expectation in expectations:
+            target = expectation.get("intentExpectationTarget")
+            if not target:
+                continue
+
+            condition = target.get("targetCondition", "EQUAL")
+            if condition not in CONDITION_CODES:
+                raise ConversionError(
+                    f"Unsupported target condition: {condition}",
+                    {"intentExpectationId": expectation.get("intentExpectationId")}
+                )
+            try:
+                low, high, unit = parse_target_value(target.get("targetValue", "0"))
+            except ConversionError:
+                self.skipped.append(expectation)
+                continue
+            attribute = target.get("targetAttribute", "unknown")
+
+            index = len(self._expectation_ids)
+            self._expectation_ids.append(expectation["intentExpectationId"])
+            self._report_ids.append(f"report-{uuid4().hex[:8]}")
+            self._units.append(unit)
+            self._attributes.append(attribute)
+            self._rows.setdefault(attribute, []).append(
+                (index, CONDITION_CODES[condition], low, high)
+            )
+            touched.add(attribute)
+
+        for attribute in touched:
+            rows = self._rows[attribute]
+            group = self._groups.get(attribute)
+            if group is not None:
+                # Carry existing statuses over into the rebuilt group
+                previous = dict(zip(group.expectation_index.tolist(), group.status.tolist()))
+            else:
+                previous = {}
+            group = _TargetGroup(list(rows))
+            if previous:
+                group.status[:] = [
+                    previous.get(index, STATUS_PENDING)
+                    for index in group.expectation_index.tolist()
+                ]
+            self._groups[attribute] = group
+
+    @property
+    def target_attributes(self) -> List[str]:
+        """Indexed target attributes."""
+        return sorted(self._groups)
+
+    def ingest(
+        self,
+        metrics: Mapping[str, Any],
+        timestamp: Optional[str] = None
+    ) -> List[ReportTransition]:
+        """Apply one metric sample and return the resulting transitions.
+
+        Non-numeric values (such as the adapter's ``metadata``) are skipped.
+        """
+        if timestamp is None:
+            timestamp = metrics.get("timestamp") or datetime.utcnow().isoformat() + "Z"
+        self._last_timestamp = timestamp
+
+        transitions: List[ReportTransition] = []
+        for name, value in metrics.items():
+            attribute = self.metric_aliases.get(name, name)
+            group = self._groups.get(attribute)
+            if group is None or isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+
+            value = float(value)
+            self._last_measurement[attribute] = (value, timestamp)
+            changed, previous = group.evaluate(value)
+            for position, was in zip(changed.tolist(), previous.tolist()):
+                index = int(group.expectation_index[position])
+                transitions.append(ReportTransition(
+                    self._expectation_ids[index],
+                    "PENDING" if was == STATUS_PENDING else _STATUS_NAMES[was],
+                    self._build_report(index, int(group.status[position]), timestamp)
+                ))
+        return transitions
+
+    def ingest_stream(
+        self,
+        samples: Iterable[Mapping[str, Any]]
+    ) -> Iterator[ReportTransition]:
+        """Apply samples in order, yielding transitions as they occur."""
+        for sample in samples:
+            yield from self.ingest(sample)
+
+    def reports(self) -> List[Dict[str, Any]]:
+        """Return the current IntentReport for every indexed expectation."""
+        timestamp = self._last_timestamp or datetime.utcnow().isoformat() + "Z"
+        statuses = [STATUS_PENDING] * len(self._expectation_ids)
+        for group in self._groups.values():
+            for index, status in zip(group.expectation_index.tolist(), group.status.tolist()):
+                statuses[index] = status
+        return [
+            self._build_report(index, status, timestamp)
+            for index, status in enumerate(statuses)
+        ]
+
+    def _build_report(self, index: int, status: int, timestamp: str) -> Dict[str, Any]:
+        """Build the 28.312 IntentReport of one expectation."""
+        report = {
+            "intentReportId": self._report_ids[index],
+            "intentExpectationId": self._expectation_ids[index],
+            "intentReportStatus": _STATUS_NAMES[status],
+            "timestamp": timestamp,
+        }
+
+        attribute = self._attributes[index]
+        measurement = self._last_measurement.get(attribute)
+        if status == STATUS_PENDING or measurement is None:
+            report["notFulfilledReason"] = "PENDING_MEASUREMENT"
+            return report
+
+        if status == STATUS_NOT_FULFILLED:
+            report["notFulfilledReason"] = "PERFORMANCE_DEGRADATION"
+
+        value, measured_at = measurement
+        unit = self._units[index]
+        data_point = {
+            "measurementAttribute": attribute,
+            "measurementValue": f"{value:g}{unit}",
+            "timestamp": measured_at,
+        }
+        if unit:
+            data_point["measurementUnit"] = unit
+        report["measurementData"] = [data_point]
+        return report
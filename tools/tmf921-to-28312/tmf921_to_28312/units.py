@@ -0,0 +1,28 @@
+"""Canonical KPI units and job-query-adapter metric names.
+
+The 28.312 IntentReport engine compares targets in milliseconds for time,
+Mbps for bit rates and plain ratios for percentages. The intent-gateway
+ExpectationIndex keeps an identical copy of these tables, since it installs
+without the converter; its tests check the two stay equal.
+"""
+
+from typing import Dict, Tuple
+
+# Multipliers to canonical units (ms, Mbps, unitless ratio)
+UNIT_SCALES: Dict[str, Tuple[str, float]] = {
+    "us": ("ms", 1e-3),
+    "ms": ("ms", 1.0),
+    "s": ("ms", 1e3),
+    "bps": ("Mbps", 1e-6),
+    "kbps": ("Mbps", 1e-3),
+    "mbps": ("Mbps", 1.0),
+    "gbps": ("Mbps", 1e3),
+    "%": ("", 1e-2),
+}
+
+# Metric names published by the job-query-adapter and the KPIs (28.312
+# target attributes) they measure
+DEFAULT_METRIC_ALIASES: Dict[str, str] = {
+    "latency_p95_ms": "latency",
+    "throughput_p95_mbps": "throughput",
+}